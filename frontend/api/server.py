@@ -4,15 +4,15 @@ Real-time streaming of equity research pipeline with agent-level visibility.
 """
 
 import asyncio
+import gzip
 import json
-import os
 import sys
 import uuid
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Callable, Optional
 import traceback
 
 from dotenv import load_dotenv
@@ -21,15 +21,36 @@ from dotenv import load_dotenv
 ROOT = Path(__file__).parent.parent.parent
 load_dotenv(ROOT / ".env")
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
+from er.budget import load_costs
+from er.checkpoints import (
+    checkpoint_exists,
+    checkpoint_path,
+    legacy_path,
+    load_checkpoint,
+)
 from er.exceptions import PipelinePaused
 from er.config import Settings
 from er.llm.router import LLMRouter, AgentRole, EscalationLevel
 from er.manifest import RunManifest
+from er.payload_cache import (
+    GZIP_LEVEL,
+    FilePayloadCache,
+    etag_matches,
+    negotiate_json,
+    run_dir_etag,
+)
+from er.run_catalog import SORTABLE_COLUMNS, RunCatalog
+from er.run_events import (
+    SSE_KEEPALIVE_SECONDS,
+    TERMINAL_STATUSES,
+    AgentEvent,
+    RunEventBroker,
+)
 from er.types import Phase
 from er.workspace.store import WorkspaceStore
 from er.evidence.store import EvidenceStore
@@ -110,17 +131,6 @@ def _load_transcripts_from_dir(
     return transcripts
 
 
-@dataclass
-class AgentEvent:
-    """Event from an agent during pipeline execution."""
-    timestamp: str
-    type: str  # stage_update, run_complete, run_error, etc.
-    event_type: str  # legacy alias for type (kept for backward compatibility)
-    agent_name: str
-    stage: float
-    data: dict = field(default_factory=dict)
-
-
 @dataclass
 class RunSession:
     """Active pipeline run session."""
@@ -133,11 +143,16 @@ class RunSession:
     cost: float = 0.0
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    events: deque = field(default_factory=lambda: deque(maxlen=500))
+    broker: RunEventBroker = field(default_factory=RunEventBroker)
     task: Optional[asyncio.Task] = None
     error: Optional[str] = None
     result: Optional[dict] = None
 
+    @property
+    def events(self) -> list[AgentEvent]:
+        """Buffered events, oldest first."""
+        return [published.event for published in self.broker.buffer]
+
     def emit(self, event_type: str, agent_name: str, stage: float, **data):
         """Emit an event to the stream."""
         event = AgentEvent(
@@ -148,7 +163,7 @@ class RunSession:
             stage=stage,
             data=data,
         )
-        self.events.append(event)
+        self.broker.publish(event)
         return event
 
 
@@ -163,22 +178,95 @@ def get_output_dir() -> Path:
     return OUTPUT_DIR
 
 
-def _load_evidence_cards(run_dir: Path) -> dict[str, dict[str, Any]]:
-    """Load evidence cards from workspace and map evidence_id -> card."""
+# Stage key -> checkpoint name written by the pipeline ({name}.ckpt, or
+# {name}.json for runs from before the checkpoint format)
+STAGE_FILES = {
+    "stage1": "stage1_company_context",
+    "stage2_internal": "stage2_internal_discovery",
+    "stage2_external": "stage2_external_discovery",
+    "stage2_external_light": "stage2_external_discovery_light",
+    "stage2_external_anchored": "stage2_external_discovery_anchored",
+    "stage2": "stage2_discovery",
+    "stage3_groups": "stage3_group_research",
+    "stage3_verticals": "stage3_verticals",
+    "stage3_5": "stage3_5_verification",
+    "stage3_75": "stage3_75_integration",
+    "stage4_claude": "stage4_claude_synthesis",
+    "stage4_gpt": "stage4_gpt_synthesis",
+    "stage5": "stage5_editorial_feedback",
+    "stage6": "stage6_final_report",
+}
+
+# Sections the run overview renders (only these frames are decoded)
+SUMMARY_SECTIONS = {
+    "stage6": ("investment_view", "conviction", "overall_confidence", "thesis_summary"),
+    "stage5": ("preferred_synthesis", "claude_score", "gpt_score"),
+}
+
+# Serialized /runs/{run_id} responses kept in memory
+RUN_RESPONSE_CACHE_ENTRIES = 16
+
+payload_cache = FilePayloadCache()
+
+# run_id -> (etag, serialized body, gzipped body)
+_run_response_cache: OrderedDict[str, tuple[str, bytes, bytes]] = OrderedDict()
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a run JSON file through the payload cache (None if missing or invalid)."""
+    try:
+        entry = payload_cache.get(path)
+        return entry.parsed() if entry else None
+    except (OSError, ValueError):
+        return None
+
+
+def _stage_path(run_dir: Path, stage: str) -> Path:
+    """File holding a stage's output: its checkpoint, else legacy JSON."""
+    path = checkpoint_path(run_dir, STAGE_FILES[stage])
+    return path if path.exists() else legacy_path(run_dir, STAGE_FILES[stage])
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match covers etag."""
+    return etag_matches(request.headers.get("if-none-match"), etag)
+
+
+def _json_response(
+    request: Request,
+    etag: str,
+    body: bytes,
+    gzipped: Optional[Callable[[], bytes]] = None,
+) -> Response:
+    """JSON response with ETag/If-None-Match and gzip negotiation."""
+    status, content, headers = negotiate_json(
+        etag,
+        body,
+        if_none_match=request.headers.get("if-none-match"),
+        accept_encoding=request.headers.get("accept-encoding"),
+        gzipped=gzipped,
+    )
+    if status == 304:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+def _load_evidence_cards(run_dir: Path, evidence_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """Look up evidence cards for evidence IDs and map evidence_id -> card."""
     workspace_path = run_dir / "workspace.db"
-    if not workspace_path.exists():
+    if not workspace_path.exists() or not evidence_ids:
         return {}
 
     store = WorkspaceStore(workspace_path)
     try:
-        artifacts = store.list_artifacts("evidence_card")
+        matches = store.get_artifacts_by_evidence_ids(evidence_ids, artifact_type="evidence_card")
     finally:
         store.close()
 
     mapping: dict[str, dict[str, Any]] = {}
-    for artifact in artifacts:
-        content = artifact.get("content", {}) or {}
-        card = {
+    for eid, artifacts in matches.items():
+        content = artifacts[0].get("content", {}) or {}
+        mapping[eid] = {
             "title": content.get("title"),
             "url": content.get("url"),
             "summary": content.get("summary"),
@@ -190,79 +278,85 @@ def _load_evidence_cards(run_dir: Path) -> dict[str, dict[str, Any]]:
             "card_id": content.get("card_id"),
             "type": "evidence_card",
         }
-        for eid in [card["raw_evidence_id"], card["summary_evidence_id"], card["card_id"]]:
-            if eid:
-                mapping[eid] = card
 
     return mapping
 
 
-def list_completed_runs(limit: int = 50) -> list[dict]:
-    """List completed runs from output directory."""
-    runs = []
-    output_dir = get_output_dir()
-
-    if not output_dir.exists():
-        return runs
+EVIDENCE_CACHE_RUNS = 32  # Runs with cached evidence resolutions
 
-    for run_dir in sorted(output_dir.iterdir(), reverse=True):
-        if not run_dir.is_dir() or not run_dir.name.startswith("run_"):
-            continue
+# run_id -> (store file signature, evidence_id -> resolved item)
+_evidence_cache: OrderedDict[str, tuple[tuple, dict[str, dict[str, Any]]]] = OrderedDict()
 
-        manifest = RunManifest.load(run_dir)
-        if not manifest:
-            continue
-
-        manifest_data = manifest.to_dict()
-        started_at = manifest_data.get("started_at")
-        completed_at = manifest_data.get("completed_at")
-
-        duration_seconds = 0
-        if started_at and completed_at:
-            try:
-                duration_seconds = (
-                    datetime.fromisoformat(completed_at) - datetime.fromisoformat(started_at)
-                ).total_seconds()
-            except Exception:
-                duration_seconds = 0
-
-        budget_info = manifest_data.get("budget") or {}
-        total_cost = budget_info.get("used", 0)
-
-        # Derive verdict from stage6 if available
-        verdict = {}
-        stage6_path = run_dir / "stage6_final_report.json"
-        if stage6_path.exists():
-            try:
-                stage6 = json.loads(stage6_path.read_text())
-                verdict = {
-                    "investment_view": stage6.get("investment_view"),
-                    "conviction": stage6.get("conviction"),
-                    "confidence": stage6.get("overall_confidence"),
-                }
-            except Exception:
-                verdict = {}
-
-        runs.append({
-            "run_id": manifest_data.get("run_id", run_dir.name),
-            "ticker": manifest_data.get("ticker", "???"),
-            "started_at": started_at,
-            "completed_at": completed_at,
-            "duration": duration_seconds,
-            "total_cost": total_cost,
-            "verdict": verdict,
-            "status": "complete" if manifest_data.get("status") == "completed" else manifest_data.get("status", "unknown"),
-            "manifest": manifest_data,
-        })
-
-        if len(runs) >= limit:
-            break
-
-    return runs
 
+def _evidence_signature(run_dir: Path) -> tuple:
+    """mtime/size of the stores evidence is resolved from (WAL files included)."""
+    signature = []
+    for path in (
+        run_dir / "workspace.db",
+        run_dir / "workspace.db-wal",
+        run_dir / "evidence" / "evidence.db",
+        run_dir / "evidence" / "evidence.db-wal",
+    ):
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def list_completed_runs(
+    limit: int = 50,
+    offset: int = 0,
+    ticker: Optional[str] = None,
+    status: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    sort: str = "started_at",
+    descending: bool = True,
+) -> tuple[list[dict], int]:
+    """List runs from the output directory's run catalog.
+
+    The catalog is built from the run directories until a full rebuild has
+    been recorded; afterwards it is kept current by RunManifest.save().
+
+    Returns:
+        Tuple of (page of run summaries, total matching runs).
+    """
+    output_dir = get_output_dir()
+    if not output_dir.exists():
+        return [], 0
+
+    # The API reports "complete" for manifests marked "completed"
+    if status == "complete":
+        status = "completed"
+
+    with RunCatalog(output_dir) as catalog:
+        if not catalog.is_backfilled():
+            catalog.rebuild()
+        filters = {"ticker": ticker, "status": status, "since": since, "until": until}
+        summaries = catalog.list_runs(
+            limit=limit, offset=offset, sort=sort, descending=descending, **filters
+        )
+        total = catalog.count(**filters)
 
-def load_run_data(run_id: str) -> dict:
-    """Load all data for a completed run."""
+    runs = []
+    for summary in summaries:
+        summary.pop("run_dir")
+        summary.pop("phase")
+        if summary["status"] == "completed":
+            summary["status"] = "complete"
+        runs.append(summary)
+    return runs, total
+
+
+def load_run_data(run_id: str, include_stages: bool = True) -> dict:
+    """Load all data for a completed run.
+
+    Stage files are parsed through the payload cache. With include_stages
+    False the raw "stages" map is omitted; the derived views are kept and
+    individual stages can be fetched from /runs/{run_id}/stage/{stage}.
+    """
     run_dir = get_output_dir() / run_id
     if not run_dir.exists():
         raise HTTPException(status_code=404, detail="Run not found")
@@ -275,9 +369,9 @@ def load_run_data(run_id: str) -> dict:
         data["manifest"] = manifest.to_dict()
 
     # Load costs
-    costs_path = run_dir / "costs.json"
-    if costs_path.exists():
-        data["costs"] = json.loads(costs_path.read_text())
+    costs = load_costs(run_dir)
+    if costs is not None:
+        data["costs"] = costs
 
     # Load report
     report_path = run_dir / "report.md"
@@ -285,30 +379,10 @@ def load_run_data(run_id: str) -> dict:
         data["report"] = report_path.read_text()
 
     # Load stage outputs
-    stage_files = [
-        ("stage1", "stage1_company_context.json"),
-        ("stage2_internal", "stage2_internal_discovery.json"),
-        ("stage2_external", "stage2_external_discovery.json"),
-        ("stage2_external_light", "stage2_external_discovery_light.json"),
-        ("stage2_external_anchored", "stage2_external_discovery_anchored.json"),
-        ("stage2", "stage2_discovery.json"),
-        ("stage3_groups", "stage3_group_research.json"),
-        ("stage3_verticals", "stage3_verticals.json"),
-        ("stage3_5", "stage3_5_verification.json"),
-        ("stage3_75", "stage3_75_integration.json"),
-        ("stage4_claude", "stage4_claude_synthesis.json"),
-        ("stage4_gpt", "stage4_gpt_synthesis.json"),
-        ("stage5", "stage5_editorial_feedback.json"),
-        ("stage6", "stage6_final_report.json"),
-    ]
-
-    for key, filename in stage_files:
-        file_path = run_dir / filename
-        if file_path.exists():
-            try:
-                data["stages"][key] = json.loads(file_path.read_text())
-            except Exception:
-                pass
+    for key in STAGE_FILES:
+        stage_data = _read_json(_stage_path(run_dir, key))
+        if stage_data is not None:
+            data["stages"][key] = stage_data
 
     # Extract structured report data for frontend
     if "stage6" in data["stages"]:
@@ -351,13 +425,7 @@ def load_run_data(run_id: str) -> dict:
         }
 
     # Extract discovery threads for traceability (prefer review override)
-    s2 = None
-    review_path = run_dir / "stage2_discovery_review.json"
-    if review_path.exists():
-        try:
-            s2 = json.loads(review_path.read_text())
-        except Exception:
-            s2 = None
+    s2 = _read_json(run_dir / "stage2_discovery_review.json")
     if s2 is None and "stage2" in data["stages"]:
         s2 = data["stages"]["stage2"]
 
@@ -437,9 +505,49 @@ def load_run_data(run_id: str) -> dict:
             "full_report": s4g.get("full_report"),
         }
 
+    if not include_stages:
+        del data["stages"]
     return data
 
 
+def load_run_summary(run_id: str) -> dict:
+    """Load only what the run overview renders."""
+    run_dir = get_output_dir() / run_id
+    if not run_dir.exists():
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    summary: dict[str, Any] = {
+        "run_id": run_id,
+        "manifest": _read_json(run_dir / "manifest.json"),
+        "available_stages": [key for key, name in STAGE_FILES.items() if checkpoint_exists(run_dir, name)],
+        "has_report": (run_dir / "report.md").exists(),
+    }
+
+    costs = load_costs(run_dir)
+    if costs is not None:
+        summary["costs"] = {key: value for key, value in costs.items() if key != "records"}
+        summary["costs"]["record_count"] = len(costs.get("records", []))
+
+    s6 = load_checkpoint(run_dir, STAGE_FILES["stage6"], SUMMARY_SECTIONS["stage6"])
+    if s6:
+        summary["structured_report"] = {
+            "investment_view": s6.get("investment_view"),
+            "conviction": s6.get("conviction"),
+            "confidence": s6.get("overall_confidence"),
+            "thesis_summary": s6.get("thesis_summary"),
+        }
+
+    s5 = load_checkpoint(run_dir, STAGE_FILES["stage5"], SUMMARY_SECTIONS["stage5"])
+    if s5:
+        summary["editorial_feedback"] = {
+            "preferred_synthesis": s5.get("preferred_synthesis"),
+            "claude_score": s5.get("claude_score"),
+            "gpt_score": s5.get("gpt_score"),
+        }
+
+    return summary
+
+
 # ============== Pipeline Runner with Event Streaming ==============
 
 async def run_pipeline_with_events(session: RunSession, resume: bool = False):
@@ -587,7 +695,7 @@ async def run_pipeline_with_events(session: RunSession, resume: bool = False):
         # Update manifest
         if run_manifest:
             run_manifest.add_artifact("report", "report.md")
-            run_manifest.add_artifact("stage6_final_report", "stage6_final_report.json")
+            run_manifest.add_artifact("stage6_final_report", "stage6_final_report.ckpt")
             run_manifest.complete(success=True)
 
         # Write report
@@ -637,6 +745,7 @@ async def run_pipeline_with_events(session: RunSession, resume: bool = False):
         await asyncio.sleep(300)
         if session.run_id in active_runs:
             del active_runs[session.run_id]
+            session.broker.wake_all()
 
 
 # ============== API Routes ==============
@@ -652,9 +761,31 @@ async def root():
 
 
 @app.get("/runs")
-async def get_runs(limit: int = Query(50, ge=1, le=100)):
-    """List all runs (active and completed)."""
-    completed = list_completed_runs(limit)
+async def get_runs(
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    ticker: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    since: Optional[str] = Query(None, description="ISO date/time; runs started at or after"),
+    until: Optional[str] = Query(None, description="ISO date/time; runs started before"),
+    sort: str = Query("started_at", enum=list(SORTABLE_COLUMNS)),
+    order: str = Query("desc", enum=["asc", "desc"]),
+):
+    """List all runs (active and completed).
+
+    Completed runs come from the indexed run catalog and are paginated;
+    "total" is the number of catalogued runs matching the filters.
+    """
+    completed, total = list_completed_runs(
+        limit=limit,
+        offset=offset,
+        ticker=ticker,
+        status=status,
+        since=since,
+        until=until,
+        sort=sort,
+        descending=order == "desc",
+    )
 
     active = []
     for session in active_runs.values():
@@ -668,12 +799,21 @@ async def get_runs(limit: int = Query(50, ge=1, le=100)):
             "started_at": session.started_at.isoformat() if session.started_at else None,
         })
 
-    return {"completed": completed, "active": active}
+    return {"completed": completed, "active": active, "total": total}
 
 
 @app.get("/runs/{run_id}")
-async def get_run(run_id: str):
-    """Get details of a specific run."""
+async def get_run(
+    run_id: str,
+    request: Request,
+    stages: bool = Query(True, description="Include raw stage payloads"),
+):
+    """Get details of a specific run.
+
+    Completed runs are served with an ETag derived from the run directory's
+    file mtimes; unchanged runs answer If-None-Match with 304 without
+    reading any files, and serialized responses are cached.
+    """
     # Check active runs first
     if run_id in active_runs:
         session = active_runs[run_id]
@@ -704,7 +844,43 @@ async def get_run(run_id: str):
         return payload
 
     # Load from disk
-    return load_run_data(run_id)
+    run_dir = get_output_dir() / run_id
+    if not run_dir.is_dir():
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    etag = run_dir_etag(run_dir)
+    if not stages:
+        etag = etag[:-1] + '-nostages"'
+    if _etag_matches(request, etag):
+        return _json_response(request, etag, b"")
+
+    cache_key = f"{run_id}:{stages}"
+    cached = _run_response_cache.get(cache_key)
+    if cached and cached[0] == etag:
+        _run_response_cache.move_to_end(cache_key)
+    else:
+        body = json.dumps(load_run_data(run_id, include_stages=stages)).encode("utf-8")
+        cached = (etag, body, gzip.compress(body, compresslevel=GZIP_LEVEL))
+        _run_response_cache[cache_key] = cached
+        while len(_run_response_cache) > RUN_RESPONSE_CACHE_ENTRIES:
+            _run_response_cache.popitem(last=False)
+
+    gzipped = cached[2]
+    return _json_response(request, etag, cached[1], lambda: gzipped)
+
+
+@app.get("/runs/{run_id}/summary")
+async def get_run_summary(run_id: str, request: Request):
+    """Get the fields the run overview needs, without stage payloads."""
+    run_dir = get_output_dir() / run_id
+    if not run_dir.is_dir():
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    etag = run_dir_etag(run_dir)[:-1] + '-summary"'
+    if _etag_matches(request, etag):
+        return _json_response(request, etag, b"")
+    body = json.dumps(load_run_summary(run_id)).encode("utf-8")
+    return _json_response(request, etag, body)
 
 
 @app.get("/runs/{run_id}/report")
@@ -720,14 +896,23 @@ async def get_report(run_id: str):
 
 
 @app.get("/runs/{run_id}/stage/{stage}")
-async def get_stage_output(run_id: str, stage: str):
-    """Get output from a specific stage."""
-    data = load_run_data(run_id)
+async def get_stage_output(run_id: str, stage: str, request: Request):
+    """Get output from a specific stage.
+
+    Serves JSON stage files' bytes from the payload cache without parsing
+    (checkpoints are decoded once per cache entry), with ETag/If-None-Match
+    and gzip.
+    """
+    if stage not in STAGE_FILES:
+        raise HTTPException(status_code=404, detail=f"Stage '{stage}' not found")
 
-    if stage not in data.get("stages", {}):
+    entry = payload_cache.get(_stage_path(get_output_dir() / run_id, stage))
+    if entry is None:
         raise HTTPException(status_code=404, detail=f"Stage '{stage}' not found")
 
-    return data["stages"][stage]
+    if _etag_matches(request, entry.etag):
+        return _json_response(request, entry.etag, b"")
+    return _json_response(request, entry.etag, entry.json_bytes(), entry.gzipped)
 
 
 @app.post("/runs/{run_id}/evidence")
@@ -741,17 +926,23 @@ async def resolve_evidence(run_id: str, request: EvidenceRequest):
     if not ids:
         return {"items": []}
 
-    cards_map = _load_evidence_cards(run_dir)
-    items: list[dict[str, Any]] = []
-    missing: list[str] = []
-
-    for eid in ids:
-        card = cards_map.get(eid)
-        if card:
-            items.append({**card, "evidence_id": eid})
-        else:
-            missing.append(eid)
-
+    # Per-run cache of resolved items, invalidated when either store changes
+    signature = _evidence_signature(run_dir)
+    cached = _evidence_cache.get(run_id)
+    if cached is None or cached[0] != signature:
+        cached = (signature, {})
+        _evidence_cache[run_id] = cached
+    _evidence_cache.move_to_end(run_id)
+    while len(_evidence_cache) > EVIDENCE_CACHE_RUNS:
+        _evidence_cache.popitem(last=False)
+    resolved = cached[1]
+
+    unresolved = [eid for eid in dict.fromkeys(ids) if eid not in resolved]
+    cards_map = _load_evidence_cards(run_dir, unresolved)
+    for eid, card in cards_map.items():
+        resolved[eid] = {**card, "evidence_id": eid}
+
+    missing = [eid for eid in unresolved if eid not in cards_map]
     evidence_dir = run_dir / "evidence"
     if missing and evidence_dir.exists():
         store = EvidenceStore(evidence_dir)
@@ -760,7 +951,7 @@ async def resolve_evidence(run_id: str, request: EvidenceRequest):
             for eid in missing:
                 ev = await store.get(eid)
                 if ev:
-                    items.append({
+                    resolved[eid] = {
                         "evidence_id": eid,
                         "url": ev.source_url,
                         "title": ev.title,
@@ -768,21 +959,15 @@ async def resolve_evidence(run_id: str, request: EvidenceRequest):
                         "published_date": ev.published_at.isoformat() if ev.published_at else None,
                         "source": ev.source_url.split("/")[2] if ev.source_url else None,
                         "type": "raw_evidence",
-                    })
-                else:
-                    items.append({
-                        "evidence_id": eid,
-                        "type": "missing",
-                    })
+                    }
         finally:
             await store.close()
-    else:
-        for eid in missing:
-            items.append({
-                "evidence_id": eid,
-                "type": "missing",
-            })
+    for eid in missing:
+        resolved.setdefault(eid, {"evidence_id": eid, "type": "missing"})
 
+    # Cards first, then raw evidence and missing IDs, each in request order
+    items = [resolved[eid] for eid in ids if resolved[eid]["type"] == "evidence_card"]
+    items += [resolved[eid] for eid in ids if resolved[eid]["type"] != "evidence_card"]
     return {"items": items}
 
 
@@ -916,14 +1101,24 @@ async def delete_run(run_id: str):
     
     try:
         shutil.rmtree(run_dir)
+        with RunCatalog(get_output_dir()) as catalog:
+            catalog.remove(run_id)
         return {"message": "Run deleted", "run_id": run_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete run: {str(e)}")
 
 
 @app.get("/runs/{run_id}/stream")
-async def stream_run(run_id: str):
-    """Stream real-time events from a run via SSE."""
+async def stream_run(
+    run_id: str,
+    request: Request,
+    last_event_id: Optional[int] = Query(None, description="Replay events after this id"),
+):
+    """Stream real-time events from a run via SSE.
+
+    Reconnecting clients resume after the Last-Event-ID header (or the
+    last_event_id query parameter) from the run's replay buffer.
+    """
     if run_id not in active_runs:
         # Check if it's a completed run
         run_dir = get_output_dir() / run_id
@@ -931,8 +1126,12 @@ async def stream_run(run_id: str):
             raise HTTPException(status_code=400, detail="Run already completed - use GET /runs/{run_id} instead")
         raise HTTPException(status_code=404, detail="Run not found")
 
+    header_id = request.headers.get("last-event-id")
+    if header_id and header_id.isdigit():
+        last_event_id = int(header_id)
+
     return StreamingResponse(
-        event_generator(run_id),
+        event_generator(run_id, last_event_id),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -942,36 +1141,40 @@ async def stream_run(run_id: str):
     )
 
 
-async def event_generator(run_id: str) -> AsyncGenerator[str, None]:
-    """Generate SSE events for a pipeline run."""
+async def event_generator(
+    run_id: str,
+    last_event_id: Optional[int] = None,
+) -> AsyncGenerator[str, None]:
+    """Generate SSE events for a pipeline run from its broker."""
     session = active_runs.get(run_id)
     if not session:
         yield f"data: {json.dumps({'type': 'error', 'message': 'Run not found'})}\n\n"
         return
 
-    last_idx = 0
-
-    # Send initial state
-    yield f"data: {json.dumps({'type': 'connected', 'run_id': run_id, 'status': session.status})}\n\n"
-
-    while run_id in active_runs:
-        session = active_runs[run_id]
-        events = list(session.events)
-
-        # Send new events
-        while last_idx < len(events):
-            event = events[last_idx]
-            yield f"data: {json.dumps(asdict(event))}\n\n"
-            last_idx += 1
-
-        # Check if done
-        if session.status in ("complete", "error", "cancelled"):
-            yield f"data: {json.dumps({'type': 'stream_end', 'status': session.status, 'result': session.result, 'error': session.error})}\n\n"
-            break
-
-        await asyncio.sleep(0.3)
-
-    yield f"data: {json.dumps({'type': 'disconnected'})}\n\n"
+    subscriber = session.broker.subscribe(last_event_id)
+    try:
+        # Send initial state
+        yield f"data: {json.dumps({'type': 'connected', 'run_id': run_id, 'status': session.status})}\n\n"
+
+        while run_id in active_runs:
+            if not subscriber.pending:
+                try:
+                    await asyncio.wait_for(subscriber.wakeup.wait(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+
+            # Send new events (already serialized by the broker)
+            for published in subscriber.drain():
+                yield published.frame
+
+            # Check if done (status flips before the final event is published)
+            if session.status in TERMINAL_STATUSES and session.broker.finished() and not subscriber.pending:
+                yield f"data: {json.dumps({'type': 'stream_end', 'status': session.status, 'result': session.result, 'error': session.error})}\n\n"
+                break
+
+        yield f"data: {json.dumps({'type': 'disconnected'})}\n\n"
+    finally:
+        session.broker.unsubscribe(subscriber)
 
 
 # ============== Config/Prompt Endpoints ==============
@@ -18,6 +18,12 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from er.budget import load_costs
+from er.checkpoints import load_checkpoint
+
 
 def count_tokens(text: str) -> int:
     """Approximate token count (1 token ≈ 4 chars for English)."""
@@ -36,14 +42,8 @@ def format_cost(c: float) -> str:
     return f"${c:.4f}"
 
 
-def analyze_company_context(context_path: Path) -> dict:
+def analyze_company_context(data: dict) -> dict:
     """Break down the company context into components."""
-    if not context_path.exists():
-        return {}
-
-    with open(context_path) as f:
-        data = json.load(f)
-
     breakdown = {}
 
     # Profile
@@ -202,15 +202,6 @@ def print_context_breakdown(breakdown: dict):
     print()
 
 
-def analyze_costs(costs_path: Path) -> dict:
-    """Analyze costs.json."""
-    if not costs_path.exists():
-        return {}
-
-    with open(costs_path) as f:
-        return json.load(f)
-
-
 def print_agent_breakdown(costs: dict):
     """Print agent-by-agent breakdown."""
     if not costs.get("records"):
@@ -289,34 +280,33 @@ def main():
     print(f"{'#' * 100}")
 
     # 1. Company Context Breakdown
-    context_path = run_dir / "stage1_company_context.json"
-    if context_path.exists():
-        breakdown = analyze_company_context(context_path)
+    context = load_checkpoint(run_dir, "stage1_company_context")
+    if context is not None:
+        breakdown = analyze_company_context(context)
         print_context_breakdown(breakdown)
     else:
-        print("\nNo stage1_company_context.json found")
+        print("\nNo stage1_company_context checkpoint found")
 
     # 2. LLM Calls Analysis
-    costs_path = run_dir / "costs.json"
-    if costs_path.exists():
-        costs = analyze_costs(costs_path)
+    # Records come from the costs.jsonl ledger, not the costs.json snapshot
+    costs = load_costs(run_dir)
+    if costs is not None:
         print_agent_breakdown(costs)
         print_stage_summary(costs)
     else:
-        print("\nNo costs.json found")
+        print("\nNo cost data (costs.json / costs.jsonl) found")
 
     # 3. Summary
     print("\n" + "=" * 60)
     print("TOKEN FLOW SUMMARY")
     print("=" * 60)
 
-    if context_path.exists():
-        breakdown = analyze_company_context(context_path)
+    if context is not None:
+        breakdown = analyze_company_context(context)
         context_tokens = sum(b["tokens"] for b in breakdown.values())
         print(f"FMP Company Context:    {format_number(context_tokens):>15} tokens")
 
-    if costs_path.exists():
-        costs = analyze_costs(costs_path)
+    if costs is not None:
         print(f"Total LLM Input:        {format_number(costs.get('total_input_tokens', 0)):>15} tokens")
         print(f"Total LLM Output:       {format_number(costs.get('total_output_tokens', 0)):>15} tokens")
         print(f"Total Cost:             {format_cost(costs.get('total_cost_usd', 0)):>15}")
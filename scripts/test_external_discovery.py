@@ -23,6 +23,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from er.agents.base import AgentContext
 from er.agents.external_discovery import ExternalDiscoveryAgent, ExternalDiscoveryOutput
 from er.budget import BudgetTracker
+from er.checkpoints import load_checkpoint
 from er.config import Settings
 from er.evidence.store import EvidenceStore
 from er.llm.router import LLMRouter
@@ -31,13 +32,9 @@ from er.types import CompanyContext, RunState
 
 def load_company_context_from_checkpoint(run_dir: Path) -> CompanyContext:
     """Load CompanyContext from a checkpoint directory."""
-    context_file = run_dir / "stage1_company_context.json"
-
-    if not context_file.exists():
-        raise FileNotFoundError(f"No company context found at {context_file}")
-
-    with open(context_file) as f:
-        data = json.load(f)
+    data = load_checkpoint(run_dir, "stage1_company_context")
+    if data is None:
+        raise FileNotFoundError(f"No company context checkpoint found in {run_dir}")
 
     # Convert fetched_at string to datetime
     if isinstance(data.get("fetched_at"), str):
@@ -27,6 +27,8 @@ from er.workspace.store import WorkspaceStore
 
 if TYPE_CHECKING:
     from er.config import Settings
+    from er.data.fmp_client import FMPClient
+    from er.llm.client_pool import ProviderClientPool
     from er.types import RunState
 
 logger = get_logger(__name__)
@@ -37,6 +39,8 @@ class AgentContext:
     """Runtime context for agents.
 
     Contains shared resources that all agents need access to.
+    client_pool and fmp_client are set when several runs share one data
+    layer (batch mode); agents use them instead of creating their own.
     """
 
     settings: Settings
@@ -44,6 +48,8 @@ class AgentContext:
     evidence_store: EvidenceStore
     budget_tracker: BudgetTracker
     workspace_store: WorkspaceStore | None = None
+    client_pool: ProviderClientPool | None = None
+    fmp_client: FMPClient | None = None
 
 
 class Agent(ABC):
@@ -112,6 +118,17 @@ class Agent(ABC):
         """Get workspace store (may be None if not configured)."""
         return self.context.workspace_store
 
+    @property
+    def client_pool(self) -> ProviderClientPool | None:
+        """Get shared provider client pool (None outside batch mode)."""
+        return self.context.client_pool
+
+    async def _close_client(self, client: Any) -> None:
+        """Close a provider client unless it is owned by the shared pool."""
+        if self.client_pool is not None and self.client_pool.owns(client):
+            return
+        await client.close()
+
     def log_info(self, message: str, **kwargs: Any) -> None:
         """Log info message with agent context."""
         self._logger.info(message, agent=self.name, **kwargs)
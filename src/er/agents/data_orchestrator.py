@@ -48,11 +48,15 @@ class DataOrchestratorAgent(Agent):
         return "Fetch and organize all financial data from FMP API"
 
     async def _get_fmp_client(self) -> FMPClient:
-        """Get or create FMP client."""
+        """Get or create FMP client (the shared one in batch mode)."""
+        if self.context.fmp_client is not None:
+            return self.context.fmp_client
         if self._fmp_client is None:
             self._fmp_client = FMPClient(
                 evidence_store=self.evidence_store,
                 api_key=self.settings.FMP_API_KEY,
+                max_concurrency=self.settings.FMP_MAX_CONCURRENCY,
+                requests_per_minute=self.settings.FMP_REQUESTS_PER_MINUTE,
             )
         return self._fmp_client
 
@@ -32,6 +32,7 @@ from er.utils.dates import (
     format_quarter,
     format_quarters_for_prompt,
 )
+from er.workspace.store import ArtifactInput
 
 
 # Discovery prompt template - 7 Mandatory Lenses
@@ -545,9 +546,12 @@ class DiscoveryAgent(Agent):
     async def _get_openai_client(self) -> OpenAIClient:
         """Get or create OpenAI client."""
         if self._openai_client is None:
-            self._openai_client = OpenAIClient(
-                api_key=self.settings.OPENAI_API_KEY,
-            )
+            if self.client_pool is not None:
+                self._openai_client = self.client_pool.openai()
+            else:
+                self._openai_client = OpenAIClient(
+                    api_key=self.settings.OPENAI_API_KEY,
+                )
         return self._openai_client
 
     async def run(
@@ -644,14 +648,16 @@ class DiscoveryAgent(Agent):
 
         # Store ThreadBriefs in WorkspaceStore for downstream stages
         if self.workspace_store and discovery_output.thread_briefs:
-            for brief in discovery_output.thread_briefs:
-                self.workspace_store.put_artifact(
+            self.workspace_store.put_artifacts(
+                ArtifactInput(
                     artifact_type="thread_brief",
                     producer=self.name,
                     json_obj=brief.to_dict(),
                     summary=f"ThreadBrief for {brief.thread_id}: {brief.rationale[:100]}...",
                     evidence_ids=brief.key_evidence_ids,
                 )
+                for brief in discovery_output.thread_briefs
+            )
             self.log_info(
                 "Stored thread briefs",
                 count=len(discovery_output.thread_briefs),
@@ -939,5 +945,5 @@ class DiscoveryAgent(Agent):
     async def close(self) -> None:
         """Close any open clients."""
         if self._openai_client:
-            await self._openai_client.close()
+            await self._close_client(self._openai_client)
             self._openai_client = None
@@ -26,6 +26,7 @@ from er.types import (
     ThreadType,
     generate_id,
 )
+from er.workspace.store import ArtifactInput
 
 
 class DiscoveryMerger(Agent):
@@ -299,15 +300,17 @@ class DiscoveryMerger(Agent):
         # Store merged ThreadBriefs in WorkspaceStore
         if self.workspace_store:
             # Store only the newly created briefs (externally-added threads)
-            for brief in merged_thread_briefs:
-                if brief not in internal.thread_briefs:
-                    self.workspace_store.put_artifact(
-                        artifact_type="thread_brief",
-                        producer=self.name,
-                        json_obj=brief.to_dict(),
-                        summary=f"Merged ThreadBrief: {brief.rationale[:100]}...",
-                        evidence_ids=brief.key_evidence_ids,
-                    )
+            self.workspace_store.put_artifacts(
+                ArtifactInput(
+                    artifact_type="thread_brief",
+                    producer=self.name,
+                    json_obj=brief.to_dict(),
+                    summary=f"Merged ThreadBrief: {brief.rationale[:100]}...",
+                    evidence_ids=brief.key_evidence_ids,
+                )
+                for brief in merged_thread_briefs
+                if brief not in internal.thread_briefs
+            )
 
         self.log_info(
             "Merge complete",
@@ -30,6 +30,7 @@ from er.types import (
     ThreadType,
     generate_id,
 )
+from er.workspace.store import ArtifactInput
 
 
 # External Discovery prompts - now receives pre-fetched EvidenceCards
@@ -1120,14 +1121,16 @@ Return ONLY JSON.
         # Generate and store ThreadBriefs
         thread_briefs = self.generate_thread_briefs(output)
         if self.workspace_store and thread_briefs:
-            for brief in thread_briefs:
-                self.workspace_store.put_artifact(
+            self.workspace_store.put_artifacts(
+                ArtifactInput(
                     artifact_type="thread_brief",
                     producer=self.name,
                     json_obj=brief.to_dict(),
                     summary=f"External ThreadBrief: {brief.rationale[:100]}...",
                     evidence_ids=brief.key_evidence_ids,
                 )
+                for brief in thread_briefs
+            )
             self.log_info(
                 "Stored external thread briefs",
                 count=len(thread_briefs),
@@ -298,9 +298,12 @@ class JudgeAgent(Agent):
     async def _get_anthropic_client(self) -> AnthropicClient:
         """Get or create Anthropic client."""
         if self._anthropic_client is None:
-            self._anthropic_client = AnthropicClient(
-                api_key=self.settings.ANTHROPIC_API_KEY,
-            )
+            if self.client_pool is not None:
+                self._anthropic_client = self.client_pool.anthropic()
+            else:
+                self._anthropic_client = AnthropicClient(
+                    api_key=self.settings.ANTHROPIC_API_KEY,
+                )
         return self._anthropic_client
 
     async def run(
@@ -580,5 +583,5 @@ class JudgeAgent(Agent):
     async def close(self) -> None:
         """Close any open clients."""
         if self._anthropic_client:
-            await self._anthropic_client.close()
+            await self._close_client(self._anthropic_client)
             self._anthropic_client = None
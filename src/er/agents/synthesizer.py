@@ -16,6 +16,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from er.agents.base import Agent, AgentContext
+from er.checkpoints import write_checkpoint
 from er.llm.anthropic_client import AnthropicClient
 from er.llm.base import LLMRequest
 from er.llm.openai_client import OpenAIClient
@@ -280,17 +281,23 @@ class SynthesizerAgent(Agent):
     async def _get_anthropic_client(self) -> AnthropicClient:
         """Get or create Anthropic client."""
         if self._anthropic_client is None:
-            self._anthropic_client = AnthropicClient(
-                api_key=self.settings.ANTHROPIC_API_KEY,
-            )
+            if self.client_pool is not None:
+                self._anthropic_client = self.client_pool.anthropic()
+            else:
+                self._anthropic_client = AnthropicClient(
+                    api_key=self.settings.ANTHROPIC_API_KEY,
+                )
         return self._anthropic_client
 
     async def _get_openai_client(self) -> OpenAIClient:
         """Get or create OpenAI client."""
         if self._openai_client is None:
-            self._openai_client = OpenAIClient(
-                api_key=self.settings.OPENAI_API_KEY,
-            )
+            if self.client_pool is not None:
+                self._openai_client = self.client_pool.openai()
+            else:
+                self._openai_client = OpenAIClient(
+                    api_key=self.settings.OPENAI_API_KEY,
+                )
         return self._openai_client
 
     async def run(
@@ -355,7 +362,6 @@ class SynthesizerAgent(Agent):
         # Run both syntheses in parallel, save each as it completes
         self.log_info("Running Claude and GPT syntheses in parallel", ticker=run_state.ticker)
 
-        import json
         from pathlib import Path
 
         claude_task = asyncio.create_task(self._run_claude_synthesis(prompt, company_context))
@@ -383,28 +389,26 @@ class SynthesizerAgent(Agent):
                         claude_synthesis = result
                         self.log_info("Claude synthesis completed, saving immediately")
                         # Save Claude synthesis immediately
-                        claude_file = output_dir / "stage4_claude_synthesis.json"
-                        claude_file.write_text(json.dumps({
+                        write_checkpoint(output_dir, "stage4_claude_synthesis", {
                             "full_report": result.full_report,
                             "investment_view": result.investment_view,
                             "conviction": result.conviction,
                             "overall_confidence": result.overall_confidence,
                             "thesis_summary": result.thesis_summary,
                             "synthesizer_model": result.synthesizer_model,
-                        }, indent=2))
+                        }, export_json=self.settings.CHECKPOINT_JSON_EXPORT)
                     else:
                         gpt_synthesis = result
                         self.log_info("GPT synthesis completed, saving immediately")
                         # Save GPT synthesis immediately
-                        gpt_file = output_dir / "stage4_gpt_synthesis.json"
-                        gpt_file.write_text(json.dumps({
+                        write_checkpoint(output_dir, "stage4_gpt_synthesis", {
                             "full_report": result.full_report,
                             "investment_view": result.investment_view,
                             "conviction": result.conviction,
                             "overall_confidence": result.overall_confidence,
                             "thesis_summary": result.thesis_summary,
                             "synthesizer_model": result.synthesizer_model,
-                        }, indent=2))
+                        }, export_json=self.settings.CHECKPOINT_JSON_EXPORT)
                 except Exception as e:
                     if task == claude_task:
                         self.log_error("Claude synthesis failed", error=str(e))
@@ -973,8 +977,8 @@ You must address the following critical issues:
     async def close(self) -> None:
         """Close any open clients."""
         if self._anthropic_client:
-            await self._anthropic_client.close()
+            await self._close_client(self._anthropic_client)
             self._anthropic_client = None
         if self._openai_client:
-            await self._openai_client.close()
+            await self._close_client(self._openai_client)
             self._openai_client = None
@@ -7,13 +7,23 @@ significantly smaller than full transcripts while preserving key information.
 
 This runs after Data Orchestrator but before Discovery, allowing downstream
 agents to use compact, structured transcript data instead of raw text.
+
+Transcripts are extracted concurrently (bounded, with per-transcript
+retries) and results keep input order. Extracts are cached on disk by a
+hash of the prompt version, model and transcript text, so re-running a
+ticker does not re-extract unchanged transcripts.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import re
-from typing import Any
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+import orjson
 
 from er.agents.base import Agent, AgentContext
 from er.llm.base import LLMRequest
@@ -21,8 +31,21 @@ from er.llm.openai_client import OpenAIClient
 from er.logging import get_logger
 from er.types import RunState, TranscriptExtract
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 logger = get_logger(__name__)
 
+EXTRACTION_MODEL = "gpt-5.2-mini"
+
+# Bump whenever EXTRACTION_PROMPT or the parsing changes to invalidate cached extracts
+EXTRACTION_PROMPT_VERSION = "1"
+
+# Concurrency and retry settings for extraction requests
+EXTRACTION_MAX_CONCURRENCY = 4
+EXTRACTION_MAX_ATTEMPTS = 3
+EXTRACTION_RETRY_BASE_DELAY = 1.0  # Seconds, doubled per attempt
+
 # Prompt for transcript extraction
 EXTRACTION_PROMPT = """You are a financial analyst assistant specializing in extracting key information from earnings call transcripts.
 
@@ -81,10 +104,24 @@ class TranscriptExtractorAgent(Agent):
     objects that are ~10x smaller than raw transcripts.
     """
 
-    def __init__(self, context: AgentContext) -> None:
-        """Initialize the transcript extractor agent."""
+    def __init__(
+        self,
+        context: AgentContext,
+        max_concurrency: int = EXTRACTION_MAX_CONCURRENCY,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """Initialize the transcript extractor agent.
+
+        Args:
+            context: Runtime context with shared resources.
+            max_concurrency: Maximum concurrent extraction requests.
+            cache_dir: Directory for cached extracts
+                (default: CACHE_DIR/transcript_extracts).
+        """
         super().__init__(context)
         self._openai_client: OpenAIClient | None = None
+        self._max_concurrency = max(1, max_concurrency)
+        self._cache_dir = cache_dir or self.settings.CACHE_DIR / "transcript_extracts"
 
     @property
     def name(self) -> str:
@@ -97,9 +134,12 @@ class TranscriptExtractorAgent(Agent):
     async def _get_openai_client(self) -> OpenAIClient:
         """Get or create OpenAI client."""
         if self._openai_client is None:
-            self._openai_client = OpenAIClient(
-                api_key=self.settings.openai_api_key,
-            )
+            if self.client_pool is not None:
+                self._openai_client = self.client_pool.openai()
+            else:
+                self._openai_client = OpenAIClient(
+                    api_key=self.settings.openai_api_key,
+                )
         return self._openai_client
 
     async def run(
@@ -126,21 +166,25 @@ class TranscriptExtractorAgent(Agent):
             transcript_count=len(transcripts),
         )
 
-        extracts = []
-        for transcript in transcripts:
-            try:
-                extract = await self._extract_single(run_state, transcript)
-                extracts.append(extract)
-            except Exception as e:
-                self.log_error(
-                    "Failed to extract transcript",
-                    ticker=run_state.ticker,
-                    quarter=transcript.get("quarter"),
-                    year=transcript.get("year"),
-                    error=str(e),
-                )
-                # Create minimal fallback extract
-                extracts.append(self._create_fallback_extract(transcript))
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def extract_one(transcript: dict[str, Any]) -> TranscriptExtract:
+            async with semaphore:
+                try:
+                    return await self._extract_with_retries(run_state, transcript)
+                except Exception as e:
+                    self.log_error(
+                        "Failed to extract transcript",
+                        ticker=run_state.ticker,
+                        quarter=transcript.get("quarter"),
+                        year=transcript.get("year"),
+                        error=str(e),
+                    )
+                    # Create minimal fallback extract
+                    return self._create_fallback_extract(transcript)
+
+        # gather preserves input order
+        extracts = list(await asyncio.gather(*(extract_one(t) for t in transcripts)))
 
         self.log_info(
             "Transcript extraction complete",
@@ -150,6 +194,58 @@ class TranscriptExtractorAgent(Agent):
 
         return extracts
 
+    async def _extract_with_retries(
+        self,
+        run_state: RunState,
+        transcript: dict[str, Any],
+    ) -> TranscriptExtract:
+        """Extract one transcript, retrying failed requests with backoff."""
+        attempt = 1
+        while True:
+            try:
+                return await self._extract_single(run_state, transcript)
+            except Exception as e:
+                if attempt >= EXTRACTION_MAX_ATTEMPTS:
+                    raise
+                delay = EXTRACTION_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                self.log_warning(
+                    "Transcript extraction failed, retrying",
+                    quarter=transcript.get("quarter"),
+                    year=transcript.get("year"),
+                    attempt=attempt,
+                    retry_in_seconds=delay,
+                    error=str(e),
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _cache_key(self, prompt: str) -> str:
+        """Cache key for an extraction prompt under the current version and model."""
+        key_str = f"{EXTRACTION_PROMPT_VERSION}:{EXTRACTION_MODEL}:{prompt}"
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def _read_cache(self, cache_key: str) -> TranscriptExtract | None:
+        """Read a cached extract."""
+        cache_file = self._cache_dir / f"{cache_key}.json"
+        if not cache_file.exists():
+            return None
+        try:
+            return TranscriptExtract(**orjson.loads(cache_file.read_bytes()))
+        except (orjson.JSONDecodeError, TypeError) as e:
+            self.log_warning("Ignoring unreadable cached extract", cache_key=cache_key, error=str(e))
+            return None
+
+    def _write_cache(self, cache_key: str, extract: TranscriptExtract) -> None:
+        """Write an extract to the cache."""
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = self._cache_dir / f"{cache_key}.json"
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_bytes(orjson.dumps(asdict(extract)))
+            tmp_file.replace(cache_file)
+        except OSError as e:
+            self.log_warning("Failed to cache extract", cache_key=cache_key, error=str(e))
+
     async def _extract_single(
         self,
         run_state: RunState,
@@ -171,11 +267,17 @@ class TranscriptExtractorAgent(Agent):
             transcript_text=text,
         )
 
+        cache_key = self._cache_key(prompt)
+        cached = self._read_cache(cache_key)
+        if cached is not None:
+            self.log_info("Using cached transcript extract", quarter=quarter, year=year)
+            return cached
+
         client = await self._get_openai_client()
 
         request = LLMRequest(
             messages=[{"role": "user", "content": prompt}],
-            model="gpt-5.2-mini",
+            model=EXTRACTION_MODEL,
             temperature=0.1,  # Low temp for consistency
             max_tokens=4000,  # Plenty for JSON response
         )
@@ -185,9 +287,9 @@ class TranscriptExtractorAgent(Agent):
         # Track usage
         self.budget_tracker.record_usage(
             provider="openai",
-            model="gpt-5.2-mini",
-            input_tokens=response.usage.get("input_tokens", 0),
-            output_tokens=response.usage.get("output_tokens", 0),
+            model=EXTRACTION_MODEL,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
             agent=self.name,
             phase="transcript_extraction",
         )
@@ -195,7 +297,7 @@ class TranscriptExtractorAgent(Agent):
         # Parse JSON response
         parsed = self._parse_response(response.content, transcript)
 
-        return TranscriptExtract(
+        extract = TranscriptExtract(
             quarter=f"Q{quarter} {year}",
             year=year,
             quarter_num=quarter,
@@ -210,6 +312,12 @@ class TranscriptExtractorAgent(Agent):
             raw_excerpt=text[:2000],  # Keep first 2000 chars as fallback
         )
 
+        # Unparseable responses are not cached so a later run can retry them
+        if parsed:
+            self._write_cache(cache_key, extract)
+
+        return extract
+
     def _parse_response(
         self,
         content: str,
@@ -253,5 +361,5 @@ class TranscriptExtractorAgent(Agent):
     async def close(self) -> None:
         """Close resources."""
         if self._openai_client:
-            await self._openai_client.close()
+            await self._close_client(self._openai_client)
             self._openai_client = None
@@ -35,6 +35,7 @@ from er.utils.dates import (
     format_quarter,
     format_quarters_for_prompt,
 )
+from er.workspace.store import ArtifactInput
 
 
 # Deep Research prompt template - handles multiple verticals in a research group
@@ -333,9 +334,12 @@ class VerticalAnalystAgent(Agent):
     async def _get_openai_client(self) -> OpenAIClient:
         """Get or create OpenAI client for Deep Research."""
         if self._openai_client is None:
-            self._openai_client = OpenAIClient(
-                api_key=self.settings.OPENAI_API_KEY,
-            )
+            if self.client_pool is not None:
+                self._openai_client = self.client_pool.openai()
+            else:
+                self._openai_client = OpenAIClient(
+                    api_key=self.settings.OPENAI_API_KEY,
+                )
         return self._openai_client
 
     def _get_thread_evidence_ids(
@@ -540,15 +544,17 @@ class VerticalAnalystAgent(Agent):
 
         # Store VerticalDossiers in WorkspaceStore for downstream stages
         if self.workspace_store:
-            for va in group_output.vertical_analyses:
-                if va.dossier:
-                    self.workspace_store.put_artifact(
-                        artifact_type="vertical_dossier",
-                        producer=self.name,
-                        json_obj=va.dossier.to_dict(),
-                        summary=f"Dossier for {va.vertical_name}: {len(va.facts)} facts",
-                        evidence_ids=va.evidence_ids,
-                    )
+            self.workspace_store.put_artifacts(
+                ArtifactInput(
+                    artifact_type="vertical_dossier",
+                    producer=self.name,
+                    json_obj=va.dossier.to_dict(),
+                    summary=f"Dossier for {va.vertical_name}: {len(va.facts)} facts",
+                    evidence_ids=va.evidence_ids,
+                )
+                for va in group_output.vertical_analyses
+                if va.dossier
+            )
             total_facts = sum(len(va.facts) for va in group_output.vertical_analyses)
             self.log_info(
                 "Stored vertical dossiers",
@@ -1035,5 +1041,5 @@ class VerticalAnalystAgent(Agent):
     async def close(self) -> None:
         """Close any open clients."""
         if self._openai_client:
-            await self._openai_client.close()
+            await self._close_client(self._openai_client)
             self._openai_client = None
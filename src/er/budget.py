@@ -2,20 +2,34 @@
 Budget tracking for the equity research system.
 
 Tracks token usage and costs across providers, agents, and phases.
+
+Each LLM call is appended as one line to an append-only JSONL ledger
+(costs.jsonl). costs.json holds a periodic snapshot of the aggregated
+breakdowns; the ledger is the source of truth for individual records.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
 
 import orjson
 
 from er.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
 logger = get_logger(__name__)
 
+# Aggregated snapshot and append-only usage ledger, relative to the run directory
+COSTS_SNAPSHOT_FILENAME = "costs.json"
+COSTS_LEDGER_FILENAME = "costs.jsonl"
+
+# Records appended between costs.json snapshots
+SNAPSHOT_INTERVAL = 25
+
 
 # Cost per million tokens (as of January 2026)
 # Format: (input_cost_per_million, output_cost_per_million)
@@ -121,6 +135,93 @@ class UsageRecord:
     agent: str
     phase: str
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict for JSON serialization."""
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cost_usd": self.cost_usd,
+            "agent": self.agent,
+            "phase": self.phase,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UsageRecord:
+        """Create from dict."""
+        return cls(
+            provider=data["provider"],
+            model=data["model"],
+            input_tokens=data["input_tokens"],
+            output_tokens=data["output_tokens"],
+            cost_usd=data["cost_usd"],
+            agent=data["agent"],
+            phase=data["phase"],
+        )
+
+
+def iter_usage_records(run_dir: Path) -> Iterator[UsageRecord]:
+    """Stream a run's usage records, oldest first.
+
+    Reads the JSONL ledger line by line. Runs written before the ledger
+    existed fall back to the records embedded in costs.json. A torn final
+    line (e.g. from a crash mid-write) is skipped.
+
+    Args:
+        run_dir: Run output directory.
+
+    Yields:
+        UsageRecord for each LLM call.
+    """
+    ledger_path = run_dir / COSTS_LEDGER_FILENAME
+    if ledger_path.exists():
+        with ledger_path.open("rb") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield UsageRecord.from_dict(orjson.loads(line))
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    logger.warning(
+                        "Skipping unreadable cost ledger line",
+                        path=str(ledger_path),
+                        line=line_number,
+                    )
+        return
+
+    snapshot_path = run_dir / COSTS_SNAPSHOT_FILENAME
+    if snapshot_path.exists():
+        data = orjson.loads(snapshot_path.read_bytes())
+        for r in data.get("records", []):
+            yield UsageRecord.from_dict(r)
+
+
+def load_costs(run_dir: Path) -> dict[str, Any] | None:
+    """Load a run's cost breakdown including its records.
+
+    Args:
+        run_dir: Run output directory.
+
+    Returns:
+        Dict in the BudgetTracker.to_dict() shape, or None if the run has
+        no cost data.
+    """
+    snapshot_path = run_dir / COSTS_SNAPSHOT_FILENAME
+    ledger_path = run_dir / COSTS_LEDGER_FILENAME
+    if not snapshot_path.exists() and not ledger_path.exists():
+        return None
+
+    budget_limit = 0.0
+    if snapshot_path.exists():
+        budget_limit = orjson.loads(snapshot_path.read_bytes()).get("budget_limit", 0.0)
+
+    # Replay the ledger so totals include calls made since the last snapshot
+    tracker = BudgetTracker(budget_limit=budget_limit)
+    for record in iter_usage_records(run_dir):
+        tracker._apply(record)
+    return tracker.to_dict()
+
 
 @dataclass
 class BudgetTracker:
@@ -130,10 +231,15 @@ class BudgetTracker:
     - Provider (openai, anthropic, gemini)
     - Agent
     - Phase
+
+    When output_dir is set, every call is appended to costs.jsonl and
+    costs.json is rewritten only every snapshot_interval calls. Call close()
+    at the end of a run to write the final snapshot.
     """
 
     budget_limit: float
     output_dir: Path | None = None
+    snapshot_interval: int = SNAPSHOT_INTERVAL
 
     # Usage tracking
     total_input_tokens: int = 0
@@ -149,6 +255,11 @@ class BudgetTracker:
     # Detailed records
     records: list[UsageRecord] = field(default_factory=list)
 
+    # Ledger append handle and records written since the last snapshot
+    _ledger: IO[bytes] | None = field(default=None, init=False, repr=False, compare=False)
+    _unsnapshotted: int = field(default=0, init=False, repr=False, compare=False)
+    _snapshotted: bool = field(default=False, init=False, repr=False, compare=False)
+
     def record_usage(
         self,
         provider: str,
@@ -172,30 +283,16 @@ class BudgetTracker:
             Cost in USD for this call.
         """
         cost = calculate_cost(model, input_tokens, output_tokens)
-
-        # Update totals
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        self.total_cost_usd += cost
-
-        # Update breakdowns
-        self.by_provider[provider] = self.by_provider.get(provider, 0.0) + cost
-        self.by_agent[agent] = self.by_agent.get(agent, 0.0) + cost
-        self.by_phase[phase] = self.by_phase.get(phase, 0.0) + cost
-        self.by_model[model] = self.by_model.get(model, 0.0) + cost
-
-        # Store record
-        self.records.append(
-            UsageRecord(
-                provider=provider,
-                model=model,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                cost_usd=cost,
-                agent=agent,
-                phase=phase,
-            )
+        record = UsageRecord(
+            provider=provider,
+            model=model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=cost,
+            agent=agent,
+            phase=phase,
         )
+        self._apply(record)
 
         logger.debug(
             "Recorded usage",
@@ -206,12 +303,41 @@ class BudgetTracker:
             total=f"${self.total_cost_usd:.4f}",
         )
 
-        # Save to file if output_dir set
+        # Append to the ledger; snapshot the breakdowns periodically
         if self.output_dir:
-            self._save()
+            self._append(record)
+            if not self._snapshotted or self._unsnapshotted >= self.snapshot_interval:
+                self._save()
 
         return cost
 
+    def _apply(self, record: UsageRecord) -> None:
+        """Add a record to the totals, breakdowns and record list."""
+        cost = record.cost_usd
+
+        # Update totals
+        self.total_input_tokens += record.input_tokens
+        self.total_output_tokens += record.output_tokens
+        self.total_cost_usd += cost
+
+        # Update breakdowns
+        self.by_provider[record.provider] = self.by_provider.get(record.provider, 0.0) + cost
+        self.by_agent[record.agent] = self.by_agent.get(record.agent, 0.0) + cost
+        self.by_phase[record.phase] = self.by_phase.get(record.phase, 0.0) + cost
+        self.by_model[record.model] = self.by_model.get(record.model, 0.0) + cost
+
+        self.records.append(record)
+
+    def _append(self, record: UsageRecord) -> None:
+        """Append one record to the JSONL ledger."""
+        if self._ledger is None:
+            assert self.output_dir is not None
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._ledger = (self.output_dir / COSTS_LEDGER_FILENAME).open("ab")
+        self._ledger.write(orjson.dumps(record.to_dict()) + b"\n")
+        self._ledger.flush()
+        self._unsnapshotted += 1
+
     def get_remaining(self) -> float:
         """Get remaining budget.
 
@@ -246,13 +372,16 @@ class BudgetTracker:
         """
         return self.total_cost_usd > self.budget_limit
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, include_records: bool = True) -> dict[str, Any]:
         """Serialize to dict for JSON.
 
+        Args:
+            include_records: Include the per-call records.
+
         Returns:
             Dict representation.
         """
-        return {
+        data: dict[str, Any] = {
             "budget_limit": self.budget_limit,
             "total_cost_usd": self.total_cost_usd,
             "remaining": self.get_remaining(),
@@ -263,42 +392,89 @@ class BudgetTracker:
             "by_agent": dict(self.by_agent),
             "by_phase": dict(self.by_phase),
             "by_model": dict(self.by_model),
-            "records": [
-                {
-                    "provider": r.provider,
-                    "model": r.model,
-                    "input_tokens": r.input_tokens,
-                    "output_tokens": r.output_tokens,
-                    "cost_usd": r.cost_usd,
-                    "agent": r.agent,
-                    "phase": r.phase,
-                }
-                for r in self.records
-            ],
         }
+        if include_records:
+            data["records"] = [r.to_dict() for r in self.records]
+        return data
 
     def _save(self) -> None:
-        """Save costs to file."""
+        """Write the aggregated snapshot to costs.json.
+
+        Records are not embedded; they live in the ledger.
+        """
         if not self.output_dir:
             return
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        costs_path = self.output_dir / "costs.json"
+        costs_path = self.output_dir / COSTS_SNAPSHOT_FILENAME
+        snapshot = self.to_dict(include_records=False)
+        snapshot["ledger"] = COSTS_LEDGER_FILENAME
+        snapshot["record_count"] = len(self.records)
+
+        tmp_path = costs_path.with_suffix(".json.tmp")
+        with tmp_path.open("wb") as f:
+            f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+        tmp_path.replace(costs_path)
+
+        self._unsnapshotted = 0
+        self._snapshotted = True
+
+    def close(self) -> None:
+        """Write the final snapshot and close the ledger."""
+        if self._unsnapshotted:
+            self._save()
+        if self._ledger is not None:
+            self._ledger.close()
+            self._ledger = None
+
+    @classmethod
+    def resume(cls, output_dir: Path, budget_limit: float) -> BudgetTracker:
+        """Rebuild a tracker from a run directory's cost ledger.
+
+        Runs written before the ledger existed are migrated: the records in
+        their costs.json are copied into a new ledger.
+
+        Args:
+            output_dir: Run output directory.
+            budget_limit: Budget limit in USD.
 
-        with open(costs_path, "wb") as f:
-            f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        Returns:
+            BudgetTracker that continues appending to the same ledger.
+        """
+        tracker = cls(budget_limit=budget_limit, output_dir=output_dir)
+        migrate = not (output_dir / COSTS_LEDGER_FILENAME).exists()
+        for record in iter_usage_records(output_dir):
+            tracker._apply(record)
+            if migrate:
+                tracker._append(record)
+
+        if tracker.records:
+            tracker._save()
+            logger.info(
+                "Resumed budget tracker from ledger",
+                records=len(tracker.records),
+                total=f"${tracker.total_cost_usd:.4f}",
+            )
+        return tracker
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> BudgetTracker:
+    def from_dict(cls, data: dict[str, Any], output_dir: Path | None = None) -> BudgetTracker:
         """Load from dict.
 
+        A costs.json snapshot carries no records; when output_dir is given
+        the state is rebuilt from that directory's ledger instead.
+
         Args:
             data: Dict representation.
+            output_dir: Run directory holding the ledger, if any.
 
         Returns:
             BudgetTracker instance.
         """
-        tracker = cls(budget_limit=data["budget_limit"])
+        if "records" not in data and output_dir is not None:
+            return cls.resume(output_dir, data["budget_limit"])
+
+        tracker = cls(budget_limit=data["budget_limit"], output_dir=output_dir)
         tracker.total_cost_usd = data.get("total_cost_usd", 0.0)
         tracker.total_input_tokens = data.get("total_input_tokens", 0)
         tracker.total_output_tokens = data.get("total_output_tokens", 0)
@@ -308,16 +484,6 @@ class BudgetTracker:
         tracker.by_model = data.get("by_model", {})
 
         for r in data.get("records", []):
-            tracker.records.append(
-                UsageRecord(
-                    provider=r["provider"],
-                    model=r["model"],
-                    input_tokens=r["input_tokens"],
-                    output_tokens=r["output_tokens"],
-                    cost_usd=r["cost_usd"],
-                    agent=r["agent"],
-                    phase=r["phase"],
-                )
-            )
+            tracker.records.append(UsageRecord.from_dict(r))
 
         return tracker
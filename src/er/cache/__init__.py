@@ -4,3 +4,8 @@ Cache package for data persistence.
 This package provides caching layers for:
 - File cache (file_cache.py): Blob storage for large files (PDFs, HTML, etc.)
 """
+
+from er.cache.base import CacheProtocol
+from er.cache.file_cache import BlobReference, FileCache
+
+__all__ = ["BlobReference", "CacheProtocol", "FileCache"]
@@ -1,20 +1,563 @@
 """
 File-based blob cache for large content.
 
-This module will implement:
-- FileCache: File system-based cache for large blobs
-  - Content-addressed storage using SHA-256 hashes
-  - Automatic deduplication
-  - Metadata sidecar files (JSON)
-  - Compression support (gzip, zstd)
-
-- BlobReference: Lightweight reference to cached blob
-  - Hash, size, content_type, created_at
-  - Methods to read/stream content
-
-Features:
-- LRU eviction based on total size
-- Cleanup of orphaned files
-- Atomic writes to prevent corruption
-- Support for streaming large files
+Content-addressed storage for raw HTML, filings, PDFs and API payloads:
+- Blobs are addressed by the SHA-256 of their uncompressed content, stored
+  under {root}/{hash[:2]}/{hash}[.zst|.gz], so identical content is stored once
+- Compression with zstd (if the `zstandard` package is installed) or gzip;
+  already-compressed types (PDF, images, archives) are stored raw
+- Atomic writes (temp file + rename); a blob is committed once its JSON
+  metadata sidecar ({hash}.json) exists
+- Size-bounded LRU eviction: reads touch the blob's mtime, eviction removes
+  least recently used blobs until the cache is under its low watermark
+- Cleanup of orphaned temp files, sidecars and unreferenced blobs
+- Streaming readers (file-like objects, chunk iterators) and mmap for raw
+  blobs, so large content need not be read into memory
+
+Raw files without a sidecar (the layout EvidenceStore used before this cache
+existed) are read as uncompressed legacy blobs.
 """
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import mmap as mmap_module
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager, suppress
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import orjson
+
+from er.cache.base import CacheProtocol
+from er.logging import get_logger
+from er.types import utc_now
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_ZSTD = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = get_logger(__name__)
+
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+
+_SUFFIXES = {COMPRESSION_NONE: "", COMPRESSION_GZIP: ".gz", COMPRESSION_ZSTD: ".zst"}
+
+# Content below this size is not worth compressing
+MIN_COMPRESS_BYTES = 512
+
+# Eviction stops once the cache is at or below this fraction of max_size_bytes
+EVICTION_LOW_WATERMARK = 0.9
+
+# Temp files younger than this may belong to an in-flight write
+ORPHAN_MIN_AGE_SECONDS = 3600
+
+_INCOMPRESSIBLE_PREFIXES = ("image/", "video/", "audio/")
+_INCOMPRESSIBLE_TYPES = {
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/zstd",
+    "application/octet-stream+zstd",
+}
+
+
+def default_compression() -> str:
+    """Best available compression codec."""
+    return COMPRESSION_ZSTD if HAS_ZSTD else COMPRESSION_GZIP
+
+
+def _compress(content: bytes, compression: str) -> bytes:
+    if compression == COMPRESSION_ZSTD:
+        compressed: bytes = zstandard.ZstdCompressor(level=3).compress(content)
+        return compressed
+    if compression == COMPRESSION_GZIP:
+        return gzip.compress(content, compresslevel=6)
+    return content
+
+
+def _open_blob(path: Path, compression: str) -> BinaryIO:
+    """Open a stored blob as a decompressing binary stream."""
+    if compression == COMPRESSION_ZSTD:
+        if not HAS_ZSTD:
+            raise RuntimeError("zstandard is required to read zstd-compressed blobs")
+        reader: BinaryIO = zstandard.ZstdDecompressor().stream_reader(
+            path.open("rb"), closefd=True
+        )
+        return reader
+    if compression == COMPRESSION_GZIP:
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    return path.open("rb")
+
+
+@dataclass
+class BlobReference:
+    """Lightweight reference to a cached blob."""
+
+    hash: str
+    size: int  # Uncompressed size
+    stored_size: int  # Size on disk
+    content_type: str
+    compression: str
+    created_at: str
+    path: Path
+    expires_at: str | None = None
+
+    @property
+    def expired(self) -> bool:
+        """Whether the blob's TTL has passed."""
+        return self.expires_at is not None and datetime.fromisoformat(self.expires_at) <= utc_now()
+
+    def open(self) -> BinaryIO:
+        """Open the blob as a decompressing binary stream."""
+        return _open_blob(self.path, self.compression)
+
+    def read(self) -> bytes:
+        """Read the whole (decompressed) blob."""
+        with self.open() as f:
+            return f.read()
+
+    def to_sidecar(self) -> dict[str, Any]:
+        """Metadata stored in the JSON sidecar."""
+        data = asdict(self)
+        data.pop("path")
+        return data
+
+
+class FileCache(CacheProtocol):
+    """Content-addressed, compressed, size-bounded blob cache.
+
+    Synchronous methods do the file I/O; the async CacheProtocol methods
+    wrap them for use as a generic cache (keys are content hashes).
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        max_size_bytes: int | None = None,
+        compression: str | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            root: Directory holding the blobs.
+            max_size_bytes: Evict least recently used blobs beyond this
+                on-disk size (None = unbounded).
+            compression: "zstd", "gzip" or "none" (default: zstd if
+                available, else gzip).
+        """
+        self.root = Path(root)
+        self.max_size_bytes = max_size_bytes
+        self.compression = compression or default_compression()
+        if self.compression not in _SUFFIXES:
+            raise ValueError(f"Unknown compression: {self.compression}")
+        if self.compression == COMPRESSION_ZSTD and not HAS_ZSTD:
+            raise ValueError("zstd compression requires the zstandard package")
+
+        self._lock = threading.Lock()
+        self._total_size: int | None = None  # Computed lazily by scanning
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+
+    def _dir(self, content_hash: str) -> Path:
+        # First 2 chars as subdirectory for better filesystem performance
+        return self.root / content_hash[:2]
+
+    def _blob_path(self, content_hash: str, compression: str) -> Path:
+        return self._dir(content_hash) / f"{content_hash}{_SUFFIXES[compression]}"
+
+    def _sidecar_path(self, content_hash: str) -> Path:
+        return self._dir(content_hash) / f"{content_hash}.json"
+
+    def _choose_compression(self, content: bytes, content_type: str) -> str:
+        mime = content_type.split(";", 1)[0].strip().lower()
+        if (
+            len(content) < MIN_COMPRESS_BYTES
+            or mime in _INCOMPRESSIBLE_TYPES
+            or mime.startswith(_INCOMPRESSIBLE_PREFIXES)
+        ):
+            return COMPRESSION_NONE
+        return self.compression
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+        try:
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def put(
+        self,
+        content: bytes,
+        content_type: str = "application/octet-stream",
+        ttl_seconds: int | None = None,
+    ) -> BlobReference:
+        """Store content, deduplicating by hash.
+
+        Args:
+            content: Raw (uncompressed) bytes.
+            content_type: MIME type, used to skip compressing compressed formats.
+            ttl_seconds: Optional time-to-live.
+
+        Returns:
+            Reference to the stored (or already present) blob.
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+
+        existing = self.reference(content_hash)
+        if existing is not None and not existing.expired:
+            self._touch(existing.path)
+            return existing
+
+        compression = self._choose_compression(content, content_type)
+        stored = _compress(content, compression)
+        if compression != COMPRESSION_NONE and len(stored) >= len(content):
+            compression, stored = COMPRESSION_NONE, content
+
+        now = utc_now()
+        ref = BlobReference(
+            hash=content_hash,
+            size=len(content),
+            stored_size=len(stored),
+            content_type=content_type,
+            compression=compression,
+            created_at=now.isoformat(),
+            path=self._blob_path(content_hash, compression),
+            expires_at=(now + timedelta(seconds=ttl_seconds)).isoformat() if ttl_seconds else None,
+        )
+
+        # Blob first, sidecar last: the sidecar marks the write committed
+        self._atomic_write(ref.path, stored)
+        self._atomic_write(self._sidecar_path(content_hash), orjson.dumps(ref.to_sidecar()))
+
+        # A legacy or differently-compressed copy is superseded
+        freed = 0
+        for other in _SUFFIXES:
+            other_path = self._blob_path(content_hash, other)
+            if other != compression and other_path.exists():
+                freed += other_path.stat().st_size
+                other_path.unlink(missing_ok=True)
+
+        with self._lock:
+            if self._total_size is not None:
+                self._total_size += ref.stored_size - freed
+
+        logger.debug(
+            "Stored blob",
+            hash=content_hash[:12],
+            size=ref.size,
+            stored_size=ref.stored_size,
+            compression=compression,
+        )
+
+        if self.max_size_bytes is not None and self.total_size() > self.max_size_bytes:
+            self.evict()
+
+        return ref
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def reference(self, content_hash: str) -> BlobReference | None:
+        """Look up a blob's metadata without reading it."""
+        sidecar = self._sidecar_path(content_hash)
+        try:
+            data = orjson.loads(sidecar.read_bytes())
+        except FileNotFoundError:
+            data = None
+        except orjson.JSONDecodeError:
+            logger.warning("Corrupt blob sidecar", hash=content_hash[:12])
+            return None
+
+        if data is not None:
+            ref = BlobReference(path=self._blob_path(content_hash, data["compression"]), **data)
+            return ref if ref.path.exists() else None
+
+        # Legacy raw blob without a sidecar
+        legacy_path = self._blob_path(content_hash, COMPRESSION_NONE)
+        if legacy_path.exists():
+            stat = legacy_path.stat()
+            return BlobReference(
+                hash=content_hash,
+                size=stat.st_size,
+                stored_size=stat.st_size,
+                content_type="application/octet-stream",
+                compression=COMPRESSION_NONE,
+                created_at=datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                path=legacy_path,
+            )
+        return None
+
+    def _live_reference(self, content_hash: str) -> BlobReference | None:
+        ref = self.reference(content_hash)
+        if ref is None:
+            return None
+        if ref.expired:
+            self.remove(content_hash)
+            return None
+        self._touch(ref.path)
+        return ref
+
+    def _touch(self, path: Path) -> None:
+        """Record an access for LRU eviction."""
+        with suppress(OSError):
+            os.utime(path)
+
+    def contains(self, content_hash: str) -> bool:
+        """Check whether a live blob exists."""
+        ref = self.reference(content_hash)
+        return ref is not None and not ref.expired
+
+    def read_bytes(self, content_hash: str) -> bytes | None:
+        """Read a whole (decompressed) blob, or None if absent."""
+        ref = self._live_reference(content_hash)
+        return ref.read() if ref else None
+
+    def open(self, content_hash: str) -> BinaryIO | None:
+        """Open a blob as a decompressing binary stream, or None if absent."""
+        ref = self._live_reference(content_hash)
+        return ref.open() if ref else None
+
+    def iter_chunks(self, content_hash: str, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+        """Stream a blob in decompressed chunks (empty if absent)."""
+        stream = self.open(content_hash)
+        if stream is None:
+            return
+        with stream:
+            while chunk := stream.read(chunk_size):
+                yield chunk
+
+    @contextmanager
+    def mmap(self, content_hash: str) -> Iterator[mmap_module.mmap]:
+        """Memory-map an uncompressed blob.
+
+        Raises:
+            FileNotFoundError: If the blob is absent.
+            ValueError: If the blob is compressed (use open() instead).
+        """
+        ref = self._live_reference(content_hash)
+        if ref is None:
+            raise FileNotFoundError(content_hash)
+        if ref.compression != COMPRESSION_NONE:
+            raise ValueError(f"Blob {content_hash[:12]} is {ref.compression}-compressed")
+        if ref.stored_size == 0:
+            raise ValueError(f"Blob {content_hash[:12]} is empty")
+
+        with ref.path.open("rb") as f:
+            mapped = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    # ------------------------------------------------------------------
+    # Deletion, eviction, cleanup
+    # ------------------------------------------------------------------
+
+    def remove(self, content_hash: str) -> bool:
+        """Delete a blob and its sidecar.
+
+        Returns:
+            True if anything was deleted.
+        """
+        freed = 0
+        removed = False
+        for compression in _SUFFIXES:
+            path = self._blob_path(content_hash, compression)
+            try:
+                freed += path.stat().st_size
+                path.unlink()
+                removed = True
+            except FileNotFoundError:
+                continue
+        sidecar = self._sidecar_path(content_hash)
+        if sidecar.exists():
+            sidecar.unlink(missing_ok=True)
+            removed = True
+
+        with self._lock:
+            if self._total_size is not None:
+                self._total_size -= freed
+        return removed
+
+    def _scan(self) -> list[tuple[float, int, str]]:
+        """List stored blobs as (last access, size, hash)."""
+        entries: list[tuple[float, int, str]] = []
+        if not self.root.exists():
+            return entries
+        for subdir in self.root.iterdir():
+            if not subdir.is_dir():
+                continue
+            for path in subdir.iterdir():
+                name = path.name
+                if name.startswith(".") or name.endswith(".json"):
+                    continue
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name.split(".", 1)[0]))
+        return entries
+
+    def total_size(self) -> int:
+        """Total on-disk size of stored blobs (excluding sidecars)."""
+        with self._lock:
+            if self._total_size is not None:
+                return self._total_size
+        size = sum(entry[1] for entry in self._scan())
+        with self._lock:
+            self._total_size = size
+        return size
+
+    def evict(self, target_bytes: int | None = None) -> int:
+        """Remove least recently used blobs until under the target size.
+
+        Args:
+            target_bytes: Size to shrink to (default: low watermark of
+                max_size_bytes).
+
+        Returns:
+            Number of blobs removed.
+        """
+        if target_bytes is None:
+            if self.max_size_bytes is None:
+                return 0
+            target_bytes = int(self.max_size_bytes * EVICTION_LOW_WATERMARK)
+
+        entries = sorted(self._scan())
+        total = sum(entry[1] for entry in entries)
+        removed = 0
+        for _, size, content_hash in entries:
+            if total <= target_bytes:
+                break
+            self.remove(content_hash)
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self._total_size = total
+        if removed:
+            logger.info("Evicted blobs", count=removed, total_size=total, root=str(self.root))
+        return removed
+
+    def cleanup_orphans(
+        self,
+        referenced: set[str] | None = None,
+        min_age_seconds: float = ORPHAN_MIN_AGE_SECONDS,
+    ) -> int:
+        """Remove files that no longer belong to a committed blob.
+
+        Removes stale temp files, sidecars without a blob, compressed blobs
+        without a sidecar (interrupted writes) and, if `referenced` is given,
+        every blob whose hash is not in it. Files younger than min_age_seconds
+        are kept so in-flight writes are not disturbed.
+
+        Args:
+            referenced: Hashes still in use (None = keep all committed blobs).
+            min_age_seconds: Minimum file age before removal.
+
+        Returns:
+            Number of files removed.
+        """
+        if not self.root.exists():
+            return 0
+
+        cutoff = time.time() - min_age_seconds
+        removed = 0
+        for subdir in self.root.iterdir():
+            if not subdir.is_dir():
+                continue
+            for path in list(subdir.iterdir()):
+                try:
+                    if path.stat().st_mtime > cutoff:
+                        continue
+                except FileNotFoundError:
+                    continue
+
+                name = path.name
+                content_hash = name.split(".", 1)[0] if not name.startswith(".") else ""
+                if name.startswith("."):
+                    orphan = name.endswith(".tmp")
+                elif referenced is not None and content_hash not in referenced:
+                    orphan = True
+                elif name.endswith(".json"):
+                    orphan = not any(
+                        self._blob_path(content_hash, c).exists() for c in _SUFFIXES
+                    )
+                elif name != content_hash:
+                    # Compressed blobs are only valid with a sidecar
+                    orphan = not self._sidecar_path(content_hash).exists()
+                else:
+                    orphan = False
+
+                if orphan:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+
+        with self._lock:
+            self._total_size = None
+        if removed:
+            logger.info("Removed orphaned cache files", count=removed, root=str(self.root))
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Blob count and sizes."""
+        entries = self._scan()
+        return {
+            "blobs": len(entries),
+            "total_size": sum(entry[1] for entry in entries),
+            "max_size": self.max_size_bytes,
+            "compression": self.compression,
+        }
+
+    # ------------------------------------------------------------------
+    # CacheProtocol
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> bytes | None:
+        """Get blob content by hash."""
+        return self.read_bytes(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        """Store bytes under their content hash.
+
+        Raises:
+            ValueError: If key is not the SHA-256 of value.
+        """
+        content = value if isinstance(value, bytes) else str(value).encode()
+        if hashlib.sha256(content).hexdigest() != key:
+            raise ValueError("FileCache keys must be the SHA-256 of the content")
+        self.put(content, ttl_seconds=ttl_seconds)
+
+    async def delete(self, key: str) -> bool:
+        """Delete a blob by hash."""
+        return self.remove(key)
+
+    async def exists(self, key: str) -> bool:
+        """Check if a blob exists."""
+        return self.contains(key)
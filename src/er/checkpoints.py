@@ -0,0 +1,446 @@
+"""
+Compact stage checkpoints for pipeline resume and the dashboard.
+
+Each pipeline stage output is stored as {run_dir}/{stage}.ckpt:
+
+    MAGIC | frame | frame | ... | index | index length (u64) | MAGIC
+
+A frame is one top-level section of the stage output (a dict key, or an
+item of a list output) serialized with orjson and compressed with zstd (if
+the `zstandard` package is installed) or gzip; frames below
+MIN_COMPRESS_BYTES are stored raw. The index at the end of the file is a
+small orjson manifest of the section keys and their frame offsets, so
+readers load only the sections they need: resume detection reads nothing
+but the file name, and the run list reads three scalars out of a final
+report instead of parsing the whole report.
+
+Writes are atomic (temp file + rename). Runs from before this format have
+{stage}.json files; load_checkpoint falls back to them, convert_run_dir
+writes checkpoints next to them (deleting the JSON only when asked), and
+export_json writes the indented JSON view of a
+checkpoint for debugging (also written on every save when
+CHECKPOINT_JSON_EXPORT is set).
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import os
+import struct
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import orjson
+
+from er.cache.file_cache import (
+    COMPRESSION_GZIP,
+    COMPRESSION_NONE,
+    COMPRESSION_ZSTD,
+    default_compression,
+)
+from er.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_ZSTD = False
+
+logger = get_logger(__name__)
+
+CHECKPOINT_SUFFIX = ".ckpt"
+LEGACY_SUFFIX = ".json"
+
+# Checkpoint layout version (stored in the index)
+CHECKPOINT_VERSION = 1
+
+# File header and trailer
+MAGIC = b"ERCKPT01"
+_TRAILER = struct.Struct("<Q")
+_TRAILER_SIZE = _TRAILER.size + len(MAGIC)
+
+# Frames below this size are not worth compressing
+MIN_COMPRESS_BYTES = 512
+
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6
+
+# Shape of the stored output
+KIND_DICT = "dict"
+KIND_LIST = "list"
+KIND_VALUE = "value"
+
+# Legacy stage files matched by convert_run_dir
+LEGACY_STAGE_GLOB = "stage[0-9]*.json"
+
+# Stage-named files other tools write as plain JSON; never converted
+JSON_ONLY_STAGES = frozenset({"stage2_discovery_review"})
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a section; unknown types fall back to str() like json.dumps(default=str)."""
+    return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS)
+
+
+def _compress(raw: bytes, compression: str) -> tuple[bytes, str]:
+    """Compress one frame, returning (stored bytes, codec used)."""
+    if len(raw) < MIN_COMPRESS_BYTES or compression == COMPRESSION_NONE:
+        return raw, COMPRESSION_NONE
+    if compression == COMPRESSION_ZSTD:
+        compressed: bytes = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+        return compressed, COMPRESSION_ZSTD
+    return gzip.compress(raw, compresslevel=GZIP_LEVEL), COMPRESSION_GZIP
+
+
+def _decompress(stored: bytes, codec: str) -> bytes:
+    if codec == COMPRESSION_ZSTD:
+        if not HAS_ZSTD:
+            raise RuntimeError("zstandard is required to read zstd-compressed checkpoints")
+        raw: bytes = zstandard.ZstdDecompressor().decompress(stored)
+        return raw
+    if codec == COMPRESSION_GZIP:
+        return gzip.decompress(stored)
+    return stored
+
+
+def checkpoint_path(directory: Path, stage: str) -> Path:
+    """Path of a stage's checkpoint file."""
+    return directory / f"{stage}{CHECKPOINT_SUFFIX}"
+
+
+def legacy_path(directory: Path, stage: str) -> Path:
+    """Path of a stage's JSON file (pre-checkpoint runs and debug exports)."""
+    return directory / f"{stage}{LEGACY_SUFFIX}"
+
+
+def checkpoint_exists(directory: Path, stage: str) -> bool:
+    """Whether a stage has output in either format."""
+    return checkpoint_path(directory, stage).exists() or legacy_path(directory, stage).exists()
+
+
+def encode_checkpoint(data: Any, compression: str | None = None) -> bytes:
+    """Encode a stage output in the checkpoint layout.
+
+    Args:
+        data: JSON-compatible stage output (dict, list or scalar).
+        compression: Codec for large frames (default: best available).
+
+    Returns:
+        Checkpoint file bytes.
+    """
+    compression = compression or default_compression()
+    if compression == COMPRESSION_ZSTD and not HAS_ZSTD:
+        raise ValueError("zstd compression requires the zstandard package")
+
+    if isinstance(data, dict):
+        kind = KIND_DICT
+        items: Iterable[tuple[Any, Any]] = data.items()
+    elif isinstance(data, (list, tuple)):
+        kind = KIND_LIST
+        items = enumerate(data)
+    else:
+        kind = KIND_VALUE
+        items = [("", data)]
+
+    chunks = [MAGIC]
+    offset = len(MAGIC)
+    sections = []
+    for key, value in items:
+        raw = _dumps(value)
+        stored, codec = _compress(raw, compression)
+        chunks.append(stored)
+        sections.append([str(key), offset, len(stored), len(raw), codec])
+        offset += len(stored)
+
+    index = orjson.dumps({"version": CHECKPOINT_VERSION, "kind": kind, "sections": sections})
+    chunks.append(index)
+    chunks.append(_TRAILER.pack(len(index)))
+    chunks.append(MAGIC)
+    return b"".join(chunks)
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_checkpoint(
+    directory: Path,
+    stage: str,
+    data: Any,
+    export_json: bool = False,
+    compression: str | None = None,
+) -> Path:
+    """Save a stage output as a checkpoint.
+
+    Args:
+        directory: Run output directory.
+        stage: Stage name (e.g., "stage2_discovery").
+        data: JSON-compatible stage output.
+        export_json: Also write the indented {stage}.json view.
+        compression: Codec for large frames (default: best available).
+
+    Returns:
+        Path of the checkpoint file.
+    """
+    path = checkpoint_path(directory, stage)
+    _write_atomic(path, encode_checkpoint(data, compression))
+    if export_json:
+        _write_atomic(legacy_path(directory, stage), _dumps_indented(data))
+    return path
+
+
+def _dumps_indented(data: Any) -> bytes:
+    return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+
+
+@dataclass(frozen=True)
+class SectionInfo:
+    """Location of one section's frame in a checkpoint file."""
+
+    key: str
+    offset: int
+    stored_size: int
+    size: int  # Uncompressed size
+    codec: str
+
+
+class CheckpointReader:
+    """Reads sections of a checkpoint file on demand.
+
+    Opening reads only the trailer and index; each section is read and
+    decoded when asked for. Use as a context manager or call close().
+    """
+
+    def __init__(self, source: Path | bytes) -> None:
+        """Open a checkpoint and read its index.
+
+        Args:
+            source: Checkpoint file, or checkpoint bytes already in memory.
+
+        Raises:
+            ValueError: If the content is not a valid checkpoint.
+        """
+        self.path = source if isinstance(source, Path) else None
+        self._file: BinaryIO = (
+            source.open("rb") if isinstance(source, Path) else io.BytesIO(source)
+        )
+        try:
+            self._read_index()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_index(self) -> None:
+        size = self._file.seek(0, os.SEEK_END)
+        if size < len(MAGIC) + _TRAILER_SIZE:
+            raise ValueError(f"Truncated checkpoint: {self.path}")
+        self._file.seek(size - _TRAILER_SIZE)
+        trailer = self._file.read(_TRAILER_SIZE)
+        if trailer[_TRAILER.size:] != MAGIC:
+            raise ValueError(f"Not a checkpoint (or incomplete write): {self.path}")
+        (index_size,) = _TRAILER.unpack(trailer[: _TRAILER.size])
+        self._file.seek(size - _TRAILER_SIZE - index_size)
+        index = orjson.loads(self._file.read(index_size))
+        if index.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {index.get('version')}: {self.path}")
+        self.kind: str = index["kind"]
+        self.sections: dict[str, SectionInfo] = {
+            key: SectionInfo(key, offset, stored_size, raw_size, codec)
+            for key, offset, stored_size, raw_size, codec in index["sections"]
+        }
+
+    def keys(self) -> list[str]:
+        """Section keys in stored order (list items are "0", "1", ...)."""
+        return list(self.sections)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.sections
+
+    def read_section(self, key: str) -> Any:
+        """Decode one section.
+
+        Raises:
+            KeyError: If the checkpoint has no such section.
+        """
+        info = self.sections[key]
+        self._file.seek(info.offset)
+        stored = self._file.read(info.stored_size)
+        return orjson.loads(_decompress(stored, info.codec))
+
+    def read(self, sections: Iterable[str] | None = None) -> Any:
+        """Decode the stage output, or only some of its sections.
+
+        Args:
+            sections: Keys to read (default: all). For dict outputs the
+                result holds only the keys present; for list outputs, the
+                selected items in stored order. Ignored for scalar outputs.
+
+        Returns:
+            The decoded output (dict, list or scalar).
+        """
+        if self.kind == KIND_VALUE:
+            return self.read_section("")
+        if sections is None:
+            keys = list(self.sections)
+        else:
+            wanted = {str(key) for key in sections}
+            keys = [key for key in self.sections if key in wanted]
+        if self.kind == KIND_LIST:
+            return [self.read_section(key) for key in keys]
+        return {key: self.read_section(key) for key in keys}
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def __enter__(self) -> CheckpointReader:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def decode_checkpoint(content: bytes, sections: Iterable[str] | None = None) -> Any:
+    """Decode checkpoint bytes (see CheckpointReader.read)."""
+    with CheckpointReader(content) as reader:
+        return reader.read(sections)
+
+
+def load_checkpoint(
+    directory: Path,
+    stage: str,
+    sections: Iterable[str] | None = None,
+) -> Any | None:
+    """Load a stage output from its checkpoint, or from legacy JSON.
+
+    Args:
+        directory: Run output directory.
+        stage: Stage name.
+        sections: Top-level keys to read (default: all). Only these frames
+            are decoded from a checkpoint; a legacy dict is filtered to them.
+
+    Returns:
+        The stage output, or None if the stage has no (readable) output.
+    """
+    path = checkpoint_path(directory, stage)
+    if path.exists():
+        try:
+            with CheckpointReader(path) as reader:
+                return reader.read(sections)
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.warning("Failed to read checkpoint", path=str(path), error=str(e))
+
+    path = legacy_path(directory, stage)
+    if not path.exists():
+        return None
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning("Failed to read checkpoint", path=str(path), error=str(e))
+        return None
+    if sections is not None and isinstance(data, dict):
+        wanted = set(sections)
+        data = {key: value for key, value in data.items() if key in wanted}
+    return data
+
+
+def export_json(directory: Path, stage: str) -> Path:
+    """Write the indented {stage}.json view of a checkpoint for debugging.
+
+    Raises:
+        FileNotFoundError: If the stage has no checkpoint.
+    """
+    with CheckpointReader(checkpoint_path(directory, stage)) as reader:
+        data = reader.read()
+    path = legacy_path(directory, stage)
+    _write_atomic(path, _dumps_indented(data))
+    return path
+
+
+def _is_readable(path: Path) -> bool:
+    """Whether a checkpoint file has a valid trailer and index."""
+    try:
+        with CheckpointReader(path):
+            return True
+    except (OSError, ValueError):
+        return False
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of upgrading one run directory's stage files."""
+
+    converted: list[str]
+    failed: list[str]
+    json_bytes: int = 0
+    checkpoint_bytes: int = 0
+
+
+def convert_run_dir(
+    run_dir: Path,
+    delete_json: bool = False,
+    compression: str | None = None,
+) -> ConversionResult:
+    """Upgrade a run's stageN_*.json files to checkpoints.
+
+    Stages that already have a checkpoint are not converted again. Unreadable
+    files are reported as failed and left in place.
+
+    Args:
+        run_dir: Run output directory.
+        delete_json: Delete each JSON file once its stage has a readable
+            checkpoint (default: keep them).
+        compression: Codec for large frames (default: best available).
+
+    Returns:
+        The converted and failed stage names and the before/after sizes.
+    """
+    result = ConversionResult(converted=[], failed=[])
+    for json_path in sorted(run_dir.glob(LEGACY_STAGE_GLOB)):
+        stage = json_path.stem
+        if stage in JSON_ONLY_STAGES:
+            continue
+        if checkpoint_path(run_dir, stage).exists():
+            if delete_json and _is_readable(checkpoint_path(run_dir, stage)):
+                json_path.unlink()
+            continue
+        try:
+            data = orjson.loads(json_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("Cannot convert stage file", path=str(json_path), error=str(e))
+            result.failed.append(stage)
+            continue
+        path = write_checkpoint(run_dir, stage, data, compression=compression)
+        result.json_bytes += json_path.stat().st_size
+        result.checkpoint_bytes += path.stat().st_size
+        if delete_json:
+            json_path.unlink()
+        result.converted.append(stage)
+
+    if result.converted:
+        logger.info(
+            "Converted stage files to checkpoints",
+            run_dir=str(run_dir),
+            stages=len(result.converted),
+            json_kb=round(result.json_bytes / 1024, 1),
+            checkpoint_kb=round(result.checkpoint_bytes / 1024, 1),
+        )
+    return result
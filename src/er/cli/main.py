@@ -3,6 +3,9 @@ CLI for the equity research system.
 
 Commands:
     er analyze TICKER - Run analysis on a stock ticker
+    er batch TICKER... - Run analysis on many tickers with a shared data layer
+    er reindex-evidence [PATH...] - Build full-text search indexes for evidence stores
+    er reindex-runs [OUTPUT_DIR] - Rebuild the run catalog used to list runs
     er config - Show current configuration
     er version - Print version
 """
@@ -260,7 +263,7 @@ def analyze(
     is_resuming = resume is not None
     run_manifest: RunManifest | None = None
 
-    if is_resuming:
+    if resume is not None:
         if not resume.exists():
             error_console.print(f"[red]Error:[/red] Resume directory not found: {resume}")
             raise typer.Exit(1)
@@ -283,16 +286,18 @@ def analyze(
             )
 
         # Check which stages are already done
-        stage_files = [
-            "stage1_company_context.json",
-            "stage2_discovery.json",
-            "stage3_verticals.json",
-            "stage3_5_verification.json",
-            "stage3_75_integration.json",
-            "stage4_claude_synthesis.json",
-            "stage5_editorial_feedback.json",
+        from er.checkpoints import checkpoint_exists
+
+        stages = [
+            "stage1_company_context",
+            "stage2_discovery",
+            "stage3_verticals",
+            "stage3_5_verification",
+            "stage3_75_integration",
+            "stage4_claude_synthesis",
+            "stage5_editorial_feedback",
         ]
-        completed = [f for f in stage_files if (run_output_dir / f).exists()]
+        completed = [stage for stage in stages if checkpoint_exists(run_output_dir, stage)]
 
         console.print()
         console.print(
@@ -481,6 +486,311 @@ def analyze(
     console.print()
 
 
+@app.command()
+def batch(
+    tickers: Annotated[
+        list[str] | None,
+        typer.Argument(help="Stock ticker symbols (e.g., AAPL MSFT GOOGL)"),
+    ] = None,
+    tickers_file: Annotated[
+        Path | None,
+        typer.Option("--file", "-f", help="File with one ticker per line (# for comments)"),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", help="Maximum tickers running at once"),
+    ] = 4,
+    budget: Annotated[
+        float | None,
+        typer.Option("--budget", "-b", help="Maximum budget in USD per ticker"),
+    ] = None,
+    output_dir: Annotated[
+        Path | None,
+        typer.Option("--output-dir", "-o", help="Output directory"),
+    ] = None,
+    no_transcripts: Annotated[
+        bool,
+        typer.Option("--no-transcripts", help="Skip fetching transcripts from FMP"),
+    ] = False,
+    num_quarters: Annotated[
+        int,
+        typer.Option("--quarters", "-q", help="Number of transcript quarters to fetch"),
+    ] = 4,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Show detailed progress logs"),
+    ] = False,
+) -> None:
+    """Run equity research analysis on many tickers.
+
+    All runs share one evidence store, FMP client and pooled LLM provider
+    clients. Each ticker gets its own run folder, manifest and budget.
+    Transcripts are fetched from FMP (no interactive collection).
+    """
+    settings = _get_settings_safe()
+    if settings is None:
+        error_console.print(
+            "[red]Error:[/red] Configuration is invalid. "
+            "Run 'er config' to see what's missing."
+        )
+        raise typer.Exit(1)
+
+    all_tickers = list(tickers or [])
+    if tickers_file is not None:
+        if not tickers_file.exists():
+            error_console.print(f"[red]Error:[/red] Tickers file not found: {tickers_file}")
+            raise typer.Exit(1)
+        for line in tickers_file.read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                all_tickers.append(line)
+    all_tickers = list(dict.fromkeys(t.upper().strip() for t in all_tickers if t.strip()))
+
+    if not all_tickers:
+        error_console.print("[red]Error:[/red] No tickers given. Pass tickers or --file.")
+        raise typer.Exit(1)
+
+    effective_budget = budget if budget is not None else settings.MAX_BUDGET_USD
+    effective_output_dir = output_dir if output_dir is not None else settings.OUTPUT_DIR
+    effective_output_dir.mkdir(parents=True, exist_ok=True)
+
+    console.print()
+    console.print(
+        Panel(
+            f"[bold]Tickers:[/bold] {len(all_tickers)} ({', '.join(all_tickers[:10])}"
+            f"{', ...' if len(all_tickers) > 10 else ''})\n"
+            f"[bold]Concurrency:[/bold] {concurrency}\n"
+            f"[bold]Budget per ticker:[/bold] ${effective_budget:.2f}\n"
+            f"[bold]Providers:[/bold] {', '.join(settings.available_providers)}\n"
+            f"[bold]Output directory:[/bold] {effective_output_dir}",
+            title="[bold cyan]Batch Equity Research[/bold cyan]",
+            border_style="cyan",
+        )
+    )
+
+    import asyncio
+    from er.coordinator.batch import BatchConfig, BatchRunner
+    from er.coordinator.pipeline import PipelineConfig
+    from er.logging import setup_logging
+
+    setup_logging(
+        log_level="DEBUG" if verbose else "INFO",
+        log_file=effective_output_dir / "batch.log",
+    )
+
+    def on_progress(
+        ticker: str,
+        stage: int,
+        stage_name: str,
+        status: str,
+        detail: str,
+        cost_usd: float,
+    ) -> None:
+        if status in ("complete", "error"):
+            color = "green" if status == "complete" else "red"
+            console.print(
+                f"  [{color}]{ticker:<6}[/{color}] {stage_name}: {status}"
+                f" [dim]{detail[:60]} (${cost_usd:.2f})[/dim]"
+            )
+
+    batch_config = BatchConfig(
+        output_dir=effective_output_dir,
+        max_concurrent_runs=concurrency,
+        budget_per_ticker_usd=effective_budget,
+        pipeline_config=PipelineConfig(
+            include_transcripts=not no_transcripts,
+            num_transcript_quarters=num_quarters,
+            use_web_search_discovery=True,
+            use_deep_research_verticals=True,
+            max_parallel_verticals=5,
+        ),
+    )
+    runner = BatchRunner(config=batch_config, settings=settings, progress_callback=on_progress)
+    result = asyncio.run(runner.run(all_tickers))
+
+    table = Table(title="Batch Results", show_header=True)
+    table.add_column("Ticker", style="cyan")
+    table.add_column("Status")
+    table.add_column("View")
+    table.add_column("Cost", justify="right")
+    table.add_column("Run Directory", style="dim")
+    for run in result.runs:
+        if run.result is not None:
+            status = "[green]complete[/green]"
+            view = f"{run.result.final_report.investment_view} ({run.result.final_report.conviction})"
+        else:
+            status = "[red]failed[/red]"
+            view = (run.error or "")[:40]
+        table.add_row(run.ticker, status, view, f"${run.cost_usd:.2f}", str(run.output_dir))
+
+    console.print()
+    console.print(table)
+    console.print(
+        f"\n[bold]{len(result.succeeded)}/{len(result.runs)} succeeded[/bold] | "
+        f"Total cost: ${result.total_cost_usd:.2f} | Duration: {result.duration_seconds:.0f}s"
+    )
+    console.print()
+
+    if result.failed:
+        raise typer.Exit(1)
+
+
+@app.command("reindex-evidence")
+def reindex_evidence(
+    paths: Annotated[
+        Optional[list[Path]],
+        typer.Argument(help="Evidence cache dirs, evidence.db files, or dirs to scan"),
+    ] = None,
+) -> None:
+    """Index existing evidence stores for full-text search.
+
+    Finds every evidence.db under the given paths (default: the output
+    directory) and indexes titles, snippets and blob text that are missing
+    from the search index. Safe to re-run.
+    """
+    if not paths:
+        settings = _get_settings_safe()
+        paths = [settings.OUTPUT_DIR if settings is not None else Path("output")]
+
+    db_files: list[Path] = []
+    for path in paths:
+        if path.is_file():
+            db_files.append(path)
+        elif (path / "evidence.db").exists():
+            db_files.append(path / "evidence.db")
+        elif path.is_dir():
+            db_files.extend(sorted(path.rglob("evidence.db")))
+    db_files = list(dict.fromkeys(p.resolve() for p in db_files))
+
+    if not db_files:
+        error_console.print("[yellow]No evidence.db files found.[/yellow]")
+        raise typer.Exit(1)
+
+    import asyncio
+    from er.evidence.store import EvidenceStore
+
+    async def reindex(db_file: Path) -> tuple[int, int]:
+        store = EvidenceStore(db_file.parent)
+        await store.init()
+        try:
+            indexed = await store.backfill_search_index()
+            return await store.count(), indexed
+        finally:
+            await store.close()
+
+    table = Table(title="Evidence Search Index", show_header=True)
+    table.add_column("Evidence DB", style="dim")
+    table.add_column("Rows", justify="right")
+    table.add_column("Blob Text Indexed", justify="right")
+    for db_file in db_files:
+        rows, indexed = asyncio.run(reindex(db_file))
+        table.add_row(str(db_file), str(rows), str(indexed))
+
+    console.print()
+    console.print(table)
+    console.print()
+
+
+@app.command("reindex-runs")
+def reindex_runs(
+    output_dir: Annotated[
+        Optional[Path],
+        typer.Argument(help="Output directory containing run_* directories"),
+    ] = None,
+) -> None:
+    """Rebuild the run catalog (runs.db) from the run directories.
+
+    Indexes every run_* directory with a manifest.json and drops catalog
+    rows whose directories no longer exist. Safe to re-run.
+    """
+    if output_dir is None:
+        settings = _get_settings_safe()
+        output_dir = settings.OUTPUT_DIR if settings is not None else Path("output")
+
+    if not output_dir.is_dir():
+        error_console.print(f"[red]Error:[/red] Output directory not found: {output_dir}")
+        raise typer.Exit(1)
+
+    from er.run_catalog import RunCatalog
+
+    with RunCatalog(output_dir) as catalog:
+        indexed = catalog.rebuild()
+
+    console.print(f"Indexed [bold]{indexed}[/bold] runs into {output_dir / 'runs.db'}")
+
+
+@app.command("convert-checkpoints")
+def convert_checkpoints(
+    paths: Annotated[
+        list[Path] | None,
+        typer.Argument(help="Run directories, or directories containing run_* directories"),
+    ] = None,
+    delete_json: Annotated[
+        bool,
+        typer.Option(
+            "--delete-json",
+            help="Delete each stage JSON file once it has a readable checkpoint",
+        ),
+    ] = False,
+    export_json: Annotated[
+        str | None,
+        typer.Option("--export-json", help="Instead, write the JSON view of this stage (debugging)"),
+    ] = None,
+) -> None:
+    """Convert stage JSON files of older runs to compact checkpoints.
+
+    Upgrades every stageN_*.json file without a checkpoint to the
+    compressed, lazily loadable format used for resume and the dashboard.
+    The JSON files are kept unless --delete-json is given. Safe to re-run.
+    """
+    from er.checkpoints import checkpoint_path, convert_run_dir, export_json as export_stage
+    from er.run_catalog import RUN_DIR_PREFIX
+
+    if not paths:
+        settings = _get_settings_safe()
+        paths = [settings.OUTPUT_DIR if settings is not None else Path("output")]
+
+    run_dirs: list[Path] = []
+    for path in paths:
+        if not path.is_dir():
+            error_console.print(f"[red]Error:[/red] Directory not found: {path}")
+            raise typer.Exit(1)
+        if path.name.startswith(RUN_DIR_PREFIX):
+            run_dirs.append(path)
+        else:
+            run_dirs.extend(sorted(p for p in path.glob(f"{RUN_DIR_PREFIX}*") if p.is_dir()))
+
+    if export_json is not None:
+        for run_dir in run_dirs:
+            if checkpoint_path(run_dir, export_json).exists():
+                console.print(f"Wrote {export_stage(run_dir, export_json)}")
+        return
+
+    table = Table(title="Checkpoint Conversion", show_header=True)
+    table.add_column("Run", style="dim")
+    table.add_column("Stages", justify="right")
+    table.add_column("JSON KB", justify="right")
+    table.add_column("Checkpoint KB", justify="right")
+    failed = False
+    for run_dir in run_dirs:
+        result = convert_run_dir(run_dir, delete_json=delete_json)
+        failed = failed or bool(result.failed)
+        if result.converted or result.failed:
+            table.add_row(
+                run_dir.name,
+                f"{len(result.converted)}" + (f" ([red]{len(result.failed)} failed[/red])" if result.failed else ""),
+                f"{result.json_bytes / 1024:.0f}",
+                f"{result.checkpoint_bytes / 1024:.0f}",
+            )
+
+    console.print()
+    console.print(table)
+    console.print()
+
+    if failed:
+        raise typer.Exit(1)
+
+
 @app.command()
 def config() -> None:
     """Show current configuration.
@@ -25,10 +25,18 @@ class Settings(BaseSettings):
     Optional:
         FMP_API_KEY: Financial Modeling Prep API key for transcripts
         FINNHUB_API_KEY: Finnhub API key for transcripts
+        FMP_MAX_CONCURRENCY: Maximum in-flight FMP API requests
+        FMP_REQUESTS_PER_MINUTE: FMP per-minute request quota
+        EVIDENCE_WRITE_BEHIND: Batch evidence store writes into fewer commits
+        EVIDENCE_BLOB_MAX_MB: Size limit for evidence blob storage (LRU eviction)
+        CHECKPOINT_JSON_EXPORT: Also write stage outputs as indented JSON (debugging)
         MAX_BUDGET_USD: Maximum budget per run in USD
         MAX_DELIBERATION_ROUNDS: Maximum deliberation rounds
         MAX_CONCURRENT_AGENTS: Maximum concurrent agent tasks
         CACHE_DIR: Directory for caching data
+        LLM_CACHE_MODE: LLM response cache mode (off|read_through|replay)
+        LLM_CACHE_MAX_MB: Size limit for the LLM response cache (LRU eviction)
+        LLM_CACHE_MAX_AGE_DAYS: Age after which cached LLM responses expire
         OUTPUT_DIR: Directory for output files
         LOG_LEVEL: Logging level
     """
@@ -55,6 +63,28 @@ class Settings(BaseSettings):
         default=None, description="Financial Modeling Prep API key"
     )
     FINNHUB_API_KEY: str | None = Field(default=None, description="Finnhub API key")
+    FMP_MAX_CONCURRENCY: int = Field(
+        default=8, ge=1, le=50, description="Maximum in-flight FMP API requests"
+    )
+    FMP_REQUESTS_PER_MINUTE: int = Field(
+        default=300, ge=1, description="FMP per-minute request quota"
+    )
+
+    # Evidence store
+    EVIDENCE_WRITE_BEHIND: bool = Field(
+        default=True, description="Batch evidence store writes into fewer commits"
+    )
+    EVIDENCE_BLOB_MAX_MB: int | None = Field(
+        default=None,
+        ge=1,
+        description="Size limit for evidence blob storage in MB (None = unbounded)",
+    )
+
+    # Stage checkpoints
+    CHECKPOINT_JSON_EXPORT: bool = Field(
+        default=False,
+        description="Also write each stage checkpoint as indented JSON for debugging",
+    )
 
     # Provider preference
     PREFERRED_PROVIDER: str | None = Field(
@@ -77,6 +107,22 @@ class Settings(BaseSettings):
     CACHE_DIR: Path = Field(default=Path(".cache"), description="Cache directory")
     OUTPUT_DIR: Path = Field(default=Path("output"), description="Output directory")
 
+    # LLM response cache (record/replay)
+    LLM_CACHE_MODE: Literal["off", "read_through", "replay"] = Field(
+        default="off",
+        description="LLM response cache: off, read_through (record misses) or replay (offline)",
+    )
+    LLM_CACHE_MAX_MB: int | None = Field(
+        default=1024,
+        ge=1,
+        description="Size limit for the LLM response cache in MB (None = unbounded)",
+    )
+    LLM_CACHE_MAX_AGE_DAYS: float | None = Field(
+        default=30.0,
+        gt=0,
+        description="Age after which cached LLM responses expire (None = never)",
+    )
+
     # Logging
     LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO", description="Logging level"
@@ -100,6 +146,20 @@ class Settings(BaseSettings):
         description="Default model for synthesis (high quality)",
     )
 
+    @property
+    def evidence_blob_max_bytes(self) -> int | None:
+        """Evidence blob storage limit in bytes (None = unbounded)."""
+        if self.EVIDENCE_BLOB_MAX_MB is None:
+            return None
+        return self.EVIDENCE_BLOB_MAX_MB * 1024 * 1024
+
+    @property
+    def llm_cache_max_bytes(self) -> int | None:
+        """LLM response cache limit in bytes (None = unbounded)."""
+        if self.LLM_CACHE_MAX_MB is None:
+            return None
+        return self.LLM_CACHE_MAX_MB * 1024 * 1024
+
     @property
     def model_workhorse(self) -> str:
         """Get workhorse model (lowercase alias)."""
@@ -214,11 +274,19 @@ class Settings(BaseSettings):
             "GEMINI_API_KEY": redact("GEMINI_API_KEY", self.GEMINI_API_KEY),
             "FMP_API_KEY": redact("FMP_API_KEY", self.FMP_API_KEY),
             "FINNHUB_API_KEY": redact("FINNHUB_API_KEY", self.FINNHUB_API_KEY),
+            "FMP_MAX_CONCURRENCY": self.FMP_MAX_CONCURRENCY,
+            "FMP_REQUESTS_PER_MINUTE": self.FMP_REQUESTS_PER_MINUTE,
+            "EVIDENCE_WRITE_BEHIND": self.EVIDENCE_WRITE_BEHIND,
+            "EVIDENCE_BLOB_MAX_MB": self.EVIDENCE_BLOB_MAX_MB,
+            "CHECKPOINT_JSON_EXPORT": self.CHECKPOINT_JSON_EXPORT,
             "MAX_BUDGET_USD": self.MAX_BUDGET_USD,
             "MAX_DELIBERATION_ROUNDS": self.MAX_DELIBERATION_ROUNDS,
             "MAX_CONCURRENT_AGENTS": self.MAX_CONCURRENT_AGENTS,
             "CACHE_DIR": str(self.CACHE_DIR),
             "OUTPUT_DIR": str(self.OUTPUT_DIR),
+            "LLM_CACHE_MODE": self.LLM_CACHE_MODE,
+            "LLM_CACHE_MAX_MB": self.LLM_CACHE_MAX_MB,
+            "LLM_CACHE_MAX_AGE_DAYS": self.LLM_CACHE_MAX_AGE_DAYS,
             "LOG_LEVEL": self.LOG_LEVEL,
             "MODEL_WORKHORSE": self.MODEL_WORKHORSE,
             "MODEL_RESEARCH": self.MODEL_RESEARCH,
@@ -7,8 +7,17 @@ This package implements the research orchestration:
 - Agent coordination
 - Budget management
 - 5-stage pipeline
+- Multi-ticker batch runner with a shared data layer
 """
 
+from er.coordinator.batch import (
+    BatchConfig,
+    BatchResult,
+    BatchRunner,
+    BatchRunResult,
+    SharedResources,
+    run_batch,
+)
 from er.coordinator.event_store import EventStore
 from er.coordinator.pipeline import (
     PipelineConfig,
@@ -18,9 +27,15 @@ from er.coordinator.pipeline import (
 )
 
 __all__ = [
+    "BatchConfig",
+    "BatchResult",
+    "BatchRunResult",
+    "BatchRunner",
     "EventStore",
     "PipelineConfig",
     "PipelineResult",
     "ResearchPipeline",
+    "SharedResources",
+    "run_batch",
     "run_research",
 ]
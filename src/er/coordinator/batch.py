@@ -0,0 +1,341 @@
+"""
+Multi-ticker batch runner.
+
+Runs the research pipeline for many tickers with a global concurrency limit.
+All runs share one data layer:
+- One EvidenceStore (so FMP/web content fetched for one ticker is reused)
+- One FMPClient (shared HTTP connection pool, FMP cache and rate limiter)
+- One ProviderClientPool (warm OpenAI/Anthropic/Gemini clients)
+
+Each ticker still gets its own run directory, manifest, budget tracker,
+event store and workspace, exactly like a single `er analyze` run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+from er.config import Settings
+from er.coordinator.pipeline import PipelineConfig, PipelineResult, ResearchPipeline
+from er.data.fmp_client import FMPClient
+from er.evidence.store import EvidenceStore
+from er.llm.client_pool import ProviderClientPool
+from er.llm.response_cache import create_response_cache
+from er.logging import get_logger
+from er.manifest import RunManifest
+from er.types import RunState
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+
+# Called as (ticker, stage, stage_name, status, detail, cost_usd)
+BatchProgressCallback = Callable[[str, int, str, str, str, float], None]
+
+
+@dataclass
+class SharedResources:
+    """Data layer shared by every pipeline run in a batch."""
+
+    evidence_store: EvidenceStore
+    client_pool: ProviderClientPool
+    fmp_client: FMPClient | None = None
+
+    @classmethod
+    def create(cls, settings: Settings, cache_dir: Path) -> SharedResources:
+        """Create shared resources for a batch.
+
+        Args:
+            settings: Application settings.
+            cache_dir: Directory for the shared evidence store.
+
+        Returns:
+            Uninitialized SharedResources (call init() before use).
+        """
+        evidence_store = EvidenceStore(
+            cache_dir=cache_dir,
+            write_behind=settings.EVIDENCE_WRITE_BEHIND,
+            max_blob_bytes=settings.evidence_blob_max_bytes,
+        )
+        return cls(
+            evidence_store=evidence_store,
+            client_pool=ProviderClientPool(settings, create_response_cache(settings)),
+            fmp_client=FMPClient(
+                evidence_store=evidence_store,
+                api_key=settings.FMP_API_KEY,
+                max_concurrency=settings.FMP_MAX_CONCURRENCY,
+                requests_per_minute=settings.FMP_REQUESTS_PER_MINUTE,
+            ),
+        )
+
+    async def init(self) -> None:
+        """Initialize the shared evidence store."""
+        await self.evidence_store.init()
+
+    async def close(self) -> None:
+        """Close all shared clients and the evidence store."""
+        if self.fmp_client:
+            await self.fmp_client.close()
+        await self.client_pool.close()
+        await self.evidence_store.close()
+
+
+@dataclass
+class BatchConfig:
+    """Configuration for a batch of pipeline runs."""
+
+    # Root output directory; each ticker gets its own run directory under it
+    output_dir: Path
+
+    # Global limit on concurrently running pipelines
+    max_concurrent_runs: int = 4
+
+    # Budget per ticker (None = use pipeline_config.max_budget_usd)
+    budget_per_ticker_usd: float | None = None
+    ticker_budgets: dict[str, float] = field(default_factory=dict)  # Per-ticker overrides
+
+    # Template for every run (output_dir and max_budget_usd are set per run)
+    pipeline_config: PipelineConfig = field(default_factory=PipelineConfig)
+
+    def budget_for(self, ticker: str) -> float | None:
+        """Get the budget for a ticker."""
+        if ticker in self.ticker_budgets:
+            return self.ticker_budgets[ticker]
+        if self.budget_per_ticker_usd is not None:
+            return self.budget_per_ticker_usd
+        return self.pipeline_config.max_budget_usd
+
+
+@dataclass
+class BatchRunResult:
+    """Outcome of one ticker's run within a batch."""
+
+    ticker: str
+    run_id: str
+    output_dir: Path
+    result: PipelineResult | None = None
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the run completed successfully."""
+        return self.result is not None and self.error is None
+
+    @property
+    def cost_usd(self) -> float:
+        """Total cost of the run (0 if it failed before completion)."""
+        return self.result.total_cost_usd if self.result else 0.0
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a whole batch, in input ticker order."""
+
+    runs: list[BatchRunResult]
+    started_at: datetime
+    completed_at: datetime
+
+    @property
+    def succeeded(self) -> list[BatchRunResult]:
+        """Runs that completed successfully."""
+        return [run for run in self.runs if run.succeeded]
+
+    @property
+    def failed(self) -> list[BatchRunResult]:
+        """Runs that failed."""
+        return [run for run in self.runs if not run.succeeded]
+
+    @property
+    def total_cost_usd(self) -> float:
+        """Total cost across completed runs."""
+        return sum(run.cost_usd for run in self.runs)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Wall-clock duration of the batch."""
+        return (self.completed_at - self.started_at).total_seconds()
+
+
+class BatchRunner:
+    """Runs the research pipeline for many tickers with a shared data layer."""
+
+    def __init__(
+        self,
+        config: BatchConfig,
+        settings: Settings | None = None,
+        progress_callback: BatchProgressCallback | None = None,
+    ) -> None:
+        """Initialize the batch runner.
+
+        Args:
+            config: Batch configuration.
+            settings: Application settings (loads from env if None).
+            progress_callback: Optional per-ticker progress callback.
+        """
+        self.config = config
+        self.settings = settings or Settings()
+        self._progress_callback = progress_callback
+
+    def _prepare_run(self, ticker: str) -> tuple[RunManifest, PipelineConfig]:
+        """Create the run directory, manifest and pipeline config for a ticker."""
+        budget = self.config.budget_for(ticker)
+        run_state = RunState.create(ticker=ticker, budget_usd=budget or 0.0)
+
+        run_output_dir = self.config.output_dir / run_state.run_id
+        run_output_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest = RunManifest(
+            output_dir=run_output_dir,
+            run_id=run_state.run_id,
+            ticker=ticker,
+        )
+        manifest.set_input_hash({
+            "ticker": ticker,
+            "budget_usd": budget,
+            "providers": self.settings.available_providers,
+            "batch": True,
+        })
+        manifest.save()
+
+        pipeline_config = replace(
+            self.config.pipeline_config,
+            output_dir=run_output_dir,
+            resume_from_run_dir=None,
+            max_budget_usd=budget,
+        )
+        return manifest, pipeline_config
+
+    def _ticker_progress(self, ticker: str) -> Callable[..., None] | None:
+        """Bind the batch progress callback to a ticker."""
+        callback = self._progress_callback
+        if callback is None:
+            return None
+
+        def update(
+            stage: int,
+            stage_name: str,
+            status: str,
+            detail: str = "",
+            cost_usd: float = 0.0,
+        ) -> None:
+            callback(ticker, stage, stage_name, status, detail, cost_usd)
+
+        return update
+
+    async def _run_one(
+        self,
+        ticker: str,
+        shared: SharedResources,
+        semaphore: asyncio.Semaphore,
+    ) -> BatchRunResult:
+        """Run the pipeline for one ticker under the global concurrency limit."""
+        async with semaphore:
+            manifest, pipeline_config = self._prepare_run(ticker)
+            run = BatchRunResult(
+                ticker=ticker,
+                run_id=manifest.run_id,
+                output_dir=manifest.output_dir,
+            )
+            logger.info("Batch run starting", ticker=ticker, run_id=run.run_id)
+
+            pipeline = ResearchPipeline(
+                settings=self.settings,
+                config=pipeline_config,
+                progress_callback=self._ticker_progress(ticker),
+                shared=shared,
+            )
+            try:
+                result = await pipeline.run(ticker)
+            except Exception as e:
+                logger.error("Batch run failed", ticker=ticker, run_id=run.run_id, error=str(e))
+                run.error = str(e)
+                manifest.fail(str(e))
+                manifest.save()
+                return run
+
+            report_path = manifest.output_dir / "report.md"
+            report_path.write_text(result.to_report_markdown())
+            manifest.add_artifact("report", str(report_path))
+            manifest.complete(success=True)
+            manifest.save()
+
+            run.result = result
+            logger.info(
+                "Batch run completed",
+                ticker=ticker,
+                run_id=run.run_id,
+                cost_usd=result.total_cost_usd,
+            )
+            return run
+
+    async def run(self, tickers: list[str]) -> BatchResult:
+        """Run the pipeline for every ticker.
+
+        A failing ticker does not stop the batch; its error is recorded in
+        its BatchRunResult and run manifest.
+
+        Args:
+            tickers: Ticker symbols (normalized and de-duplicated).
+
+        Returns:
+            BatchResult with one entry per unique ticker, in input order.
+        """
+        unique_tickers = list(dict.fromkeys(t.upper().strip() for t in tickers if t.strip()))
+        started_at = datetime.now(UTC)
+
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+        shared = SharedResources.create(self.settings, self.config.output_dir / "evidence")
+        await shared.init()
+
+        logger.info(
+            "Starting batch",
+            tickers=len(unique_tickers),
+            max_concurrent_runs=self.config.max_concurrent_runs,
+        )
+
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrent_runs))
+        try:
+            runs = await asyncio.gather(
+                *(self._run_one(ticker, shared, semaphore) for ticker in unique_tickers)
+            )
+        finally:
+            await shared.close()
+
+        batch = BatchResult(
+            runs=list(runs),
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+        )
+        logger.info(
+            "Batch completed",
+            succeeded=len(batch.succeeded),
+            failed=len(batch.failed),
+            total_cost_usd=batch.total_cost_usd,
+            duration_seconds=batch.duration_seconds,
+        )
+        return batch
+
+
+async def run_batch(
+    tickers: list[str],
+    config: BatchConfig,
+    settings: Settings | None = None,
+) -> BatchResult:
+    """Convenience function to run the pipeline for many tickers.
+
+    Args:
+        tickers: Ticker symbols.
+        config: Batch configuration.
+        settings: Optional settings (loads from env if None).
+
+    Returns:
+        BatchResult with per-ticker outcomes.
+    """
+    runner = BatchRunner(config=config, settings=settings)
+    return await runner.run(tickers)
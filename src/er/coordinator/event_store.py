@@ -3,14 +3,18 @@ Event store for agent message logging.
 
 Append-only event store that logs every agent message and enables full audit trails.
 Uses JSONL for full message storage and SQLite for fast indexed queries.
+
+The JSONL file is written through one persistent append handle whose offset
+is tracked in memory, and queries read all matching lines from a single
+memory-mapped view of the file in offset order.
 """
 
 from __future__ import annotations
 
-import json
+import mmap
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
 
 import aiosqlite
 import orjson
@@ -18,8 +22,23 @@ import orjson
 from er.logging import get_logger
 from er.types import AgentMessage, MessageType
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 logger = get_logger(__name__)
 
+# Appends between SQLite commits (reads on the same connection see pending rows)
+EVENT_COMMIT_INTERVAL = 20
+
+_INSERT_COLUMNS = """
+    INTO events (
+        message_id, run_id, ts, from_agent, to_agent,
+        message_type, confidence, evidence_count, jsonl_offset, phase, agent
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_SQL = "INSERT" + _INSERT_COLUMNS
+_INSERT_OR_IGNORE_SQL = "INSERT OR IGNORE" + _INSERT_COLUMNS
+
 
 class EventStore:
     """Immutable log of all agent interactions.
@@ -29,17 +48,26 @@ class EventStore:
     - Index fields in SQLite for fast queries
     """
 
-    def __init__(self, output_dir: str | Path) -> None:
+    def __init__(
+        self,
+        output_dir: str | Path,
+        commit_interval: int = EVENT_COMMIT_INTERVAL,
+    ) -> None:
         """Initialize event store.
 
         Args:
             output_dir: Directory for run output (output/{run_id}/).
+            commit_interval: Appends between SQLite commits.
         """
         self.output_dir = Path(output_dir)
         self.jsonl_path: Path | None = None
         self.db_path: Path | None = None
+        self.commit_interval = max(1, commit_interval)
         self._db: aiosqlite.Connection | None = None
         self._run_id: str | None = None
+        self._jsonl: IO[bytes] | None = None
+        self._offset = 0
+        self._uncommitted = 0
 
     async def init(self, run_id: str) -> None:
         """Initialize the store for a specific run.
@@ -73,9 +101,12 @@ class EventStore:
                 message_type TEXT NOT NULL,
                 confidence REAL,
                 evidence_count INTEGER,
-                jsonl_offset INTEGER
+                jsonl_offset INTEGER,
+                phase TEXT,
+                agent TEXT
             )
         """)
+        await self._migrate()
 
         # Create indexes
         await self._db.execute(
@@ -88,14 +119,62 @@ class EventStore:
             "CREATE INDEX IF NOT EXISTS idx_message_type ON events(message_type)"
         )
         await self._db.execute("CREATE INDEX IF NOT EXISTS idx_ts ON events(ts)")
+        await self._db.execute("CREATE INDEX IF NOT EXISTS idx_phase ON events(phase)")
+        await self._db.execute("CREATE INDEX IF NOT EXISTS idx_agent ON events(agent)")
+
+        # Open the append handle and index any lines written after the last commit
+        self._jsonl = self.jsonl_path.open("ab")
+        self._offset = self._jsonl.seek(0, 2)
+        await self._index_unindexed_lines()
 
         await self._db.commit()
 
         logger.info("Event store initialized", run_id=run_id, output_dir=str(self.output_dir))
 
+    async def _migrate(self) -> None:
+        """Add the phase/agent columns to events.db files that predate them."""
+        assert self._db is not None
+        async with self._db.execute("PRAGMA table_info(events)") as cursor:
+            columns = {row[1] for row in await cursor.fetchall()}
+        added = [column for column in ("phase", "agent") if column not in columns]
+        for column in added:
+            await self._db.execute(f"ALTER TABLE events ADD COLUMN {column} TEXT")
+        if not added or not self.jsonl_path or not self.jsonl_path.exists():
+            return
+
+        # Backfill from the JSONL log in one sequential pass
+        updates = [
+            (self._phase_of(data), self._agent_of(data), data["message_id"])
+            for _, data in self._scan_jsonl(0)
+        ]
+        await self._db.executemany(
+            "UPDATE events SET phase = ?, agent = ? WHERE message_id = ?", updates
+        )
+        logger.info("Migrated event index", added_columns=added, backfilled=len(updates))
+
+    async def _index_unindexed_lines(self) -> None:
+        """Index JSONL lines past the last indexed offset (e.g. after a crash)."""
+        assert self._db is not None
+        async with self._db.execute("SELECT MAX(jsonl_offset) FROM events") as cursor:
+            row = await cursor.fetchone()
+        last_offset = row[0] if row and row[0] is not None else -1
+
+        rows = []
+        for offset, data in self._scan_jsonl(max(last_offset, 0)):
+            if offset <= last_offset:
+                continue
+            rows.append(self._index_row(self._dict_to_message(data), offset))
+        if rows:
+            await self._db.executemany(_INSERT_OR_IGNORE_SQL, rows)
+            logger.info("Indexed unindexed events", count=len(rows))
+
     async def close(self) -> None:
-        """Close the database connection."""
+        """Commit pending index rows and close the log and database."""
+        if self._jsonl:
+            self._jsonl.close()
+            self._jsonl = None
         if self._db:
+            await self._db.commit()
             await self._db.close()
             self._db = None
 
@@ -105,44 +184,24 @@ class EventStore:
         Args:
             message: The agent message to store.
         """
-        if not self._db or not self.jsonl_path:
+        if not self._db or not self._jsonl:
             raise RuntimeError("EventStore not initialized. Call init() first.")
 
         # Serialize message to JSON
-        message_dict = self._message_to_dict(message)
-        json_line = orjson.dumps(message_dict).decode("utf-8") + "\n"
+        line = orjson.dumps(self._message_to_dict(message)) + b"\n"
 
-        # Get current file offset before writing
-        if self.jsonl_path.exists():
-            jsonl_offset = self.jsonl_path.stat().st_size
-        else:
-            jsonl_offset = 0
+        # Append at the tracked offset (no await between reserve and write)
+        jsonl_offset = self._offset
+        self._jsonl.write(line)
+        self._jsonl.flush()
+        self._offset += len(line)
 
-        # Append to JSONL file
-        with open(self.jsonl_path, "a", encoding="utf-8") as f:
-            f.write(json_line)
-
-        # Insert index record into SQLite
-        await self._db.execute(
-            """
-            INSERT INTO events (
-                message_id, run_id, ts, from_agent, to_agent,
-                message_type, confidence, evidence_count, jsonl_offset
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                message.message_id,
-                message.run_id,
-                message.timestamp.isoformat(),
-                message.from_agent,
-                message.to_agent,
-                message.message_type.value,
-                message.confidence,
-                len(message.evidence_ids),
-                jsonl_offset,
-            ),
-        )
-        await self._db.commit()
+        # Insert index record into SQLite; commit in batches
+        await self._db.execute(_INSERT_SQL, self._index_row(message, jsonl_offset))
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_interval:
+            self._uncommitted = 0
+            await self._db.commit()
 
         logger.debug(
             "Appended event",
@@ -173,7 +232,8 @@ class EventStore:
             return None
 
         # Read from JSONL at offset
-        return await self._read_at_offset(row["jsonl_offset"])
+        messages = self._read_offsets([row["jsonl_offset"]])
+        return messages[0] if messages else None
 
     async def query(
         self,
@@ -181,6 +241,8 @@ class EventStore:
         to_agent: str | None = None,
         message_type: MessageType | None = None,
         since: datetime | None = None,
+        phase: str | None = None,
+        agent: str | None = None,
     ) -> list[AgentMessage]:
         """Query messages with filters.
 
@@ -189,6 +251,9 @@ class EventStore:
             to_agent: Filter by recipient agent.
             message_type: Filter by message type.
             since: Filter by timestamp (messages after this time).
+            phase: Filter by the phase recorded in the message context.
+            agent: Filter by the agent recorded in the message context
+                (defaults to the sender).
 
         Returns:
             List of matching messages.
@@ -216,21 +281,26 @@ class EventStore:
             conditions.append("ts > ?")
             params.append(since.isoformat())
 
+        if phase:
+            conditions.append("phase = ?")
+            params.append(phase)
+
+        if agent:
+            conditions.append("agent = ?")
+            params.append(agent)
+
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        query = f"SELECT jsonl_offset FROM events WHERE {where_clause} ORDER BY ts ASC"
+        query = (
+            f"SELECT jsonl_offset FROM events WHERE {where_clause} "
+            "ORDER BY ts ASC, jsonl_offset ASC"
+        )
 
         # Execute query
         async with self._db.execute(query, params) as cursor:
             rows = await cursor.fetchall()
 
         # Read messages from JSONL
-        messages = []
-        for row in rows:
-            msg = await self._read_at_offset(row["jsonl_offset"])
-            if msg:
-                messages.append(msg)
-
-        return messages
+        return self._read_offsets([row["jsonl_offset"] for row in rows])
 
     async def get_conversation(self, agent_name: str) -> list[AgentMessage]:
         """Get all messages to/from an agent.
@@ -247,19 +317,13 @@ class EventStore:
         query = """
             SELECT jsonl_offset FROM events
             WHERE from_agent = ? OR to_agent = ?
-            ORDER BY ts ASC
+            ORDER BY ts ASC, jsonl_offset ASC
         """
 
         async with self._db.execute(query, (agent_name, agent_name)) as cursor:
             rows = await cursor.fetchall()
 
-        messages = []
-        for row in rows:
-            msg = await self._read_at_offset(row["jsonl_offset"])
-            if msg:
-                messages.append(msg)
-
-        return messages
+        return self._read_offsets([row["jsonl_offset"] for row in rows])
 
     async def get_phase_messages(self, phase: str) -> list[AgentMessage]:
         """Get all messages from a specific phase.
@@ -272,12 +336,7 @@ class EventStore:
         Returns:
             List of messages from this phase.
         """
-        # Since phase isn't indexed, we need to read all and filter
-        # This could be optimized by adding phase to the index
-        all_messages = await self.query()
-        return [
-            msg for msg in all_messages if msg.context.get("phase") == phase
-        ]
+        return await self.query(phase=phase)
 
     async def count_by_type(self) -> dict[MessageType, int]:
         """Count messages by type.
@@ -313,30 +372,82 @@ class EventStore:
             row = await cursor.fetchone()
             return row[0] if row else 0
 
-    async def _read_at_offset(self, offset: int) -> AgentMessage | None:
-        """Read a message from JSONL at a specific byte offset.
+    def _read_offsets(self, offsets: list[int]) -> list[AgentMessage]:
+        """Read messages at byte offsets through one memory-mapped view.
+
+        Offsets are visited in ascending order for sequential access; the
+        result keeps the order of the input. Unreadable lines are skipped.
 
         Args:
-            offset: Byte offset in the JSONL file.
+            offsets: Byte offsets of lines in the JSONL file.
 
         Returns:
-            AgentMessage or None if read fails.
+            Messages in input order.
         """
+        if not offsets or not self.jsonl_path or not self.jsonl_path.exists():
+            return []
+        if self._jsonl:
+            self._jsonl.flush()
+
+        decoded: dict[int, AgentMessage] = {}
+        with self.jsonl_path.open("rb") as f:
+            size = f.seek(0, 2)
+            if size == 0:
+                return []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                for offset in sorted(set(offsets)):
+                    if offset >= size:
+                        continue
+                    end = view.find(b"\n", offset)
+                    try:
+                        data = orjson.loads(view[offset:end if end != -1 else size])
+                        decoded[offset] = self._dict_to_message(data)
+                    except Exception as e:
+                        logger.warning("Failed to read event at offset", offset=offset, error=str(e))
+
+        return [decoded[offset] for offset in offsets if offset in decoded]
+
+    def _scan_jsonl(self, start: int) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Yield (offset, message dict) for each complete line from start."""
         if not self.jsonl_path or not self.jsonl_path.exists():
-            return None
+            return
+        with self.jsonl_path.open("rb") as f:
+            f.seek(start)
+            offset = start
+            for line in f:
+                if line.endswith(b"\n"):
+                    try:
+                        yield offset, orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        logger.warning("Skipping unreadable event line", offset=offset)
+                offset += len(line)
+
+    def _index_row(self, message: AgentMessage, jsonl_offset: int) -> tuple[Any, ...]:
+        """Build the SQLite index row for a message."""
+        return (
+            message.message_id,
+            message.run_id,
+            message.timestamp.isoformat(),
+            message.from_agent,
+            message.to_agent,
+            message.message_type.value,
+            message.confidence,
+            len(message.evidence_ids),
+            jsonl_offset,
+            message.context.get("phase"),
+            message.context.get("agent") or message.from_agent,
+        )
 
-        try:
-            with open(self.jsonl_path, "r", encoding="utf-8") as f:
-                f.seek(offset)
-                line = f.readline()
-                if not line:
-                    return None
-
-                data = orjson.loads(line)
-                return self._dict_to_message(data)
-        except Exception as e:
-            logger.warning("Failed to read event at offset", offset=offset, error=str(e))
-            return None
+    @staticmethod
+    def _phase_of(data: dict[str, Any]) -> str | None:
+        """Phase recorded in a serialized message's context."""
+        return (data.get("context") or {}).get("phase")
+
+    @staticmethod
+    def _agent_of(data: dict[str, Any]) -> str:
+        """Agent recorded in a serialized message's context, else the sender."""
+        agent: str = (data.get("context") or {}).get("agent") or data["from_agent"]
+        return agent
 
     def _message_to_dict(self, message: AgentMessage) -> dict[str, Any]:
         """Convert AgentMessage to dict for JSON serialization."""
@@ -13,11 +13,13 @@ Orchestrates the complete equity research pipeline:
 from __future__ import annotations
 
 import asyncio
-import json
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Protocol
+from typing import TYPE_CHECKING, Any, Callable, Protocol
+
+if TYPE_CHECKING:
+    from er.coordinator.batch import SharedResources
 
 
 class ProgressCallback(Protocol):
@@ -53,12 +55,15 @@ from er.agents.synthesizer import SynthesizerAgent
 from er.agents.verifier import VerificationAgent
 from er.agents.vertical_analyst import VerticalAnalystAgent
 from er.budget import BudgetTracker
+from er.checkpoints import checkpoint_exists, load_checkpoint, write_checkpoint
 from er.config import Settings
 from er.coordinator.event_store import EventStore
 from er.evidence.store import EvidenceStore
+from er.llm.client_pool import ProviderClientPool
+from er.llm.response_cache import create_response_cache
 from er.llm.router import LLMRouter
 from er.logging import get_logger, log_context, set_run_id, set_phase
-from er.workspace.store import WorkspaceStore
+from er.workspace.store import ArtifactInput, WorkspaceStore
 from er.types import (
     CompanyContext,
     CrossVerticalMap,
@@ -74,7 +79,14 @@ from er.types import (
 )
 
 # Valuation and report modules
-from er.valuation.dcf import DCFEngine, DCFInputs, WACCInputs, DCFResult
+from er.valuation.dcf import (
+    DCFEngine,
+    DCFInputs,
+    DCFResult,
+    MonteCarloResult,
+    MonteCarloSpec,
+    WACCInputs,
+)
 from er.valuation.reverse_dcf import ReverseDCFEngine, ReverseDCFInputs, ReverseDCFResult
 from er.valuation.excel_export import ValuationExporter, ValuationWorkbook
 from er.reports.compiler import ReportCompiler, CompiledReport
@@ -82,6 +94,31 @@ from er.peers.selector import PeerSelector, PeerGroup, create_default_peer_datab
 
 logger = get_logger(__name__)
 
+# Checkpoint sections the stage loaders rebuild outputs from; other
+# sections are not decoded on resume
+DISCOVERY_SECTIONS = (
+    "official_segments",
+    "research_threads",
+    "research_groups",
+    "cross_cutting_themes",
+    "optionality_candidates",
+    "data_gaps",
+    "conflicting_signals",
+    "evidence_ids",
+    "thread_briefs",
+)
+# all_verified_facts repeats the facts in verification_results
+VERIFICATION_SECTIONS = (
+    "ticker",
+    "verification_results",
+    "total_facts",
+    "verified_count",
+    "contradicted_count",
+    "unverifiable_count",
+    "critical_issues",
+    "evidence_ids",
+)
+
 
 @dataclass
 class PipelineConfig:
@@ -197,6 +234,7 @@ class ResearchPipeline:
         settings: Settings | None = None,
         config: PipelineConfig | None = None,
         progress_callback: ProgressCallback | None = None,
+        shared: SharedResources | None = None,
     ) -> None:
         """Initialize the pipeline.
 
@@ -204,22 +242,49 @@ class ResearchPipeline:
             settings: Application settings (loads from env if None).
             config: Pipeline configuration.
             progress_callback: Optional callback for progress updates.
+            shared: Data layer shared with other runs (batch mode). Its
+                evidence store and clients are used but not closed here.
         """
         self.settings = settings or Settings()
         self.config = config or PipelineConfig()
         self._progress_callback = progress_callback
+        self._shared = shared
 
-        # Determine cache directory for evidence store
-        cache_dir = self.config.output_dir / "evidence" if self.config.output_dir else Path("output/evidence")
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        if shared is not None:
+            self.evidence_store = shared.evidence_store
+        else:
+            # Determine cache directory for evidence store
+            cache_dir = self.config.output_dir / "evidence" if self.config.output_dir else Path("output/evidence")
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self.evidence_store = EvidenceStore(
+                cache_dir=cache_dir,
+                write_behind=self.settings.EVIDENCE_WRITE_BEHIND,
+                max_blob_bytes=self.settings.evidence_blob_max_bytes,
+            )
 
         # Initialize shared resources
-        self.evidence_store = EvidenceStore(cache_dir=cache_dir)
-        self.budget_tracker = BudgetTracker(
-            budget_limit=self.config.max_budget_usd or 1000.0,  # Default to $1000 if not set
-            output_dir=self.config.output_dir,
+        budget_limit = self.config.max_budget_usd or 1000.0  # Default to $1000 if not set
+        if self.config.resume_from_run_dir and self.config.output_dir:
+            # Keep prior spend: replay the run's cost ledger
+            self.budget_tracker = BudgetTracker.resume(self.config.output_dir, budget_limit)
+        else:
+            self.budget_tracker = BudgetTracker(
+                budget_limit=budget_limit,
+                output_dir=self.config.output_dir,
+            )
+        # Batch runs share the batch's pool; a single run only needs its own
+        # pool to route provider clients through the LLM response cache
+        if shared is not None:
+            self._client_pool: ProviderClientPool | None = shared.client_pool
+        else:
+            response_cache = create_response_cache(self.settings)
+            self._client_pool = (
+                ProviderClientPool(self.settings, response_cache) if response_cache else None
+            )
+        self.llm_router = LLMRouter(
+            settings=self.settings,
+            client_pool=self._client_pool,
         )
-        self.llm_router = LLMRouter(settings=self.settings)
 
         # Event store for audit trail (initialized in run())
         self.event_store: EventStore | None = None
@@ -234,6 +299,8 @@ class ResearchPipeline:
             evidence_store=self.evidence_store,
             budget_tracker=self.budget_tracker,
             workspace_store=None,  # Set per-run
+            client_pool=self._client_pool,
+            fmp_client=shared.fmp_client if shared else None,
         )
 
         # Initialize agents
@@ -247,7 +314,10 @@ class ResearchPipeline:
         self._judge: JudgeAgent | None = None
 
     def _save_stage_output(self, stage: str, data: Any) -> None:
-        """Save stage output to JSON file for debugging and resume capability.
+        """Save stage output as a checkpoint for resume and the dashboard.
+
+        Written in the compact checkpoint format (see er.checkpoints), plus
+        indented JSON when CHECKPOINT_JSON_EXPORT is set.
 
         Args:
             stage: Stage name (e.g., "stage1_company_context", "stage2_discovery").
@@ -256,8 +326,6 @@ class ResearchPipeline:
         if not self.config.output_dir:
             return
 
-        output_path = self.config.output_dir / f"{stage}.json"
-
         try:
             # Convert dataclass to dict if needed
             if hasattr(data, "__dataclass_fields__"):
@@ -271,7 +339,12 @@ class ResearchPipeline:
             else:
                 data_dict = data
 
-            output_path.write_text(json.dumps(data_dict, indent=2, default=str))
+            output_path = write_checkpoint(
+                self.config.output_dir,
+                stage,
+                data_dict,
+                export_json=self.settings.CHECKPOINT_JSON_EXPORT,
+            )
             logger.info(f"Saved {stage} output", path=str(output_path), size_kb=output_path.stat().st_size / 1024)
         except Exception as e:
             logger.warning(f"Failed to save {stage} output", error=str(e))
@@ -306,11 +379,12 @@ class ResearchPipeline:
                 result[field_name] = value
         return result
 
-    def _load_checkpoint(self, stage: str) -> Any | None:
-        """Load a stage checkpoint from JSON file.
+    def _load_checkpoint(self, stage: str, sections: tuple[str, ...] | None = None) -> Any | None:
+        """Load a stage checkpoint (or a pre-checkpoint JSON file).
 
         Args:
             stage: Stage name (e.g., "stage1_company_context").
+            sections: Top-level keys to read (default: all).
 
         Returns:
             Loaded data as dict/list, or None if not found.
@@ -319,18 +393,12 @@ class ResearchPipeline:
         if not checkpoint_dir:
             return None
 
-        checkpoint_path = checkpoint_dir / f"{stage}.json"
-        if not checkpoint_path.exists():
-            logger.debug(f"No checkpoint found for {stage}", path=str(checkpoint_path))
-            return None
-
-        try:
-            data = json.loads(checkpoint_path.read_text())
-            logger.info(f"Loaded checkpoint for {stage}", path=str(checkpoint_path))
-            return data
-        except Exception as e:
-            logger.warning(f"Failed to load checkpoint for {stage}", error=str(e))
+        data = load_checkpoint(checkpoint_dir, stage, sections)
+        if data is None:
+            logger.debug(f"No checkpoint found for {stage}", run_dir=str(checkpoint_dir))
             return None
+        logger.info(f"Loaded checkpoint for {stage}", run_dir=str(checkpoint_dir))
+        return data
 
     def _load_company_context(self) -> CompanyContext | None:
         """Load CompanyContext from checkpoint."""
@@ -341,7 +409,7 @@ class ResearchPipeline:
 
     def _load_discovery_output(self) -> DiscoveryOutput | None:
         """Load DiscoveryOutput from checkpoint."""
-        data = self._load_checkpoint("stage2_discovery")
+        data = self._load_checkpoint("stage2_discovery", DISCOVERY_SECTIONS)
         if not data:
             return None
 
@@ -473,42 +541,28 @@ class ResearchPipeline:
         if not self.config.resume_from_run_dir:
             return set()
 
+        run_dir = self.config.resume_from_run_dir
         completed: set[float] = set()
-        stage_files = {
-            1: "stage1_company_context.json",
-            2: "stage2_discovery.json",
-            3: "stage3_verticals.json",  # Need both stage3 files
-            3.5: "stage3_5_verification.json",
-            3.75: "stage3_75_integration.json",
-            4: "stage4_claude_synthesis.json",  # Need both stage4 files
-            5: "stage5_editorial_feedback.json",
-            6: "stage6_final_report.json",
+        stage_checkpoints = {
+            1: ("stage1_company_context",),
+            2: ("stage2_discovery",),
+            3: ("stage3_group_research", "stage3_verticals"),
+            3.5: ("stage3_5_verification",),
+            3.75: ("stage3_75_integration",),
+            4: ("stage4_claude_synthesis", "stage4_gpt_synthesis"),
+            5: ("stage5_editorial_feedback",),
+            6: ("stage6_final_report",),
         }
 
-        # Check stage 3 (needs both files)
-        stage3_group = self.config.resume_from_run_dir / "stage3_group_research.json"
-        stage3_vert = self.config.resume_from_run_dir / "stage3_verticals.json"
-
-        # Check stage 4 (needs both files)
-        stage4_claude = self.config.resume_from_run_dir / "stage4_claude_synthesis.json"
-        stage4_gpt = self.config.resume_from_run_dir / "stage4_gpt_synthesis.json"
-
-        for stage, filename in stage_files.items():
-            if stage == 3:
-                if stage3_group.exists() and stage3_vert.exists():
-                    completed.add(3)
-            elif stage == 4:
-                if stage4_claude.exists() and stage4_gpt.exists():
-                    completed.add(4)
-            else:
-                if (self.config.resume_from_run_dir / filename).exists():
-                    completed.add(stage)
+        for stage, names in stage_checkpoints.items():
+            if all(checkpoint_exists(run_dir, name) for name in names):
+                completed.add(stage)
 
         return completed
 
     def _load_verification_output(self) -> VerifiedResearchPackage | None:
         """Load Stage 3.5 verification output from checkpoint."""
-        data = self._load_checkpoint("stage3_5_verification")
+        data = self._load_checkpoint("stage3_5_verification", VERIFICATION_SECTIONS)
         if not data:
             return None
 
@@ -1590,6 +1644,7 @@ class ResearchPipeline:
         dcf_engine = DCFEngine()
         dcf_result: DCFResult | None = None
         sensitivity_data: dict[str, Any] | None = None
+        monte_carlo_result: MonteCarloResult | None = None
 
         try:
             # Project 5 years of revenue (assume 10% CAGR as placeholder)
@@ -1626,10 +1681,20 @@ class ResearchPipeline:
                 shares_outstanding=shares_outstanding,
             )
 
+            # Value distribution over correlated input scenarios
+            # (fixed seed keeps reruns reproducible)
+            monte_carlo_result = dcf_engine.monte_carlo(
+                dcf_inputs,
+                net_debt=net_debt,
+                shares_outstanding=shares_outstanding,
+                spec=MonteCarloSpec(seed=0),
+            )
+
             logger.info(
                 "DCF valuation complete",
                 ticker=ticker,
                 intrinsic_value=dcf_result.intrinsic_value_per_share,
+                monte_carlo_median=monte_carlo_result.percentiles.get(50),
             )
 
         except Exception as e:
@@ -1699,29 +1764,41 @@ class ResearchPipeline:
 
         # Store in WorkspaceStore
         if self.workspace_store:
+            artifacts = []
             if dcf_result:
-                self.workspace_store.put_artifact(
+                artifacts.append(ArtifactInput(
                     artifact_type="dcf_valuation",
                     producer="pipeline",
                     json_obj=dcf_result.to_dict(),
                     summary=f"DCF intrinsic value: ${dcf_result.intrinsic_value_per_share:.2f}",
-                )
+                ))
+
+            if monte_carlo_result and monte_carlo_result.n_valid:
+                p5, p95 = monte_carlo_result.percentiles[5], monte_carlo_result.percentiles[95]
+                artifacts.append(ArtifactInput(
+                    artifact_type="dcf_monte_carlo",
+                    producer="pipeline",
+                    json_obj=monte_carlo_result.to_dict(),
+                    summary=f"DCF value 5th-95th percentile: ${p5:.2f}-${p95:.2f}",
+                ))
 
             if reverse_dcf_result:
-                self.workspace_store.put_artifact(
+                artifacts.append(ArtifactInput(
                     artifact_type="reverse_dcf",
                     producer="pipeline",
                     json_obj=reverse_dcf_result.to_dict(),
                     summary=f"Implied CAGR: {reverse_dcf_result.implied_revenue_cagr:.1%}",
-                )
+                ))
 
             if peer_group:
-                self.workspace_store.put_artifact(
+                artifacts.append(ArtifactInput(
                     artifact_type="peer_group",
                     producer="pipeline",
                     json_obj=peer_group.to_dict(),
                     summary=f"Selected {len(peer_group.peers)} peers",
-                )
+                ))
+
+            self.workspace_store.put_artifacts(artifacts)
 
         return valuation_workbook, peer_group
 
@@ -1864,6 +1941,15 @@ class ResearchPipeline:
         if self.workspace_store:
             self.workspace_store.close()
             self.workspace_store = None
+        # Commit buffered evidence; a shared store is closed by its owner
+        if self._shared is None:
+            await self.evidence_store.close()
+            if self._client_pool is not None:
+                await self._client_pool.close()
+        else:
+            await self.evidence_store.flush()
+        # Write the final cost snapshot and close the ledger
+        self.budget_tracker.close()
         # Clear logging context
         set_run_id(None)
         set_phase(None)
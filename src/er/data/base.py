@@ -25,6 +25,8 @@ Concrete implementations in submodules:
 
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -47,3 +49,58 @@ class DataFetcher(ABC):
     async def close(self) -> None:
         """Close any open connections."""
         ...
+
+
+class RateLimiter:
+    """Async token bucket rate limiter.
+
+    Tokens refill continuously at ``rate / period`` per second up to
+    ``burst``. Each ``acquire()`` consumes one token, sleeping until one
+    is available. Safe to share across concurrent tasks.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        period: float = 1.0,
+        burst: int | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            rate: Number of requests allowed per period.
+            period: Period length in seconds (60.0 for per-minute quotas).
+            burst: Maximum tokens held at once. Defaults to ``rate``.
+        """
+        if rate <= 0 or period <= 0:
+            raise ValueError("rate and period must be positive")
+        self.rate = rate
+        self.period = period
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._refill_per_sec = rate / period
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self._refill_per_sec)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                wait = (1.0 - self._tokens) / self._refill_per_sec
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1.0
+
+    async def __aenter__(self) -> RateLimiter:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
@@ -12,22 +12,30 @@ Provides access to:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import os
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
 import orjson
 
+from er.data.base import RateLimiter
 from er.evidence.store import EvidenceStore
 from er.exceptions import DataFetchError
 from er.logging import get_logger
 from er.types import Evidence, SourceTier, ToSRisk
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 # Base URL for FMP API
 FMP_BASE_URL = "https://financialmodelingprep.com/stable"
 
@@ -35,6 +43,10 @@ FMP_BASE_URL = "https://financialmodelingprep.com/stable"
 FMP_CACHE_DIR = Path.home() / ".cache" / "equity-research" / "fmp"
 FMP_CACHE_TTL_HOURS = 24  # Cache TTL in hours
 
+# Concurrency settings for network requests (cache hits are not limited)
+FMP_MAX_CONCURRENCY = 8  # Max in-flight requests per client
+FMP_REQUESTS_PER_MINUTE = 300  # FMP Starter plan quota
+
 # News filtering - low-value sources to exclude (opinion/clickbait)
 LOW_VALUE_NEWS_SOURCES = {
     "defenseworld.net",  # Politician stock trades - noise
@@ -78,12 +90,16 @@ class FMPClient:
         self,
         evidence_store: EvidenceStore,
         api_key: str | None = None,
+        max_concurrency: int = FMP_MAX_CONCURRENCY,
+        requests_per_minute: int = FMP_REQUESTS_PER_MINUTE,
     ) -> None:
         """Initialize FMP client.
 
         Args:
             evidence_store: Store for persisting fetched data.
             api_key: FMP API key. If None, reads from FMP_API_KEY env var.
+            max_concurrency: Maximum number of in-flight API requests.
+            requests_per_minute: FMP per-minute request quota to respect.
         """
         self.evidence_store = evidence_store
         self.api_key = api_key or os.environ.get("FMP_API_KEY")
@@ -93,6 +109,14 @@ class FMPClient:
 
         self._client: httpx.AsyncClient | None = None
 
+        # Shared across all concurrent fetches made through this client
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._rate_limiter = RateLimiter(
+            rate=requests_per_minute,
+            period=60.0,
+            burst=max(1, max_concurrency),
+        )
+
         # Ensure cache directory exists
         FMP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -208,7 +232,9 @@ class FMPClient:
         logger.info("Fetching from FMP", endpoint=endpoint, params={k: v for k, v in request_params.items() if k != "apikey"})
 
         try:
-            response = await client.get(url, params=request_params)
+            async with self._semaphore:
+                await self._rate_limiter.acquire()
+                response = await client.get(url, params=request_params)
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
             raise DataFetchError(
@@ -267,6 +293,25 @@ class FMPClient:
 
         return data, evidence
 
+    async def _run_ordered(
+        self,
+        factories: list[Callable[[], Awaitable[T]]],
+        concurrent: bool,
+    ) -> list[T]:
+        """Run independent fetches and return results in input order.
+
+        Args:
+            factories: Zero-arg callables returning the awaitables to run.
+            concurrent: Run all at once (bounded by the client semaphore
+                and rate limiter) instead of one after another.
+
+        Returns:
+            Results in the same order as ``factories``.
+        """
+        if concurrent:
+            return list(await asyncio.gather(*(factory() for factory in factories)))
+        return [await factory() for factory in factories]
+
     def _params_to_string(self, params: dict[str, Any] | None) -> str:
         """Convert params to query string (excluding apikey)."""
         if not params:
@@ -447,22 +492,24 @@ class FMPClient:
         self,
         symbol: str,
         num_quarters: int = 4,
+        concurrent: bool = True,
     ) -> list[tuple[dict[str, Any], Evidence]]:
         """Get recent earnings call transcripts.
 
         Args:
             symbol: Stock ticker symbol.
             num_quarters: Number of recent quarters to fetch.
+            concurrent: Fetch all quarters concurrently.
 
         Returns:
-            List of (transcript data, Evidence record) tuples.
+            List of (transcript data, Evidence record) tuples, most recent first.
         """
         # Calculate recent quarters
         now = datetime.now(timezone.utc)
         current_year = now.year
         current_quarter = (now.month - 1) // 3 + 1
 
-        results = []
+        periods: list[tuple[int, int]] = []
         year, quarter = current_year, current_quarter
 
         for _ in range(num_quarters):
@@ -471,13 +518,15 @@ class FMPClient:
             if quarter == 0:
                 quarter = 4
                 year -= 1
+            periods.append((year, quarter))
 
+        async def fetch_quarter(
+            year: int, quarter: int
+        ) -> tuple[dict[str, Any], Evidence] | None:
             try:
                 transcripts, evidence = await self.get_earnings_transcript(
                     symbol, year, quarter
                 )
-                if transcripts:
-                    results.append((transcripts[0], evidence))
             except DataFetchError as e:
                 logger.warning(
                     "Failed to fetch transcript",
@@ -486,8 +535,14 @@ class FMPClient:
                     quarter=quarter,
                     error=str(e),
                 )
+                return None
+            return (transcripts[0], evidence) if transcripts else None
 
-        return results
+        fetched = await self._run_ordered(
+            [partial(fetch_quarter, y, q) for y, q in periods],
+            concurrent,
+        )
+        return [result for result in fetched if result is not None]
 
     # ==================== News ====================
 
@@ -1159,6 +1214,7 @@ class FMPClient:
     async def get_quant_metrics(
         self,
         symbol: str,
+        concurrent: bool = True,
     ) -> tuple[dict[str, Any], list[str]]:
         """Get curated quant metrics for equity research.
 
@@ -1167,6 +1223,7 @@ class FMPClient:
 
         Args:
             symbol: Stock ticker symbol.
+            concurrent: Fetch the underlying endpoints concurrently.
 
         Returns:
             Tuple of (structured quant metrics dict, list of evidence IDs).
@@ -1174,60 +1231,51 @@ class FMPClient:
         symbol = symbol.upper()
         evidence_ids: list[str] = []
 
-        # Fetch all data sources
-        ratios_ttm = {}
-        key_metrics_ttm = {}
-        scores = {}
-        income_statements = []
-
-        try:
-            data, ev = await self.get_financial_ratios_ttm(symbol)
-            if data:
-                ratios_ttm = data[0]
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch ratios TTM", symbol=symbol, error=str(e))
-
-        try:
-            data, ev = await self.get_key_metrics_ttm(symbol)
-            if data:
-                key_metrics_ttm = data[0]
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch key metrics TTM", symbol=symbol, error=str(e))
-
-        try:
-            data, ev = await self.get_financial_scores(symbol)
-            if data:
-                scores = data[0]
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch financial scores", symbol=symbol, error=str(e))
-
-        # Fetch financial statements for advanced metrics (need 2 years)
-        balance_sheets: list[dict[str, Any]] = []
-        cash_flows: list[dict[str, Any]] = []
-
-        try:
-            data, ev = await self.get_income_statement(symbol, period="annual", limit=2)
-            income_statements = data
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch income statements", symbol=symbol, error=str(e))
-
-        try:
-            data, ev = await self.get_balance_sheet(symbol, period="annual", limit=2)
-            balance_sheets = data
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch balance sheets for advanced metrics", symbol=symbol, error=str(e))
-
-        try:
-            data, ev = await self.get_cash_flow(symbol, period="annual", limit=2)
-            cash_flows = data
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch cash flows for advanced metrics", symbol=symbol, error=str(e))
+        async def fetch_source(
+            label: str,
+            fetch: Callable[[], Awaitable[tuple[list[dict[str, Any]], Evidence]]],
+        ) -> tuple[list[dict[str, Any]], str | None]:
+            try:
+                data, ev = await fetch()
+            except DataFetchError as e:
+                logger.warning(f"Failed to fetch {label}", symbol=symbol, error=str(e))
+                return [], None
+            return data, ev.evidence_id
+
+        # Fetch all data sources; statements for advanced metrics need 2 years
+        fetched = await self._run_ordered(
+            [
+                lambda: fetch_source("ratios TTM", lambda: self.get_financial_ratios_ttm(symbol)),
+                lambda: fetch_source("key metrics TTM", lambda: self.get_key_metrics_ttm(symbol)),
+                lambda: fetch_source("financial scores", lambda: self.get_financial_scores(symbol)),
+                lambda: fetch_source(
+                    "income statements",
+                    lambda: self.get_income_statement(symbol, period="annual", limit=2),
+                ),
+                lambda: fetch_source(
+                    "balance sheets for advanced metrics",
+                    lambda: self.get_balance_sheet(symbol, period="annual", limit=2),
+                ),
+                lambda: fetch_source(
+                    "cash flows for advanced metrics",
+                    lambda: self.get_cash_flow(symbol, period="annual", limit=2),
+                ),
+            ],
+            concurrent,
+        )
+        evidence_ids.extend(ev_id for _, ev_id in fetched if ev_id is not None)
+
+        (
+            (ratios_data, _),
+            (key_metrics_data, _),
+            (scores_data, _),
+            (income_statements, _),
+            (balance_sheets, _),
+            (cash_flows, _),
+        ) = fetched
+        ratios_ttm: dict[str, Any] = ratios_data[0] if ratios_data else {}
+        key_metrics_ttm: dict[str, Any] = key_metrics_data[0] if key_metrics_data else {}
+        scores: dict[str, Any] = scores_data[0] if scores_data else {}
 
         # Helper to get value (TTM fields have TTM suffix)
         def get_ratio(field: str) -> Any:
@@ -1344,22 +1392,29 @@ class FMPClient:
         symbol: str,
         include_transcripts: bool = False,  # Requires higher FMP tier - default off
         num_transcript_quarters: int = 4,
+        concurrent: bool = True,
     ) -> dict[str, Any]:
         """Fetch all relevant data to build CompanyContext.
 
         This is the main method used by the Data Orchestrator to gather
         all financial data for a company in one call.
 
+        In concurrent mode every section is fetched at once, bounded by the
+        client's concurrency cap and per-minute rate limiter. Sections are
+        assembled in a fixed order, so the context dict and evidence ID
+        ordering are identical to a sequential fetch.
+
         Args:
             symbol: Stock ticker symbol.
             include_transcripts: Whether to fetch earnings transcripts.
             num_transcript_quarters: Number of transcript quarters to fetch.
+            concurrent: Fetch sections concurrently instead of one by one.
 
         Returns:
             Dict with all fetched data and evidence_ids.
         """
         symbol = symbol.upper()
-        logger.info("Fetching full company context", symbol=symbol)
+        logger.info("Fetching full company context", symbol=symbol, concurrent=concurrent)
 
         evidence_ids: list[str] = []
         context: dict[str, Any] = {
@@ -1367,130 +1422,102 @@ class FMPClient:
             "fetched_at": datetime.now(timezone.utc).isoformat(),
         }
 
-        # Fetch profile
-        try:
-            profiles, ev = await self.get_company_profile(symbol)
-            context["profile"] = profiles[0] if profiles else {}
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch profile", symbol=symbol, error=str(e))
-            context["profile"] = {}
-
-        # Fetch financial statements (annual)
-        try:
-            income, ev = await self.get_income_statement(symbol, "annual", 3)
-            context["income_statement_annual"] = income
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch income statement", symbol=symbol, error=str(e))
-            context["income_statement_annual"] = []
-
-        try:
-            balance, ev = await self.get_balance_sheet(symbol, "annual", 3)
-            context["balance_sheet_annual"] = balance
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch balance sheet", symbol=symbol, error=str(e))
-            context["balance_sheet_annual"] = []
+        async def single(
+            fetch: Awaitable[tuple[Any, Evidence]],
+        ) -> tuple[Any, list[str]]:
+            data, ev = await fetch
+            return data, [ev.evidence_id]
 
-        try:
-            cashflow, ev = await self.get_cash_flow(symbol, "annual", 3)
-            context["cash_flow_annual"] = cashflow
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch cash flow", symbol=symbol, error=str(e))
-            context["cash_flow_annual"] = []
-
-        # Fetch financial statements (quarterly - last 4)
-        try:
-            income_q, ev = await self.get_income_statement(symbol, "quarterly", 4)
-            context["income_statement_quarterly"] = income_q
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch quarterly income", symbol=symbol, error=str(e))
-            context["income_statement_quarterly"] = []
-
-        # Fetch segmentation
-        try:
-            prod_seg, ev = await self.get_revenue_product_segmentation(symbol)
-            context["revenue_product_segmentation"] = prod_seg
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch product segmentation", symbol=symbol, error=str(e))
-            context["revenue_product_segmentation"] = []
+        async def profile() -> tuple[Any, list[str]]:
+            profiles, ev = await self.get_company_profile(symbol)
+            return (profiles[0] if profiles else {}), [ev.evidence_id]
 
-        try:
-            geo_seg, ev = await self.get_revenue_geographic_segmentation(symbol)
-            context["revenue_geographic_segmentation"] = geo_seg
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch geo segmentation", symbol=symbol, error=str(e))
-            context["revenue_geographic_segmentation"] = []
-
-        # Fetch transcripts
+        async def transcripts() -> tuple[Any, list[str]]:
+            fetched = await self.get_recent_transcripts(
+                symbol, num_transcript_quarters, concurrent=concurrent
+            )
+            return [t[0] for t in fetched], [ev.evidence_id for _, ev in fetched]
+
+        async def quant_metrics() -> tuple[Any, list[str]]:
+            return await self.get_quant_metrics(symbol, concurrent=concurrent)
+
+        # (context key, log label, fetcher, default on failure) in output order.
+        # News is fetched as 50 items and filtered to 15 high-quality signals -
+        # headlines only, no URLs, for Discovery.
+        sections: list[tuple[str, str, Callable[[], Awaitable[tuple[Any, list[str]]]], Any]] = [
+            ("profile", "profile", profile, {}),
+            (
+                "income_statement_annual", "income statement",
+                lambda: single(self.get_income_statement(symbol, "annual", 3)), [],
+            ),
+            (
+                "balance_sheet_annual", "balance sheet",
+                lambda: single(self.get_balance_sheet(symbol, "annual", 3)), [],
+            ),
+            (
+                "cash_flow_annual", "cash flow",
+                lambda: single(self.get_cash_flow(symbol, "annual", 3)), [],
+            ),
+            (
+                "income_statement_quarterly", "quarterly income",
+                lambda: single(self.get_income_statement(symbol, "quarterly", 4)), [],
+            ),
+            (
+                "revenue_product_segmentation", "product segmentation",
+                lambda: single(self.get_revenue_product_segmentation(symbol)), [],
+            ),
+            (
+                "revenue_geographic_segmentation", "geo segmentation",
+                lambda: single(self.get_revenue_geographic_segmentation(symbol)), [],
+            ),
+        ]
         if include_transcripts:
+            sections.append(("transcripts", "transcripts", transcripts, []))
+        sections += [
+            (
+                "news", "news",
+                lambda: single(self.get_stock_news(
+                    symbol, limit=50, filter_news=True, max_filtered=15
+                )), [],
+            ),
+            (
+                "analyst_estimates", "analyst estimates",
+                lambda: single(self.get_analyst_estimates(symbol)), [],
+            ),
+            (
+                "price_target_summary", "price target summary",
+                lambda: single(self.get_price_target_summary(symbol)), {},
+            ),
+            (
+                "price_target_consensus", "price target consensus",
+                lambda: single(self.get_price_target_consensus(symbol)), {},
+            ),
+            (
+                "analyst_grades", "analyst grades",
+                lambda: single(self.get_stock_grades(symbol)), [],
+            ),
+            ("quant_metrics", "quant metrics", quant_metrics, {}),
+        ]
+
+        async def fetch_section(
+            label: str,
+            fetch: Callable[[], Awaitable[tuple[Any, list[str]]]],
+            default: Any,
+        ) -> tuple[Any, list[str]]:
             try:
-                transcripts = await self.get_recent_transcripts(symbol, num_transcript_quarters)
-                context["transcripts"] = [t[0] for t in transcripts]
-                for _, ev in transcripts:
-                    evidence_ids.append(ev.evidence_id)
+                return await fetch()
             except DataFetchError as e:
-                logger.warning("Failed to fetch transcripts", symbol=symbol, error=str(e))
-                context["transcripts"] = []
-
-        # Fetch news (fetch 50, filter to 15 high-quality signals)
-        # News serves as signals for Discovery - headlines only, no URLs
-        try:
-            news, ev = await self.get_stock_news(
-                symbol, limit=50, filter_news=True, max_filtered=15
-            )
-            context["news"] = news
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch news", symbol=symbol, error=str(e))
-            context["news"] = []
-
-        # Fetch analyst data
-        try:
-            estimates, ev = await self.get_analyst_estimates(symbol)
-            context["analyst_estimates"] = estimates
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch analyst estimates", symbol=symbol, error=str(e))
-            context["analyst_estimates"] = []
-
-        try:
-            pt_summary, ev = await self.get_price_target_summary(symbol)
-            context["price_target_summary"] = pt_summary
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch price target summary", symbol=symbol, error=str(e))
-            context["price_target_summary"] = {}
+                logger.warning(f"Failed to fetch {label}", symbol=symbol, error=str(e))
+                return default, []
 
-        try:
-            pt_consensus, ev = await self.get_price_target_consensus(symbol)
-            context["price_target_consensus"] = pt_consensus
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch price target consensus", symbol=symbol, error=str(e))
-            context["price_target_consensus"] = {}
+        results = await self._run_ordered(
+            [partial(fetch_section, label, fetch, default) for _, label, fetch, default in sections],
+            concurrent,
+        )
 
-        try:
-            grades, ev = await self.get_stock_grades(symbol)
-            context["analyst_grades"] = grades
-            evidence_ids.append(ev.evidence_id)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch analyst grades", symbol=symbol, error=str(e))
-            context["analyst_grades"] = []
-
-        # Fetch quant metrics (ratios, key metrics, scores with red flags)
-        try:
-            quant_metrics, quant_evidence_ids = await self.get_quant_metrics(symbol)
-            context["quant_metrics"] = quant_metrics
-            evidence_ids.extend(quant_evidence_ids)
-        except DataFetchError as e:
-            logger.warning("Failed to fetch quant metrics", symbol=symbol, error=str(e))
-            context["quant_metrics"] = {}
+        for (key, _, _, _), (value, section_evidence_ids) in zip(sections, results, strict=True):
+            context[key] = value
+            evidence_ids.extend(section_evidence_ids)
 
         context["evidence_ids"] = evidence_ids
 
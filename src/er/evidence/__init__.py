@@ -8,6 +8,6 @@ This package handles storage and retrieval of evidence:
 - Provenance tracking
 """
 
-from er.evidence.store import EvidenceStore
+from er.evidence.store import EvidenceInput, EvidenceStore
 
-__all__ = ["EvidenceStore"]
+__all__ = ["EvidenceInput", "EvidenceStore"]
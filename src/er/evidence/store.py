@@ -3,43 +3,233 @@ Evidence store for managing research evidence.
 
 The central store for ALL external content. Every piece of data from outside
 the system gets stored here with full provenance tracking.
+
+Full-text search uses an SQLite FTS5 table (evidence_fts) over title, snippet
+and text extracted from the blob. Triggers keep it in sync with the evidence
+table; databases created before FTS existed are indexed with
+backfill_search_index() (`er reindex-evidence`).
+
+Writes are grouped into transactions: store_many() inserts a batch in one
+commit, and in write-behind mode store() buffers rows and flushes them when
+the buffer reaches flush_size, after flush_interval seconds, before any
+read, and on close. The database runs in WAL mode with synchronous=NORMAL.
+
+Raw content lives in a content-addressed FileCache (compressed, optionally
+size-bounded) under blobs/.
+
+Derivations of a blob (extracted page text, and later chunk lists) are kept
+in the derived table, keyed by content hash, kind and the deriving code's
+version, so re-reading known content is one small row lookup instead of a
+blob read plus re-parse. HTTP validators (ETag, Last-Modified) for fetched
+URLs are kept in url_validators so fetchers can revalidate with conditional
+requests.
 """
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
+import html
+import re
+import sqlite3
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import aiosqlite
+import orjson
 
+from er.cache.file_cache import BlobReference, FileCache
 from er.logging import get_logger
 from er.types import Evidence, SourceTier, ToSRisk, generate_id, utc_now
 
 logger = get_logger(__name__)
 
+# Blob text beyond this many characters is not indexed
+MAX_SEARCH_BODY_CHARS = 100_000
+
+# Write-behind defaults: flush after this many rows or this many seconds
+DEFAULT_FLUSH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+
+_INSERT_SQL = """
+    INSERT INTO evidence (
+        evidence_id, source_url, retrieved_at, content_type, content_hash,
+        snippet, title, published_at, author, tos_risk, source_tier, blob_path
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# FTS rows share the evidence rowid, found via the primary key index
+_UPDATE_BODY_SQL = """
+    UPDATE evidence_fts SET body = ?
+    WHERE rowid = (SELECT rowid FROM evidence WHERE evidence_id = ?)
+"""
+
+# bm25() column weights for (title, snippet, body); evidence_id is unindexed
+_BM25_WEIGHTS = "0.0, 10.0, 5.0, 1.0"
+
+_FTS_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS evidence_fts USING fts5(
+        evidence_id UNINDEXED,
+        title,
+        snippet,
+        body,
+        tokenize = 'porter unicode61',
+        prefix = '2 3'
+    )
+    """,
+    # FTS rows share the evidence rowid; body is filled in by the writer
+    """
+    CREATE TRIGGER IF NOT EXISTS evidence_fts_insert AFTER INSERT ON evidence BEGIN
+        INSERT INTO evidence_fts(rowid, evidence_id, title, snippet, body)
+        VALUES (new.rowid, new.evidence_id, coalesce(new.title, ''), new.snippet, '');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS evidence_fts_delete AFTER DELETE ON evidence BEGIN
+        DELETE FROM evidence_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS evidence_fts_update AFTER UPDATE OF title, snippet ON evidence
+    BEGIN
+        UPDATE evidence_fts
+        SET title = coalesce(new.title, ''), snippet = new.snippet
+        WHERE rowid = old.rowid;
+    END
+    """,
+]
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SCRIPT_RE = re.compile(r"(?is)<(script|style|noscript)\b.*?</\1>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_QUERY_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def extract_search_text(content: bytes, content_type: str) -> str:
+    """Extract indexable text from blob content.
+
+    Text-like content (HTML, JSON, plain text, XML) is decoded and HTML
+    markup stripped. Binary content (PDF, images) yields an empty string.
+
+    Args:
+        content: Raw blob bytes.
+        content_type: MIME type of the content.
+
+    Returns:
+        Plain text, truncated to MAX_SEARCH_BODY_CHARS.
+    """
+    mime = content_type.split(";", 1)[0].strip().lower()
+    if not (mime.startswith("text/") or mime.endswith(("json", "xml"))):
+        return ""
+
+    text = content.decode("utf-8", errors="ignore")
+    if "html" in mime or "xml" in mime:
+        text = _SCRIPT_RE.sub(" ", text)
+        text = html.unescape(_TAG_RE.sub(" ", text))
+    return _WHITESPACE_RE.sub(" ", text).strip()[:MAX_SEARCH_BODY_CHARS]
+
+
+def build_fts_query(query: str) -> str:
+    """Convert a user query into an FTS5 MATCH expression.
+
+    Every term must match (implicit AND). "Double quoted" text is a phrase
+    and a trailing * makes a term a prefix query (e.g. `semicond*`). All
+    other FTS5 syntax is quoted away so user input cannot break the query.
+
+    Args:
+        query: User search string.
+
+    Returns:
+        FTS5 expression, or "" if the query has no searchable terms.
+    """
+    parts = []
+    for match in _QUERY_TOKEN_RE.finditer(query):
+        phrase, term = match.groups()
+        if phrase is not None:
+            if phrase.strip():
+                parts.append('"' + phrase.replace('"', '""') + '"')
+            continue
+
+        prefix = term.endswith("*")
+        term = term.rstrip("*").replace('"', "")
+        if not any(ch.isalnum() for ch in term):
+            continue
+        parts.append('"' + term + '"' + ("*" if prefix else ""))
+    return " ".join(parts)
+
+
+@dataclass(frozen=True)
+class EvidenceInput:
+    """One item for EvidenceStore.store_many (same fields as store())."""
+
+    url: str
+    content: bytes
+    content_type: str
+    snippet: str
+    title: str | None = None
+    published_at: datetime | None = None
+    author: str | None = None
+    tos_risk: ToSRisk = ToSRisk.NONE
+    source_tier: SourceTier = SourceTier.OTHER
+
+
+# (evidence row for _INSERT_SQL, extracted blob text for the search index)
+_PendingRow = tuple[tuple[Any, ...], str]
+
 
 class EvidenceStore:
     """Central store for all evidence with provenance tracking.
 
-    Stores raw content as files under .cache/blobs/{sha256_hash}
-    and metadata in SQLite at .cache/evidence.db.
+    Stores raw content in a FileCache under .cache/blobs/ (addressed by
+    SHA-256) and metadata in SQLite at .cache/evidence.db.
     """
 
-    def __init__(self, cache_dir: str | Path) -> None:
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        write_behind: bool = False,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        blob_cache: FileCache | None = None,
+        max_blob_bytes: int | None = None,
+    ) -> None:
         """Initialize evidence store.
 
         Args:
             cache_dir: Base directory for cache storage.
+            write_behind: Buffer store() rows and commit them in batches.
+            flush_size: Buffered rows that trigger a flush (write-behind).
+            flush_interval: Seconds after the first buffered row before a
+                flush (write-behind).
+            blob_cache: Blob storage (default: FileCache under blobs/).
+            max_blob_bytes: Size limit for the default blob cache; least
+                recently used blobs are evicted beyond it.
         """
         self.cache_dir = Path(cache_dir)
         self.blobs_dir = self.cache_dir / "blobs"
+        self.blob_cache = blob_cache or FileCache(self.blobs_dir, max_size_bytes=max_blob_bytes)
         self.db_path = self.cache_dir / "evidence.db"
         self._db: aiosqlite.Connection | None = None
+        self._fts_enabled = False
+
+        self.write_behind = write_behind
+        self.flush_size = max(1, flush_size)
+        self.flush_interval = flush_interval
+        self._pending: list[_PendingRow] = []
+        self._write_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
 
     async def init(self) -> None:
-        """Initialize the store - create directories and database schema."""
+        """Initialize the store - create directories and database schema.
+
+        Safe to call more than once; a store shared across pipeline runs
+        keeps its existing connection.
+        """
+        if self._db is not None:
+            return
+
         # Create directories
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.blobs_dir.mkdir(parents=True, exist_ok=True)
@@ -48,6 +238,11 @@ class EvidenceStore:
         self._db = await aiosqlite.connect(self.db_path)
         self._db.row_factory = aiosqlite.Row
 
+        # WAL lets readers (dashboard, other runs) proceed during writes;
+        # NORMAL only fsyncs at checkpoints, which is safe in WAL mode
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute("PRAGMA synchronous=NORMAL")
+
         # Create schema
         await self._db.execute("""
             CREATE TABLE IF NOT EXISTS evidence (
@@ -77,37 +272,254 @@ class EvidenceStore:
             "CREATE INDEX IF NOT EXISTS idx_evidence_tier ON evidence(source_tier)"
         )
 
+        # Derived artifacts (e.g. extracted text) keyed by blob content
+        await self._db.execute("""
+            CREATE TABLE IF NOT EXISTS derived (
+                content_hash TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                version TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (content_hash, kind, version)
+            ) WITHOUT ROWID
+        """)
+
+        # HTTP cache validators of the latest content fetched per URL
+        await self._db.execute("""
+            CREATE TABLE IF NOT EXISTS url_validators (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                checked_at TEXT NOT NULL
+            )
+        """)
+
+        await self._init_search_index()
+
         await self._db.commit()
         logger.info("Evidence store initialized", cache_dir=str(self.cache_dir))
 
+    async def _init_search_index(self) -> None:
+        """Create the FTS5 table and sync triggers.
+
+        Falls back to LIKE search if this SQLite build lacks FTS5. When the
+        table is created for an existing database, titles and snippets are
+        indexed immediately; blob text needs backfill_search_index().
+        """
+        assert self._db is not None
+
+        async with self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'evidence_fts'"
+        ) as cursor:
+            existed = await cursor.fetchone() is not None
+
+        try:
+            for statement in _FTS_SCHEMA:
+                await self._db.execute(statement)
+        except sqlite3.OperationalError as e:
+            logger.warning("FTS5 unavailable, using LIKE search", error=str(e))
+            self._fts_enabled = False
+            return
+        self._fts_enabled = True
+
+        if not existed:
+            indexed = await self._index_missing_rows()
+            if indexed:
+                logger.info(
+                    "Indexed existing evidence titles and snippets; "
+                    "run backfill_search_index() to index blob text",
+                    rows=indexed,
+                )
+
+    async def _index_missing_rows(self) -> int:
+        """Add FTS rows (without body text) for evidence not yet indexed."""
+        assert self._db is not None
+        cursor = await self._db.execute(
+            """
+            INSERT INTO evidence_fts(rowid, evidence_id, title, snippet, body)
+            SELECT e.rowid, e.evidence_id, coalesce(e.title, ''), e.snippet, ''
+            FROM evidence e
+            WHERE e.rowid NOT IN (SELECT rowid FROM evidence_fts)
+            """
+        )
+        return cursor.rowcount
+
+    async def backfill_search_index(self, batch_size: int = 500) -> int:
+        """Index evidence that is missing from the full-text index.
+
+        Adds rows written before the FTS table existed and fills in blob
+        text for rows indexed without it. Safe to re-run.
+
+        Args:
+            batch_size: Rows updated per transaction.
+
+        Returns:
+            Number of rows whose blob text was indexed.
+        """
+        if not self._db:
+            raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        await self.flush()
+        if not self._fts_enabled:
+            logger.warning("FTS5 unavailable, nothing to backfill")
+            return 0
+
+        await self._index_missing_rows()
+        await self._db.commit()
+
+        async with self._db.execute(
+            """
+            SELECT f.rowid, e.content_type, e.content_hash
+            FROM evidence_fts f JOIN evidence e ON e.evidence_id = f.evidence_id
+            WHERE f.body = '' AND e.blob_path IS NOT NULL
+            """
+        ) as cursor:
+            pending = list(await cursor.fetchall())
+
+        indexed = 0
+        for start in range(0, len(pending), batch_size):
+            # Blob reads and tag stripping run off the event loop
+            updates = await asyncio.to_thread(
+                self._read_search_bodies, pending[start:start + batch_size]
+            )
+            if updates:
+                await self._db.executemany(
+                    "UPDATE evidence_fts SET body = ? WHERE rowid = ?", updates
+                )
+                await self._db.commit()
+                indexed += len(updates)
+
+        logger.info("Backfilled evidence search index", rows=indexed, cache_dir=str(self.cache_dir))
+        return indexed
+
+    def _read_search_bodies(self, rows: list[Any]) -> list[tuple[str, int]]:
+        """Read blobs and extract their search text as (body, rowid) updates."""
+        updates = []
+        for rowid, content_type, content_hash in rows:
+            content = self.blob_cache.read_bytes(content_hash)
+            if content is None:
+                continue
+            body = extract_search_text(content, content_type)
+            if body:
+                updates.append((body, rowid))
+        return updates
+
     async def close(self) -> None:
-        """Close the database connection."""
+        """Flush buffered writes and close the database connection."""
         if self._db:
+            await self.flush()
             await self._db.close()
             self._db = None
 
-    def _get_blob_path(self, content_hash: str) -> Path:
-        """Get the path for a blob file based on content hash.
+    async def flush(self) -> int:
+        """Commit all buffered write-behind rows in one transaction.
 
-        Uses first 2 chars as subdirectory for better filesystem performance.
+        Returns:
+            Number of rows written.
         """
-        return self.blobs_dir / content_hash[:2] / content_hash
+        if not self._pending:
+            return 0
+
+        async with self._write_lock:
+            self._cancel_flush_timer()
+            pending, self._pending = self._pending, []
+            if not pending:
+                return 0
+            try:
+                await self._write_rows(pending)
+            except Exception:
+                # Keep the rows so a later flush can retry
+                self._pending = pending + self._pending
+                raise
+
+        logger.debug("Flushed evidence writes", rows=len(pending))
+        return len(pending)
+
+    def _cancel_flush_timer(self) -> None:
+        """Cancel the pending interval flush (unless it is the caller)."""
+        task = self._flush_task
+        self._flush_task = None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _flush_after_interval(self) -> None:
+        """Flush buffered rows once flush_interval has elapsed."""
+        await asyncio.sleep(self.flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error("Evidence write-behind flush failed", error=str(e))
+
+    async def _write_rows(self, rows: list[_PendingRow]) -> None:
+        """Insert rows and their search text, then commit once."""
+        assert self._db is not None
+        await self._db.executemany(_INSERT_SQL, [row for row, _ in rows])
+        if self._fts_enabled:
+            bodies = [(body, row[0]) for row, body in rows if body]
+            if bodies:
+                await self._db.executemany(_UPDATE_BODY_SQL, bodies)
+        await self._db.commit()
 
-    async def _store_blob(self, content: bytes, content_hash: str) -> str:
+    async def _store_blob(self, content: bytes, content_type: str) -> BlobReference:
         """Store blob content if not already present.
 
+        Hashing, compression and the file write run in a worker thread.
+
         Returns:
-            Relative path to blob from cache_dir.
+            Reference to the stored blob.
         """
-        blob_path = self._get_blob_path(content_hash)
-
-        if not blob_path.exists():
-            blob_path.parent.mkdir(parents=True, exist_ok=True)
-            blob_path.write_bytes(content)
-            logger.debug("Stored blob", hash=content_hash[:12], size=len(content))
+        return await asyncio.to_thread(self.blob_cache.put, content, content_type)
+
+    def _relative_blob_path(self, ref: BlobReference) -> str:
+        """Blob path as recorded in evidence rows (relative to cache_dir)."""
+        try:
+            return str(ref.path.relative_to(self.cache_dir))
+        except ValueError:
+            return str(ref.path)
+
+    async def _prepare(self, item: EvidenceInput) -> tuple[Evidence, _PendingRow]:
+        """Hash and store the blob, and build the evidence row."""
+        # Store the blob and extract its search text (regex tag stripping of
+        # a multi-MB page) concurrently, both off the event loop
+        if self._fts_enabled:
+            ref, body = await asyncio.gather(
+                self._store_blob(item.content, item.content_type),
+                asyncio.to_thread(extract_search_text, item.content, item.content_type),
+            )
+        else:
+            ref, body = await self._store_blob(item.content, item.content_type), ""
+        content_hash = ref.hash
+        blob_path = self._relative_blob_path(ref)
 
-        # Return relative path
-        return str(blob_path.relative_to(self.cache_dir))
+        evidence = Evidence(
+            evidence_id=generate_id("ev"),
+            source_url=item.url,
+            retrieved_at=utc_now(),
+            content_type=item.content_type,
+            content_hash=content_hash,
+            snippet=item.snippet,
+            title=item.title,
+            published_at=item.published_at,
+            author=item.author,
+            tos_risk=item.tos_risk,
+            source_tier=item.source_tier,
+            blob_path=blob_path,
+        )
+        row = (
+            evidence.evidence_id,
+            evidence.source_url,
+            evidence.retrieved_at.isoformat(),
+            evidence.content_type,
+            evidence.content_hash,
+            evidence.snippet,
+            evidence.title,
+            evidence.published_at.isoformat() if evidence.published_at else None,
+            evidence.author,
+            evidence.tos_risk.value,
+            evidence.source_tier.value,
+            evidence.blob_path,
+        )
+        return evidence, (row, body)
 
     async def store(
         self,
@@ -126,6 +538,9 @@ class EvidenceStore:
         Content is hashed with SHA-256. If same hash already exists, reuses blob
         but creates new evidence record (same content can be cited multiple times).
 
+        In write-behind mode the row is buffered and committed with the next
+        flush; the returned Evidence (and its blob) is valid immediately.
+
         Args:
             url: Source URL of the content.
             content: Raw content bytes.
@@ -143,63 +558,61 @@ class EvidenceStore:
         if not self._db:
             raise RuntimeError("EvidenceStore not initialized. Call init() first.")
 
-        # Compute hash and store blob
-        content_hash = hashlib.sha256(content).hexdigest()
-        blob_path = await self._store_blob(content, content_hash)
-
-        # Generate evidence ID and timestamp
-        evidence_id = generate_id("ev")
-        retrieved_at = utc_now()
-
-        # Insert into database
-        await self._db.execute(
-            """
-            INSERT INTO evidence (
-                evidence_id, source_url, retrieved_at, content_type, content_hash,
-                snippet, title, published_at, author, tos_risk, source_tier, blob_path
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                evidence_id,
-                url,
-                retrieved_at.isoformat(),
-                content_type,
-                content_hash,
-                snippet,
-                title,
-                published_at.isoformat() if published_at else None,
-                author,
-                tos_risk.value,
-                source_tier.value,
-                blob_path,
-            ),
-        )
-        await self._db.commit()
-
-        evidence = Evidence(
-            evidence_id=evidence_id,
-            source_url=url,
-            retrieved_at=retrieved_at,
+        evidence, pending = await self._prepare(EvidenceInput(
+            url=url,
+            content=content,
             content_type=content_type,
-            content_hash=content_hash,
             snippet=snippet,
             title=title,
             published_at=published_at,
             author=author,
             tos_risk=tos_risk,
             source_tier=source_tier,
-            blob_path=blob_path,
-        )
+        ))
+
+        if self.write_behind:
+            self._pending.append(pending)
+            if len(self._pending) >= self.flush_size:
+                await self.flush()
+            elif self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_after_interval())
+        else:
+            async with self._write_lock:
+                await self._write_rows([pending])
 
         logger.info(
             "Stored evidence",
-            evidence_id=evidence_id,
+            evidence_id=evidence.evidence_id,
             url=url[:80],
             tier=source_tier.value,
         )
 
         return evidence
 
+    async def store_many(self, items: list[EvidenceInput]) -> list[Evidence]:
+        """Store several pieces of evidence in a single transaction.
+
+        Args:
+            items: Evidence to store.
+
+        Returns:
+            Evidence records in the same order as items.
+        """
+        if not self._db:
+            raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        if not items:
+            return []
+
+        prepared = [await self._prepare(item) for item in items]
+
+        # Buffered rows go first so commit order matches call order
+        await self.flush()
+        async with self._write_lock:
+            await self._write_rows([pending for _, pending in prepared])
+
+        logger.info("Stored evidence batch", count=len(prepared))
+        return [evidence for evidence, _ in prepared]
+
     async def get(self, evidence_id: str) -> Evidence | None:
         """Retrieve evidence by ID.
 
@@ -211,6 +624,7 @@ class EvidenceStore:
         """
         if not self._db:
             raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        await self.flush()
 
         async with self._db.execute(
             "SELECT * FROM evidence WHERE evidence_id = ?", (evidence_id,)
@@ -235,38 +649,216 @@ class EvidenceStore:
         if not evidence or not evidence.blob_path:
             return None
 
-        blob_path = self.cache_dir / evidence.blob_path
-        if not blob_path.exists():
+        content = await asyncio.to_thread(self.blob_cache.read_bytes, evidence.content_hash)
+        if content is None:
             logger.warning("Blob file missing", evidence_id=evidence_id)
+        return content
+
+    async def open_blob(self, evidence_id: str) -> BinaryIO | None:
+        """Open raw blob content for evidence as a stream.
+
+        Avoids reading large blobs (filings, HTML) fully into memory. The
+        caller must close the returned stream.
+
+        Args:
+            evidence_id: The evidence ID.
+
+        Returns:
+            Decompressing binary stream or None if not found.
+        """
+        evidence = await self.get(evidence_id)
+        if not evidence or not evidence.blob_path:
             return None
 
-        return blob_path.read_bytes()
+        stream = self.blob_cache.open(evidence.content_hash)
+        if stream is None:
+            logger.warning("Blob file missing", evidence_id=evidence_id)
+        return stream
+
+    async def get_derived(self, content_hash: str, kind: str, version: str) -> Any | None:
+        """Get a stored derivation of blob content.
 
-    async def search(self, query: str, limit: int = 20) -> list[Evidence]:
-        """Search evidence by text in snippet.
+        Args:
+            content_hash: SHA-256 of the source content.
+            kind: Derivation kind (e.g. "text").
+            version: Version of the code that produced it.
 
-        Simple case-insensitive text search on snippet content.
+        Returns:
+            The stored value, or None if not derived with this version.
+        """
+        if not self._db:
+            raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+
+        async with self._db.execute(
+            "SELECT data FROM derived WHERE content_hash = ? AND kind = ? AND version = ?",
+            (content_hash, kind, version),
+        ) as cursor:
+            row = await cursor.fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    async def put_derived(self, content_hash: str, kind: str, version: str, data: Any) -> None:
+        """Store a derivation of blob content, replacing any earlier one.
 
         Args:
-            query: Search query string.
-            limit: Maximum results to return.
+            content_hash: SHA-256 of the source content.
+            kind: Derivation kind (e.g. "text").
+            version: Version of the code that produced it.
+            data: JSON-serializable value.
+        """
+        if not self._db:
+            raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+
+        async with self._write_lock:
+            await self._db.execute(
+                """
+                INSERT OR REPLACE INTO derived (content_hash, kind, version, created_at, data)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (content_hash, kind, version, utc_now().isoformat(), orjson.dumps(data)),
+            )
+            await self._db.commit()
+
+    async def get_validators(self, url: str) -> dict[str, Any] | None:
+        """Get the HTTP validators recorded for a URL.
+
+        Args:
+            url: Fetched URL.
 
         Returns:
-            List of matching evidence records.
+            Dict with content_hash, etag, last_modified and checked_at
+            (datetime of the last successful fetch or revalidation), or None.
         """
         if not self._db:
             raise RuntimeError("EvidenceStore not initialized. Call init() first.")
 
-        # Simple LIKE search - could be upgraded to FTS5 for larger datasets
         async with self._db.execute(
-            """
-            SELECT * FROM evidence
-            WHERE snippet LIKE ?
-            ORDER BY retrieved_at DESC
-            LIMIT ?
-            """,
-            (f"%{query}%", limit),
+            "SELECT content_hash, etag, last_modified, checked_at FROM url_validators WHERE url = ?",
+            (url,),
         ) as cursor:
+            row = await cursor.fetchone()
+        if not row:
+            return None
+        return {
+            "content_hash": row["content_hash"],
+            "etag": row["etag"],
+            "last_modified": row["last_modified"],
+            "checked_at": datetime.fromisoformat(row["checked_at"]),
+        }
+
+    async def put_validators(
+        self,
+        url: str,
+        content_hash: str,
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """Record the HTTP validators for a URL's current content.
+
+        Args:
+            url: Fetched URL.
+            content_hash: SHA-256 of the content the validators describe.
+            etag: ETag response header, if any.
+            last_modified: Last-Modified response header, if any.
+        """
+        if not self._db:
+            raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+
+        async with self._write_lock:
+            await self._db.execute(
+                """
+                INSERT OR REPLACE INTO url_validators
+                    (url, content_hash, etag, last_modified, checked_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (url, content_hash, etag, last_modified, utc_now().isoformat()),
+            )
+            await self._db.commit()
+
+    async def cleanup_blobs(self, min_age_seconds: float = 3600) -> int:
+        """Remove blobs no evidence row references, plus interrupted writes.
+
+        Args:
+            min_age_seconds: Keep files younger than this (in-flight writes).
+
+        Returns:
+            Number of files removed.
+        """
+        if not self._db:
+            raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        await self.flush()
+
+        async with self._db.execute("SELECT DISTINCT content_hash FROM evidence") as cursor:
+            referenced = {row[0] for row in await cursor.fetchall()}
+
+        return await asyncio.to_thread(
+            self.blob_cache.cleanup_orphans, referenced, min_age_seconds
+        )
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        tiers: list[SourceTier] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[Evidence]:
+        """Full-text search over evidence title, snippet and blob text.
+
+        Results are ranked by BM25 (title matches weigh most, then snippet,
+        then body). Supports "quoted phrases" and prefix* terms; all terms
+        must match.
+
+        Args:
+            query: Search query string.
+            limit: Maximum results to return.
+            tiers: Only return evidence from these source tiers.
+            since: Only evidence published (or retrieved, if no publish
+                date) at or after this time.
+            until: Only evidence published (or retrieved) at or before this time.
+
+        Returns:
+            List of matching evidence records, best match first.
+        """
+        if not self._db:
+            raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        await self.flush()
+
+        filters: list[str] = []
+        params: list[Any] = []
+        if tiers:
+            filters.append(f"e.source_tier IN ({', '.join('?' for _ in tiers)})")
+            params.extend(tier.value for tier in tiers)
+        if since:
+            filters.append("coalesce(e.published_at, e.retrieved_at) >= ?")
+            params.append(since.isoformat())
+        if until:
+            filters.append("coalesce(e.published_at, e.retrieved_at) <= ?")
+            params.append(until.isoformat())
+        filter_sql = "".join(f" AND {f}" for f in filters)
+
+        if not self._fts_enabled:
+            # Fallback for SQLite builds without FTS5
+            sql = f"""
+                SELECT e.* FROM evidence e
+                WHERE e.snippet LIKE ?{filter_sql}
+                ORDER BY e.retrieved_at DESC
+                LIMIT ?
+            """
+            args: list[Any] = [f"%{query}%", *params, limit]
+        else:
+            match = build_fts_query(query)
+            if not match:
+                return []
+            sql = f"""
+                SELECT e.* FROM evidence_fts
+                JOIN evidence e ON e.evidence_id = evidence_fts.evidence_id
+                WHERE evidence_fts MATCH ?{filter_sql}
+                ORDER BY bm25(evidence_fts, {_BM25_WEIGHTS}), e.retrieved_at DESC
+                LIMIT ?
+            """
+            args = [match, *params, limit]
+
+        async with self._db.execute(sql, args) as cursor:
             rows = await cursor.fetchall()
 
         return [self._row_to_evidence(row) for row in rows]
@@ -282,6 +874,7 @@ class EvidenceStore:
         """
         if not self._db:
             raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        await self.flush()
 
         async with self._db.execute(
             """
@@ -306,6 +899,7 @@ class EvidenceStore:
         """
         if not self._db:
             raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        await self.flush()
 
         async with self._db.execute(
             """
@@ -332,6 +926,7 @@ class EvidenceStore:
         """
         if not self._db:
             raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        await self.flush()
 
         async with self._db.execute(
             """
@@ -353,6 +948,7 @@ class EvidenceStore:
         """Get total count of evidence records."""
         if not self._db:
             raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        await self.flush()
 
         async with self._db.execute("SELECT COUNT(*) FROM evidence") as cursor:
             row = await cursor.fetchone()
@@ -366,6 +962,7 @@ class EvidenceStore:
         """
         if not self._db:
             raise RuntimeError("EvidenceStore not initialized. Call init() first.")
+        await self.flush()
 
         stats: dict[str, Any] = {}
 
@@ -1,10 +1,12 @@
 """Indexing and retrieval for transcripts and filings."""
 
+from er.indexing.inverted_index import InvertedIndex
 from er.indexing.text_chunker import TextChunker, chunk_text
 from er.indexing.transcript_index import TranscriptIndex
 from er.indexing.filing_index import FilingIndex, FilingType
 
 __all__ = [
+    "InvertedIndex",
     "TextChunker",
     "chunk_text",
     "TranscriptIndex",
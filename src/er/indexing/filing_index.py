@@ -2,21 +2,31 @@
 Filing Index for SEC filing retrieval.
 
 Indexes 10-K, 10-Q, and 8-K filings for excerpt retrieval.
-Provides BM25-like retrieval similar to TranscriptIndex.
+Provides BM25 retrieval over the shared InvertedIndex engine, like
+TranscriptIndex. Callers that pass an index_path get an index that is
+persisted and reopened, so a ticker's filings are chunked and indexed once
+and reused across runs.
 """
 
 from __future__ import annotations
 
+import hashlib
 import re
 from collections import Counter
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any
-import math
+from typing import TYPE_CHECKING, Any
 
+from er.indexing.inverted_index import InvertedIndex, read_index_file, write_index_file
 from er.indexing.text_chunker import TextChunker
+from er.logging import get_logger
 from er.types import TextExcerpt, generate_id
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
 
 class FilingType(Enum):
     """Types of SEC filings."""
@@ -70,8 +80,9 @@ class FilingIndex:
 
     Provides:
     1. Chunking of filings into excerpt evidence
-    2. BM25-like retrieval for relevant excerpts
+    2. BM25 retrieval over an inverted index (posting lists + MaxScore top-k)
     3. Section detection for 10-K/10-Q items
+    4. Optional on-disk persistence; re-adding an indexed filing reuses its chunks
     """
 
     # BM25 parameters (same as TranscriptIndex)
@@ -82,19 +93,45 @@ class FilingIndex:
         self,
         chunk_size: int = 2000,
         chunk_overlap: int = 300,
+        index_path: Path | None = None,
     ) -> None:
         """Initialize the filing index.
 
         Args:
             chunk_size: Target chunk size in characters.
             chunk_overlap: Overlap between chunks.
+            index_path: Optional file to persist the index to. An existing
+                index built with the same chunk settings is loaded.
         """
         self.chunker = TextChunker(chunk_size=chunk_size, overlap=chunk_overlap)
+        self.index_path = index_path
 
-        # In-memory index
+        # Chunks are stored in doc ID order of the inverted index
         self.chunks: list[FilingChunk] = []
-        self.idf: dict[str, float] = {}
-        self.avg_doc_length: float = 0.0
+        self._index = InvertedIndex(k1=self.K1, b=self.B)
+
+        # Content hash -> doc IDs of that filing's chunks
+        self._filings: dict[str, list[int]] = {}
+
+        if index_path is not None and index_path.exists():
+            self._load(index_path)
+
+    @property
+    def idf(self) -> dict[str, float]:
+        """IDF of every indexed term."""
+        return self._index.idf_table()
+
+    @property
+    def avg_doc_length(self) -> float:
+        """Average chunk length in tokens."""
+        return self._index.avg_doc_length
+
+    @staticmethod
+    def _filing_key(content: str, filing_type: FilingType, fiscal_period: str) -> str:
+        """Identity of a filing for de-duplication."""
+        digest = hashlib.sha256(content.encode())
+        digest.update(f"|{filing_type.value}|{fiscal_period}".encode())
+        return digest.hexdigest()
 
     def add_filing(
         self,
@@ -111,7 +148,10 @@ class FilingIndex:
             filing_type: Type of filing (10-K, 10-Q, 8-K).
             filing_date: Date of filing.
             fiscal_period: Fiscal period covered (e.g., "FY2024").
-            evidence_id: Optional evidence ID for source tracking.
+            evidence_id: Optional evidence ID for source tracking. If the
+                filing is already indexed under another evidence ID (e.g. by
+                an earlier run), its chunks are re-cited to this one and get
+                new excerpt IDs.
 
         Returns:
             List of indexed chunks.
@@ -119,12 +159,23 @@ class FilingIndex:
         if isinstance(filing_type, str):
             filing_type = self._parse_filing_type(filing_type)
 
+        # Already indexed (e.g. loaded from disk): reuse the existing chunks
+        filing_key = self._filing_key(content, filing_type, fiscal_period)
+        if filing_key in self._filings:
+            reused = [self.chunks[doc_id] for doc_id in self._filings[filing_key]]
+            if evidence_id and any(c.source_evidence_id != evidence_id for c in reused):
+                for existing in reused:
+                    existing.source_evidence_id = evidence_id
+                    existing.excerpt_id = generate_id("exc")
+            return reused
+
         if not evidence_id:
             evidence_id = generate_id("ev")
 
         # Chunk the filing
         text_chunks = self.chunker.chunk(content)
         new_chunks: list[FilingChunk] = []
+        doc_ids: list[int] = []
 
         for chunk in text_chunks:
             # Detect section from chunk text
@@ -146,14 +197,75 @@ class FilingIndex:
             indexed_chunk.term_frequencies = self._tokenize_and_count(chunk.text)
             indexed_chunk.doc_length = len(chunk.text.split())
 
+            # Collection statistics update incrementally; no IDF rebuild
+            doc_ids.append(
+                self._index.add_document(
+                    indexed_chunk.term_frequencies, indexed_chunk.doc_length
+                )
+            )
             new_chunks.append(indexed_chunk)
             self.chunks.append(indexed_chunk)
 
-        # Rebuild IDF with new documents
-        self._build_idf()
+        self._filings[filing_key] = doc_ids
 
         return new_chunks
 
+    def save(self, path: Path | None = None) -> None:
+        """Persist the index to disk.
+
+        Args:
+            path: Target file (defaults to index_path).
+
+        Raises:
+            ValueError: If no path is given and index_path is not set.
+        """
+        path = path or self.index_path
+        if path is None:
+            raise ValueError("No index path configured for FilingIndex.save()")
+
+        chunks = []
+        for chunk in self.chunks:
+            data = asdict(chunk)
+            data.pop("term_frequencies")
+            data["filing_type"] = chunk.filing_type.value
+            chunks.append(data)
+
+        write_index_file(path, {
+            "chunk_size": self.chunker.chunk_size,
+            "chunk_overlap": self.chunker.overlap,
+            "index": self._index.to_dict(),
+            "chunks": chunks,
+            "filings": self._filings,
+        })
+        logger.debug("Saved filing index", path=str(path), chunks=len(chunks))
+
+    def _load(self, path: Path) -> None:
+        """Load a persisted index built with the same chunk settings."""
+        try:
+            payload = read_index_file(path)
+            if (
+                payload["chunk_size"] != self.chunker.chunk_size
+                or payload["chunk_overlap"] != self.chunker.overlap
+            ):
+                logger.info("Filing index chunk settings changed; rebuilding", path=str(path))
+                return
+            index = InvertedIndex.from_dict(payload["index"])
+            chunks = []
+            for data in payload["chunks"]:
+                data["filing_type"] = FilingType(data["filing_type"])
+                chunks.append(FilingChunk(**data))
+            filings = {key: list(doc_ids) for key, doc_ids in payload["filings"].items()}
+            for chunk, term_frequencies in zip(chunks, index.all_term_frequencies(), strict=True):
+                chunk.term_frequencies = term_frequencies
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable filing index", path=str(path), error=str(e))
+            return
+
+        self._index = index
+        self.chunks = chunks
+        self._filings = filings
+        logger.debug("Loaded filing index", path=str(path), chunks=len(chunks))
+
     def retrieve_excerpts(
         self,
         query: str,
@@ -176,33 +288,24 @@ class FilingIndex:
             return []
 
         # Filter chunks if requested
-        candidate_chunks = self.chunks
-        if filing_type:
-            candidate_chunks = [c for c in candidate_chunks if c.filing_type == filing_type]
-        if section:
-            section_lower = section.lower()
-            candidate_chunks = [
-                c for c in candidate_chunks
-                if c.section and section_lower in c.section.lower()
-            ]
+        section_lower = section.lower() if section else None
+
+        def matches(doc_id: int) -> bool:
+            chunk = self.chunks[doc_id]
+            if filing_type and chunk.filing_type != filing_type:
+                return False
+            return not section_lower or bool(
+                chunk.section and section_lower in chunk.section.lower()
+            )
 
         # Tokenize query
         query_terms = self._tokenize(query)
 
-        # Score each chunk
-        scored_chunks: list[tuple[float, FilingChunk]] = []
-
-        for chunk in candidate_chunks:
-            score = self._bm25_score(query_terms, chunk)
-            if score > 0:
-                scored_chunks.append((score, chunk))
-
-        # Sort by score descending
-        scored_chunks.sort(key=lambda x: x[0], reverse=True)
-
         # Convert to TextExcerpt
         excerpts = []
-        for score, chunk in scored_chunks[:top_k]:
+        doc_filter = matches if (filing_type or section_lower) else None
+        for doc_id, score in self._index.search(query_terms, top_k, doc_filter=doc_filter):
+            chunk = self.chunks[doc_id]
             excerpt = TextExcerpt(
                 excerpt_id=chunk.excerpt_id,
                 source_evidence_id=chunk.source_evidence_id,
@@ -268,8 +371,8 @@ class FilingIndex:
             List of TextExcerpt objects from MD&A section.
         """
         # Filter to Item 7 MD&A section
-        mda_chunks = [
-            c for c in self.chunks
+        mda_doc_ids = [
+            doc_id for doc_id, c in enumerate(self.chunks)
             if c.section and ("management" in c.section.lower() or "item 7" in c.section.lower())
         ]
 
@@ -277,13 +380,13 @@ class FilingIndex:
             # Score and rank by query
             query_terms = self._tokenize(query)
             scored = []
-            for chunk in mda_chunks:
-                score = self._bm25_score(query_terms, chunk)
-                scored.append((score, chunk))
+            for doc_id in mda_doc_ids:
+                score = self._index.score(query_terms, doc_id)
+                scored.append((score, doc_id))
             scored.sort(key=lambda x: x[0], reverse=True)
-            mda_chunks = [c for _, c in scored[:top_k]]
+            mda_chunks = [self.chunks[doc_id] for _, doc_id in scored[:top_k]]
         else:
-            mda_chunks = mda_chunks[:top_k]
+            mda_chunks = [self.chunks[doc_id] for doc_id in mda_doc_ids[:top_k]]
 
         excerpts = []
         for chunk in mda_chunks:
@@ -358,54 +461,10 @@ class FilingIndex:
         tokens = self._tokenize(text)
         return dict(Counter(tokens))
 
-    def _build_idf(self) -> None:
-        """Build IDF scores for all terms in the index."""
-        if not self.chunks:
-            return
-
-        doc_freq: dict[str, int] = Counter()
-        total_length = 0
-
-        for chunk in self.chunks:
-            total_length += chunk.doc_length
-            for term in chunk.term_frequencies.keys():
-                doc_freq[term] += 1
-
-        n = len(self.chunks)
-        self.idf = {
-            term: math.log((n - df + 0.5) / (df + 0.5) + 1)
-            for term, df in doc_freq.items()
-        }
-        self.avg_doc_length = total_length / n if n > 0 else 0
-
-    def _bm25_score(
-        self,
-        query_terms: list[str],
-        chunk: FilingChunk,
-    ) -> float:
-        """Compute BM25 score for a chunk given query terms."""
-        score = 0.0
-
-        for term in query_terms:
-            if term not in self.idf:
-                continue
-
-            tf = chunk.term_frequencies.get(term, 0)
-            if tf == 0:
-                continue
-
-            idf = self.idf[term]
-            numerator = tf * (self.K1 + 1)
-            denominator = tf + self.K1 * (
-                1 - self.B + self.B * chunk.doc_length / self.avg_doc_length
-            )
-            score += idf * numerator / denominator
-
-        return score
-
 
 def build_filing_excerpts(
     filings: list[dict[str, Any]],
+    index_path: Path | None = None,
 ) -> list[TextExcerpt]:
     """Build filing excerpts from a list of filings.
 
@@ -413,11 +472,12 @@ def build_filing_excerpts(
 
     Args:
         filings: List of filing dicts with 'content', 'type', 'date', 'period'.
+        index_path: Optional persisted index to reuse and update.
 
     Returns:
         List of all excerpts (unranked).
     """
-    index = FilingIndex()
+    index = FilingIndex(index_path=index_path)
 
     for filing in filings:
         content = filing.get("content", "")
@@ -432,6 +492,9 @@ def build_filing_excerpts(
             evidence_id=filing.get("evidence_id"),
         )
 
+    if index_path is not None:
+        index.save()
+
     # Return all chunks as excerpts
     return [
         TextExcerpt(
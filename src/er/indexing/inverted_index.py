@@ -0,0 +1,308 @@
+"""
+Inverted index engine with BM25 scoring.
+
+Shared by TranscriptIndex and FilingIndex. Stores posting lists instead of
+scanning every chunk per query:
+- Posting lists (term -> doc_id -> tf), doc IDs assigned in insertion order
+- Incremental document frequency and length statistics (IDF is computed on
+  demand from the current counts, never rebuilt as a table)
+- Top-k retrieval with MaxScore pruning: terms whose combined score upper
+  bound cannot beat the current k-th best score are only probed for
+  candidates produced by the other terms
+- Serialization to/from a JSON-safe dict for on-disk persistence
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import Counter
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+# Bump when the on-disk layout changes; older files are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+# Guards MaxScore bounds against float rounding so pruning never drops a
+# document an exhaustive scan would have kept
+_BOUND_SLACK = 1.0 + 1e-9
+
+
+class InvertedIndex:
+    """BM25 inverted index over integer document IDs."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        """Initialize an empty index.
+
+        Args:
+            k1: BM25 term frequency saturation.
+            b: BM25 length normalization.
+        """
+        self.k1 = k1
+        self.b = b
+
+        # term -> {doc_id: tf}; dicts keep doc IDs in ascending insertion order
+        self._postings: dict[str, dict[int, int]] = {}
+        # Per-term statistics for MaxScore upper bounds
+        self._max_tf: dict[str, int] = {}
+        self._min_len: dict[str, int] = {}
+
+        self._doc_lengths: list[int] = []
+        self._total_length = 0
+
+    @property
+    def num_docs(self) -> int:
+        """Number of indexed documents."""
+        return len(self._doc_lengths)
+
+    @property
+    def avg_doc_length(self) -> float:
+        """Average document length in tokens."""
+        return self._total_length / self.num_docs if self.num_docs else 0.0
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of distinct terms."""
+        return len(self._postings)
+
+    def add_document(self, term_frequencies: dict[str, int], length: int) -> int:
+        """Add a document and update statistics incrementally.
+
+        Args:
+            term_frequencies: Term -> count for the document.
+            length: Document length used for BM25 normalization.
+
+        Returns:
+            The assigned document ID.
+        """
+        doc_id = len(self._doc_lengths)
+        self._doc_lengths.append(length)
+        self._total_length += length
+
+        for term, tf in term_frequencies.items():
+            if tf <= 0:
+                continue
+            postings = self._postings.get(term)
+            if postings is None:
+                self._postings[term] = {doc_id: tf}
+                self._max_tf[term] = tf
+                self._min_len[term] = length
+            else:
+                postings[doc_id] = tf
+                if tf > self._max_tf[term]:
+                    self._max_tf[term] = tf
+                if length < self._min_len[term]:
+                    self._min_len[term] = length
+
+        return doc_id
+
+    def doc_length(self, doc_id: int) -> int:
+        """Get the stored length of a document."""
+        return self._doc_lengths[doc_id]
+
+    def doc_frequency(self, term: str) -> int:
+        """Number of documents containing a term."""
+        postings = self._postings.get(term)
+        return len(postings) if postings else 0
+
+    def idf(self, term: str) -> float:
+        """BM25 IDF of a term under the current collection statistics."""
+        df = self.doc_frequency(term)
+        if df == 0:
+            return 0.0
+        n = self.num_docs
+        return math.log((n - df + 0.5) / (df + 0.5) + 1)
+
+    def idf_table(self) -> dict[str, float]:
+        """IDF for every term in the vocabulary (for inspection/debugging)."""
+        return {term: self.idf(term) for term in self._postings}
+
+    def all_term_frequencies(self) -> list[dict[str, int]]:
+        """Reconstruct every document's term frequencies in one pass."""
+        per_doc: list[dict[str, int]] = [{} for _ in self._doc_lengths]
+        for term, postings in self._postings.items():
+            for doc_id, tf in postings.items():
+                per_doc[doc_id][term] = tf
+        return per_doc
+
+    def _term_score(self, idf: float, tf: int, length: int, avg_len: float) -> float:
+        denominator = tf + self.k1 * (1 - self.b + self.b * length / avg_len)
+        return idf * tf * (self.k1 + 1) / denominator
+
+    def score(self, query_terms: list[str], doc_id: int) -> float:
+        """BM25 score of one document for a query (repeated terms count again)."""
+        avg_len = self.avg_doc_length
+        if not avg_len:
+            return 0.0
+        length = self._doc_lengths[doc_id]
+        total = 0.0
+        for term in query_terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            tf = postings.get(doc_id, 0)
+            if tf:
+                total += self._term_score(self.idf(term), tf, length, avg_len)
+        return total
+
+    def search(
+        self,
+        query_terms: list[str],
+        top_k: int,
+        doc_filter: Callable[[int], bool] | None = None,
+    ) -> list[tuple[int, float]]:
+        """Top-k BM25 retrieval with MaxScore pruning.
+
+        Produces the same ranking as scoring every document and sorting by
+        score (ties broken by lower doc ID), keeping only positive scores.
+
+        Args:
+            query_terms: Tokenized query (repeated terms weigh more).
+            top_k: Number of results.
+            doc_filter: Optional predicate; documents failing it are skipped.
+
+        Returns:
+            List of (doc_id, score) sorted by descending score.
+        """
+        avg_len = self.avg_doc_length
+        if top_k <= 0 or not avg_len:
+            return []
+
+        # Unique terms present in the index, weighted by query count
+        query_counts = Counter(t for t in query_terms if t in self._postings)
+        if not query_counts:
+            return []
+
+        terms: list[tuple[float, str, float, dict[int, int]]] = []
+        for term, qtf in query_counts.items():
+            idf = self.idf(term)
+            bound = qtf * self._term_score(
+                idf, self._max_tf[term], self._min_len[term], avg_len
+            ) * _BOUND_SLACK
+            terms.append((bound, term, idf, self._postings[term]))
+
+        # Ascending by upper bound; prefix sums bound the non-essential terms
+        terms.sort(key=lambda item: item[0])
+        prefix_bounds: list[float] = []
+        running = 0.0
+        for bound, _, _, _ in terms:
+            running += bound
+            prefix_bounds.append(running)
+
+        doc_lists = [list(postings) for _, _, _, postings in terms]
+        cursors = [0] * len(terms)
+
+        # Min-heap of (score, -doc_id): the root is the current k-th best,
+        # with later documents losing ties
+        heap: list[tuple[float, int]] = []
+        threshold = 0.0
+        first_essential = 0
+
+        while True:
+            # Next candidate: smallest doc ID among essential posting lists
+            doc_id = -1
+            for i in range(first_essential, len(terms)):
+                if cursors[i] < len(doc_lists[i]):
+                    candidate = doc_lists[i][cursors[i]]
+                    if doc_id < 0 or candidate < doc_id:
+                        doc_id = candidate
+            if doc_id < 0:
+                break
+
+            keep = doc_filter is None or doc_filter(doc_id)
+            length = self._doc_lengths[doc_id]
+            score = 0.0
+            for i in range(first_essential, len(terms)):
+                docs = doc_lists[i]
+                if cursors[i] < len(docs) and docs[cursors[i]] == doc_id:
+                    cursors[i] += 1
+                    if keep:
+                        _, term, idf, postings = terms[i]
+                        score += query_counts[term] * self._term_score(
+                            idf, postings[doc_id], length, avg_len
+                        )
+            if not keep:
+                continue
+
+            # Probe non-essential terms, highest bound first, while they can
+            # still lift the document above the threshold
+            for i in range(first_essential - 1, -1, -1):
+                if len(heap) == top_k and score + prefix_bounds[i] <= threshold:
+                    break
+                _, term, idf, postings = terms[i]
+                tf = postings.get(doc_id)
+                if tf:
+                    score += query_counts[term] * self._term_score(idf, tf, length, avg_len)
+
+            if score <= 0:
+                continue
+            if len(heap) < top_k:
+                heapq.heappush(heap, (score, -doc_id))
+            elif score > threshold:
+                heapq.heapreplace(heap, (score, -doc_id))
+            else:
+                continue
+
+            if len(heap) == top_k:
+                threshold = heap[0][0]
+                while (
+                    first_essential < len(terms)
+                    and prefix_bounds[first_essential] <= threshold
+                ):
+                    first_essential += 1
+
+        results = [(-neg_doc, score) for score, neg_doc in heap]
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return results
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-safe dict."""
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "doc_lengths": self._doc_lengths,
+            "postings": {
+                term: [[doc_id, tf] for doc_id, tf in postings.items()]
+                for term, postings in self._postings.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> InvertedIndex:
+        """Deserialize from to_dict() output.
+
+        Raises:
+            ValueError: If the data was written by an incompatible version.
+        """
+        if data.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format version: {data.get('version')}")
+
+        index = cls(k1=data["k1"], b=data["b"])
+        index._doc_lengths = list(data["doc_lengths"])
+        index._total_length = sum(index._doc_lengths)
+        for term, entries in data["postings"].items():
+            postings = {int(doc_id): int(tf) for doc_id, tf in entries}
+            index._postings[term] = postings
+            index._max_tf[term] = max(postings.values())
+            index._min_len[term] = min(index._doc_lengths[d] for d in postings)
+        return index
+
+
+def write_index_file(path: Path, payload: dict[str, Any]) -> None:
+    """Atomically write an index payload to disk."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(orjson.dumps(payload))
+    tmp_path.replace(path)
+
+
+def read_index_file(path: Path) -> dict[str, Any]:
+    """Read an index payload written by write_index_file."""
+    payload: dict[str, Any] = orjson.loads(path.read_bytes())
+    return payload
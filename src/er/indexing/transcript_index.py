@@ -1,21 +1,30 @@
 """
 Transcript Index for excerpt retrieval.
 
-Chunks transcripts and provides BM25-like retrieval for relevant excerpts.
+Chunks transcripts and provides BM25 retrieval for relevant excerpts,
+backed by the shared InvertedIndex engine. The index can be persisted so a
+ticker's transcripts are chunked and indexed once and reused across runs.
 """
 
 from __future__ import annotations
 
-import math
+import hashlib
 import re
 from collections import Counter
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from er.evidence.store import EvidenceStore
+from er.indexing.inverted_index import InvertedIndex, read_index_file, write_index_file
 from er.indexing.text_chunker import TextChunker, TextChunk
+from er.logging import get_logger
 from er.types import CompanyContext, TextExcerpt, generate_id
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class TranscriptChunk:
@@ -40,8 +49,9 @@ class TranscriptIndex:
 
     Provides:
     1. Chunking of transcripts into excerpt evidence
-    2. BM25-like retrieval for relevant excerpts
-    3. Integration with EvidenceStore
+    2. BM25 retrieval over an inverted index (posting lists + MaxScore top-k)
+    3. Optional on-disk persistence keyed by the transcript corpus
+    4. Integration with EvidenceStore
     """
 
     # BM25 parameters
@@ -53,6 +63,7 @@ class TranscriptIndex:
         evidence_store: EvidenceStore | None = None,
         chunk_size: int = 1500,
         chunk_overlap: int = 200,
+        index_path: Path | None = None,
     ) -> None:
         """Initialize the transcript index.
 
@@ -60,14 +71,26 @@ class TranscriptIndex:
             evidence_store: Optional EvidenceStore for persistence.
             chunk_size: Target chunk size in characters.
             chunk_overlap: Overlap between chunks.
+            index_path: Optional file to persist the index to. If it holds
+                an index for the same transcripts, building reuses it.
         """
         self.evidence_store = evidence_store
         self.chunker = TextChunker(chunk_size=chunk_size, overlap=chunk_overlap)
+        self.index_path = index_path
 
-        # In-memory index
+        # Chunks are stored in doc ID order of the inverted index
         self.chunks: list[TranscriptChunk] = []
-        self.idf: dict[str, float] = {}
-        self.avg_doc_length: float = 0.0
+        self._index = InvertedIndex(k1=self.K1, b=self.B)
+
+    @property
+    def idf(self) -> dict[str, float]:
+        """IDF of every indexed term."""
+        return self._index.idf_table()
+
+    @property
+    def avg_doc_length(self) -> float:
+        """Average chunk length in tokens."""
+        return self._index.avg_doc_length
 
     def build_from_company_context(
         self,
@@ -82,9 +105,14 @@ class TranscriptIndex:
             List of indexed chunks.
         """
         self.chunks = []
+        self._index = InvertedIndex(k1=self.K1, b=self.B)
 
         transcripts = company_context.transcripts or []
 
+        fingerprint = self._corpus_fingerprint(transcripts)
+        if self.index_path is not None and self._load(self.index_path, fingerprint):
+            return self.chunks
+
         for transcript in transcripts:
             # Get transcript text
             content = transcript.get("content", "")
@@ -124,13 +152,63 @@ class TranscriptIndex:
                 indexed_chunk.term_frequencies = self._tokenize_and_count(chunk.text)
                 indexed_chunk.doc_length = len(chunk.text.split())
 
+                self._index.add_document(
+                    indexed_chunk.term_frequencies, indexed_chunk.doc_length
+                )
                 self.chunks.append(indexed_chunk)
 
-        # Build IDF scores
-        self._build_idf()
+        if self.index_path is not None:
+            self._save(self.index_path, fingerprint)
 
         return self.chunks
 
+    def _corpus_fingerprint(self, transcripts: list[dict[str, Any]]) -> str:
+        """Hash of the transcripts and chunking settings that shape the index."""
+        digest = hashlib.sha256()
+        digest.update(f"{self.chunker.chunk_size}:{self.chunker.overlap}".encode())
+        for transcript in transcripts:
+            for key in ("evidence_id", "quarter", "year"):
+                digest.update(f"|{transcript.get(key, '')}".encode())
+            digest.update(hashlib.sha256(transcript.get("content", "").encode()).digest())
+        return digest.hexdigest()
+
+    def _save(self, path: Path, fingerprint: str) -> None:
+        """Persist chunks and the inverted index to disk."""
+        chunks = []
+        for chunk in self.chunks:
+            data = asdict(chunk)
+            data.pop("term_frequencies")
+            chunks.append(data)
+        try:
+            write_index_file(path, {
+                "fingerprint": fingerprint,
+                "index": self._index.to_dict(),
+                "chunks": chunks,
+            })
+        except OSError as e:
+            logger.warning("Failed to persist transcript index", path=str(path), error=str(e))
+
+    def _load(self, path: Path, fingerprint: str) -> bool:
+        """Load a persisted index if it matches the corpus fingerprint."""
+        if not path.exists():
+            return False
+        try:
+            payload = read_index_file(path)
+            if payload.get("fingerprint") != fingerprint:
+                return False
+            index = InvertedIndex.from_dict(payload["index"])
+            chunks = [TranscriptChunk(**data) for data in payload["chunks"]]
+            for chunk, term_frequencies in zip(chunks, index.all_term_frequencies(), strict=True):
+                chunk.term_frequencies = term_frequencies
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable transcript index", path=str(path), error=str(e))
+            return False
+
+        self._index = index
+        self.chunks = chunks
+        logger.debug("Loaded transcript index", path=str(path), chunks=len(chunks))
+        return True
+
     def retrieve_excerpts(
         self,
         query: str,
@@ -151,20 +229,10 @@ class TranscriptIndex:
         # Tokenize query
         query_terms = self._tokenize(query)
 
-        # Score each chunk
-        scored_chunks: list[tuple[float, TranscriptChunk]] = []
-
-        for chunk in self.chunks:
-            score = self._bm25_score(query_terms, chunk)
-            if score > 0:
-                scored_chunks.append((score, chunk))
-
-        # Sort by score descending
-        scored_chunks.sort(key=lambda x: x[0], reverse=True)
-
         # Convert to TextExcerpt
         excerpts = []
-        for score, chunk in scored_chunks[:top_k]:
+        for doc_id, score in self._index.search(query_terms, top_k):
+            chunk = self.chunks[doc_id]
             excerpt = TextExcerpt(
                 excerpt_id=chunk.excerpt_id,
                 source_evidence_id=chunk.source_evidence_id,
@@ -201,58 +269,6 @@ class TranscriptIndex:
         tokens = self._tokenize(text)
         return dict(Counter(tokens))
 
-    def _build_idf(self) -> None:
-        """Build IDF scores for all terms in the index."""
-        if not self.chunks:
-            return
-
-        # Count document frequency for each term
-        doc_freq: dict[str, int] = Counter()
-        total_length = 0
-
-        for chunk in self.chunks:
-            total_length += chunk.doc_length
-            for term in chunk.term_frequencies.keys():
-                doc_freq[term] += 1
-
-        # Compute IDF
-        n = len(self.chunks)
-        self.idf = {
-            term: math.log((n - df + 0.5) / (df + 0.5) + 1)
-            for term, df in doc_freq.items()
-        }
-
-        # Average document length
-        self.avg_doc_length = total_length / n if n > 0 else 0
-
-    def _bm25_score(
-        self,
-        query_terms: list[str],
-        chunk: TranscriptChunk,
-    ) -> float:
-        """Compute BM25 score for a chunk given query terms."""
-        score = 0.0
-
-        for term in query_terms:
-            if term not in self.idf:
-                continue
-
-            tf = chunk.term_frequencies.get(term, 0)
-            if tf == 0:
-                continue
-
-            idf = self.idf[term]
-
-            # BM25 formula
-            numerator = tf * (self.K1 + 1)
-            denominator = tf + self.K1 * (
-                1 - self.B + self.B * chunk.doc_length / self.avg_doc_length
-            )
-
-            score += idf * numerator / denominator
-
-        return score
-
     def _detect_speaker(self, text: str) -> str | None:
         """Detect speaker from transcript text."""
         # Look for common speaker patterns
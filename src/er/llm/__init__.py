@@ -9,6 +9,7 @@ This package provides a unified interface for LLM providers:
 
 from er.llm.base import (
     BudgetExceededError,
+    LLMCacheMissError,
     LLMClient,
     LLMError,
     LLMRequest,
@@ -16,17 +17,26 @@ from er.llm.base import (
     RateLimitError,
     ToolCall,
 )
+from er.llm.client_pool import ProviderClientPool
+from er.llm.response_cache import CachingClient, LLMResponseCache
 from er.llm.router import AgentRole, EscalationLevel, LLMRouter
+from er.llm.token_counter import TokenCounter, get_token_counter
 
 __all__ = [
     "AgentRole",
     "BudgetExceededError",
+    "CachingClient",
     "EscalationLevel",
+    "LLMCacheMissError",
     "LLMClient",
     "LLMError",
     "LLMRequest",
     "LLMResponse",
+    "LLMResponseCache",
     "LLMRouter",
+    "ProviderClientPool",
     "RateLimitError",
+    "TokenCounter",
     "ToolCall",
+    "get_token_counter",
 ]
@@ -217,3 +217,9 @@ class BudgetExceededError(LLMError):
     """Budget limit exceeded."""
 
     pass
+
+
+class LLMCacheMissError(LLMError):
+    """No recorded response for a request in cache replay mode."""
+
+    pass
@@ -0,0 +1,122 @@
+"""
+Shared provider client pool.
+
+Holds one lazily-created client per LLM provider so that multiple pipeline
+runs (e.g. a batch of tickers) reuse warm HTTP connections instead of each
+agent opening its own. Clients handed out by the pool are owned by the pool:
+callers must not close them, the pool closes them once in close().
+
+With a response cache, each pooled client is wrapped in a CachingClient so
+that every completion made through the pool is recorded and replayed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from er.llm.anthropic_client import AnthropicClient
+from er.llm.gemini_client import GeminiClient
+from er.llm.openai_client import OpenAIClient
+from er.llm.response_cache import CachingClient, LLMResponseCache
+from er.logging import get_logger
+
+if TYPE_CHECKING:
+    from er.config import Settings
+
+logger = get_logger(__name__)
+
+
+class ProviderClientPool:
+    """One shared client per LLM provider."""
+
+    def __init__(
+        self,
+        settings: Settings,
+        response_cache: LLMResponseCache | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            settings: Application settings with provider API keys.
+            response_cache: Optional LLM response cache the clients record
+                and replay through. Owned by the pool once passed in.
+        """
+        self._settings = settings
+        self.response_cache = response_cache
+        self._openai_client: OpenAIClient | None = None
+        self._anthropic_client: AnthropicClient | None = None
+        self._gemini_client: GeminiClient | None = None
+
+    def openai(self) -> OpenAIClient:
+        """Get the shared OpenAI client."""
+        if self._openai_client is None:
+            self._openai_client = self._wrap(OpenAIClient(api_key=self._settings.openai_api_key))
+        return self._openai_client
+
+    def anthropic(self) -> AnthropicClient:
+        """Get the shared Anthropic client."""
+        if self._anthropic_client is None:
+            self._anthropic_client = self._wrap(
+                AnthropicClient(api_key=self._settings.anthropic_api_key)
+            )
+        return self._anthropic_client
+
+    def gemini(self) -> GeminiClient:
+        """Get the shared Gemini client."""
+        if self._gemini_client is None:
+            self._gemini_client = self._wrap(GeminiClient(api_key=self._settings.gemini_api_key))
+        return self._gemini_client
+
+    def _wrap(self, client: Any) -> Any:
+        """Route a client through the response cache, if configured.
+
+        CachingClient delegates every attribute to the client and reports its
+        class, so callers (including isinstance checks) keep using it as the
+        provider client type.
+        """
+        if self.response_cache is None:
+            return client
+        return CachingClient(client, self.response_cache)
+
+    def get(self, provider: str) -> OpenAIClient | AnthropicClient | GeminiClient:
+        """Get the shared client for a provider name.
+
+        Args:
+            provider: "openai", "anthropic" or "google".
+
+        Returns:
+            Shared client instance.
+
+        Raises:
+            ValueError: If provider is unknown.
+        """
+        if provider == "openai":
+            return self.openai()
+        if provider == "anthropic":
+            return self.anthropic()
+        if provider == "google":
+            return self.gemini()
+        raise ValueError(f"Unknown provider: {provider}")
+
+    def owns(self, client: object) -> bool:
+        """Check whether a client instance belongs to this pool."""
+        return client is not None and any(
+            client is pooled
+            for pooled in (self._openai_client, self._anthropic_client, self._gemini_client)
+        )
+
+    async def close(self) -> None:
+        """Close all pooled clients."""
+        if self._openai_client:
+            await self._openai_client.close()
+            self._openai_client = None
+        if self._anthropic_client:
+            await self._anthropic_client.close()
+            self._anthropic_client = None
+        if self._gemini_client:
+            await self._gemini_client.close()
+            self._gemini_client = None
+        if self.response_cache:
+            logger.info("LLM response cache usage", **self.response_cache.stats())
+            self.response_cache.close()
+        logger.debug("Closed provider client pool")
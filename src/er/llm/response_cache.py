@@ -0,0 +1,447 @@
+"""
+Deterministic LLM response cache with record/replay.
+
+Responses are stored in a SQLite database keyed by a hash of everything that
+determines the output: provider, client method, model, messages, tools,
+temperature, response format and method options such as reasoning effort or
+thinking budget. CachingClient wraps any provider client (OpenAI, Anthropic,
+Gemini) and routes its completion methods through the cache, so re-running a
+ticker after changing a downstream prompt replays the unchanged upstream calls
+instead of paying for them again.
+
+Modes:
+- off: no caching (clients are not wrapped)
+- read_through: serve hits from the cache, call the provider and record misses
+- replay: serve hits only; a miss raises LLMCacheMissError (offline runs)
+
+Entries expire after a maximum age and the least recently used entries are
+evicted once the database exceeds its size limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import inspect
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from er.llm.base import LLMCacheMissError, LLMRequest, LLMResponse, ToolCall
+from er.logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from er.config import Settings
+
+logger = get_logger(__name__)
+
+CACHE_MODE_OFF = "off"
+CACHE_MODE_READ_THROUGH = "read_through"
+CACHE_MODE_REPLAY = "replay"
+CACHE_MODES = (CACHE_MODE_OFF, CACHE_MODE_READ_THROUGH, CACHE_MODE_REPLAY)
+
+# Cache database, relative to the cache directory
+RESPONSE_CACHE_FILENAME = "llm_responses.db"
+
+# Bump when the key derivation changes so old entries stop matching
+CACHE_KEY_VERSION = 1
+
+# Client methods whose responses are cached
+CACHEABLE_METHODS = frozenset({
+    "complete",
+    "complete_with_tools",
+    "complete_with_reasoning",
+    "complete_with_thinking",
+    "complete_with_web_search",
+    "complete_with_grounding",
+    "deep_research",
+})
+
+# Method arguments that affect polling, not the response
+IGNORED_ARGUMENTS = frozenset({"poll_interval", "max_wait_seconds"})
+
+
+def _normalize(value: Any) -> Any:
+    """Convert request arguments into JSON-serializable key material."""
+    if isinstance(value, LLMRequest):
+        return dataclasses.asdict(value)
+    return value
+
+
+def cache_key(provider: str, method: str, arguments: dict[str, Any]) -> str:
+    """Build the cache key for a client call.
+
+    Args:
+        provider: Provider name ("openai", "anthropic", "google").
+        method: Client method name.
+        arguments: The call's bound arguments (including defaults).
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    material = {
+        "version": CACHE_KEY_VERSION,
+        "provider": provider,
+        "method": method,
+        "arguments": {
+            name: _normalize(value)
+            for name, value in arguments.items()
+            if name not in IGNORED_ARGUMENTS
+        },
+    }
+    encoded = orjson.dumps(
+        material, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _encode_response(response: LLMResponse) -> bytes:
+    """Serialize a response for storage."""
+    return orjson.dumps(dataclasses.asdict(response), default=str)
+
+
+def _decode_response(data: bytes, key: str) -> LLMResponse:
+    """Rebuild a cached response.
+
+    Token counts are reported as zero because nothing was billed; the
+    recorded counts are kept in metadata.
+    """
+    fields: dict[str, Any] = orjson.loads(data)
+    tool_calls = fields.pop("tool_calls", None)
+    metadata = dict(fields.pop("metadata", None) or {})
+    metadata.update({
+        "cache_hit": True,
+        "cache_key": key,
+        "cached_input_tokens": fields["input_tokens"],
+        "cached_output_tokens": fields["output_tokens"],
+    })
+    fields.update(input_tokens=0, output_tokens=0, latency_ms=0)
+    return LLMResponse(
+        **fields,
+        tool_calls=[ToolCall(**call) for call in tool_calls] if tool_calls else None,
+        metadata=metadata,
+    )
+
+
+class LLMResponseCache:
+    """SQLite-backed store of recorded LLM responses."""
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        mode: str = CACHE_MODE_READ_THROUGH,
+        max_size_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the cache database.
+            mode: CACHE_MODE_READ_THROUGH or CACHE_MODE_REPLAY.
+            max_size_bytes: Evict least recently used entries above this
+                total response size (None = unbounded).
+            max_age_seconds: Entries older than this are expired
+                (None = never).
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown LLM cache mode {mode!r}; expected one of {CACHE_MODES}")
+        self.cache_dir = Path(cache_dir)
+        self.db_path = self.cache_dir / RESPONSE_CACHE_FILENAME
+        self.mode = mode
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._total_size = 0
+        # Identical concurrent calls share one provider request
+        self._inflight: dict[str, asyncio.Future[LLMResponse]] = {}
+
+    @property
+    def replay(self) -> bool:
+        """Whether misses are errors instead of provider calls."""
+        return self.mode == CACHE_MODE_REPLAY
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get or create the connection, creating the schema on first use."""
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    method TEXT NOT NULL,
+                    model TEXT,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    response BLOB NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_created ON responses(created_at)"
+            )
+            conn.commit()
+            self._conn = conn
+            self.prune()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Look up a recorded response.
+
+        Args:
+            key: Cache key from cache_key().
+
+        Returns:
+            The cached response, or None on a miss or expired entry.
+        """
+        conn = self._get_conn()
+        row = conn.execute(
+            "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        now = time.time()
+        if row is None:
+            return None
+        if self.max_age_seconds is not None and now - row[1] > self.max_age_seconds:
+            with conn:
+                self._delete(conn, "WHERE key = ?", (key,))
+            return None
+        with conn:
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return _decode_response(row[0], key)
+
+    def put(self, key: str, provider: str, method: str, response: LLMResponse) -> None:
+        """Record a response, evicting old entries if over the size limit.
+
+        Args:
+            key: Cache key from cache_key().
+            provider: Provider name.
+            method: Client method name.
+            response: Response to record.
+        """
+        conn = self._get_conn()
+        data = _encode_response(response)
+        now = time.time()
+        with conn:
+            self._delete(conn, "WHERE key = ?", (key,))
+            conn.execute(
+                """
+                INSERT INTO responses (key, provider, method, model, created_at, accessed_at, size, response)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, provider, method, response.model, now, now, len(data), data),
+            )
+            self._total_size += len(data)
+            self._evict(conn, keep=key)
+
+    def prune(self) -> int:
+        """Drop expired entries and enforce the size limit.
+
+        Returns:
+            Number of entries removed.
+        """
+        conn = self._get_conn()
+        removed = 0
+        with conn:
+            if self.max_age_seconds is not None:
+                removed += self._delete(
+                    conn, "WHERE created_at < ?", (time.time() - self.max_age_seconds,)
+                )
+            self._total_size = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            removed += self._evict(conn)
+        if removed:
+            logger.info("Pruned LLM response cache", removed=removed, size_bytes=self._total_size)
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        count = self._get_conn().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "mode": self.mode,
+            "entries": count,
+            "size_bytes": self._total_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _delete(self, conn: sqlite3.Connection, where: str, params: tuple[Any, ...]) -> int:
+        """Delete matching rows, keeping the running size total in step."""
+        size: int
+        count: int
+        size, count = conn.execute(
+            f"SELECT COALESCE(SUM(size), 0), COUNT(*) FROM responses {where}", params
+        ).fetchone()
+        conn.execute(f"DELETE FROM responses {where}", params)
+        self._total_size -= size
+        return count
+
+    def _evict(self, conn: sqlite3.Connection, keep: str | None = None) -> int:
+        """Evict least recently used entries until under the size limit.
+
+        The entry just recorded (keep) is never evicted, even if it alone
+        exceeds the limit.
+        """
+        if self.max_size_bytes is None or self._total_size <= self.max_size_bytes:
+            return 0
+        evicted = 0
+        cursor = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC")
+        victims = []
+        for key, size in cursor.fetchall():
+            if self._total_size <= self.max_size_bytes:
+                break
+            if key == keep:
+                continue
+            victims.append((key,))
+            self._total_size -= size
+            evicted += 1
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        return evicted
+
+    async def call(
+        self,
+        provider: str,
+        method: str,
+        arguments: dict[str, Any],
+        fetch: Callable[[], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """Serve a client call from the cache, or fetch and record it.
+
+        Args:
+            provider: Provider name.
+            method: Client method name.
+            arguments: The call's bound arguments.
+            fetch: Zero-argument coroutine function making the real call.
+
+        Returns:
+            The cached or fresh response.
+
+        Raises:
+            LLMCacheMissError: On a miss in replay mode.
+        """
+        key = cache_key(provider, method, arguments)
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            logger.debug("LLM cache hit", provider=provider, method=method, key=key[:12])
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        if self.replay:
+            raise LLMCacheMissError(
+                f"No recorded response for {provider}.{method} (key {key[:12]}) in replay mode"
+            )
+
+        future: asyncio.Future[LLMResponse] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved for the no-waiter case
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self.put(key, provider, method, response)
+        future.set_result(response)
+        return response
+
+
+class CachingClient:
+    """Provider client wrapper that routes completions through a response cache.
+
+    Cacheable methods (see CACHEABLE_METHODS) are keyed on their full bound
+    arguments; every other attribute is delegated to the wrapped client. The
+    wrapper reports the wrapped client's class, so provider checks such as
+    isinstance(client, OpenAIClient) see through it.
+    """
+
+    def __init__(self, client: Any, cache: LLMResponseCache) -> None:
+        """Wrap a provider client.
+
+        Args:
+            client: OpenAIClient, AnthropicClient or GeminiClient.
+            cache: Response cache to read and record through.
+        """
+        self.client = client
+        self.cache = cache
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type[Any]:
+        """Class of the wrapped client (isinstance falls back to this)."""
+        return type(self.client)
+
+    @property
+    def provider(self) -> str:
+        """Name of the wrapped provider."""
+        provider: str = self.client.provider
+        return provider
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.client, name)
+        if name not in CACHEABLE_METHODS:
+            return attr
+
+        signature = inspect.signature(attr)
+
+        async def cached_call(*args: Any, **kwargs: Any) -> LLMResponse:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return await self.cache.call(
+                self.client.provider,
+                name,
+                dict(bound.arguments),
+                lambda: attr(*args, **kwargs),
+            )
+
+        return cached_call
+
+    async def close(self) -> None:
+        """Close the wrapped client (the cache is closed by its owner)."""
+        await self.client.close()
+
+
+def create_response_cache(settings: Settings) -> LLMResponseCache | None:
+    """Create the response cache configured in settings.
+
+    Args:
+        settings: Application settings.
+
+    Returns:
+        LLMResponseCache, or None when caching is off.
+    """
+    if settings.LLM_CACHE_MODE == CACHE_MODE_OFF:
+        return None
+    max_age = settings.LLM_CACHE_MAX_AGE_DAYS
+    return LLMResponseCache(
+        cache_dir=settings.CACHE_DIR,
+        mode=settings.LLM_CACHE_MODE,
+        max_size_bytes=settings.llm_cache_max_bytes,
+        max_age_seconds=max_age * 86400 if max_age is not None else None,
+    )
@@ -11,7 +11,7 @@ import os
 import time
 from contextlib import asynccontextmanager
 from enum import Enum
-from typing import Any, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from er.budget import BudgetTracker
 from er.config import Settings
@@ -25,8 +25,12 @@ from er.llm.base import (
 )
 from er.llm.gemini_client import GeminiClient
 from er.llm.openai_client import OpenAIClient
+from er.llm.token_counter import get_token_counter
 from er.logging import get_logger
 
+if TYPE_CHECKING:
+    from er.llm.client_pool import ProviderClientPool
+
 logger = get_logger(__name__)
 
 
@@ -119,6 +123,7 @@ class LLMRouter:
         settings: Settings | None = None,
         budget_tracker: BudgetTracker | None = None,
         dry_run: bool | None = None,
+        client_pool: ProviderClientPool | None = None,
     ) -> None:
         """Initialize the router.
 
@@ -126,9 +131,12 @@ class LLMRouter:
             settings: Application settings. If None, loads from env.
             budget_tracker: Budget tracker for cost management.
             dry_run: Force dry run mode. If None, uses DRY_RUN env var.
+            client_pool: Shared provider clients. If set, the router uses
+                (and never closes) the pooled clients.
         """
         self._settings = settings or Settings()
         self._budget_tracker = budget_tracker
+        self._client_pool = client_pool
         self._forced_provider: str | None = None
 
         # Determine dry run mode
@@ -260,6 +268,9 @@ class LLMRouter:
                     f"Set one of: OPENAI_API_KEY, ANTHROPIC_API_KEY, or GEMINI_API_KEY"
                 )
 
+        if self._client_pool is not None:
+            return self._client_pool.get(provider)
+
         if provider == "openai":
             if self._openai_client is None:
                 self._openai_client = OpenAIClient(api_key=self._settings.openai_api_key)
@@ -362,6 +373,9 @@ class LLMRouter:
         else:
             response = await client.complete(request)
 
+        # Billed input tokens calibrate token estimates for this provider
+        get_token_counter().observe(request, response)
+
         # Log the call
         logger.info(
             "LLM call completed",
@@ -455,7 +469,7 @@ class LLMRouter:
         self._budget_tracker = tracker
 
     async def close(self) -> None:
-        """Close all clients."""
+        """Close all clients (pooled clients are closed by their pool)."""
         if self._openai_client:
             await self._openai_client.close()
         if self._anthropic_client:
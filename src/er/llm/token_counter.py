@@ -3,16 +3,46 @@ Token counting and preflight checking utilities.
 
 Provides accurate token counting for different models and preflight checks
 to warn or compress context before sending to LLMs.
+
+TokenCounter is the shared counting service:
+- OpenAI models are counted exactly with tiktoken (when installed); one
+  encoder is loaded per encoding and reused for the life of the process
+- exact counts are memoized by content hash, so re-checking the same
+  context while trimming it (or across agents) costs one hash
+- count_many encodes a batch on worker threads (tiktoken releases the GIL)
+- other providers are estimated from character counts with a chars/token
+  ratio calibrated from the input_tokens that real responses report
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import math
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import orjson
+
 from er.logging import get_logger
 
+try:
+    import tiktoken
+
+    HAS_TIKTOKEN = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_TIKTOKEN = False
+
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Sequence
+
+    from tiktoken import Encoding
+
+    from er.llm.base import LLMRequest, LLMResponse
 
 logger = get_logger(__name__)
 
@@ -41,6 +71,27 @@ CHARS_PER_TOKEN_ESTIMATES: dict[str, float] = {
     "mixed": 3.5,
 }
 
+# Starting chars/token ratio per provider, before any calibration
+PROVIDER_CHARS_PER_TOKEN: dict[str, float] = {
+    "openai": 4.0,
+    "anthropic": 3.5,
+    "google": 4.0,
+    "default": 3.5,
+}
+
+# Weight of the starting ratio, in characters of pseudo-observations
+CALIBRATION_PRIOR_CHARS = 20000
+
+# Chat formatting tokens added per message (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Exact counts remembered by content hash
+TOKEN_MEMO_MAX_ENTRIES = 10000
+
+# count_many encodes on threads only when the uncached text is this large
+PARALLEL_MIN_CHARS = 64 * 1024
+TOKEN_COUNT_WORKERS = 4
+
 
 def estimate_tokens(text: str, content_type: str = "mixed") -> int:
     """Estimate token count from text length.
@@ -61,10 +112,261 @@ def estimate_tokens(text: str, content_type: str = "mixed") -> int:
     return int(len(text) / chars_per_token)
 
 
+def model_provider(model: str) -> str:
+    """Provider whose tokenizer a model uses ("openai", "anthropic", "google" or "default")."""
+    name = model.lower()
+    if name.startswith("claude"):
+        return "anthropic"
+    if name.startswith("gemini"):
+        return "google"
+    if "gpt" in name or name[:2] in ("o1", "o3", "o4"):
+        return "openai"
+    return "default"
+
+
+def model_encoding(model: str) -> str | None:
+    """tiktoken encoding name for a model, or None if it has no public tokenizer."""
+    if model_provider(model) != "openai":
+        return None
+    name = model.lower()
+    if name.startswith(("gpt-3.5", "gpt-4-")) or name == "gpt-4":
+        return "cl100k_base"
+    return "o200k_base"
+
+
+@functools.cache
+def _get_encoding(name: str) -> Encoding | None:
+    """Load a tiktoken encoding once (None if tiktoken is unavailable)."""
+    if not HAS_TIKTOKEN:
+        logger.debug("tiktoken not available, using estimates", encoding=name)
+        return None
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        logger.debug("tiktoken encoding unavailable, using estimates", encoding=name, error=str(e))
+        return None
+
+
+def request_text(request: LLMRequest) -> tuple[str, int]:
+    """Text a request sends as input, and its message count.
+
+    Message content may be a string or a list of content parts; tool
+    definitions count as their JSON.
+    """
+    parts: list[str] = []
+    for message in request.messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            parts.append(content)
+        elif isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict) and isinstance(part.get("text"), str):
+                    parts.append(part["text"])
+    if request.tools:
+        parts.append(orjson.dumps(request.tools, default=str).decode())
+    return "\n".join(parts), len(request.messages)
+
+
+@dataclass
+class CalibratedEstimator:
+    """Chars/token ratio for one provider, refined by observed usage.
+
+    The ratio is pooled over every observation (total characters over
+    total tokens), starting from a prior worth CALIBRATION_PRIOR_CHARS.
+    """
+
+    prior_chars_per_token: float
+    observed_chars: float = 0.0
+    observed_tokens: float = 0.0
+    samples: int = 0
+
+    @property
+    def chars_per_token(self) -> float:
+        """Current calibrated ratio."""
+        prior_tokens = CALIBRATION_PRIOR_CHARS / self.prior_chars_per_token
+        return (CALIBRATION_PRIOR_CHARS + self.observed_chars) / (
+            prior_tokens + self.observed_tokens
+        )
+
+    def observe(self, chars: int, tokens: int) -> None:
+        """Add one request's character count and its billed input tokens."""
+        if chars <= 0 or tokens <= 0:
+            return
+        self.observed_chars += chars
+        self.observed_tokens += tokens
+        self.samples += 1
+
+    def estimate(self, chars: int) -> int:
+        """Estimated tokens for a text of this many characters."""
+        return math.ceil(chars / self.chars_per_token) if chars else 0
+
+
+class TokenCounter:
+    """Model-aware token counting with cached encoders and memoized counts.
+
+    Thread-safe; one instance (get_token_counter()) is shared process-wide
+    so every agent benefits from the same memo and calibration.
+    """
+
+    def __init__(
+        self,
+        memo_size: int = TOKEN_MEMO_MAX_ENTRIES,
+        max_workers: int = TOKEN_COUNT_WORKERS,
+    ) -> None:
+        """Initialize the counter.
+
+        Args:
+            memo_size: Exact counts remembered (least recently used dropped).
+            max_workers: Threads used by count_many for large batches.
+        """
+        self.memo_size = memo_size
+        self.max_workers = max_workers
+        self._memo: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._estimators: dict[str, CalibratedEstimator] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def estimator(self, provider: str) -> CalibratedEstimator:
+        """Calibrated estimator for a provider."""
+        with self._lock:
+            estimator = self._estimators.get(provider)
+            if estimator is None:
+                prior = PROVIDER_CHARS_PER_TOKEN.get(provider, PROVIDER_CHARS_PER_TOKEN["default"])
+                estimator = self._estimators[provider] = CalibratedEstimator(prior)
+            return estimator
+
+    def is_exact(self, model: str) -> bool:
+        """Whether counts for this model come from its real tokenizer."""
+        encoding = model_encoding(model)
+        return encoding is not None and _get_encoding(encoding) is not None
+
+    @staticmethod
+    def _memo_key(encoding: str, text: str) -> tuple[str, bytes]:
+        return encoding, hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _memo_get(self, key: tuple[str, bytes]) -> int | None:
+        with self._lock:
+            count = self._memo.get(key)
+            if count is not None:
+                self._memo.move_to_end(key)
+            return count
+
+    def _memo_put(self, key: tuple[str, bytes], count: int) -> None:
+        with self._lock:
+            self._memo[key] = count
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def count(self, text: str, model: str) -> int:
+        """Count tokens in a text for a model.
+
+        Args:
+            text: Text to count.
+            model: Target model.
+
+        Returns:
+            Exact count for OpenAI models (with tiktoken), else a calibrated
+            estimate.
+        """
+        return self.count_many([text], model)[0]
+
+    def count_many(self, texts: Sequence[str], model: str) -> list[int]:
+        """Count tokens in many texts for one model.
+
+        Cached texts cost a hash lookup; the rest are encoded on worker
+        threads when there is enough text to make that worthwhile.
+
+        Args:
+            texts: Texts to count.
+            model: Target model.
+
+        Returns:
+            Token counts, in input order.
+        """
+        encoding_name = model_encoding(model)
+        encoding = _get_encoding(encoding_name) if encoding_name else None
+        if encoding_name is None or encoding is None:
+            estimator = self.estimator(model_provider(model))
+            return [estimator.estimate(len(text)) for text in texts]
+
+        counts: list[int] = [0] * len(texts)
+        pending: dict[tuple[str, bytes], list[int]] = {}
+        pending_texts: dict[tuple[str, bytes], str] = {}
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            key = self._memo_key(encoding_name, text)
+            cached = self._memo_get(key)
+            if cached is not None:
+                counts[i] = cached
+            else:
+                pending.setdefault(key, []).append(i)
+                pending_texts[key] = text
+
+        if pending:
+            keys = list(pending)
+            batch = [pending_texts[key] for key in keys]
+            if len(batch) > 1 and sum(map(len, batch)) >= PARALLEL_MIN_CHARS:
+                encoded = self._get_executor().map(encoding.encode_ordinary, batch)
+            else:
+                encoded = map(encoding.encode_ordinary, batch)
+            for key, tokens in zip(keys, encoded, strict=True):
+                self._memo_put(key, len(tokens))
+                for i in pending[key]:
+                    counts[i] = len(tokens)
+
+        return counts
+
+    def count_request(self, request: LLMRequest) -> int:
+        """Count the input tokens of a request (messages, tools, formatting)."""
+        text, messages = request_text(request)
+        return self.count(text, request.model) + MESSAGE_OVERHEAD_TOKENS * messages
+
+    def observe(self, request: LLMRequest, response: LLMResponse) -> None:
+        """Calibrate the provider's estimator from a completed call.
+
+        Responses served from cache (no billed tokens) are ignored, as are
+        models counted exactly.
+        """
+        if response.input_tokens <= 0 or self.is_exact(request.model):
+            return
+        text, messages = request_text(request)
+        tokens = response.input_tokens - MESSAGE_OVERHEAD_TOKENS * messages
+        self.estimator(model_provider(request.model)).observe(len(text), tokens)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="token-count"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Stop the worker threads."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+_default_counter: TokenCounter | None = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Get the process-wide token counter shared by all agents."""
+    global _default_counter
+    if _default_counter is None:
+        _default_counter = TokenCounter()
+    return _default_counter
+
+
 def count_tokens(text: str, model: str = "gpt-5.2") -> int:
     """Count tokens for a given text and model.
 
-    Uses tiktoken for OpenAI models and character estimation for others.
+    Uses tiktoken for OpenAI models and calibrated estimation for others
+    (see TokenCounter).
 
     Args:
         text: Text to count tokens for.
@@ -75,24 +377,12 @@ def count_tokens(text: str, model: str = "gpt-5.2") -> int:
     """
     if not text:
         return 0
+    return get_token_counter().count(text, model)
+
 
-    # Try tiktoken for OpenAI models
-    if "gpt" in model.lower() or model.startswith("o"):
-        try:
-            import tiktoken
-            # Use cl100k_base encoding (GPT-4 style)
-            encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(text))
-        except ImportError:
-            logger.debug("tiktoken not available, using estimate")
-            return estimate_tokens(text, "mixed")
-        except Exception as e:
-            logger.debug(f"tiktoken error: {e}, using estimate")
-            return estimate_tokens(text, "mixed")
-
-    # For Claude models, use character estimation
-    # Claude uses a similar BPE tokenizer, ~4 chars per token
-    return estimate_tokens(text, "english")
+def count_tokens_many(texts: Sequence[str], model: str = "gpt-5.2") -> list[int]:
+    """Count tokens for many texts at once (see TokenCounter.count_many)."""
+    return get_token_counter().count_many(texts, model)
 
 
 def get_model_limit(model: str) -> int:
@@ -205,7 +495,6 @@ def compress_context(
         Compressed context.
     """
     # Step 1: Remove redundant whitespace
-    import re
     compressed = re.sub(r'\n{3,}', '\n\n', context)
     compressed = re.sub(r' {2,}', ' ', compressed)
     compressed = re.sub(r'\t+', ' ', compressed)
@@ -215,8 +504,9 @@ def compress_context(
         return compressed
 
     # Step 2: Truncate from middle (preserve beginning and end)
-    # Keep first 60% and last 20% of target
-    chars_per_token = 4.0  # Conservative estimate
+    # Keep first 60% and last 20% of target, sizing the cut with this
+    # text's own chars/token ratio so no recount is needed
+    chars_per_token = len(compressed) / current_tokens
     target_chars = int(target_tokens * chars_per_token)
 
     head_chars = int(target_chars * 0.60)
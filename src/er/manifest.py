@@ -16,6 +16,7 @@ import orjson
 
 from er.budget import BudgetTracker
 from er.logging import get_logger
+from er.run_catalog import record_run
 from er.types import Phase, utc_now
 
 logger = get_logger(__name__)
@@ -273,11 +274,14 @@ class RunManifest:
         }
 
     def save(self) -> None:
-        """Save manifest to file."""
+        """Save manifest to file and update the output directory's run catalog."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        data = self.to_dict()
         with open(self.manifest_path, "wb") as f:
-            f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+        record_run(self.output_dir, data)
 
     @classmethod
     def load(cls, output_dir: Path) -> RunManifest | None:
@@ -18,6 +18,7 @@ from typing import Any
 
 import orjson
 
+from er.budget import COSTS_LEDGER_FILENAME, COSTS_SNAPSHOT_FILENAME, iter_usage_records
 from er.logging import get_logger
 
 logger = get_logger(__name__)
@@ -308,15 +309,11 @@ def count_tokens_approx(text: str) -> int:
 def analyze_run_directory(run_dir: Path) -> TokenFlowTracker | None:
     """Analyze a completed run directory and build token flow."""
 
-    # Load costs.json for actual token counts
-    costs_path = run_dir / "costs.json"
-    if not costs_path.exists():
+    # Stream the cost ledger (or legacy costs.json) for actual token counts
+    if not (run_dir / COSTS_LEDGER_FILENAME).exists() and not (run_dir / COSTS_SNAPSHOT_FILENAME).exists():
         logger.warning(f"No costs.json found in {run_dir}")
         return None
 
-    with open(costs_path) as f:
-        costs = json.load(f)
-
     # Load manifest for run info
     manifest_path = run_dir / "manifest.json"
     if manifest_path.exists():
@@ -348,30 +345,30 @@ def analyze_run_directory(run_dir: Path) -> TokenFlowTracker | None:
         "resynthesis": 6,
     }
 
-    for record in costs.get("records", []):
-        stage = stage_map.get(record["phase"], 0)
+    for record in iter_usage_records(run_dir):
+        stage = stage_map.get(record.phase, 0)
 
         call = tracker.start_call(
-            agent=record["agent"],
+            agent=record.agent,
             stage=stage,
-            phase=record["phase"],
-            model=record["model"],
-            provider=record["provider"],
+            phase=record.phase,
+            model=record.model,
+            provider=record.provider,
         )
 
         # Add input as single component (we don't have breakdown in basic costs.json)
         call.add_input_component(
             name="prompt",
-            tokens=record["input_tokens"],
+            tokens=record.input_tokens,
             source="context",
             description="Full prompt (breakdown not available in costs.json)",
         )
-        call.input_tokens = record["input_tokens"]
+        call.input_tokens = record.input_tokens
 
         call.complete(
-            output_tokens=record["output_tokens"],
-            cost=record["cost_usd"],
-            description=f"Output from {record['agent']}",
+            output_tokens=record.output_tokens,
+            cost=record.cost_usd,
+            description=f"Output from {record.agent}",
         )
 
     return tracker
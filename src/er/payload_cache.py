@@ -0,0 +1,186 @@
+"""
+Cached, conditional and compressed serving of run files for the dashboard.
+
+FilePayloadCache is an LRU of run files keyed by path. An entry is reused
+while the file's mtime and size are unchanged, and holds the raw bytes,
+the parsed payload and the gzipped body, each computed on first use.
+ETags are derived from the same mtime/size (or, for a whole run, from
+every file in the run directory), and negotiate_json answers
+If-None-Match with 304 and compresses for clients that accept gzip.
+
+Kept free of FastAPI so it can be used and tested without the API server.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from er.checkpoints import CHECKPOINT_SUFFIX, decode_checkpoint
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+PAYLOAD_CACHE_ENTRIES = 128  # Parsed run files kept in memory
+PAYLOAD_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Raw bytes across cached files
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+
+
+@dataclass
+class CachedFile:
+    """A run file's bytes, validated by mtime/size, parsed and gzipped on demand."""
+
+    mtime_ns: int
+    size: int
+    raw: bytes
+    etag: str
+    checkpoint: bool = False  # Stage checkpoint rather than a JSON file
+    _parsed: Any = None
+    _json: bytes | None = None
+    _gzipped: bytes | None = None
+
+    def parsed(self) -> Any:
+        """The decoded payload."""
+        if self._parsed is None:
+            self._parsed = decode_checkpoint(self.raw) if self.checkpoint else json.loads(self.raw)
+        return self._parsed
+
+    def json_bytes(self) -> bytes:
+        """The file as JSON (checkpoints are decoded and re-serialized once)."""
+        if not self.checkpoint:
+            return self.raw
+        if self._json is None:
+            self._json = orjson.dumps(self.parsed())
+        return self._json
+
+    def gzipped(self) -> bytes:
+        """The JSON body, gzip-compressed."""
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.json_bytes(), compresslevel=GZIP_LEVEL)
+        return self._gzipped
+
+
+class FilePayloadCache:
+    """LRU of run files keyed by path; entries are reloaded when mtime or size changes."""
+
+    def __init__(
+        self,
+        max_entries: int = PAYLOAD_CACHE_ENTRIES,
+        max_bytes: int = PAYLOAD_CACHE_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Path, CachedFile] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: Path) -> CachedFile | None:
+        """The cached file, reloaded if it changed on disk (None if missing)."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._discard(path)
+            return None
+
+        entry = self._entries.get(path)
+        if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            self._entries.move_to_end(path)
+            return entry
+
+        self._discard(path)
+        entry = CachedFile(
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            raw=path.read_bytes(),
+            etag=f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+            checkpoint=path.suffix == CHECKPOINT_SUFFIX,
+        )
+        self._entries[path] = entry
+        self._bytes += entry.size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+        return entry
+
+    def _discard(self, path: Path) -> None:
+        entry = self._entries.pop(path, None)
+        if entry:
+            self._bytes -= entry.size
+
+
+def run_dir_etag(run_dir: Path) -> str:
+    """ETag over the names, mtimes and sizes of a run directory's files."""
+    digest = hashlib.sha1()
+    with os.scandir(run_dir) as entries:
+        for entry in sorted(entries, key=lambda e: e.name):
+            if entry.is_file():
+                stat = entry.stat()
+                digest.update(f"{entry.name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an If-None-Match header value covers etag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether an Accept-Encoding header value allows gzip (q=0 refuses it)."""
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        q = params.strip().lower()
+        if q.startswith("q="):
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def negotiate_json(
+    etag: str,
+    body: bytes,
+    if_none_match: str | None = None,
+    accept_encoding: str | None = None,
+    gzipped: Callable[[], bytes] | None = None,
+) -> tuple[int, bytes, dict[str, str]]:
+    """Apply ETag/If-None-Match and gzip negotiation to a JSON body.
+
+    Args:
+        etag: The payload's ETag.
+        body: Uncompressed JSON body (unused for a 304).
+        if_none_match: The request's If-None-Match header.
+        accept_encoding: The request's Accept-Encoding header.
+        gzipped: Returns the body already compressed (e.g. cached);
+            compressed here if not given.
+
+    Returns:
+        Tuple of (status code, body, response headers).
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(if_none_match, etag):
+        return 304, b"", headers
+
+    if len(body) >= GZIP_MIN_BYTES and accepts_gzip(accept_encoding):
+        body = gzipped() if gzipped is not None else gzip.compress(body, compresslevel=GZIP_LEVEL)
+        headers["Content-Encoding"] = "gzip"
+    return 200, body, headers
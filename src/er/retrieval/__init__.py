@@ -5,6 +5,7 @@ Provides:
 - SearchProvider: Protocol for web search providers
 - OpenAIWebSearchProvider: Web search using OpenAI's web_search tool
 - WebFetcher: Fetch and extract text from URLs
+- TextExtractor: Off-loop HTML text extraction in a process pool
 - EvidenceCardGenerator: Summarize web pages into bounded EvidenceCards
 - WebResearchService: Orchestrates search, fetch, and summarization
 """
@@ -14,6 +15,7 @@ from er.retrieval.search_provider import (
     SearchProvider,
     OpenAIWebSearchProvider,
 )
+from er.retrieval.extract import TextExtractor
 from er.retrieval.fetch import WebFetcher
 from er.retrieval.evidence_cards import EvidenceCardGenerator
 from er.retrieval.service import WebResearchService
@@ -22,6 +24,7 @@ __all__ = [
     "SearchResult",
     "SearchProvider",
     "OpenAIWebSearchProvider",
+    "TextExtractor",
     "WebFetcher",
     "EvidenceCardGenerator",
     "WebResearchService",
@@ -0,0 +1,328 @@
+"""
+HTML text extraction for fetched web pages.
+
+Parsing is CPU-bound, so TextExtractor runs it in a process pool and the
+event loop only awaits the result. The fastest available parser is used:
+selectolax if installed, else BeautifulSoup with lxml, else BeautifulSoup
+with the stdlib html.parser. All three produce the same (title, text) shape.
+
+Extraction time grows with page size, so each page gets a timeout scaled to
+its size. The timeout covers execution only: at most one page per worker is
+in flight, and the worker arms the deadline when it picks the page up, so
+time spent queued for a worker is never charged. A page that times out (or
+hits a broken pool) falls back to a regex tag strip rather than failing the
+fetch. A worker that ignores its deadline has its pool torn down and
+replaced so it cannot keep holding a slot.
+
+Results are cached in the evidence store's derived table under
+DERIVED_TEXT_KIND and the extractor's version; bump EXTRACTOR_VERSION when
+the extraction rules change so stale text is not served.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from bs4 import BeautifulSoup
+
+from er.evidence.store import extract_search_text
+from er.logging import get_logger
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    HAS_SELECTOLAX = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_SELECTOLAX = False
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    HAS_LXML = False
+else:
+    HAS_LXML = True
+
+if TYPE_CHECKING:
+    from types import FrameType
+
+logger = get_logger(__name__)
+
+PARSER_SELECTOLAX = "selectolax"
+PARSER_LXML = "lxml"
+PARSER_HTML = "html.parser"
+
+# Fastest parser available in this environment
+DEFAULT_PARSER = (
+    PARSER_SELECTOLAX if HAS_SELECTOLAX else PARSER_LXML if HAS_LXML else PARSER_HTML
+)
+
+# Version of the extraction rules (part of the derived-text cache key)
+EXTRACTOR_VERSION = "2"
+
+# Evidence store derivation kind for extracted page text
+DERIVED_TEXT_KIND = "text"
+
+# Elements that never hold page content
+NOISE_TAGS = ["script", "style", "nav", "header", "footer", "aside"]
+
+# Extracted text beyond this many characters is truncated
+MAX_EXTRACTED_CHARS = 50000
+
+# Pages smaller than this are parsed inline; pool round trips cost more
+INLINE_EXTRACT_CHARS = 32 * 1024
+
+# Timeout for one page: base plus an allowance per MB of HTML
+EXTRACT_BASE_TIMEOUT = 5.0
+EXTRACT_TIMEOUT_PER_MB = 10.0
+
+# Extra seconds a worker gets past its deadline before its pool is replaced
+EXTRACT_KILL_GRACE = 2.0
+
+
+def _clean_text(text: str) -> str:
+    """Drop blank lines, strip each line and truncate."""
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    text = "\n".join(lines)
+    if len(text) > MAX_EXTRACTED_CHARS:
+        text = text[:MAX_EXTRACTED_CHARS] + "\n...[truncated]"
+    return text
+
+
+def _extract_selectolax(html: str) -> tuple[str, str]:
+    """Extract title and text with selectolax."""
+    tree = LexborHTMLParser(html)
+    title_node = tree.css_first("title")
+    title = title_node.text(strip=True) if title_node else ""
+
+    for node in tree.css(",".join(NOISE_TAGS)):
+        node.decompose()
+
+    main = tree.css_first("main") or tree.css_first("article") or tree.body or tree.root
+    text = main.text(separator="\n", strip=True) if main else ""
+    return title, _clean_text(text)
+
+
+def _extract_soup(html: str, parser: str) -> tuple[str, str]:
+    """Extract title and text with BeautifulSoup."""
+    soup = BeautifulSoup(html, parser)
+
+    title_tag = soup.find("title")
+    title = title_tag.get_text(strip=True) if title_tag else ""
+
+    for element in soup(NOISE_TAGS):
+        element.decompose()
+
+    # Prefer the main content area
+    main = soup.find("main") or soup.find("article") or soup.find("body") or soup
+    text = main.get_text(separator="\n", strip=True)
+    return title, _clean_text(text)
+
+
+def extract_text(html: str, parser: str = DEFAULT_PARSER) -> tuple[str, str]:
+    """Extract readable text from HTML.
+
+    Args:
+        html: Raw HTML content.
+        parser: One of PARSER_SELECTOLAX, PARSER_LXML, PARSER_HTML.
+
+    Returns:
+        Tuple of (title, extracted_text).
+    """
+    if parser == PARSER_SELECTOLAX:
+        if HAS_SELECTOLAX:
+            return _extract_selectolax(html)
+        parser = PARSER_LXML
+    if parser == PARSER_LXML and not HAS_LXML:
+        parser = PARSER_HTML
+    return _extract_soup(html, parser)
+
+
+def _warm_up() -> None:
+    """No-op run in each new worker so process startup is not timed."""
+
+
+def _on_deadline(_signum: int, _frame: FrameType | None) -> None:
+    raise TimeoutError("HTML extraction exceeded its deadline")
+
+
+def _extract_with_deadline(html: str, parser: str, timeout: float) -> tuple[str, str]:
+    """Run extract_text in a worker, aborting after timeout seconds.
+
+    The deadline starts when the worker picks the page up. Where SIGALRM is
+    unavailable the parent's kill deadline is the only limit.
+    """
+    if not hasattr(signal, "setitimer"):
+        return extract_text(html, parser)
+    previous = signal.signal(signal.SIGALRM, _on_deadline)
+    # A zero interval would disarm the timer instead of firing at once
+    signal.setitimer(signal.ITIMER_REAL, max(timeout, 1e-6))
+    try:
+        return extract_text(html, parser)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _terminate_pool(pool: ProcessPoolExecutor) -> None:
+    """Shut down a pool and kill its workers, including busy ones."""
+    processes = list((pool._processes or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+
+def extraction_timeout(
+    html_chars: int,
+    base_timeout: float = EXTRACT_BASE_TIMEOUT,
+    timeout_per_mb: float = EXTRACT_TIMEOUT_PER_MB,
+) -> float:
+    """Seconds allowed to extract a page of the given size."""
+    return base_timeout + timeout_per_mb * html_chars / (1024 * 1024)
+
+
+@dataclass
+class ExtractedText:
+    """Text extracted from one HTML page."""
+
+    title: str
+    text: str
+    # True when extraction timed out and the tag-strip fallback was used
+    degraded: bool = False
+
+
+class TextExtractor:
+    """Runs HTML text extraction off the event loop in a process pool."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        parser: str = DEFAULT_PARSER,
+        inline_threshold: int = INLINE_EXTRACT_CHARS,
+        base_timeout: float = EXTRACT_BASE_TIMEOUT,
+        timeout_per_mb: float = EXTRACT_TIMEOUT_PER_MB,
+        kill_grace: float = EXTRACT_KILL_GRACE,
+    ) -> None:
+        """Initialize the extractor.
+
+        Args:
+            max_workers: Worker processes (default: CPU count, at most 4).
+            parser: Parser to use (defaults to the fastest available).
+            inline_threshold: Pages below this many characters are parsed
+                on the calling thread.
+            base_timeout: Seconds allowed for any page.
+            timeout_per_mb: Extra seconds allowed per MB of HTML.
+            kill_grace: Seconds past a page's deadline after which its
+                worker is assumed stuck and the pool is replaced.
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.parser = parser
+        self.inline_threshold = inline_threshold
+        self.base_timeout = base_timeout
+        self.timeout_per_mb = timeout_per_mb
+        self.kill_grace = kill_grace
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = asyncio.Lock()
+        # One page per worker, so a submitted page starts running at once
+        self._slots = asyncio.Semaphore(self.max_workers)
+
+    async def _get_pool(self) -> ProcessPoolExecutor:
+        """Get or create the process pool, with every worker started."""
+        async with self._pool_lock:
+            if self._pool is None:
+                # spawn: forking a process with a running event loop and
+                # client threads is unsafe
+                pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                # Start (and import into) all workers before any page is
+                # timed against its extraction timeout
+                loop = asyncio.get_running_loop()
+                await asyncio.gather(
+                    *(loop.run_in_executor(pool, _warm_up) for _ in range(self.max_workers))
+                )
+                self._pool = pool
+            return self._pool
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Tear down a pool so the next page gets a fresh one."""
+        if self._pool is pool:
+            self._pool = None
+        _terminate_pool(pool)
+
+    @property
+    def version(self) -> str:
+        """Cache version of this extractor's output (rules and parser)."""
+        return f"{EXTRACTOR_VERSION}:{self.parser}"
+
+    async def extract(self, html: str) -> ExtractedText:
+        """Extract title and text from HTML without blocking the event loop.
+
+        Args:
+            html: Raw HTML content.
+
+        Returns:
+            ExtractedText (degraded if the size-based timeout was hit).
+        """
+        if len(html) < self.inline_threshold:
+            return ExtractedText(*extract_text(html, self.parser))
+
+        timeout = extraction_timeout(len(html), self.base_timeout, self.timeout_per_mb)
+        loop = asyncio.get_running_loop()
+        pool: ProcessPoolExecutor | None = None
+        try:
+            async with self._slots:
+                pool = await self._get_pool()
+                future = loop.run_in_executor(
+                    pool, _extract_with_deadline, html, self.parser, timeout
+                )
+                done, _ = await asyncio.wait({future}, timeout=timeout + self.kill_grace)
+                if not done:
+                    # The worker ignored its deadline; free its slot for good
+                    logger.warning(
+                        "Extraction worker overran its deadline, replacing pool",
+                        html_chars=len(html),
+                    )
+                    future.cancel()
+                    self._discard_pool(pool)
+                    raise TimeoutError
+                title, text = future.result()
+            return ExtractedText(title, text)
+        except TimeoutError:
+            logger.warning(
+                "HTML extraction timed out, using tag strip",
+                html_chars=len(html),
+                timeout_s=round(timeout, 1),
+            )
+        except BrokenProcessPool:
+            logger.warning("Extraction pool broke, using tag strip", html_chars=len(html))
+            if pool is not None:
+                self._discard_pool(pool)
+        text = await asyncio.to_thread(
+            extract_search_text, html.encode("utf-8", errors="replace"), "text/html"
+        )
+        return ExtractedText("", _clean_text(text), degraded=True)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_default_extractor: TextExtractor | None = None
+
+
+def get_text_extractor() -> TextExtractor:
+    """Get the process-wide extractor shared by all fetchers."""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = TextExtractor()
+    return _default_extractor
@@ -2,21 +2,43 @@
 Web page fetcher with text extraction.
 
 Fetches URLs via HTTP, extracts readable text, and stores in EvidenceStore.
+Text extraction runs in a process pool (see er.retrieval.extract) and its
+result is saved as a derived artifact of the page's content hash, so cached
+pages are served without re-reading or re-parsing the HTML.
+
+Requests share one pooled client (HTTP/2 when the h2 package is installed)
+and go through a per-host gate that caps concurrent connections and request
+rate. Bodies are streamed and abandoned as soon as they pass the size
+limit. Cached pages with an ETag or Last-Modified header are revalidated
+with conditional requests once they are older than revalidate_after, and
+failed attempts are retried with jittered exponential backoff.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-from dataclasses import dataclass
-from typing import Any
+import importlib.util
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
 
+from er.data.base import RateLimiter
 from er.evidence.store import EvidenceStore
 from er.logging import get_logger
-from er.types import Evidence, SourceTier, ToSRisk
+from er.retrieval.extract import (
+    DERIVED_TEXT_KIND,
+    ExtractedText,
+    TextExtractor,
+    get_text_extractor,
+)
+from er.types import Evidence, SourceTier, ToSRisk, utc_now
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 logger = get_logger(__name__)
 
@@ -29,6 +51,28 @@ REQUEST_TIMEOUT = 30.0
 # Max content size to fetch (10MB)
 MAX_CONTENT_SIZE = 10 * 1024 * 1024
 
+# Connection pool shared by all hosts
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+
+# Politeness limits for each host
+PER_HOST_CONCURRENCY = 2
+PER_HOST_REQUESTS_PER_SECOND = 2.0
+
+# URLs fetched at once by fetch_many (across all hosts)
+FETCH_MANY_CONCURRENCY = 16
+
+# Retry backoff: base * 2^attempt, capped, with full jitter
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 10.0
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Cached pages with validators are revalidated once older than this
+REVALIDATE_AFTER_SECONDS = 24 * 3600.0
+
+# HTTP/2 needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 @dataclass
 class FetchResult:
@@ -43,12 +87,33 @@ class FetchResult:
     error: str | None = None
 
 
+@dataclass
+class _Download:
+    """Outcome of one streamed GET (after retries)."""
+
+    body: bytes = b""
+    encoding: str = "utf-8"
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+    error: str | None = None
+
+
+@dataclass
+class _HostGate:
+    """Concurrency and rate limits for one host."""
+
+    semaphore: asyncio.Semaphore
+    limiter: RateLimiter = field(repr=False)
+
+
 class WebFetcher:
     """Fetches web pages and stores them as evidence.
 
     Features:
-    - HTTP fetching with timeouts and retries
-    - Text extraction using BeautifulSoup
+    - Pooled HTTP(/2) fetching with per-host limits, streamed size limits,
+      conditional revalidation and jittered retries
+    - Text extraction off the event loop (process pool, fastest parser)
     - Caching/deduplication via EvidenceStore
     - Source tier and ToS risk classification
     """
@@ -74,6 +139,12 @@ class WebFetcher:
         evidence_store: EvidenceStore,
         timeout: float = REQUEST_TIMEOUT,
         max_retries: int = 2,
+        extractor: TextExtractor | None = None,
+        max_content_size: int = MAX_CONTENT_SIZE,
+        per_host_concurrency: int = PER_HOST_CONCURRENCY,
+        per_host_rate: float = PER_HOST_REQUESTS_PER_SECOND,
+        retry_base_delay: float = RETRY_BASE_DELAY,
+        revalidate_after: float | None = REVALIDATE_AFTER_SECONDS,
     ) -> None:
         """Initialize the fetcher.
 
@@ -81,11 +152,25 @@ class WebFetcher:
             evidence_store: Store for persisting fetched content.
             timeout: Request timeout in seconds.
             max_retries: Number of retry attempts on failure.
+            extractor: Text extractor (defaults to the shared process pool).
+            max_content_size: Abort downloads larger than this many bytes.
+            per_host_concurrency: Concurrent requests allowed per host.
+            per_host_rate: Requests per second allowed per host.
+            retry_base_delay: First retry delay in seconds (doubles per attempt).
+            revalidate_after: Seconds after which cached pages with
+                validators are revalidated (None = never).
         """
         self.evidence_store = evidence_store
         self.timeout = timeout
         self.max_retries = max_retries
+        self.extractor = extractor or get_text_extractor()
+        self.max_content_size = max_content_size
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self.retry_base_delay = retry_base_delay
+        self.revalidate_after = revalidate_after
         self._client: httpx.AsyncClient | None = None
+        self._host_gates: dict[str, _HostGate] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -94,9 +179,25 @@ class WebFetcher:
                 timeout=self.timeout,
                 follow_redirects=True,
                 headers={"User-Agent": USER_AGENT},
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
             )
         return self._client
 
+    def _host_gate(self, url: str) -> _HostGate:
+        """Get the politeness gate for a URL's host."""
+        host = urlparse(url).netloc.lower()
+        gate = self._host_gates.get(host)
+        if gate is None:
+            gate = self._host_gates[host] = _HostGate(
+                semaphore=asyncio.Semaphore(max(1, self.per_host_concurrency)),
+                limiter=RateLimiter(rate=self.per_host_rate, burst=self.per_host_concurrency),
+            )
+        return gate
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
@@ -130,42 +231,49 @@ class WebFetcher:
         else:
             return ToSRisk.LOW
 
-    def _extract_text(self, html: str) -> tuple[str, str]:
-        """Extract readable text from HTML.
+    async def _extract_text(self, html: str, content_hash: str) -> ExtractedText:
+        """Extract readable text from HTML and save it for later fetches.
 
         Args:
             html: Raw HTML content.
+            content_hash: SHA-256 of the HTML bytes.
 
         Returns:
-            Tuple of (title, extracted_text).
+            Extracted title and text.
         """
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Get title
-        title_tag = soup.find("title")
-        title = title_tag.get_text(strip=True) if title_tag else ""
-
-        # Remove script and style elements
-        for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
-            element.decompose()
+        extracted = await self.extractor.extract(html)
+        if not extracted.degraded:
+            await self.evidence_store.put_derived(
+                content_hash,
+                DERIVED_TEXT_KIND,
+                self.extractor.version,
+                {"title": extracted.title, "text": extracted.text},
+            )
+        return extracted
 
-        # Try to find main content area
-        main = soup.find("main") or soup.find("article") or soup.find("body")
-        if not main:
-            main = soup
+    async def _cached_text(self, evidence: Evidence) -> ExtractedText | None:
+        """Get the extracted text of stored HTML evidence.
 
-        # Get text
-        text = main.get_text(separator="\n", strip=True)
+        Reads the saved derivation when this extractor version produced
+        one; otherwise re-extracts from the blob once and saves the result.
 
-        # Clean up whitespace
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
-        text = "\n".join(lines)
+        Args:
+            evidence: Stored evidence for the URL.
 
-        # Truncate if too long (keep first 50k chars)
-        if len(text) > 50000:
-            text = text[:50000] + "\n...[truncated]"
+        Returns:
+            Extracted text, or None if the blob is unavailable.
+        """
+        derived = await self.evidence_store.get_derived(
+            evidence.content_hash, DERIVED_TEXT_KIND, self.extractor.version
+        )
+        if derived is not None:
+            return ExtractedText(derived["title"], derived["text"])
 
-        return title, text
+        content = await self.evidence_store.get_blob(evidence.evidence_id)
+        if not content:
+            return None
+        html = content.decode("utf-8", errors="replace")
+        return await self._extract_text(html, evidence.content_hash)
 
     async def fetch(
         self,
@@ -176,73 +284,39 @@ class WebFetcher:
 
         Args:
             url: URL to fetch.
-            skip_if_cached: If True, return cached evidence if exists.
+            skip_if_cached: If True, return cached evidence if exists
+                (revalidating it first once it is older than revalidate_after).
 
         Returns:
             FetchResult with evidence_id and extracted text.
         """
-        # Check cache first
-        if skip_if_cached:
-            existing = await self.evidence_store.find_by_url(url)
-            if existing:
+        existing = await self.evidence_store.find_by_url(url)
+        validators = None
+        if existing:
+            validators = await self.evidence_store.get_validators(url)
+            if validators and validators["content_hash"] != existing.content_hash:
+                validators = None
+            if skip_if_cached and not self._needs_revalidation(existing, validators):
                 logger.debug("Using cached evidence", url=url, evidence_id=existing.evidence_id)
-                # Retrieve the full content and re-extract text
-                cached_content = await self.evidence_store.get_blob(existing.evidence_id)
-                if cached_content and existing.content_type == "text/html":
-                    # Re-extract full text from cached HTML
-                    html = cached_content.decode("utf-8", errors="replace")
-                    title, text = self._extract_text(html)
-                else:
-                    # Fallback to snippet if content not available
-                    title = existing.title or ""
-                    text = existing.snippet or ""
-                return FetchResult(
-                    url=url,
-                    evidence_id=existing.evidence_id,
-                    title=title,
-                    text=text,
-                    content_hash=existing.content_hash,
-                    success=True,
-                )
+                return await self._cached_result(url, existing)
 
-        # Fetch the URL
-        client = await self._get_client()
-        last_error = None
-
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                # Check content size
-                content_length = int(response.headers.get("content-length", 0))
-                if content_length > MAX_CONTENT_SIZE:
-                    return FetchResult(
-                        url=url,
-                        evidence_id="",
-                        title="",
-                        text="",
-                        content_hash="",
-                        success=False,
-                        error=f"Content too large: {content_length} bytes",
-                    )
-
-                html = response.text
-                break
+        download = await self._download(url, validators)
 
-            except httpx.HTTPError as e:
-                last_error = str(e)
-                if attempt < self.max_retries:
-                    logger.warning(
-                        "Fetch attempt failed, retrying",
-                        url=url,
-                        attempt=attempt + 1,
-                        error=str(e),
-                    )
-                continue
-
-        else:
-            logger.error("All fetch attempts failed", url=url, error=last_error)
+        if existing and validators and download.not_modified:
+            await self.evidence_store.put_validators(
+                url,
+                existing.content_hash,
+                download.etag or validators["etag"],
+                download.last_modified or validators["last_modified"],
+            )
+            logger.debug("Cached evidence not modified", url=url, evidence_id=existing.evidence_id)
+            return await self._cached_result(url, existing)
+
+        if download.error is not None:
+            if existing and skip_if_cached:
+                # Revalidation failed; the cached copy is still usable
+                logger.warning("Revalidation failed, using cached evidence", url=url, error=download.error)
+                return await self._cached_result(url, existing)
             return FetchResult(
                 url=url,
                 evidence_id="",
@@ -250,15 +324,18 @@ class WebFetcher:
                 text="",
                 content_hash="",
                 success=False,
-                error=last_error,
+                error=download.error,
             )
 
-        # Extract text
-        title, text = self._extract_text(html)
+        html = download.body.decode(download.encoding, errors="replace")
 
         # Compute content hash
         content_hash = hashlib.sha256(html.encode()).hexdigest()
 
+        # Extract text
+        extracted = await self._extract_text(html, content_hash)
+        title, text = extracted.title, extracted.text
+
         # Classify source
         source_tier = self._classify_source_tier(url)
         tos_risk = self._classify_tos_risk(url)
@@ -273,6 +350,10 @@ class WebFetcher:
             title=title,
             snippet=text[:500] if text else "",
         )
+        if download.etag or download.last_modified:
+            await self.evidence_store.put_validators(
+                url, content_hash, download.etag, download.last_modified
+            )
 
         logger.info(
             "Fetched and stored URL",
@@ -291,6 +372,132 @@ class WebFetcher:
             success=True,
         )
 
+    def _needs_revalidation(self, evidence: Evidence, validators: dict[str, Any] | None) -> bool:
+        """Whether cached evidence is stale enough for a conditional request."""
+        if self.revalidate_after is None or not validators:
+            return False
+        if not (validators["etag"] or validators["last_modified"]):
+            return False
+        checked_at: datetime = max(evidence.retrieved_at, validators["checked_at"])
+        return (utc_now() - checked_at).total_seconds() > self.revalidate_after
+
+    async def _cached_result(self, url: str, evidence: Evidence) -> FetchResult:
+        """Build a FetchResult from stored evidence."""
+        extracted = None
+        if evidence.content_type == "text/html":
+            extracted = await self._cached_text(evidence)
+        if extracted is not None:
+            title, text = extracted.title, extracted.text
+        else:
+            # Fallback to snippet if content not available
+            title = evidence.title or ""
+            text = evidence.snippet or ""
+        return FetchResult(
+            url=url,
+            evidence_id=evidence.evidence_id,
+            title=title,
+            text=text,
+            content_hash=evidence.content_hash,
+            success=True,
+        )
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None) -> float:
+        """Seconds to wait before retry number attempt + 1.
+
+        Honors a numeric Retry-After header; otherwise exponential backoff
+        with full jitter so concurrent retries do not arrive together.
+        """
+        if response is not None:
+            retry_after = response.headers.get("retry-after", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), RETRY_MAX_DELAY)
+        return random.uniform(0, min(RETRY_MAX_DELAY, self.retry_base_delay * 2**attempt))
+
+    async def _download(self, url: str, validators: dict[str, Any] | None) -> _Download:
+        """GET a URL with per-host limits, a streamed size cap and retries.
+
+        Args:
+            url: URL to fetch.
+            validators: Stored validators; sent as conditional headers.
+
+        Returns:
+            The body, a not-modified marker, or an error.
+        """
+        headers = {}
+        if validators:
+            if validators["etag"]:
+                headers["If-None-Match"] = validators["etag"]
+            if validators["last_modified"]:
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        client = await self._get_client()
+        gate = self._host_gate(url)
+        error = "no attempts made"
+
+        for attempt in range(self.max_retries + 1):
+            retry_response = None
+            try:
+                async with gate.semaphore:
+                    await gate.limiter.acquire()
+                    async with client.stream("GET", url, headers=headers) as response:
+                        if response.status_code == 304 and headers:
+                            return _Download(
+                                not_modified=True,
+                                etag=response.headers.get("etag"),
+                                last_modified=response.headers.get("last-modified"),
+                            )
+                        if response.status_code in RETRYABLE_STATUS_CODES:
+                            retry_response = response
+                            raise httpx.HTTPStatusError(
+                                f"HTTP {response.status_code}",
+                                request=response.request,
+                                response=response,
+                            )
+                        response.raise_for_status()
+
+                        # Check content size before and while downloading
+                        content_length = int(response.headers.get("content-length", 0))
+                        if content_length > self.max_content_size:
+                            return _Download(error=f"Content too large: {content_length} bytes")
+                        chunks = []
+                        received = 0
+                        async for chunk in response.aiter_bytes():
+                            received += len(chunk)
+                            if received > self.max_content_size:
+                                return _Download(
+                                    error=f"Content too large: over {self.max_content_size} bytes"
+                                )
+                            chunks.append(chunk)
+
+                        return _Download(
+                            body=b"".join(chunks),
+                            encoding=response.encoding or "utf-8",
+                            etag=response.headers.get("etag"),
+                            last_modified=response.headers.get("last-modified"),
+                        )
+
+            except httpx.HTTPStatusError as e:
+                error = str(e)
+                if retry_response is None:
+                    # Client errors (404, 403, ...) will not succeed on retry
+                    return _Download(error=error)
+            except httpx.HTTPError as e:
+                error = str(e) or type(e).__name__
+
+            if attempt < self.max_retries:
+                delay = self._retry_delay(attempt, retry_response)
+                logger.warning(
+                    "Fetch attempt failed, retrying",
+                    url=url,
+                    attempt=attempt + 1,
+                    retry_in_seconds=round(delay, 2),
+                    error=error,
+                )
+                await asyncio.sleep(delay)
+
+        logger.error("All fetch attempts failed", url=url, error=error)
+        return _Download(error=error)
+
     async def fetch_many(
         self,
         urls: list[str],
@@ -305,10 +512,8 @@ class WebFetcher:
         Returns:
             List of FetchResult objects.
         """
-        import asyncio
-
-        # Limit concurrency
-        semaphore = asyncio.Semaphore(5)
+        # Per-host limits are applied in _download; this caps total work
+        semaphore = asyncio.Semaphore(FETCH_MANY_CONCURRENCY)
 
         async def fetch_with_semaphore(url: str) -> FetchResult:
             async with semaphore:
@@ -0,0 +1,374 @@
+"""
+Run catalog: an indexed SQLite summary of every run in the output directory.
+
+Listing runs used to mean loading every run directory's manifest.json and
+stage 6 report. The catalog (output/runs.db) keeps one summary row per run
+directory, updated whenever a manifest is saved, so listings are a single
+indexed query with pagination, filtering and sorting. Runs from before the
+catalog existed are picked up by a full rebuild, which records itself in the
+meta table; readers rebuild until that marker is present.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from er.checkpoints import load_checkpoint
+from er.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Catalog database, relative to the output directory
+CATALOG_FILENAME = "runs.db"
+
+# Run directories are recognised by this prefix
+RUN_DIR_PREFIX = "run_"
+
+# Columns that listings may be sorted by
+SORTABLE_COLUMNS = ("started_at", "completed_at", "ticker", "status", "total_cost", "duration")
+
+# Meta key set once rebuild() has indexed the existing run directories
+BACKFILL_KEY = "backfilled_at"
+
+# Stage 6 report sections holding the verdict
+VERDICT_SECTIONS = ("investment_view", "conviction", "overall_confidence")
+
+_UPSERT_SQL = """
+    INSERT INTO runs (
+        run_dir, run_id, ticker, status, phase, started_at, completed_at,
+        duration, total_cost, investment_view, conviction, confidence, manifest_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(run_dir) DO UPDATE SET
+        run_id = excluded.run_id,
+        ticker = excluded.ticker,
+        status = excluded.status,
+        phase = excluded.phase,
+        started_at = excluded.started_at,
+        completed_at = excluded.completed_at,
+        duration = excluded.duration,
+        total_cost = excluded.total_cost,
+        investment_view = COALESCE(excluded.investment_view, runs.investment_view),
+        conviction = COALESCE(excluded.conviction, runs.conviction),
+        confidence = COALESCE(excluded.confidence, runs.confidence),
+        manifest_json = excluded.manifest_json
+"""
+
+
+def _duration_seconds(started_at: str | None, completed_at: str | None) -> float:
+    """Seconds between two ISO timestamps (0 if either is missing)."""
+    if not started_at or not completed_at:
+        return 0.0
+    try:
+        return (
+            datetime.fromisoformat(completed_at) - datetime.fromisoformat(started_at)
+        ).total_seconds()
+    except ValueError:
+        return 0.0
+
+
+def _read_verdict(run_dir: Path) -> dict[str, Any]:
+    """Read the verdict fields from a run's stage 6 report, if present.
+
+    Only the three verdict sections of the checkpoint are decoded.
+    """
+    stage6 = load_checkpoint(run_dir, "stage6_final_report", VERDICT_SECTIONS)
+    if not isinstance(stage6, dict):
+        return {}
+    return {
+        "investment_view": stage6.get("investment_view"),
+        "conviction": stage6.get("conviction"),
+        "confidence": stage6.get("overall_confidence"),
+    }
+
+
+class RunCatalog:
+    """SQLite index of run summaries for one output directory.
+
+    Thread-safe for multiple writers: each run updates only its own row,
+    and the database uses WAL with a busy timeout.
+    """
+
+    def __init__(self, output_dir: Path | str) -> None:
+        """Initialize the catalog.
+
+        Args:
+            output_dir: Directory containing run_* directories.
+        """
+        self.output_dir = Path(output_dir)
+        self.db_path = self.output_dir / CATALOG_FILENAME
+        self._conn: sqlite3.Connection | None = None
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get or create the connection, creating the schema on first use."""
+        if self._conn is None:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_dir TEXT PRIMARY KEY,
+                    run_id TEXT NOT NULL,
+                    ticker TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    phase TEXT,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    duration REAL NOT NULL DEFAULT 0,
+                    total_cost REAL NOT NULL DEFAULT 0,
+                    investment_view TEXT,
+                    conviction TEXT,
+                    confidence REAL,
+                    manifest_json TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_ticker ON runs(ticker, started_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status, started_at)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> RunCatalog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def is_backfilled(self) -> bool:
+        """Whether rebuild() has indexed the run directories at least once.
+
+        RunManifest.save() creates the database with only its own run, so
+        the file existing does not mean older runs are catalogued.
+        """
+        row = self._get_conn().execute(
+            "SELECT 1 FROM meta WHERE key = ?", (BACKFILL_KEY,)
+        ).fetchone()
+        return row is not None
+
+    def upsert(self, run_dir: Path, manifest: dict[str, Any]) -> None:
+        """Insert or update the summary row for a run.
+
+        The stage 6 verdict is read once the run has completed; earlier
+        updates keep any verdict already recorded.
+
+        Args:
+            run_dir: The run's output directory.
+            manifest: RunManifest.to_dict() output.
+        """
+        self._get_conn().execute(_UPSERT_SQL, self._row(run_dir, manifest))
+        self._get_conn().commit()
+
+    def remove(self, run_dir_name: str) -> bool:
+        """Remove a run's row.
+
+        Args:
+            run_dir_name: Name of the run directory.
+
+        Returns:
+            True if a row was removed.
+        """
+        conn = self._get_conn()
+        cursor = conn.execute("DELETE FROM runs WHERE run_dir = ?", (run_dir_name,))
+        conn.commit()
+        return cursor.rowcount > 0
+
+    def rebuild(self) -> int:
+        """Reindex every run directory and drop rows for deleted runs.
+
+        Returns:
+            Number of runs indexed.
+        """
+        conn = self._get_conn()
+        rows = []
+        seen: set[str] = set()
+        if self.output_dir.exists():
+            for run_dir in self.output_dir.iterdir():
+                if not run_dir.is_dir() or not run_dir.name.startswith(RUN_DIR_PREFIX):
+                    continue
+                manifest_path = run_dir / "manifest.json"
+                if not manifest_path.exists():
+                    continue
+                try:
+                    manifest = orjson.loads(manifest_path.read_bytes())
+                    rows.append(self._row(run_dir, manifest))
+                except (orjson.JSONDecodeError, KeyError) as e:
+                    logger.warning("Skipping unreadable manifest", run_dir=run_dir.name, error=str(e))
+                    continue
+                seen.add(run_dir.name)
+
+        with conn:
+            conn.executemany(_UPSERT_SQL, rows)
+            stale = [
+                (row["run_dir"],)
+                for row in conn.execute("SELECT run_dir FROM runs")
+                if row["run_dir"] not in seen
+            ]
+            conn.executemany("DELETE FROM runs WHERE run_dir = ?", stale)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (BACKFILL_KEY, datetime.now(UTC).isoformat()),
+            )
+
+        logger.info("Rebuilt run catalog", runs=len(rows), removed=len(stale))
+        return len(rows)
+
+    def list_runs(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        ticker: str | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        sort: str = "started_at",
+        descending: bool = True,
+    ) -> list[dict[str, Any]]:
+        """List run summaries.
+
+        Args:
+            limit: Maximum rows to return.
+            offset: Rows to skip (for pagination).
+            ticker: Filter by ticker (case-insensitive).
+            status: Filter by manifest status.
+            since: Only runs started at or after this ISO date/time.
+            until: Only runs started before this ISO date/time.
+            sort: Column to sort by (one of SORTABLE_COLUMNS).
+            descending: Sort direction.
+
+        Returns:
+            Summary dicts with the parsed manifest under "manifest".
+        """
+        if sort not in SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort runs by {sort!r}; expected one of {SORTABLE_COLUMNS}")
+
+        where, params = self._where(ticker, status, since, until)
+        direction = "DESC" if descending else "ASC"
+        query = (
+            f"SELECT * FROM runs {where} "
+            f"ORDER BY {sort} {direction}, run_dir {direction} LIMIT ? OFFSET ?"
+        )
+        rows = self._get_conn().execute(query, [*params, limit, offset]).fetchall()
+        return [self._to_summary(row) for row in rows]
+
+    def count(
+        self,
+        ticker: str | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> int:
+        """Count runs matching the same filters as list_runs."""
+        where, params = self._where(ticker, status, since, until)
+        row = self._get_conn().execute(f"SELECT COUNT(*) FROM runs {where}", params).fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _where(
+        ticker: str | None,
+        status: str | None,
+        since: str | None,
+        until: str | None,
+    ) -> tuple[str, list[Any]]:
+        """Build the WHERE clause for listing filters."""
+        conditions = []
+        params: list[Any] = []
+        if ticker:
+            conditions.append("ticker = ?")
+            params.append(ticker.upper())
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if since:
+            conditions.append("started_at >= ?")
+            params.append(since)
+        if until:
+            conditions.append("started_at < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    @staticmethod
+    def _row(run_dir: Path, manifest: dict[str, Any]) -> tuple[Any, ...]:
+        """Build the catalog row for a manifest."""
+        started_at = manifest.get("started_at")
+        completed_at = manifest.get("completed_at")
+        status = manifest.get("status", "unknown")
+        verdict = _read_verdict(run_dir) if status == "completed" else {}
+        budget = manifest.get("budget") or {}
+        return (
+            run_dir.name,
+            manifest.get("run_id", run_dir.name),
+            str(manifest.get("ticker", "???")).upper(),
+            status,
+            manifest.get("phase"),
+            started_at,
+            completed_at,
+            _duration_seconds(started_at, completed_at),
+            budget.get("used", 0) or 0,
+            verdict.get("investment_view"),
+            verdict.get("conviction"),
+            verdict.get("confidence"),
+            orjson.dumps(manifest).decode("utf-8"),
+        )
+
+    @staticmethod
+    def _to_summary(row: sqlite3.Row) -> dict[str, Any]:
+        """Convert a catalog row to a summary dict."""
+        verdict = {
+            key: row[key]
+            for key in ("investment_view", "conviction", "confidence")
+            if row[key] is not None
+        }
+        return {
+            "run_dir": row["run_dir"],
+            "run_id": row["run_id"],
+            "ticker": row["ticker"],
+            "status": row["status"],
+            "phase": row["phase"],
+            "started_at": row["started_at"],
+            "completed_at": row["completed_at"],
+            "duration": row["duration"],
+            "total_cost": row["total_cost"],
+            "verdict": verdict,
+            "manifest": orjson.loads(row["manifest_json"]),
+        }
+
+
+def record_run(run_dir: Path, manifest: dict[str, Any]) -> None:
+    """Update the catalog next to a run directory; never raises.
+
+    Only directories named run_* are catalogued.
+
+    Args:
+        run_dir: The run's output directory.
+        manifest: RunManifest.to_dict() output.
+    """
+    if not run_dir.name.startswith(RUN_DIR_PREFIX):
+        return
+    try:
+        with RunCatalog(run_dir.parent) as catalog:
+            catalog.upsert(run_dir, manifest)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Failed to update run catalog", run_dir=run_dir.name, error=str(e))
@@ -0,0 +1,143 @@
+"""
+Run event fan-out for the dashboard's SSE stream.
+
+Each active run has a RunEventBroker. Events are serialized once into an
+SSE frame on publish and pushed to every subscriber; a bounded ring buffer
+serves replay for clients that join late or reconnect with Last-Event-ID.
+Subscribers that fall behind have progress events dropped (lifecycle
+events are always delivered).
+
+Kept free of FastAPI so it can be used and tested without the API server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+# SSE fan-out settings
+SSE_REPLAY_BUFFER = 500  # Events kept per run for late joiners / Last-Event-ID replay
+SSE_SUBSCRIBER_BACKLOG = 100  # Undelivered events per client before coalescing
+SSE_KEEPALIVE_SECONDS = 15.0
+
+# Progress events that may be dropped for slow clients (lifecycle events never are)
+COALESCIBLE_EVENT_TYPES = frozenset({"stage_update", "agent_event"})
+TERMINAL_STATUSES = ("complete", "error", "cancelled")
+TERMINAL_EVENT_TYPES = ("run_complete", "run_error", "run_cancelled")
+
+
+@dataclass
+class AgentEvent:
+    """Event from an agent during pipeline execution."""
+
+    timestamp: str
+    type: str  # stage_update, run_complete, run_error, etc.
+    event_type: str  # legacy alias for type (kept for backward compatibility)
+    agent_name: str
+    stage: float
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PublishedEvent:
+    """An AgentEvent serialized once, with its SSE id."""
+
+    event_id: int
+    event: AgentEvent
+    frame: str  # Complete SSE frame ("id: ...\ndata: ...\n\n")
+
+
+class EventSubscriber:
+    """One SSE client's pending events.
+
+    When the backlog is full, the oldest queued progress event is dropped
+    to make room; a new progress event is dropped if nothing else can go.
+    """
+
+    def __init__(self, max_backlog: int = SSE_SUBSCRIBER_BACKLOG) -> None:
+        self.max_backlog = max_backlog
+        self.pending: deque[PublishedEvent] = deque()
+        self.wakeup = asyncio.Event()
+        self.dropped = 0
+
+    def offer(self, published: PublishedEvent) -> None:
+        """Queue an event, dropping progress events if the backlog is full."""
+        if len(self.pending) >= self.max_backlog:
+            for queued in self.pending:
+                if queued.event.type in COALESCIBLE_EVENT_TYPES:
+                    self.pending.remove(queued)
+                    self.dropped += 1
+                    break
+            else:
+                if published.event.type in COALESCIBLE_EVENT_TYPES:
+                    self.dropped += 1
+                    return
+        self.pending.append(published)
+        self.wakeup.set()
+
+    def drain(self) -> list[PublishedEvent]:
+        """Take every pending event, oldest first."""
+        events = list(self.pending)
+        self.pending.clear()
+        self.wakeup.clear()
+        return events
+
+
+class RunEventBroker:
+    """Push-based pub/sub for one run's events.
+
+    Each event is serialized once on publish and fanned out to every
+    subscriber; a bounded ring buffer serves replay for new clients and
+    for reconnects carrying Last-Event-ID.
+    """
+
+    def __init__(
+        self,
+        replay_size: int = SSE_REPLAY_BUFFER,
+        subscriber_backlog: int = SSE_SUBSCRIBER_BACKLOG,
+    ) -> None:
+        self.buffer: deque[PublishedEvent] = deque(maxlen=replay_size)
+        self.subscribers: set[EventSubscriber] = set()
+        self.subscriber_backlog = subscriber_backlog
+        self._next_id = 1
+
+    def publish(self, event: AgentEvent) -> PublishedEvent:
+        """Serialize an event, buffer it for replay and offer it to every subscriber."""
+        event_id = self._next_id
+        self._next_id += 1
+        published = PublishedEvent(
+            event_id=event_id,
+            event=event,
+            frame=f"id: {event_id}\ndata: {json.dumps(asdict(event))}\n\n",
+        )
+        self.buffer.append(published)
+        for subscriber in self.subscribers:
+            subscriber.offer(published)
+        return published
+
+    def subscribe(self, last_event_id: int | None = None) -> EventSubscriber:
+        """Register a client, queueing buffered events after last_event_id."""
+        subscriber = EventSubscriber(self.subscriber_backlog)
+        after = last_event_id or 0
+        # Replay is bounded by the ring buffer, so it bypasses the backlog limit
+        subscriber.pending.extend(e for e in self.buffer if e.event_id > after)
+        if subscriber.pending:
+            subscriber.wakeup.set()
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: EventSubscriber) -> None:
+        """Stop delivering events to a client."""
+        self.subscribers.discard(subscriber)
+
+    def finished(self) -> bool:
+        """Whether the final lifecycle event has been published."""
+        return bool(self.buffer) and self.buffer[-1].event.type in TERMINAL_EVENT_TYPES
+
+    def wake_all(self) -> None:
+        """Wake every subscriber, e.g. when the session is being discarded."""
+        for subscriber in self.subscribers:
+            subscriber.wakeup.set()
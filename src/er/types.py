@@ -15,10 +15,22 @@ import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from uuid6 import uuid7
 
+from er.utils.prompt_packing import (
+    PromptSection,
+    SectionVariant,
+    estimate_fragment_tokens,
+    pack_and_render,
+    render_fragment,
+    render_sections,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 def generate_id(prefix: str = "") -> str:
     """Generate a time-ordered unique ID using UUID7.
@@ -456,6 +468,77 @@ class ToolResult:
 
 # ============== Stage 1: Company Context ==============
 
+# Value of one packing priority tier. Each tier is worth more than any
+# realistic token-cost ratio between two upgrades, so the packer's
+# value-per-token greedy restores every upgrade of a higher tier before
+# any upgrade of a lower one.
+PROMPT_PRIORITY_TIER = 1e6
+
+# Prompt sections the budgeted serializer may shrink, as (variant, value)
+# from most to least complete. Sections not listed have one full variant.
+# Values set the packing priority, in tiers: transcript text goes first,
+# then older quarters, news beyond the top 5, analyst grades and older
+# annual data.
+PROMPT_SECTION_LADDERS: dict[str, tuple[tuple[str, float], ...]] = {
+    "income_statement_annual": (("full", PROMPT_PRIORITY_TIER**5), ("recent:2", 0.0)),
+    "balance_sheet_annual": (("full", PROMPT_PRIORITY_TIER**5), ("recent:1", 0.0)),
+    "cash_flow_annual": (("full", PROMPT_PRIORITY_TIER**5), ("recent:1", 0.0)),
+    "recent_analyst_grades": (("full", PROMPT_PRIORITY_TIER**4),),
+    "recent_news": (("full", PROMPT_PRIORITY_TIER**3), ("recent:5", 0.0)),
+    "income_statement_quarterly": (("full", PROMPT_PRIORITY_TIER**2), ("recent:4", 0.0)),
+    "earnings_transcripts": (
+        ("full", 2 * PROMPT_PRIORITY_TIER),
+        ("preview", PROMPT_PRIORITY_TIER),
+        ("metadata", 0.0),
+    ),
+}
+
+# Prompt sections that may be left out entirely under a tight budget
+OPTIONAL_PROMPT_SECTIONS = frozenset({"recent_analyst_grades"})
+
+# Transcript characters kept by the preview variant (Discovery's view)
+TRANSCRIPT_PREVIEW_CHARS = 2000
+
+
+def _prompt_section_variant(key: str, variant: str, value: Any) -> Any:
+    """Apply a PROMPT_SECTION_LADDERS variant to a payload section."""
+    if variant == "full":
+        return value
+    if variant.startswith("recent:"):
+        return value[: int(variant.split(":", 1)[1])]
+    if variant == "preview":
+        return [
+            {**t, "full_text": t["full_text"][:TRANSCRIPT_PREVIEW_CHARS] + "\n[...transcript continues...]"}
+            if len(t.get("full_text") or "") > TRANSCRIPT_PREVIEW_CHARS
+            else t
+            for t in value
+        ]
+    if variant == "metadata":
+        return [
+            {**t, "full_text": "[TRUNCATED - use transcript_extracts instead]"} if "full_text" in t else t
+            for t in value
+        ]
+    raise ValueError(f"Unknown prompt variant {variant!r} for {key}")
+
+
+def _constant(value: Any) -> Callable[[], Any]:
+    """Zero-argument callable returning value (binds loop variables)."""
+    return lambda: value
+
+
+@dataclass
+class _PromptRenderings:
+    """Cached payload, fragments, token counts and views of a CompanyContext."""
+
+    payload: dict[str, Any] | None = None
+    # Fragment name -> rendered fragment
+    fragments: dict[str, str] = field(default_factory=dict)
+    # Model (None = estimate) -> (section, variant) -> tokens
+    tokens: dict[str | None, dict[tuple[str, str], int]] = field(default_factory=dict)
+    # View name -> rendered view
+    views: dict[str, str] = field(default_factory=dict)
+
+
 @dataclass
 class CompanyContext:
     """Full context about a company gathered from FMP API.
@@ -473,6 +556,11 @@ class CompanyContext:
         news: Recent news articles.
         analyst_data: Analyst estimates, ratings, price targets.
         evidence_ids: List of evidence IDs for all fetched data.
+
+    Prompt views (to_prompt_string, for_discovery, for_deep_research,
+    for_judge) are assembled from section renderings cached on the
+    instance; assigning any field clears the cache. Mutate nested dicts
+    and lists only before the first view is rendered.
     """
 
     symbol: str
@@ -576,6 +664,110 @@ class CompanyContext:
             evidence_ids=evidence_ids,
         )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Cached prompt renderings are stale once a field is reassigned
+        self.__dict__.pop("_prompt_renderings", None)
+        object.__setattr__(self, name, value)
+
+    def _prompt_cache(self) -> _PromptRenderings:
+        """Per-instance cache of payload, fragments, token counts and views.
+
+        Kept out of the dataclass fields so it is never compared,
+        copied by replace() or written to checkpoints.
+        """
+        cache: _PromptRenderings | None = self.__dict__.get("_prompt_renderings")
+        if cache is None:
+            cache = _PromptRenderings()
+            self.__dict__["_prompt_renderings"] = cache
+        return cache
+
+    def _prompt_payload(self) -> dict[str, Any]:
+        """to_json_payload(), built once per cache."""
+        cache = self._prompt_cache()
+        if cache.payload is None:
+            cache.payload = self.to_json_payload()
+        return cache.payload
+
+    def _fragment(self, name: str, key: str, value: Callable[[], Any]) -> str:
+        """Rendered fragment for a section, serialized on first use only."""
+        fragments = self._prompt_cache().fragments
+        fragment = fragments.get(name)
+        if fragment is None:
+            fragment = fragments[name] = render_fragment(key, value())
+        return fragment
+
+    def _payload_fragment(self, key: str, variant: str = "full") -> str:
+        """Rendered fragment for one variant of a to_json_payload() section."""
+        payload = self._prompt_payload()
+        return self._fragment(
+            f"{key}:{variant}",
+            key,
+            lambda: _prompt_section_variant(key, variant, payload[key]),
+        )
+
+    def _render_payload_view(self, name: str, variants: dict[str, str] | None = None) -> str:
+        """Render the payload with chosen variants per section (cached per view)."""
+        views = self._prompt_cache().views
+        text = views.get(name)
+        if text is None:
+            variants = variants or {}
+            text = views[name] = render_sections([
+                self._payload_fragment(key, variants.get(key, "full"))
+                for key in self._prompt_payload()
+            ])
+        return text
+
+    def prompt_sections(self, model: str | None = None) -> list[PromptSection]:
+        """Payload sections with every variant rendered and measured.
+
+        Renderings and counts are cached, so each section is serialized
+        and measured once however many views or budgets use it.
+
+        Args:
+            model: Count tokens with this model's tokenizer (default:
+                chars / 4 estimate).
+
+        Returns:
+            PromptSection list in payload order.
+        """
+        self._render_payload_view("full")
+        payload = self._prompt_payload()
+        token_cache = self._prompt_cache().tokens.setdefault(model, {})
+
+        ladders = {
+            key: PROMPT_SECTION_LADDERS.get(key, (("full", 1.0),)) for key in payload
+        }
+        missing = [
+            (key, variant)
+            for key, ladder in ladders.items()
+            for variant, _ in ladder
+            if (key, variant) not in token_cache
+        ]
+        if missing:
+            fragments = [self._payload_fragment(key, variant) for key, variant in missing]
+            if model:
+                from er.llm.token_counter import get_token_counter
+                counts = get_token_counter().count_many(fragments, model)
+            else:
+                counts = estimate_fragment_tokens(fragments)
+            token_cache.update(zip(missing, counts, strict=True))
+
+        return [
+            PromptSection(
+                key=key,
+                variants=[
+                    SectionVariant(
+                        fragment=self._payload_fragment(key, variant),
+                        value=value,
+                        tokens=token_cache[(key, variant)],
+                    )
+                    for variant, value in ladder
+                ],
+                required=key not in OPTIONAL_PROMPT_SECTIONS,
+            )
+            for key, ladder in ladders.items()
+        ]
+
     def to_json_payload(self) -> dict[str, Any]:
         """Convert to clean JSON payload for LLM prompts.
 
@@ -752,87 +944,46 @@ class CompanyContext:
 
         return payload
 
-    def to_prompt_string(self, max_tokens: int | None = None) -> str:
+    def to_prompt_string(self, max_tokens: int | None = None, model: str | None = None) -> str:
         """Convert to JSON string for LLM prompts.
 
         Args:
-            max_tokens: Optional max token limit (estimated by chars/4).
-                       If exceeded, will progressively reduce content.
+            max_tokens: Optional max token limit. If exceeded, sections are
+                packed by priority (see PROMPT_SECTION_LADDERS) into the
+                budget; required sections are never dropped.
+            model: Count tokens with this model's tokenizer instead of
+                estimating chars/4.
 
         Returns:
             JSON string with company context.
         """
-        import json
         from er.logging import get_logger
         logger = get_logger(__name__)
 
-        payload = self.to_json_payload()
-        full_text = json.dumps(payload, indent=2, default=str)
-
+        full_text = self._render_payload_view("full")
         if not max_tokens:
             return full_text
 
-        max_chars = max_tokens * 4
-        if len(full_text) <= max_chars:
+        sections = self.prompt_sections(model)
+        full_tokens = sum(section.variants[0].tokens for section in sections)
+        if full_tokens <= max_tokens:
             return full_text
 
-        # Progressive truncation - remove least critical data first
+        # Packing - shrink least critical data first
         logger.warning(
-            "Context exceeds max_tokens, applying progressive truncation",
-            full_chars=len(full_text),
-            max_chars=max_chars,
+            "Context exceeds max_tokens, packing sections into budget",
+            full_tokens=full_tokens,
+            max_tokens=max_tokens,
             symbol=self.symbol,
         )
 
-        # Priority 1: Remove full transcript text (keep metadata)
-        if "earnings_transcripts" in payload:
-            for t in payload["earnings_transcripts"]:
-                if "full_text" in t:
-                    t["full_text"] = "[TRUNCATED - use transcript_extracts instead]"
-
-        text = json.dumps(payload, indent=2, default=str)
-        if len(text) <= max_chars:
-            logger.info("Truncated transcripts to fit context", new_chars=len(text))
-            return text
-
-        # Priority 2: Remove older quarterly statements (keep last 4)
-        if "income_statement_quarterly" in payload:
-            payload["income_statement_quarterly"] = payload["income_statement_quarterly"][:4]
-
-        text = json.dumps(payload, indent=2, default=str)
-        if len(text) <= max_chars:
-            return text
-
-        # Priority 3: Remove news beyond top 5
-        if "recent_news" in payload:
-            payload["recent_news"] = payload["recent_news"][:5]
-
-        text = json.dumps(payload, indent=2, default=str)
-        if len(text) <= max_chars:
-            return text
-
-        # Priority 4: Remove analyst grades
-        if "recent_analyst_grades" in payload:
-            del payload["recent_analyst_grades"]
-
-        text = json.dumps(payload, indent=2, default=str)
-        if len(text) <= max_chars:
-            return text
-
-        # Priority 5: Remove older annual statements
-        if "income_statement_annual" in payload:
-            payload["income_statement_annual"] = payload["income_statement_annual"][:2]
-        if "balance_sheet_annual" in payload:
-            payload["balance_sheet_annual"] = payload["balance_sheet_annual"][:1]
-        if "cash_flow_annual" in payload:
-            payload["cash_flow_annual"] = payload["cash_flow_annual"][:1]
-
-        text = json.dumps(payload, indent=2, default=str)
-        logger.warning(
-            "Aggressive truncation applied",
-            final_chars=len(text),
-            max_chars=max_chars,
-        )
+        text, tokens = pack_and_render(sections, max_tokens)
+        if tokens > max_tokens:
+            logger.warning(
+                "Aggressive truncation applied",
+                final_tokens=tokens,
+                max_tokens=max_tokens,
+            )
         return text
 
     def for_discovery(self) -> str:
@@ -841,18 +992,9 @@ class CompanyContext:
         Includes: Full financials, news headlines, transcript metadata (not full text).
         Optimized for initial research thread identification.
         """
-        import json
-
-        payload = self.to_json_payload()
-
-        # Keep transcript metadata but not full text (Discovery identifies threads, not deep analysis)
-        if "earnings_transcripts" in payload:
-            for t in payload["earnings_transcripts"]:
-                if "full_text" in t and len(t.get("full_text", "")) > 2000:
-                    # Keep first 2000 chars as preview
-                    t["full_text"] = t["full_text"][:2000] + "\n[...transcript continues...]"
-
-        return json.dumps(payload, indent=2, default=str)
+        # Keep transcript metadata but not full text (Discovery identifies
+        # threads, not deep analysis): first 2000 chars as preview
+        return self._render_payload_view("discovery", {"earnings_transcripts": "preview"})
 
     def for_deep_research(self, verticals: list[str] | None = None) -> str:
         """Context view for Stage 3 Deep Research.
@@ -860,10 +1002,7 @@ class CompanyContext:
         Includes: Full financials, segmentation, full transcripts.
         Verticals parameter reserved for future filtering.
         """
-        import json
-
-        payload = self.to_json_payload()
-        return json.dumps(payload, indent=2, default=str)
+        return self._render_payload_view("full")
 
     def for_synthesis(self) -> dict[str, Any]:
         """Context view for Stage 4 Synthesis.
@@ -1021,7 +1160,9 @@ class CompanyContext:
         Key metrics only for claim validation.
         Includes: profile, key financials, price targets.
         """
-        import json
+        views = self._prompt_cache().views
+        if "judge" in views:
+            return views["judge"]
 
         payload: dict[str, Any] = {
             "symbol": self.symbol,
@@ -1076,25 +1217,33 @@ class CompanyContext:
         if self.quant_metrics:
             payload["quant_metrics"] = self.quant_metrics
 
-        return json.dumps(payload, indent=2, default=str)
+        # symbol and quant_metrics render exactly as in the full payload,
+        # so those fragments are shared with the other views
+        text = views["judge"] = render_sections([
+            self._payload_fragment(key) if key in ("symbol", "quant_metrics")
+            else self._fragment(f"judge:{key}", key, _constant(value))
+            for key, value in payload.items()
+        ])
+        return text
 
     @property
     def company_name(self) -> str:
         """Get company name from profile."""
-        return self.profile.get("companyName", self.symbol)
+        name: str = self.profile.get("companyName", self.symbol)
+        return name
 
     @property
     def latest_revenue(self) -> float:
         """Get latest annual revenue."""
         if self.income_statement_annual:
-            return self.income_statement_annual[0].get("revenue", 0)
+            return float(self.income_statement_annual[0].get("revenue") or 0)
         return 0
 
     @property
     def latest_net_income(self) -> float:
         """Get latest annual net income."""
         if self.income_statement_annual:
-            return self.income_statement_annual[0].get("netIncome", 0)
+            return float(self.income_statement_annual[0].get("netIncome") or 0)
         return 0
 
 
@@ -0,0 +1,136 @@
+"""Budget-aware assembly of JSON prompt context from cached sections.
+
+A prompt context is a JSON object whose top-level keys are sections. Each
+section offers one or more renderings ("variants") from most to least
+complete, e.g. full transcripts, 2,000-character previews, metadata only.
+Every variant is serialized and measured once; pack_sections then picks at
+most one variant per section to fit a token budget (a multiple-choice
+knapsack solved greedily by value per token), and render_sections joins the
+chosen fragments into the final string without re-serializing anything.
+
+The joined output is byte-identical to json.dumps(payload, indent=2) of the
+equivalent dict, so views built this way match the old ones exactly.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+# Chars per token used when no model tokenizer is given (the estimate
+# CompanyContext.to_prompt_string has always used)
+CHARS_PER_TOKEN = 4
+
+# Chosen variant index for a section that is left out
+OMITTED = -1
+
+# Counts tokens for a batch of fragments
+TokenCountFn = Callable[[Sequence[str]], list[int]]
+
+
+def render_fragment(key: str, value: Any) -> str:
+    """Serialize one top-level entry as it appears inside an indent=2 object."""
+    rendered = json.dumps(value, indent=2, default=str)
+    return f"  {json.dumps(key)}: " + rendered.replace("\n", "\n  ")
+
+
+def render_sections(fragments: Sequence[str]) -> str:
+    """Join rendered fragments into one JSON object string."""
+    if not fragments:
+        return "{}"
+    return "{\n" + ",\n".join(fragments) + "\n}"
+
+
+def estimate_fragment_tokens(fragments: Sequence[str]) -> list[int]:
+    """Token estimate for each fragment (chars / CHARS_PER_TOKEN)."""
+    return [math.ceil((len(fragment) + 2) / CHARS_PER_TOKEN) for fragment in fragments]
+
+
+@dataclass(frozen=True)
+class SectionVariant:
+    """One rendering of a section."""
+
+    fragment: str  # From render_fragment()
+    value: float  # Worth of including this rendering
+    tokens: int
+
+
+@dataclass
+class PromptSection:
+    """A top-level prompt section and its renderings, most complete first.
+
+    Required sections always get at least their last (smallest) variant.
+    """
+
+    key: str
+    variants: list[SectionVariant] = field(default_factory=list)
+    required: bool = False
+
+
+def pack_sections(sections: Sequence[PromptSection], budget_tokens: int) -> list[int]:
+    """Choose a variant for each section to fit a token budget.
+
+    Starts from the smallest allowed choice (required sections at their
+    last variant, optional ones omitted), then repeatedly applies the
+    upgrade with the best value gained per extra token that still fits,
+    until no upgrade fits.
+
+    Args:
+        sections: Sections in output order.
+        budget_tokens: Token budget for the whole object.
+
+    Returns:
+        Chosen variant index per section (OMITTED for left-out sections).
+        Required sections are kept even if they alone exceed the budget.
+    """
+    choice = [
+        len(section.variants) - 1 if section.required and section.variants else OMITTED
+        for section in sections
+    ]
+
+    def cost(i: int, v: int) -> int:
+        return sections[i].variants[v].tokens if v != OMITTED else 0
+
+    def worth(i: int, v: int) -> float:
+        return sections[i].variants[v].value if v != OMITTED else 0.0
+
+    remaining = budget_tokens - sum(cost(i, v) for i, v in enumerate(choice))
+
+    while True:
+        best: tuple[float, int, int] | None = None
+        for i, section in enumerate(sections):
+            current = choice[i]
+            for v in range(len(section.variants)):
+                gain = worth(i, v) - worth(i, current)
+                extra = cost(i, v) - cost(i, current)
+                if gain <= 0 or extra > remaining:
+                    continue
+                density = gain / max(extra, 1)
+                if best is None or density > best[0]:
+                    best = (density, i, v)
+        if best is None:
+            return choice
+        _, i, v = best
+        remaining -= cost(i, v) - cost(i, choice[i])
+        choice[i] = v
+
+
+def pack_and_render(
+    sections: Sequence[PromptSection], budget_tokens: int
+) -> tuple[str, int]:
+    """Pack sections into a budget and emit the string in one pass.
+
+    Returns:
+        Tuple of (json_text, estimated_tokens).
+    """
+    choice = pack_sections(sections, budget_tokens)
+    chosen = [
+        section.variants[v]
+        for section, v in zip(sections, choice, strict=True)
+        if v != OMITTED
+    ]
+    return render_sections([c.fragment for c in chosen]), sum(c.tokens for c in chosen)
+
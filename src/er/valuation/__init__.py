@@ -1,7 +1,16 @@
 """Deterministic valuation engine - no LLM arithmetic."""
 
-from er.valuation.dcf import DCFEngine
-from er.valuation.reverse_dcf import ReverseDCFEngine
+from er.valuation.dcf import DCFEngine, MonteCarloResult, MonteCarloSpec, dcf_value_grid
+from er.valuation.reverse_dcf import ImpliedGrowthSolution, ReverseDCFEngine, solve_implied_growth
 from er.valuation.excel_export import ValuationExporter
 
-__all__ = ["DCFEngine", "ReverseDCFEngine", "ValuationExporter"]
+__all__ = [
+    "DCFEngine",
+    "ImpliedGrowthSolution",
+    "MonteCarloResult",
+    "MonteCarloSpec",
+    "ReverseDCFEngine",
+    "ValuationExporter",
+    "dcf_value_grid",
+    "solve_implied_growth",
+]
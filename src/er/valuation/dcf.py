@@ -3,12 +3,29 @@ Deterministic DCF (Discounted Cash Flow) Engine.
 
 All calculations are code-based - no LLM arithmetic.
 This ensures reproducible, auditable valuation calculations.
+
+The arithmetic lives in a NumPy kernel (dcf_value_grid) that broadcasts
+arrays of WACC, terminal growth, revenue paths and margin paths, so a full
+sensitivity grid or a Monte Carlo run over thousands of scenarios is one
+vectorized pass instead of a Python loop per cell.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# Monte Carlo defaults
+MONTE_CARLO_PATHS = 10_000
+MONTE_CARLO_PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+# Sampled terminal growth is kept at least this far below sampled WACC
+MIN_WACC_GROWTH_SPREAD = 0.005
 
 
 @dataclass
@@ -98,6 +115,180 @@ class DCFResult:
         }
 
 
+def _pad_path(path: npt.NDArray[np.float64], years: int) -> npt.NDArray[np.float64]:
+    """Extend a (..., n) path to (..., years) by repeating its last value."""
+    if path.shape[-1] >= years:
+        return path[..., :years]
+    tail = np.repeat(path[..., -1:], years - path.shape[-1], axis=-1)
+    return np.concatenate([path, tail], axis=-1)
+
+
+def free_cash_flows(
+    revenue_paths: npt.ArrayLike,
+    margin_paths: npt.ArrayLike,
+    current_revenue: npt.ArrayLike,
+    tax_rate: float,
+    depreciation_pct: float,
+    capex_pct: float,
+    nwc_pct_delta: float,
+) -> npt.NDArray[np.float64]:
+    """Project free cash flows for one or many revenue/margin paths.
+
+    FCF = NOPAT + depreciation - capex - change in NWC, per year.
+
+    Args:
+        revenue_paths: Revenue by year, shape (..., years).
+        margin_paths: Operating margin by year, shape (..., n); shorter
+            paths repeat their last margin.
+        current_revenue: Revenue before year 1 (broadcast over paths).
+        tax_rate: Tax rate.
+        depreciation_pct: Depreciation as % of revenue.
+        capex_pct: CapEx as % of revenue.
+        nwc_pct_delta: Working capital change as % of revenue change.
+
+    Returns:
+        FCF array of the broadcast shape (..., years).
+    """
+    revenue = np.asarray(revenue_paths, dtype=np.float64)
+    years = revenue.shape[-1]
+    if years == 0:
+        return revenue
+    margins = _pad_path(np.asarray(margin_paths, dtype=np.float64), years)
+    current = np.asarray(current_revenue, dtype=np.float64)[..., np.newaxis]
+
+    prev_revenue = np.concatenate(
+        [np.broadcast_to(current, (*revenue.shape[:-1], 1)), revenue[..., :-1]], axis=-1
+    )
+    nopat = revenue * margins * (1 - tax_rate)
+    depreciation = revenue * depreciation_pct
+    capex = revenue * capex_pct
+    nwc_change = (revenue - prev_revenue) * nwc_pct_delta
+    fcf: npt.NDArray[np.float64] = nopat + depreciation - capex - nwc_change
+    return fcf
+
+
+def dcf_value_grid(
+    revenue_paths: npt.ArrayLike,
+    margin_paths: npt.ArrayLike,
+    wacc: npt.ArrayLike,
+    terminal_growth: npt.ArrayLike,
+    current_revenue: npt.ArrayLike = 0.0,
+    net_debt: float = 0.0,
+    shares_outstanding: float = 1.0,
+    tax_rate: float = 0.21,
+    depreciation_pct: float = 0.04,
+    capex_pct: float = 0.05,
+    nwc_pct_delta: float = 0.10,
+) -> npt.NDArray[np.float64]:
+    """Per-share DCF values over broadcast arrays of inputs.
+
+    Revenue and margin paths carry years on their last axis; their leading
+    axes broadcast with the WACC and terminal growth arrays under NumPy
+    rules. For a WACC x growth grid pass wacc[:, None] and growth[None, :];
+    for N sampled scenarios pass arrays of length N (and (N, years) paths).
+
+    Args:
+        revenue_paths: Revenue by year, shape (..., years).
+        margin_paths: Operating margins by year, shape (..., n).
+        wacc: Discount rates.
+        terminal_growth: Terminal growth rates.
+        current_revenue: Revenue before year 1.
+        net_debt: Net debt (debt - cash).
+        shares_outstanding: Diluted shares outstanding.
+        tax_rate: Tax rate.
+        depreciation_pct: Depreciation as % of revenue.
+        capex_pct: CapEx as % of revenue.
+        nwc_pct_delta: Working capital change as % of revenue change.
+
+    Returns:
+        Per-share values of the broadcast shape; NaN where WACC does not
+        exceed terminal growth (the Gordon model is undefined there).
+    """
+    fcf = free_cash_flows(
+        revenue_paths,
+        margin_paths,
+        current_revenue,
+        tax_rate,
+        depreciation_pct,
+        capex_pct,
+        nwc_pct_delta,
+    )
+    wacc = np.asarray(wacc, dtype=np.float64)
+    growth = np.asarray(terminal_growth, dtype=np.float64)
+    years = np.arange(1, fcf.shape[-1] + 1, dtype=np.float64)
+
+    discount = (1 + wacc[..., np.newaxis]) ** -years
+    pv_fcf = np.sum(fcf * discount, axis=-1)
+
+    spread = wacc - growth
+    valid = spread > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terminal_value = fcf[..., -1] * (1 + growth) / np.where(valid, spread, np.nan)
+    pv_terminal = terminal_value * discount[..., -1]
+
+    values: npt.NDArray[np.float64] = (pv_fcf + pv_terminal - net_debt) / shares_outstanding
+    return values
+
+
+@dataclass
+class MonteCarloSpec:
+    """Uncertainty around base DCF inputs for Monte Carlo valuation.
+
+    Shocks are normal with the given standard deviations and correlated
+    through a 4x4 correlation matrix ordered (wacc, terminal_growth,
+    revenue_growth, margin). The revenue growth shock is added to every
+    year's growth rate; the margin shock shifts the whole margin path.
+    """
+
+    wacc_std: float = 0.01
+    terminal_growth_std: float = 0.005
+    revenue_growth_std: float = 0.03
+    margin_std: float = 0.02
+
+    # Rates move together; faster growth tends to come with scale margins
+    correlation: list[list[float]] = field(default_factory=lambda: [
+        [1.0, 0.5, -0.2, 0.0],
+        [0.5, 1.0, 0.2, 0.0],
+        [-0.2, 0.2, 1.0, 0.3],
+        [0.0, 0.0, 0.3, 1.0],
+    ])
+
+    n_paths: int = MONTE_CARLO_PATHS
+    seed: int | None = None
+
+
+@dataclass
+class MonteCarloResult:
+    """Distribution of per-share values from a Monte Carlo run."""
+
+    values: npt.NDArray[np.float64]  # Per-share value of each valid path
+    n_paths: int
+    mean: float
+    std: float
+    percentiles: dict[int, float] = field(default_factory=dict)
+
+    @property
+    def n_valid(self) -> int:
+        """Paths that produced a finite value."""
+        return int(self.values.size)
+
+    def probability_above(self, price: float) -> float:
+        """Share of valid paths valued above a price."""
+        if not self.values.size:
+            return 0.0
+        return float(np.mean(self.values > price))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict (summary statistics, not every path)."""
+        return {
+            "n_paths": self.n_paths,
+            "n_valid": self.n_valid,
+            "mean": round(self.mean, 2),
+            "std": round(self.std, 2),
+            "percentiles": {str(p): round(v, 2) for p, v in self.percentiles.items()},
+        }
+
+
 class DCFEngine:
     """Deterministic DCF valuation engine.
 
@@ -160,44 +351,24 @@ class DCFEngine:
             DCFResult with valuation.
         """
         # Calculate FCF for each projection year
-        fcf_projections = []
-        prev_revenue = inputs.current_revenue
-
-        for i, revenue in enumerate(inputs.revenue_projections):
-            margin = inputs.operating_margins[i] if i < len(inputs.operating_margins) else inputs.operating_margins[-1]
-
-            # Operating income
-            ebit = revenue * margin
-
-            # After-tax operating income (NOPAT)
-            nopat = ebit * (1 - inputs.tax_rate)
-
-            # Add back depreciation
-            depreciation = revenue * inputs.depreciation_pct
-
-            # Subtract CapEx
-            capex = revenue * inputs.capex_pct
-
-            # Subtract change in NWC
-            revenue_change = revenue - prev_revenue
-            nwc_change = revenue_change * inputs.nwc_pct_delta
-
-            # Free Cash Flow
-            fcf = nopat + depreciation - capex - nwc_change
-            fcf_projections.append(fcf)
-
-            prev_revenue = revenue
+        fcf_projections = free_cash_flows(
+            inputs.revenue_projections,
+            inputs.operating_margins,
+            inputs.current_revenue,
+            inputs.tax_rate,
+            inputs.depreciation_pct,
+            inputs.capex_pct,
+            inputs.nwc_pct_delta,
+        ).tolist()
 
         # Calculate discount factors
-        discount_factors = [
-            1 / ((1 + inputs.wacc) ** (i + 1))
-            for i in range(len(fcf_projections))
-        ]
+        years = np.arange(1, len(fcf_projections) + 1, dtype=np.float64)
+        discount_factors = ((1 + inputs.wacc) ** -years).tolist()
 
         # Present value of explicit period FCF
         pv_fcf = sum(
             fcf * df
-            for fcf, df in zip(fcf_projections, discount_factors)
+            for fcf, df in zip(fcf_projections, discount_factors, strict=True)
         )
 
         # Terminal value using Gordon Growth Model
@@ -258,26 +429,122 @@ class DCFEngine:
         if terminal_growth_range is None:
             terminal_growth_range = [0.015, 0.020, 0.025, 0.030, 0.035]
 
-        results: list[tuple[float, float, float]] = []
-
-        for wacc in wacc_range:
-            for tg in terminal_growth_range:
-                # Create modified inputs
-                modified_inputs = DCFInputs(
-                    revenue_projections=inputs.revenue_projections,
-                    operating_margins=inputs.operating_margins,
-                    tax_rate=inputs.tax_rate,
-                    depreciation_pct=inputs.depreciation_pct,
-                    capex_pct=inputs.capex_pct,
-                    nwc_pct_delta=inputs.nwc_pct_delta,
-                    terminal_growth=tg,
-                    wacc=wacc,
-                    current_revenue=inputs.current_revenue,
-                )
-
-                result = self.calculate_dcf(
-                    modified_inputs, net_debt, shares_outstanding
-                )
-                results.append((wacc, tg, result.intrinsic_value_per_share))
+        grid = self.sensitivity_grid(
+            inputs, net_debt, shares_outstanding, wacc_range, terminal_growth_range
+        )
+        results = [
+            (wacc, tg, float(grid[i, j]))
+            for i, wacc in enumerate(wacc_range)
+            for j, tg in enumerate(terminal_growth_range)
+        ]
 
         return {"sensitivity": results}
+
+    def sensitivity_grid(
+        self,
+        inputs: DCFInputs,
+        net_debt: float,
+        shares_outstanding: float,
+        wacc_values: npt.ArrayLike,
+        terminal_growth_values: npt.ArrayLike,
+    ) -> npt.NDArray[np.float64]:
+        """Per-share values over every WACC x terminal growth pair.
+
+        Args:
+            inputs: Base DCF inputs.
+            net_debt: Net debt.
+            shares_outstanding: Shares outstanding.
+            wacc_values: WACC values (rows).
+            terminal_growth_values: Terminal growth values (columns).
+
+        Returns:
+            Array of shape (len(wacc_values), len(terminal_growth_values)),
+            NaN where WACC <= terminal growth.
+        """
+        wacc = np.asarray(wacc_values, dtype=np.float64)
+        growth = np.asarray(terminal_growth_values, dtype=np.float64)
+        return dcf_value_grid(
+            inputs.revenue_projections,
+            inputs.operating_margins,
+            wacc[:, np.newaxis],
+            growth[np.newaxis, :],
+            current_revenue=inputs.current_revenue,
+            net_debt=net_debt,
+            shares_outstanding=shares_outstanding,
+            tax_rate=inputs.tax_rate,
+            depreciation_pct=inputs.depreciation_pct,
+            capex_pct=inputs.capex_pct,
+            nwc_pct_delta=inputs.nwc_pct_delta,
+        )
+
+    def monte_carlo(
+        self,
+        inputs: DCFInputs,
+        net_debt: float,
+        shares_outstanding: float,
+        spec: MonteCarloSpec | None = None,
+        percentiles: tuple[int, ...] = MONTE_CARLO_PERCENTILES,
+    ) -> MonteCarloResult:
+        """Value the company over correlated random input scenarios.
+
+        Args:
+            inputs: Base DCF inputs (the center of every distribution).
+            net_debt: Net debt.
+            shares_outstanding: Shares outstanding.
+            spec: Shock sizes, correlation, path count and seed.
+            percentiles: Percentiles of per-share value to report.
+
+        Returns:
+            MonteCarloResult with the value distribution.
+        """
+        spec = spec or MonteCarloSpec()
+        rng = np.random.default_rng(spec.seed)
+
+        scale = np.array([
+            spec.wacc_std,
+            spec.terminal_growth_std,
+            spec.revenue_growth_std,
+            spec.margin_std,
+        ])
+        chol = np.linalg.cholesky(np.asarray(spec.correlation, dtype=np.float64))
+        shocks = rng.standard_normal((spec.n_paths, 4)) @ chol.T * scale
+
+        wacc = inputs.wacc + shocks[:, 0]
+        growth = np.minimum(
+            inputs.terminal_growth + shocks[:, 1], wacc - MIN_WACC_GROWTH_SPREAD
+        )
+
+        # Compound the growth shock into every projection year
+        base_revenue = np.asarray(inputs.revenue_projections, dtype=np.float64)
+        years = np.arange(1, base_revenue.size + 1, dtype=np.float64)
+        revenue = base_revenue * (1 + shocks[:, 2:3]) ** years
+        margins = np.asarray(inputs.operating_margins, dtype=np.float64) + shocks[:, 3:4]
+
+        values = dcf_value_grid(
+            revenue,
+            margins,
+            wacc,
+            growth,
+            current_revenue=inputs.current_revenue,
+            net_debt=net_debt,
+            shares_outstanding=shares_outstanding,
+            tax_rate=inputs.tax_rate,
+            depreciation_pct=inputs.depreciation_pct,
+            capex_pct=inputs.capex_pct,
+            nwc_pct_delta=inputs.nwc_pct_delta,
+        )
+        values = values[np.isfinite(values)]
+        if values.size:
+            points = np.percentile(values, percentiles)
+            mean, std = float(values.mean()), float(values.std())
+        else:
+            points = np.full(len(percentiles), np.nan)
+            mean = std = float("nan")
+
+        return MonteCarloResult(
+            values=values,
+            n_paths=spec.n_paths,
+            mean=mean,
+            std=std,
+            percentiles={p: float(v) for p, v in zip(percentiles, points, strict=True)},
+        )
@@ -3,12 +3,51 @@ Reverse DCF Engine.
 
 Determines what growth assumptions are implied by current market price.
 All calculations are code-based - no LLM arithmetic.
+
+The implied CAGR is found by a vectorized, bracket-safeguarded Newton solver
+(solve_implied_growth) over NumPy arrays, so one call solves a single
+ticker, an implied-expectations heatmap or a whole screening universe.
+Enterprise value is a polynomial in (1 + g), so Newton steps use its exact
+derivative and usually converge in a handful of iterations; a step that
+leaves the bracket falls back to bisection.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# Growth bracket searched for the implied CAGR
+IMPLIED_GROWTH_LOW = -0.20
+IMPLIED_GROWTH_HIGH = 0.50
+
+# Coarse scan intervals used to bracket the root before Newton steps
+IMPLIED_GROWTH_SCAN_POINTS = 16
+
+# Convergence: EV error relative to the target EV
+IMPLIED_GROWTH_TOLERANCE = 1e-8
+IMPLIED_GROWTH_MAX_ITERATIONS = 50
+
+# ReverseDCFInputs fields that can vary across a heatmap or screen
+GRID_FIELDS = (
+    "current_price",
+    "shares_outstanding",
+    "net_debt",
+    "current_revenue",
+    "current_margin",
+    "terminal_margin",
+    "tax_rate",
+    "depreciation_pct",
+    "capex_pct",
+    "nwc_pct_delta",
+    "wacc",
+    "terminal_growth",
+)
 
 
 @dataclass
@@ -60,6 +99,10 @@ class ReverseDCFResult:
     is_reasonable: bool
     reasonableness_notes: list[str] = field(default_factory=list)
 
+    # Solver diagnostics
+    converged: bool = True
+    solver_iterations: int = 0
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dict."""
         return {
@@ -71,9 +114,213 @@ class ReverseDCFResult:
             "implied_year5_fcf": round(self.implied_year5_fcf, 0),
             "is_reasonable": self.is_reasonable,
             "reasonableness_notes": self.reasonableness_notes,
+            "converged": self.converged,
+            "solver_iterations": self.solver_iterations,
         }
 
 
+@dataclass
+class ImpliedGrowthSolution:
+    """Implied CAGRs and convergence diagnostics for a batch of inputs.
+
+    Every array has the broadcast shape of the solver inputs.
+    """
+
+    implied_cagr: npt.NDArray[np.float64]
+    # Residual EV error relative to the target EV
+    residual: npt.NDArray[np.float64]
+    iterations: npt.NDArray[np.int64]
+    converged: npt.NDArray[np.bool_]
+    # False where no growth in the searched range reaches the target EV;
+    # the CAGR is then the nearer end of the range
+    bracketed: npt.NDArray[np.bool_]
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the solved batch."""
+        return self.implied_cagr.shape
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary diagnostics (not every solution)."""
+        return {
+            "count": int(self.implied_cagr.size),
+            "converged": int(self.converged.sum()),
+            "unbracketed": int((~self.bracketed).sum()),
+            "max_iterations": int(self.iterations.max(initial=0)),
+            "max_residual": float(np.nanmax(np.abs(self.residual), initial=0.0)),
+        }
+
+
+def _ev_and_slope(
+    growth: npt.NDArray[np.float64],
+    current_revenue: npt.NDArray[np.float64],
+    margins: npt.NDArray[np.float64],
+    tax_rate: npt.NDArray[np.float64],
+    depreciation_pct: npt.NDArray[np.float64],
+    capex_pct: npt.NDArray[np.float64],
+    nwc_pct_delta: npt.NDArray[np.float64],
+    wacc: npt.NDArray[np.float64],
+    terminal_growth: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Enterprise value at each growth rate and its derivative in growth.
+
+    Scalar-per-item arrays share a shape; margins carries years on an
+    extra last axis.
+    """
+    years = np.arange(1, margins.shape[-1] + 1, dtype=np.float64)
+    q = (1 + growth)[..., np.newaxis]
+    revenue0 = current_revenue[..., np.newaxis]
+
+    # revenue_t = R q^t and previous year's R q^(t-1), with d/dg of each
+    revenue = revenue0 * q**years
+    d_revenue = revenue0 * years * q ** (years - 1)
+    prev_revenue = revenue0 * q ** (years - 1)
+    d_prev_revenue = revenue0 * (years - 1) * q ** np.maximum(years - 2, 0)
+
+    conversion = (
+        margins * (1 - tax_rate[..., np.newaxis])
+        + depreciation_pct[..., np.newaxis]
+        - capex_pct[..., np.newaxis]
+    )
+    nwc = nwc_pct_delta[..., np.newaxis]
+    fcf = revenue * conversion - nwc * (revenue - prev_revenue)
+    d_fcf = d_revenue * conversion - nwc * (d_revenue - d_prev_revenue)
+
+    discount = (1 + wacc[..., np.newaxis]) ** -years
+    terminal_multiple = (1 + terminal_growth) / (wacc - terminal_growth) * discount[..., -1]
+
+    ev = np.sum(fcf * discount, axis=-1) + fcf[..., -1] * terminal_multiple
+    slope = np.sum(d_fcf * discount, axis=-1) + d_fcf[..., -1] * terminal_multiple
+    return ev, slope
+
+
+def solve_implied_growth(
+    target_ev: npt.ArrayLike,
+    current_revenue: npt.ArrayLike,
+    current_margin: npt.ArrayLike,
+    terminal_margin: npt.ArrayLike | None = None,
+    wacc: npt.ArrayLike = 0.10,
+    terminal_growth: npt.ArrayLike = 0.025,
+    tax_rate: npt.ArrayLike = 0.21,
+    depreciation_pct: npt.ArrayLike = 0.04,
+    capex_pct: npt.ArrayLike = 0.05,
+    nwc_pct_delta: npt.ArrayLike = 0.10,
+    projection_years: int = 5,
+    low: float = IMPLIED_GROWTH_LOW,
+    high: float = IMPLIED_GROWTH_HIGH,
+    tolerance: float = IMPLIED_GROWTH_TOLERANCE,
+    max_iterations: int = IMPLIED_GROWTH_MAX_ITERATIONS,
+) -> ImpliedGrowthSolution:
+    """Find the revenue CAGR that makes DCF enterprise value hit a target.
+
+    All array arguments broadcast together, so the result can be a single
+    value, a heatmap (pass orthogonal axes such as wacc[:, None] and
+    price-derived EVs[None, :]) or a flat screen over many tickers.
+    Margins move linearly from current to terminal over the projection.
+
+    Args:
+        target_ev: Market-implied enterprise values.
+        current_revenue: Current revenue.
+        current_margin: Current operating margin.
+        terminal_margin: Margin reached in the final year (None = current).
+        wacc: Discount rates.
+        terminal_growth: Terminal growth rates.
+        tax_rate: Tax rates.
+        depreciation_pct: Depreciation as % of revenue.
+        capex_pct: CapEx as % of revenue.
+        nwc_pct_delta: Working capital change as % of revenue change.
+        projection_years: Explicit projection years (shared by the batch).
+        low: Lowest growth rate searched.
+        high: Highest growth rate searched.
+        tolerance: Converged when |EV error| <= tolerance * |target EV|.
+        max_iterations: Iteration cap per item.
+
+    Returns:
+        ImpliedGrowthSolution with CAGRs and diagnostics.
+    """
+    if terminal_margin is None:
+        terminal_margin = current_margin
+    arrays = np.broadcast_arrays(*(
+        np.asarray(value, dtype=np.float64)
+        for value in (
+            target_ev, current_revenue, current_margin, terminal_margin, wacc,
+            terminal_growth, tax_rate, depreciation_pct, capex_pct, nwc_pct_delta,
+        )
+    ))
+    (target, revenue0, margin0, margin_n, wacc_arr, growth_arr,
+     tax, dep, capex, nwc) = (np.array(a) for a in arrays)
+
+    steps = np.arange(1, projection_years + 1, dtype=np.float64) / projection_years
+    margins = margin0[..., np.newaxis] + (margin_n - margin0)[..., np.newaxis] * steps
+    scale = np.maximum(np.abs(target), np.finfo(np.float64).tiny)
+
+    def evaluate(
+        x: npt.NDArray[np.float64], idx: npt.NDArray[np.intp] | slice = slice(None)
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        ev, slope = _ev_and_slope(
+            x, revenue0.ravel()[idx], margins.reshape(-1, projection_years)[idx],
+            tax.ravel()[idx], dep.ravel()[idx], capex.ravel()[idx], nwc.ravel()[idx],
+            wacc_arr.ravel()[idx], growth_arr.ravel()[idx],
+        )
+        return ev - target.ravel()[idx], slope
+
+    # EV is not monotonic in growth when working capital outweighs margin,
+    # so scan the range for the lowest upward crossing of the target
+    size = target.size
+    grid = np.linspace(low, high, IMPLIED_GROWTH_SCAN_POINTS + 1)
+    f_grid = np.stack([evaluate(np.full(size, g))[0] for g in grid], axis=-1)
+    crossing = (f_grid[:, :-1] <= 0) & (f_grid[:, 1:] >= 0)
+    bracketed = np.asarray(crossing.any(axis=-1), dtype=np.bool_)
+    first = np.argmax(crossing, axis=-1)
+    lo = grid[first]
+    hi = grid[first + 1]
+
+    # Outside the range the nearer end is returned: low when even the
+    # lowest growth overshoots the target, else high
+    rows = np.arange(size)
+    overshoot = f_grid[:, 0] > 0
+    x = np.where(bracketed, (lo + hi) / 2, np.where(overshoot, low, high))
+    residual = np.where(
+        bracketed, np.nan, np.where(overshoot, f_grid[:, 0], f_grid[rows, -1])
+    )
+    iterations = np.zeros(size, dtype=np.int64)
+    converged = np.zeros(size, dtype=bool)
+
+    active = np.flatnonzero(bracketed)
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        xa = x[active]
+        f, slope = evaluate(xa, active)
+        iterations[active] += 1
+        residual[active] = f
+
+        done = np.abs(f) <= tolerance * scale.ravel()[active]
+        converged[active[done]] = True
+
+        # Shrink the bracket around the root, then take a Newton step
+        # unless it leaves the bracket (or the slope is unusable)
+        below = f < 0
+        lo[active[below]] = xa[below]
+        hi[active[~below]] = xa[~below]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = xa - f / slope
+        la, ha = lo[active], hi[active]
+        inside = np.isfinite(newton) & (newton > la) & (newton < ha)
+        x[active] = np.where(done, xa, np.where(inside, newton, (la + ha) / 2))
+
+        active = active[~done]
+
+    shape = target.shape
+    return ImpliedGrowthSolution(
+        implied_cagr=x.reshape(shape),
+        residual=(residual / scale.ravel()).reshape(shape),
+        iterations=iterations.reshape(shape),
+        converged=converged.reshape(shape),
+        bracketed=bracketed.reshape(shape),
+    )
+
+
 class ReverseDCFEngine:
     """Reverse DCF engine to find implied growth.
 
@@ -91,8 +338,8 @@ class ReverseDCFEngine:
     ) -> ReverseDCFResult:
         """Calculate implied revenue growth rate from market price.
 
-        Uses binary search to find the growth rate that produces
-        a DCF value equal to the current market price.
+        Solves for the growth rate that produces a DCF value equal to
+        the current market price (see solve_implied_growth).
 
         Args:
             inputs: Reverse DCF inputs.
@@ -104,18 +351,8 @@ class ReverseDCFEngine:
         market_cap = inputs.current_price * inputs.shares_outstanding
         enterprise_value = market_cap + inputs.net_debt
 
-        # Binary search for implied growth rate
-        low_growth = -0.20  # -20%
-        high_growth = 0.50  # 50%
-        tolerance = 0.0001  # 0.01%
-
-        implied_cagr = self._binary_search_growth(
-            enterprise_value=enterprise_value,
-            inputs=inputs,
-            low=low_growth,
-            high=high_growth,
-            tolerance=tolerance,
-        )
+        solution = self._solve([inputs])
+        implied_cagr = float(solution.implied_cagr[0])
 
         # Calculate implied figures at that growth rate
         implied_year5_revenue = inputs.current_revenue * ((1 + implied_cagr) ** inputs.projection_years)
@@ -144,82 +381,106 @@ class ReverseDCFEngine:
             implied_year5_fcf=implied_year5_fcf,
             is_reasonable=is_reasonable,
             reasonableness_notes=notes,
+            converged=bool(solution.converged[0]),
+            solver_iterations=int(solution.iterations[0]),
         )
 
-    def _binary_search_growth(
+    def implied_growth_batch(self, inputs: list[ReverseDCFInputs]) -> ImpliedGrowthSolution:
+        """Solve implied growth for many input sets at once (e.g. a screen).
+
+        Args:
+            inputs: One ReverseDCFInputs per ticker or scenario.
+
+        Returns:
+            ImpliedGrowthSolution with one entry per input, in order.
+        """
+        return self._solve(inputs)
+
+    def implied_growth_grid(
         self,
-        enterprise_value: float,
-        inputs: ReverseDCFInputs,
-        low: float,
-        high: float,
-        tolerance: float,
-        max_iterations: int = 50,
-    ) -> float:
-        """Binary search to find growth rate that produces target EV."""
-        for _ in range(max_iterations):
-            mid = (low + high) / 2
-            ev = self._calculate_ev_at_growth(inputs, mid)
+        base: ReverseDCFInputs,
+        **axes: npt.ArrayLike,
+    ) -> ImpliedGrowthSolution:
+        """Solve implied growth over a grid of input values (a heatmap).
 
-            if abs(ev - enterprise_value) / enterprise_value < tolerance:
-                return mid
+        Each keyword names a ReverseDCFInputs field (see GRID_FIELDS) and
+        gives its values along one axis, in keyword order; unnamed fields
+        keep their base values.
 
-            if ev < enterprise_value:
-                low = mid
-            else:
-                high = mid
+        Example:
+            engine.implied_growth_grid(inputs, current_price=prices, wacc=waccs)
+            -> arrays of shape (len(prices), len(waccs))
 
-        return (low + high) / 2
+        Args:
+            base: Inputs for every field not varied.
+            **axes: Field name -> 1-D values.
 
-    def _calculate_ev_at_growth(
-        self,
-        inputs: ReverseDCFInputs,
-        growth_rate: float,
-    ) -> float:
-        """Calculate enterprise value at a given growth rate."""
-        # Project revenues
-        revenues = [
-            inputs.current_revenue * ((1 + growth_rate) ** (i + 1))
-            for i in range(inputs.projection_years)
-        ]
-
-        # Project margins (linear interpolation to terminal)
-        terminal_margin = inputs.terminal_margin or inputs.current_margin
-        margins = [
-            inputs.current_margin + (terminal_margin - inputs.current_margin) * (i + 1) / inputs.projection_years
-            for i in range(inputs.projection_years)
-        ]
-
-        # Calculate FCF for each year
-        prev_revenue = inputs.current_revenue
-        fcfs = []
-        for i, (revenue, margin) in enumerate(zip(revenues, margins)):
-            fcf = self._calculate_fcf(
-                revenue=revenue,
-                margin=margin,
-                tax_rate=inputs.tax_rate,
-                depreciation_pct=inputs.depreciation_pct,
-                capex_pct=inputs.capex_pct,
-                nwc_pct_delta=inputs.nwc_pct_delta,
-                revenue_change=revenue - prev_revenue,
+        Returns:
+            ImpliedGrowthSolution shaped by the axis lengths.
+        """
+        unknown = set(axes) - set(GRID_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot vary {sorted(unknown)}; choose from {GRID_FIELDS}")
+
+        values = {name: getattr(base, name) for name in GRID_FIELDS}
+        for axis, (name, axis_values) in enumerate(axes.items()):
+            shape = [1] * len(axes)
+            shape[axis] = -1
+            values[name] = np.asarray(axis_values, dtype=np.float64).reshape(shape)
+        if "terminal_margin" not in axes and not base.terminal_margin:
+            # No terminal margin given: hold the (possibly varied) current one
+            values["terminal_margin"] = values["current_margin"]
+
+        return self._solve_arrays(values, base.projection_years)
+
+    def _solve(self, inputs: list[ReverseDCFInputs]) -> ImpliedGrowthSolution:
+        """Solve a list of inputs, grouping by projection length."""
+        count = len(inputs)
+        cagr = np.full(count, np.nan)
+        residual = np.full(count, np.nan)
+        iterations = np.zeros(count, dtype=np.int64)
+        converged = np.zeros(count, dtype=bool)
+        bracketed = np.zeros(count, dtype=bool)
+
+        for years in sorted({item.projection_years for item in inputs}):
+            idx = np.array([i for i, item in enumerate(inputs) if item.projection_years == years])
+            group = [inputs[i] for i in idx]
+            values = {
+                name: np.array([getattr(item, name) for item in group], dtype=np.float64)
+                for name in GRID_FIELDS
+                if name != "terminal_margin"
+            }
+            values["terminal_margin"] = np.array(
+                [item.terminal_margin or item.current_margin for item in group], dtype=np.float64
             )
-            fcfs.append(fcf)
-            prev_revenue = revenue
-
-        # Present value of explicit FCF
-        pv_fcf = sum(
-            fcf / ((1 + inputs.wacc) ** (i + 1))
-            for i, fcf in enumerate(fcfs)
+            solution = self._solve_arrays(values, years)
+            cagr[idx] = solution.implied_cagr
+            residual[idx] = solution.residual
+            iterations[idx] = solution.iterations
+            converged[idx] = solution.converged
+            bracketed[idx] = solution.bracketed
+
+        return ImpliedGrowthSolution(cagr, residual, iterations, converged, bracketed)
+
+    def _solve_arrays(self, values: dict[str, Any], projection_years: int) -> ImpliedGrowthSolution:
+        """Run the solver on field arrays keyed by ReverseDCFInputs names."""
+        target_ev = (
+            np.asarray(values["current_price"]) * np.asarray(values["shares_outstanding"])
+            + np.asarray(values["net_debt"])
         )
-
-        # Terminal value
-        final_fcf = fcfs[-1] if fcfs else 0
-        terminal_value = (
-            final_fcf * (1 + inputs.terminal_growth) /
-            (inputs.wacc - inputs.terminal_growth)
+        return solve_implied_growth(
+            target_ev=target_ev,
+            current_revenue=values["current_revenue"],
+            current_margin=values["current_margin"],
+            terminal_margin=values["terminal_margin"],
+            wacc=values["wacc"],
+            terminal_growth=values["terminal_growth"],
+            tax_rate=values["tax_rate"],
+            depreciation_pct=values["depreciation_pct"],
+            capex_pct=values["capex_pct"],
+            nwc_pct_delta=values["nwc_pct_delta"],
+            projection_years=projection_years,
         )
-        pv_terminal = terminal_value / ((1 + inputs.wacc) ** inputs.projection_years)
-
-        return pv_fcf + pv_terminal
 
     def _calculate_fcf(
         self,
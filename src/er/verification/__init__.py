@@ -1,6 +1,6 @@
 """Verification and entailment checking for claims."""
 
-from er.verification.claim_graph import ClaimGraphBuilder
+from er.verification.claim_graph import ClaimGraphBuilder, LinkIndex
 from er.verification.entailment import EntailmentVerifier
 
-__all__ = ["ClaimGraphBuilder", "EntailmentVerifier"]
+__all__ = ["ClaimGraphBuilder", "EntailmentVerifier", "LinkIndex"]
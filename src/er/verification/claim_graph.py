@@ -7,9 +7,10 @@ Extracts claims from analysis text and links them to supporting facts and eviden
 from __future__ import annotations
 
 import json
+import math
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from er.types import (
     Claim,
@@ -18,6 +19,9 @@ from er.types import (
     generate_id,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 @dataclass
 class ExtractedFact:
@@ -30,6 +34,100 @@ class ExtractedFact:
     confidence: float = 0.5
 
 
+# Minimum shared keywords for a fact/evidence item to be linked to a claim
+LINK_MIN_OVERLAP = 3
+
+# Minimum share of a claim's IDF mass matched by a document when TF-IDF is on
+LINK_MIN_TFIDF_SCORE = 0.2
+
+_TOKEN_RE = re.compile(r"\b[a-z]+\b")
+
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
+    'this', 'that', 'these', 'those', 'it', 'its', 'their', 'our',
+})
+
+
+def tokenize(text: str) -> list[str]:
+    """Tokenize text for keyword matching."""
+    return [
+        t for t in _TOKEN_RE.findall(text.lower())
+        if len(t) > 2 and t not in _STOPWORDS
+    ]
+
+
+class LinkIndex:
+    """Term -> document inverted index used to link claims to facts/evidence.
+
+    Each document is tokenized once. Matching a claim only visits the
+    postings of the claim's own terms, so documents sharing no terms with
+    the claim are never scored.
+    """
+
+    def __init__(self, documents: Iterable[tuple[str, str]]) -> None:
+        """Build the index.
+
+        Args:
+            documents: (doc_id, text) pairs. Duplicate ids keep the first text.
+        """
+        self.doc_ids: list[str] = []
+        self._postings: dict[str, list[int]] = {}
+        seen: set[str] = set()
+        for doc_id, text in documents:
+            if doc_id in seen:
+                continue
+            seen.add(doc_id)
+            position = len(self.doc_ids)
+            self.doc_ids.append(doc_id)
+            for term in set(tokenize(text)):
+                self._postings.setdefault(term, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def idf(self, term: str) -> float:
+        """Smoothed inverse document frequency of a term."""
+        df = len(self._postings.get(term, ()))
+        return math.log((1 + len(self.doc_ids)) / (1 + df)) + 1.0
+
+    def match(
+        self,
+        text: str,
+        min_overlap: int = LINK_MIN_OVERLAP,
+        use_tfidf: bool = False,
+        min_tfidf_score: float = LINK_MIN_TFIDF_SCORE,
+    ) -> list[str]:
+        """Return ids of documents linked to text, in insertion order.
+
+        A document is linked when it shares at least min_overlap distinct
+        terms with text. With use_tfidf, the IDF-weighted share of the
+        text's terms matched by the document must also reach min_tfidf_score,
+        so overlaps on corpus-wide boilerplate terms count for little.
+        """
+        terms = set(tokenize(text))
+        if not terms:
+            return []
+
+        overlap: dict[int, int] = {}
+        weight: dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            term_idf = self.idf(term) if use_tfidf else 0.0
+            for position in postings:
+                overlap[position] = overlap.get(position, 0) + 1
+                if use_tfidf:
+                    weight[position] = weight.get(position, 0.0) + term_idf
+
+        linked = [p for p, count in overlap.items() if count >= min_overlap]
+        if use_tfidf and linked:
+            total = sum(self.idf(term) for term in terms)
+            linked = [p for p in linked if weight[p] / total >= min_tfidf_score]
+        return [self.doc_ids[p] for p in sorted(linked)]
+
+
 # Mapping from domain categories to ClaimTypes
 DOMAIN_CATEGORY_PATTERNS = {
     "financial": [
@@ -76,13 +174,25 @@ class ClaimGraphBuilder:
     3. Evidence backing each fact
     """
 
-    def __init__(self, llm_router: Any = None) -> None:
+    def __init__(
+        self,
+        llm_router: Any = None,
+        min_overlap: int = LINK_MIN_OVERLAP,
+        use_tfidf: bool = False,
+        min_tfidf_score: float = LINK_MIN_TFIDF_SCORE,
+    ) -> None:
         """Initialize the ClaimGraphBuilder.
 
         Args:
             llm_router: Optional LLM router for advanced extraction.
+            min_overlap: Shared keywords required to link a fact/evidence item.
+            use_tfidf: Also require an IDF-weighted overlap of min_tfidf_score.
+            min_tfidf_score: Threshold used when use_tfidf is enabled.
         """
         self.llm_router = llm_router
+        self.min_overlap = min_overlap
+        self.use_tfidf = use_tfidf
+        self.min_tfidf_score = min_tfidf_score
 
     def build_from_text(
         self,
@@ -344,24 +454,16 @@ Output ONLY valid JSON."""
         Returns:
             Updated ClaimGraph with linked facts.
         """
-        # Simple keyword-based linking
+        index = LinkIndex(
+            (fact.get("fact_id") or generate_id("fact"), fact.get("text", ""))
+            for fact in facts
+        )
         for claim in claim_graph.claims:
-            claim_keywords = set(self._tokenize(claim.text))
-
-            for fact in facts:
-                fact_keywords = set(self._tokenize(fact.get("text", "")))
-
-                # If significant overlap, link the fact
-                overlap = len(claim_keywords & fact_keywords)
-                if overlap >= 3:  # At least 3 common keywords
-                    fact_id = fact.get("fact_id", generate_id("fact"))
-                    if fact_id not in claim.linked_fact_ids:
-                        claim.linked_fact_ids.append(fact_id)
-
-        # Update counts
-        claim_graph.cited_claims = sum(1 for c in claim_graph.claims if c.cited_evidence_ids)
-        claim_graph.uncited_claims = sum(1 for c in claim_graph.claims if not c.cited_evidence_ids)
+            for fact_id in self._match(index, claim.text):
+                if fact_id not in claim.linked_fact_ids:
+                    claim.linked_fact_ids.append(fact_id)
 
+        self._update_counts(claim_graph)
         return claim_graph
 
     def link_evidence_to_claims(
@@ -378,31 +480,26 @@ Output ONLY valid JSON."""
         Returns:
             Updated ClaimGraph with linked evidence.
         """
+        index = LinkIndex(evidence_texts.items())
         for claim in claim_graph.claims:
-            claim_keywords = set(self._tokenize(claim.text))
+            for ev_id in self._match(index, claim.text):
+                if ev_id not in claim.cited_evidence_ids:
+                    claim.cited_evidence_ids.append(ev_id)
 
-            for ev_id, ev_text in evidence_texts.items():
-                ev_keywords = set(self._tokenize(ev_text))
+        self._update_counts(claim_graph)
+        return claim_graph
 
-                # If significant overlap, link the evidence
-                overlap = len(claim_keywords & ev_keywords)
-                if overlap >= 3:
-                    if ev_id not in claim.cited_evidence_ids:
-                        claim.cited_evidence_ids.append(ev_id)
+    def _match(self, index: LinkIndex, text: str) -> list[str]:
+        """Match text against a LinkIndex with this builder's thresholds."""
+        return index.match(
+            text,
+            min_overlap=self.min_overlap,
+            use_tfidf=self.use_tfidf,
+            min_tfidf_score=self.min_tfidf_score,
+        )
 
-        # Update counts
+    @staticmethod
+    def _update_counts(claim_graph: ClaimGraph) -> None:
+        """Recompute cited/uncited claim counts."""
         claim_graph.cited_claims = sum(1 for c in claim_graph.claims if c.cited_evidence_ids)
         claim_graph.uncited_claims = sum(1 for c in claim_graph.claims if not c.cited_evidence_ids)
-
-        return claim_graph
-
-    def _tokenize(self, text: str) -> list[str]:
-        """Tokenize text for keyword matching."""
-        text = text.lower()
-        tokens = re.findall(r'\b[a-z]+\b', text)
-        stopwords = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
-            'this', 'that', 'these', 'those', 'it', 'its', 'their', 'our',
-        }
-        return [t for t in tokens if t not in stopwords and len(t) > 2]
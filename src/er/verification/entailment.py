@@ -2,20 +2,38 @@
 Entailment Verifier for claim verification.
 
 Uses NLI-style checking to determine if evidence supports claims.
+
+On the LLM path, claims are verified concurrently (bounded by a semaphore)
+and, by default, several claims with their evidence are packed into one
+structured request whose per-claim results are parsed individually.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass, field
 from typing import Any
 
+from er.logging import get_logger
 from er.types import (
     Claim,
     ClaimGraph,
     EntailmentStatus,
 )
 
+logger = get_logger(__name__)
+
+# Maximum concurrent LLM requests during verify_claim_graph
+ENTAILMENT_MAX_CONCURRENCY = 4
+
+# Claims per LLM request (1 = one request per claim)
+ENTAILMENT_BATCH_SIZE = 8
+
+# Evidence per claim and characters per evidence item sent to the LLM
+MAX_EVIDENCE_PER_CLAIM = 5
+MAX_EVIDENCE_CHARS = 1000
+
 
 @dataclass
 class EntailmentResult:
@@ -73,13 +91,22 @@ class EntailmentVerifier:
     - CONTRADICTED: Evidence refutes the claim
     """
 
-    def __init__(self, llm_router: Any = None) -> None:
+    def __init__(
+        self,
+        llm_router: Any = None,
+        max_concurrency: int = ENTAILMENT_MAX_CONCURRENCY,
+        batch_size: int = ENTAILMENT_BATCH_SIZE,
+    ) -> None:
         """Initialize the EntailmentVerifier.
 
         Args:
             llm_router: LLM router for entailment checking.
+            max_concurrency: Maximum concurrent LLM requests.
+            batch_size: Claims packed into one LLM request (1 disables batching).
         """
         self.llm_router = llm_router
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
 
     async def verify_claim(
         self,
@@ -124,11 +151,7 @@ class EntailmentVerifier:
         Returns:
             EntailmentReport with all verification results.
         """
-        results: list[EntailmentResult] = []
-        verified_count = 0
-        contradicted_count = 0
-        unverified_count = 0
-
+        items: list[tuple[Claim, list[str]]] = []
         for claim in claim_graph.claims:
             # Get evidence texts from claim's cited_evidence_ids
             evidence_texts = [
@@ -141,9 +164,14 @@ class EntailmentVerifier:
             if not evidence_texts:
                 evidence_texts = list(evidence_map.values())[:5]
 
-            result = await self.verify_claim(claim, evidence_texts)
-            results.append(result)
+            items.append((claim, evidence_texts))
+
+        results = await self._verify_items(items)
 
+        verified_count = 0
+        contradicted_count = 0
+        unverified_count = 0
+        for result in results:
             if result.status == EntailmentStatus.SUPPORTED:
                 verified_count += 1
             elif result.status == EntailmentStatus.CONTRADICTED:
@@ -169,18 +197,145 @@ class EntailmentVerifier:
             claims_unverified=unverified_count,
         )
 
+    async def _verify_items(
+        self,
+        items: list[tuple[Claim, list[str]]],
+    ) -> list[EntailmentResult]:
+        """Verify (claim, evidence) pairs, preserving order.
+
+        Without an LLM router every claim is checked with heuristics. With
+        one, claims are sent concurrently, batch_size claims per request.
+        """
+        if not self.llm_router:
+            return [await self.verify_claim(claim, texts) for claim, texts in items]
+
+        results: list[EntailmentResult | None] = [None] * len(items)
+        pending: list[int] = []
+        for i, (claim, texts) in enumerate(items):
+            if texts:
+                pending.append(i)
+            else:
+                results[i] = await self.verify_claim(claim, texts)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_batch(indices: list[int]) -> None:
+            async with semaphore:
+                batch = [items[i] for i in indices]
+                if len(batch) == 1:
+                    batch_results = [await self._verify_with_llm(*batch[0])]
+                else:
+                    batch_results = await self._verify_batch_with_llm(batch)
+            for i, result in zip(indices, batch_results, strict=True):
+                results[i] = result
+
+        batches = [
+            pending[start:start + self.batch_size]
+            for start in range(0, len(pending), self.batch_size)
+        ]
+        await asyncio.gather(*(run_batch(indices) for indices in batches))
+
+        logger.info(
+            "Entailment verification complete",
+            claims=len(items),
+            llm_requests=len(batches),
+            batch_size=self.batch_size,
+        )
+        return [result for result in results if result is not None]
+
+    async def _complete_json(self, prompt: str, max_tokens: int) -> str:
+        """Send a JSON-mode prompt through the router and return the content."""
+        from er.llm.router import AgentRole
+
+        response = await self.llm_router.complete(
+            role=AgentRole.WORKHORSE,
+            messages=[{"role": "user", "content": prompt}],
+            agent_name="entailment_verifier",
+            phase="verification",
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+        )
+        content: str = response.content
+        return content
+
+    async def _verify_batch_with_llm(
+        self,
+        batch: list[tuple[Claim, list[str]]],
+    ) -> list[EntailmentResult]:
+        """Verify several claims in one LLM request.
+
+        Claims missing from the response (or the whole batch, if the request
+        fails or cannot be parsed) are re-verified one by one.
+        """
+        sections = []
+        for n, (claim, evidence_texts) in enumerate(batch, start=1):
+            evidence_lines = "\n".join(
+                f"  [{i}] {text[:MAX_EVIDENCE_CHARS]}"
+                for i, text in enumerate(evidence_texts[:MAX_EVIDENCE_PER_CLAIM])
+            )
+            sections.append(f"CLAIM C{n}:\n{claim.text}\nEVIDENCE:\n{evidence_lines}")
+        claims_block = "\n\n".join(sections)
+
+        prompt = f"""You are verifying whether evidence supports or contradicts investment claims.
+Judge each claim ONLY against its own evidence list.
+
+{claims_block}
+
+For each claim, decide whether its evidence:
+1. SUPPORTED - evidence provides backing for the assertion
+2. WEAK - some support but not conclusive
+3. UNSUPPORTED - evidence doesn't address the claim
+4. CONTRADICTED - evidence refutes or disproves the assertion
+
+Return JSON with one entry per claim:
+{{
+  "results": [
+    {{
+      "claim": "C1",
+      "status": "SUPPORTED" | "WEAK" | "UNSUPPORTED" | "CONTRADICTED",
+      "confidence": 0.0-1.0,
+      "supporting_evidence_indices": [0, 1, ...],
+      "contradicting_evidence_indices": [2, ...],
+      "reasoning": "Brief explanation"
+    }}
+  ]
+}}
+
+Output ONLY valid JSON."""
+
+        by_label: dict[str, dict[str, Any]] = {}
+        try:
+            content = await self._complete_json(prompt, max_tokens=250 * len(batch) + 200)
+            parsed = json.loads(self._strip_code_fence(content))
+            for entry in parsed.get("results", []):
+                if isinstance(entry, dict):
+                    by_label[str(entry.get("claim", "")).strip().upper()] = entry
+        except Exception as e:
+            logger.warning(
+                "Batched entailment failed, verifying claims individually",
+                claims=len(batch),
+                error=str(e),
+            )
+
+        results: list[EntailmentResult] = []
+        for n, (claim, evidence_texts) in enumerate(batch, start=1):
+            entry = by_label.get(f"C{n}")
+            if entry is None:
+                results.append(await self._verify_with_llm(claim, evidence_texts))
+            else:
+                results.append(self._result_from_parsed(claim.claim_id, entry, evidence_texts))
+        return results
+
     async def _verify_with_llm(
         self,
         claim: Claim,
         evidence_texts: list[str],
     ) -> EntailmentResult:
         """Verify claim using LLM-based NLI."""
-        from er.llm.router import AgentRole
-
         # Combine evidence for context
         evidence_combined = "\n\n".join([
-            f"Evidence {i+1}: {text[:1000]}"
-            for i, text in enumerate(evidence_texts[:5])
+            f"Evidence {i+1}: {text[:MAX_EVIDENCE_CHARS]}"
+            for i, text in enumerate(evidence_texts[:MAX_EVIDENCE_PER_CLAIM])
         ])
 
         prompt = f"""You are verifying whether evidence supports or contradicts an investment claim.
@@ -209,14 +364,7 @@ Return JSON:
 Output ONLY valid JSON."""
 
         try:
-            response = await self.llm_router.call(
-                role=AgentRole.WORKHORSE,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                response_format={"type": "json_object"},
-            )
-
-            content = response.get("content", "")
+            content = await self._complete_json(prompt, max_tokens=500)
             return self._parse_llm_result(claim.claim_id, content, evidence_texts)
 
         except Exception as e:
@@ -229,6 +377,19 @@ Output ONLY valid JSON."""
                 reasoning=f"Verification failed: {e}",
             )
 
+    @staticmethod
+    def _strip_code_fence(content: str) -> str:
+        """Remove a Markdown code fence around JSON, if present."""
+        if "```json" in content:
+            start = content.find("```json") + 7
+            end = content.find("```", start)
+            return content[start:end].strip()
+        if "```" in content:
+            start = content.find("```") + 3
+            end = content.find("```", start)
+            return content[start:end].strip()
+        return content
+
     def _parse_llm_result(
         self,
         claim_id: str,
@@ -236,19 +397,20 @@ Output ONLY valid JSON."""
         evidence_texts: list[str],
     ) -> EntailmentResult:
         """Parse LLM entailment result."""
-        # Clean up JSON
-        if "```json" in content:
-            start = content.find("```json") + 7
-            end = content.find("```", start)
-            content = content[start:end].strip()
-        elif "```" in content:
-            start = content.find("```") + 3
-            end = content.find("```", start)
-            content = content[start:end].strip()
-
         try:
-            parsed = json.loads(content)
+            parsed = json.loads(self._strip_code_fence(content))
+        except json.JSONDecodeError:
+            parsed = None
+        return self._result_from_parsed(claim_id, parsed, evidence_texts)
 
+    def _result_from_parsed(
+        self,
+        claim_id: str,
+        parsed: Any,
+        evidence_texts: list[str],
+    ) -> EntailmentResult:
+        """Build an EntailmentResult from one parsed JSON verdict."""
+        try:
             status_str = parsed.get("status", "UNSUPPORTED").upper()
             status = getattr(EntailmentStatus, status_str, EntailmentStatus.UNSUPPORTED)
 
@@ -275,7 +437,7 @@ Output ONLY valid JSON."""
                 reasoning=parsed.get("reasoning", ""),
             )
 
-        except (json.JSONDecodeError, AttributeError, KeyError):
+        except (AttributeError, KeyError, TypeError, ValueError):
             return EntailmentResult(
                 claim_id=claim_id,
                 status=EntailmentStatus.UNSUPPORTED,
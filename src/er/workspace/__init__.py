@@ -4,6 +4,6 @@ Workspace module for run-scoped artifact storage.
 Provides WorkspaceStore for persisting structured artifacts during a research run.
 """
 
-from er.workspace.store import WorkspaceStore
+from er.workspace.store import ArtifactInput, WorkspaceStore
 
-__all__ = ["WorkspaceStore"]
+__all__ = ["ArtifactInput", "WorkspaceStore"]
@@ -17,24 +17,59 @@ Each artifact has:
 - JSON content
 - Summary (human-readable)
 - Evidence IDs (links to EvidenceStore)
+
+The database runs in WAL mode so readers (the API server, auditors) never
+block the agents writing artifacts. Content is encoded with orjson.
 """
 
 from __future__ import annotations
 
-import json
 import sqlite3
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import orjson
 from uuid6 import uuid7
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Rows fetched per round trip when streaming artifacts
+ITER_BATCH_SIZE = 256
+
+_INSERT_ARTIFACT_SQL = """
+    INSERT INTO artifacts (id, type, created_at, producer, json, summary, evidence_ids)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ARTIFACT_EVIDENCE_SQL = (
+    "INSERT OR IGNORE INTO artifact_evidence (evidence_id, artifact_id) VALUES (?, ?)"
+)
+
 
 def generate_artifact_id(artifact_type: str) -> str:
     """Generate a unique artifact ID with type prefix."""
     return f"{artifact_type}_{uuid7()}"
 
 
+def _dumps(obj: Any) -> str:
+    """Encode a value as JSON text (non-JSON types fall back to str())."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+@dataclass(frozen=True)
+class ArtifactInput:
+    """One item for WorkspaceStore.put_artifacts (same fields as put_artifact())."""
+
+    artifact_type: str
+    producer: str
+    json_obj: dict[str, Any]
+    summary: str | None = None
+    evidence_ids: list[str] | None = None
+
+
 class WorkspaceStore:
     """SQLite-backed store for run-scoped artifacts.
 
@@ -90,6 +125,27 @@ class WorkspaceStore:
             CREATE INDEX IF NOT EXISTS idx_artifacts_producer ON artifacts(producer)
         """)
 
+        # Evidence -> artifact mapping for indexed lookups by evidence ID
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'artifact_evidence'"
+        )
+        backfill = cursor.fetchone() is None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS artifact_evidence (
+                evidence_id TEXT NOT NULL,
+                artifact_id TEXT NOT NULL,
+                PRIMARY KEY (evidence_id, artifact_id)
+            ) WITHOUT ROWID
+        """)
+        if backfill:
+            # Workspaces created before the mapping existed
+            cursor.execute("""
+                INSERT OR IGNORE INTO artifact_evidence (evidence_id, artifact_id)
+                SELECT ids.value, artifacts.id
+                FROM artifacts, json_each(artifacts.evidence_ids) AS ids
+                WHERE artifacts.evidence_ids IS NOT NULL
+            """)
+
         # Search log table - track all web searches performed
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS search_log (
@@ -113,6 +169,8 @@ class WorkspaceStore:
                 isolation_level="DEFERRED",
             )
             self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
         return self._conn
 
     def close(self) -> None:
@@ -141,32 +199,51 @@ class WorkspaceStore:
         Returns:
             The generated artifact ID.
         """
+        return self.put_artifacts(
+            [ArtifactInput(artifact_type, producer, json_obj, summary, evidence_ids)]
+        )[0]
+
+    def put_artifacts(self, items: Iterable[ArtifactInput]) -> list[str]:
+        """Store several artifacts in one transaction.
+
+        Args:
+            items: Artifacts to store.
+
+        Returns:
+            The generated artifact IDs, in input order.
+        """
         self.init()
 
-        artifact_id = generate_artifact_id(artifact_type)
         created_at = datetime.now(timezone.utc).isoformat()
+        artifact_ids: list[str] = []
+        artifact_rows: list[tuple[Any, ...]] = []
+        evidence_rows: list[tuple[str, str]] = []
+        for item in items:
+            artifact_id = generate_artifact_id(item.artifact_type)
+            artifact_ids.append(artifact_id)
+            artifact_rows.append(
+                (
+                    artifact_id,
+                    item.artifact_type,
+                    created_at,
+                    item.producer,
+                    _dumps(item.json_obj),
+                    item.summary,
+                    _dumps(item.evidence_ids) if item.evidence_ids else None,
+                )
+            )
+            evidence_rows.extend(
+                (evidence_id, artifact_id) for evidence_id in item.evidence_ids or []
+            )
 
-        conn = self._get_conn()
-        cursor = conn.cursor()
+        if not artifact_rows:
+            return []
 
-        cursor.execute(
-            """
-            INSERT INTO artifacts (id, type, created_at, producer, json, summary, evidence_ids)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                artifact_id,
-                artifact_type,
-                created_at,
-                producer,
-                json.dumps(json_obj, default=str),
-                summary,
-                json.dumps(evidence_ids) if evidence_ids else None,
-            ),
-        )
-        conn.commit()
+        with self._get_conn() as conn:
+            conn.executemany(_INSERT_ARTIFACT_SQL, artifact_rows)
+            conn.executemany(_INSERT_ARTIFACT_EVIDENCE_SQL, evidence_rows)
 
-        return artifact_id
+        return artifact_ids
 
     def get_artifact(self, artifact_id: str) -> dict[str, Any] | None:
         """Get an artifact by ID.
@@ -193,31 +270,124 @@ class WorkspaceStore:
 
         return self._row_to_artifact(row)
 
-    def list_artifacts(self, artifact_type: str | None = None) -> list[dict[str, Any]]:
+    def list_artifacts(
+        self,
+        artifact_type: str | None = None,
+        fields: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
         """List artifacts, optionally filtered by type.
 
         Args:
             artifact_type: Optional type to filter by.
+            fields: Optional top-level content keys to project (see iter_artifacts).
 
         Returns:
             List of artifact dicts.
         """
-        self.init()
+        return list(self.iter_artifacts(artifact_type, fields=fields))
 
-        conn = self._get_conn()
-        cursor = conn.cursor()
+    def iter_artifacts(
+        self,
+        artifact_type: str | None = None,
+        fields: list[str] | None = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream artifacts (newest first), optionally filtered by type.
 
-        if artifact_type:
-            cursor.execute(
-                "SELECT * FROM artifacts WHERE type = ? ORDER BY created_at DESC",
-                (artifact_type,),
-            )
+        With ``fields``, SQLite extracts just those top-level keys from each
+        artifact's JSON, so only they are decoded; "content" then holds only
+        the requested keys (None where a key is absent).
+
+        Args:
+            artifact_type: Optional type to filter by.
+            fields: Optional top-level content keys to project.
+            batch_size: Rows fetched per round trip.
+
+        Yields:
+            Artifact dicts.
+        """
+        self.init()
+
+        params: list[Any] = []
+        if fields is None:
+            content_sql = "json"
         else:
-            cursor.execute(
-                "SELECT * FROM artifacts ORDER BY created_at DESC"
-            )
+            # json_extract results keep their JSON subtype inside json_object,
+            # so nested objects and arrays are embedded as JSON, not strings.
+            # It returns booleans as 0/1, though, so those are rebuilt with
+            # json() (the -> operator would need SQLite 3.38+).
+            pairs = []
+            for field in dict.fromkeys(fields):
+                pairs.append(
+                    "?, CASE json_type(json, ?) WHEN 'true' THEN json('true') "
+                    "WHEN 'false' THEN json('false') ELSE json_extract(json, ?) END"
+                )
+                path = '$."' + field.replace('"', '""') + '"'
+                params.extend([field, path, path])
+            content_sql = f"json_object({', '.join(pairs)})"
+        query = (
+            f"SELECT id, type, created_at, producer, {content_sql} AS json, summary, evidence_ids "
+            "FROM artifacts"
+        )
+        if artifact_type:
+            query += " WHERE type = ?"
+            params.append(artifact_type)
+        query += " ORDER BY created_at DESC, id DESC"
+
+        cursor = self._get_conn().cursor()
+        cursor.execute(query, params)
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield self._row_to_artifact(row)
+        finally:
+            cursor.close()
+
+    def get_artifacts_by_evidence_ids(
+        self,
+        evidence_ids: list[str],
+        artifact_type: str | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get the artifacts that reference each evidence ID.
+
+        Resolves all IDs with one indexed query.
 
-        return [self._row_to_artifact(row) for row in cursor.fetchall()]
+        Args:
+            evidence_ids: Evidence IDs to look up.
+            artifact_type: Optional type to filter by.
+
+        Returns:
+            Dict of evidence_id -> artifacts (newest first). IDs with no
+            artifacts are omitted.
+        """
+        self.init()
+        if not evidence_ids:
+            return {}
+
+        query = """
+            SELECT artifact_evidence.evidence_id AS lookup_id, artifacts.*
+            FROM artifact_evidence
+            JOIN artifacts ON artifacts.id = artifact_evidence.artifact_id
+            WHERE artifact_evidence.evidence_id IN (SELECT value FROM json_each(?))
+        """
+        params: list[Any] = [_dumps(list(dict.fromkeys(evidence_ids)))]
+        if artifact_type:
+            query += " AND artifacts.type = ?"
+            params.append(artifact_type)
+        query += " ORDER BY artifacts.created_at DESC"
+
+        cursor = self._get_conn().cursor()
+        cursor.execute(query, params)
+
+        # Decode each artifact once even if it matches several IDs
+        decoded: dict[str, dict[str, Any]] = {}
+        result: dict[str, list[dict[str, Any]]] = {}
+        for row in cursor.fetchall():
+            artifact = decoded.get(row["id"])
+            if artifact is None:
+                artifact = decoded[row["id"]] = self._row_to_artifact(row)
+            result.setdefault(row["lookup_id"], []).append(artifact)
+        return result
 
     def _row_to_artifact(self, row: sqlite3.Row) -> dict[str, Any]:
         """Convert a database row to an artifact dict."""
@@ -226,9 +396,9 @@ class WorkspaceStore:
             "type": row["type"],
             "created_at": row["created_at"],
             "producer": row["producer"],
-            "content": json.loads(row["json"]),
+            "content": orjson.loads(row["json"]),
             "summary": row["summary"],
-            "evidence_ids": json.loads(row["evidence_ids"]) if row["evidence_ids"] else [],
+            "evidence_ids": orjson.loads(row["evidence_ids"]) if row["evidence_ids"] else [],
         }
 
     def log_search(
@@ -265,7 +435,7 @@ class WorkspaceStore:
                 query,
                 provider,
                 created_at,
-                json.dumps(results, default=str) if results else None,
+                _dumps(results) if results else None,
             ),
         )
         conn.commit()
@@ -291,7 +461,7 @@ class WorkspaceStore:
                 "query": row["query"],
                 "provider": row["provider"],
                 "created_at": row["created_at"],
-                "results": json.loads(row["result_json"]) if row["result_json"] else None,
+                "results": orjson.loads(row["result_json"]) if row["result_json"] else None,
             }
             for row in cursor.fetchall()
         ]
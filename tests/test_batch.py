@@ -0,0 +1,141 @@
+"""
+Tests for the multi-ticker batch runner.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from er.coordinator.batch import BatchConfig, BatchRunner
+from er.coordinator.pipeline import ResearchPipeline
+from er.llm.client_pool import ProviderClientPool
+from er.manifest import RunManifest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from er.config import Settings
+
+
+class FakePipelineRuns:
+    """Replacement for ResearchPipeline.run that records shared state."""
+
+    def __init__(self, fail: set[str] | None = None) -> None:
+        self.fail = fail or set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.evidence_stores: set[int] = set()
+        self.client_pools: set[int] = set()
+        self.budgets: dict[str, float | None] = {}
+        self.output_dirs: dict[str, Path] = {}
+
+    async def __call__(self, pipeline: ResearchPipeline, ticker: str) -> Any:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+
+        await pipeline.evidence_store.init()
+        self.evidence_stores.add(id(pipeline.evidence_store))
+        self.client_pools.add(id(pipeline.agent_context.client_pool))
+        self.budgets[ticker] = pipeline.config.max_budget_usd
+        self.output_dirs[ticker] = pipeline.config.output_dir
+
+        if ticker in self.fail:
+            raise RuntimeError(f"{ticker} failed")
+
+        return SimpleNamespace(
+            total_cost_usd=1.5,
+            to_report_markdown=lambda: f"# {ticker}",
+        )
+
+
+@pytest.fixture
+def fake_runs(monkeypatch: pytest.MonkeyPatch) -> FakePipelineRuns:
+    """Patch ResearchPipeline.run with a recording fake."""
+    fake = FakePipelineRuns(fail={"BAD"})
+
+    async def run(self: ResearchPipeline, ticker: str) -> Any:
+        return await fake(self, ticker)
+
+    monkeypatch.setattr(ResearchPipeline, "run", run)
+    return fake
+
+
+class TestBatchRunner:
+    """Test BatchRunner orchestration."""
+
+    @pytest.mark.asyncio
+    async def test_runs_share_data_layer(
+        self, mock_settings: Settings, temp_dir: Path, fake_runs: FakePipelineRuns
+    ) -> None:
+        """Test that all runs share one evidence store and client pool."""
+        config = BatchConfig(output_dir=temp_dir / "batch", max_concurrent_runs=2)
+        result = await BatchRunner(config, settings=mock_settings).run(
+            ["aapl", "MSFT", "GOOGL", "AAPL"]
+        )
+
+        assert [run.ticker for run in result.runs] == ["AAPL", "MSFT", "GOOGL"]
+        assert len(fake_runs.evidence_stores) == 1
+        assert len(fake_runs.client_pools) == 1
+        assert None not in fake_runs.client_pools
+        assert fake_runs.max_in_flight <= 2
+
+    @pytest.mark.asyncio
+    async def test_per_run_directories_and_budgets(
+        self, mock_settings: Settings, temp_dir: Path, fake_runs: FakePipelineRuns
+    ) -> None:
+        """Test that each ticker gets its own directory, manifest and budget."""
+        config = BatchConfig(
+            output_dir=temp_dir / "batch",
+            budget_per_ticker_usd=10.0,
+            ticker_budgets={"MSFT": 3.0},
+        )
+        result = await BatchRunner(config, settings=mock_settings).run(["AAPL", "MSFT"])
+
+        assert fake_runs.budgets == {"AAPL": 10.0, "MSFT": 3.0}
+        assert fake_runs.output_dirs["AAPL"] != fake_runs.output_dirs["MSFT"]
+        for run in result.runs:
+            assert (run.output_dir / "report.md").read_text() == f"# {run.ticker}"
+            manifest = RunManifest.load(run.output_dir)
+            assert manifest is not None
+            assert manifest.status == "completed"
+        assert result.total_cost_usd == pytest.approx(3.0)
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_stop_batch(
+        self, mock_settings: Settings, temp_dir: Path, fake_runs: FakePipelineRuns
+    ) -> None:
+        """Test that one failing ticker is recorded and others complete."""
+        config = BatchConfig(output_dir=temp_dir / "batch")
+        result = await BatchRunner(config, settings=mock_settings).run(["AAPL", "BAD"])
+
+        assert [run.ticker for run in result.succeeded] == ["AAPL"]
+        assert [run.ticker for run in result.failed] == ["BAD"]
+        assert result.failed[0].error == "BAD failed"
+        manifest = RunManifest.load(result.failed[0].output_dir)
+        assert manifest is not None
+        assert manifest.status == "failed"
+
+
+class TestProviderClientPool:
+    """Test shared provider client pool."""
+
+    @pytest.mark.asyncio
+    async def test_pool_reuses_and_owns_clients(self, mock_settings: Settings) -> None:
+        """Test that the pool hands out one client per provider."""
+        pool = ProviderClientPool(mock_settings)
+        client = pool.openai()
+
+        assert pool.get("openai") is client
+        assert pool.owns(client)
+        assert not pool.owns(object())
+
+        await pool.close()
+        assert not pool.owns(client)
@@ -8,7 +8,13 @@ from pathlib import Path
 
 import pytest
 
-from er.budget import BudgetTracker, calculate_cost, get_model_cost
+from er.budget import (
+    BudgetTracker,
+    calculate_cost,
+    get_model_cost,
+    iter_usage_records,
+    load_costs,
+)
 
 
 class TestCostCalculation:
@@ -283,3 +289,76 @@ class TestBudgetTracker:
 
         assert data["budget_limit"] == 100.0
         assert data["total_cost_usd"] > 0
+
+
+class TestCostLedger:
+    """Test the append-only cost ledger and snapshots."""
+
+    @staticmethod
+    def _record(tracker: BudgetTracker, agent: str = "test") -> float:
+        return tracker.record_usage(
+            provider="openai",
+            model="gpt-5.2-2025-12-11",
+            input_tokens=1_000,
+            output_tokens=500,
+            agent=agent,
+            phase="research",
+        )
+
+    def test_ledger_appends_and_snapshots_periodically(self, temp_dir: Path) -> None:
+        """Test that each call appends a line and costs.json lags until a snapshot."""
+        import orjson
+
+        tracker = BudgetTracker(budget_limit=10.0, output_dir=temp_dir, snapshot_interval=3)
+        for _ in range(4):
+            self._record(tracker)
+
+        lines = (temp_dir / "costs.jsonl").read_bytes().splitlines()
+        assert len(lines) == 4
+
+        # First call snapshots immediately, then every 3 calls
+        snapshot = orjson.loads((temp_dir / "costs.json").read_bytes())
+        assert snapshot["record_count"] == 4
+        assert "records" not in snapshot
+
+        self._record(tracker)
+        assert orjson.loads((temp_dir / "costs.json").read_bytes())["record_count"] == 4
+        tracker.close()
+        assert orjson.loads((temp_dir / "costs.json").read_bytes())["record_count"] == 5
+
+    def test_resume_rebuilds_from_ledger(self, temp_dir: Path) -> None:
+        """Test that a resumed tracker replays the ledger and keeps appending."""
+        original = BudgetTracker(budget_limit=10.0, output_dir=temp_dir)
+        self._record(original, agent="a")
+        self._record(original, agent="b")
+        original.close()
+        # A torn final line from a crash is skipped
+        with (temp_dir / "costs.jsonl").open("ab") as f:
+            f.write(b'{"provider": "open')
+
+        resumed = BudgetTracker.resume(temp_dir, budget_limit=10.0)
+        assert resumed.total_cost_usd == pytest.approx(original.total_cost_usd)
+        assert resumed.by_agent == original.by_agent
+        assert len(resumed.records) == 2
+
+        snapshot = load_costs(temp_dir)
+        assert snapshot is not None
+        loaded = BudgetTracker.from_dict(snapshot)
+        assert loaded.total_cost_usd == pytest.approx(original.total_cost_usd)
+        assert len(snapshot["records"]) == 2
+
+    def test_legacy_costs_json_is_migrated(self, temp_dir: Path) -> None:
+        """Test that runs with records embedded in costs.json still load."""
+        import orjson
+
+        legacy = BudgetTracker(budget_limit=10.0)
+        self._record(legacy)
+        (temp_dir / "costs.json").write_bytes(orjson.dumps(legacy.to_dict()))
+
+        assert len(list(iter_usage_records(temp_dir))) == 1
+        resumed = BudgetTracker.resume(temp_dir, budget_limit=10.0)
+        self._record(resumed)
+        resumed.close()
+
+        assert len(list(iter_usage_records(temp_dir))) == 2
+        assert load_costs(temp_dir)["total_cost_usd"] == pytest.approx(resumed.total_cost_usd)
@@ -0,0 +1,184 @@
+"""
+Tests for stage checkpoints.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from er import checkpoints
+from er.cache.file_cache import COMPRESSION_GZIP, COMPRESSION_NONE
+from er.checkpoints import (
+    CheckpointReader,
+    checkpoint_exists,
+    checkpoint_path,
+    convert_run_dir,
+    export_json,
+    legacy_path,
+    load_checkpoint,
+    write_checkpoint,
+)
+from er.run_catalog import _read_verdict
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class Verdict(StrEnum):
+    BUY = "BUY"
+
+
+def _report() -> dict:
+    return {
+        "investment_view": Verdict.BUY,
+        "conviction": "high",
+        "overall_confidence": 0.72,
+        "full_report": "Long-form analysis. " * 500,
+        "created_at": datetime(2025, 10, 1, tzinfo=UTC),
+        "scores": {1: 0.5, 2: 0.25},
+        "notes": None,
+    }
+
+
+class TestCheckpointFormat:
+    """Test encoding, lazy section reads and the JSON fallback."""
+
+    @pytest.mark.parametrize("compression", [COMPRESSION_GZIP, COMPRESSION_NONE])
+    def test_round_trip(self, temp_dir: Path, compression: str) -> None:
+        """Test that dict, list and scalar outputs decode like their JSON."""
+        for stage, data in [
+            ("stage6_final_report", _report()),
+            ("stage3_verticals", [{"name": f"V{i}", "text": "x" * 2000} for i in range(3)]),
+            ("stage9_flag", True),
+        ]:
+            path = write_checkpoint(temp_dir, stage, data, compression=compression)
+            expected = orjson.loads(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+            assert load_checkpoint(temp_dir, stage) == expected
+            assert path.stat().st_size > 0
+
+        with CheckpointReader(checkpoint_path(temp_dir, "stage6_final_report")) as reader:
+            assert reader.keys() == list(_report())
+            assert reader.read_section("created_at") == "2025-10-01T00:00:00+00:00"
+            codec = reader.sections["full_report"].codec
+            assert codec == compression
+            # Small frames are never compressed
+            assert reader.sections["conviction"].codec == COMPRESSION_NONE
+
+    def test_reads_only_requested_sections(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that partial loads decode only the frames asked for."""
+        write_checkpoint(temp_dir, "stage6_final_report", _report(), compression=COMPRESSION_GZIP)
+        write_checkpoint(temp_dir, "stage3_verticals", [{"n": i} for i in range(5)])
+
+        decoded: list[int] = []
+        real_decompress = checkpoints._decompress
+
+        def counting_decompress(stored: bytes, codec: str) -> bytes:
+            decoded.append(len(stored))
+            return real_decompress(stored, codec)
+
+        monkeypatch.setattr(checkpoints, "_decompress", counting_decompress)
+
+        data = load_checkpoint(
+            temp_dir, "stage6_final_report", ("investment_view", "conviction", "missing")
+        )
+        assert data == {"investment_view": "BUY", "conviction": "high"}
+        assert len(decoded) == 2
+
+        assert load_checkpoint(temp_dir, "stage3_verticals", ("1", "3")) == [{"n": 1}, {"n": 3}]
+
+    def test_legacy_json_fallback(self, temp_dir: Path) -> None:
+        """Test that pre-checkpoint runs and broken checkpoints still load."""
+        legacy = {"investment_view": "SELL", "conviction": "low", "full_report": "..."}
+        legacy_path(temp_dir, "stage6_final_report").write_bytes(orjson.dumps(legacy))
+
+        assert checkpoint_exists(temp_dir, "stage6_final_report")
+        assert load_checkpoint(temp_dir, "stage6_final_report", ("conviction",)) == {"conviction": "low"}
+
+        # The checkpoint wins once written
+        write_checkpoint(temp_dir, "stage6_final_report", {"conviction": "high"})
+        assert load_checkpoint(temp_dir, "stage6_final_report") == {"conviction": "high"}
+
+        # An incomplete checkpoint falls back to the JSON file
+        path = checkpoint_path(temp_dir, "stage6_final_report")
+        path.write_bytes(path.read_bytes()[:-3])
+        assert load_checkpoint(temp_dir, "stage6_final_report") == legacy
+
+        assert load_checkpoint(temp_dir, "stage1_company_context") is None
+        assert not checkpoint_exists(temp_dir, "stage1_company_context")
+
+    def test_json_export(self, temp_dir: Path) -> None:
+        """Test that the debugging JSON view matches the checkpoint."""
+        write_checkpoint(temp_dir, "stage2_discovery", {"threads": [1, 2]}, export_json=True)
+        assert orjson.loads(legacy_path(temp_dir, "stage2_discovery").read_bytes()) == {
+            "threads": [1, 2]
+        }
+
+        write_checkpoint(temp_dir, "stage5_editorial_feedback", {"claude_score": 0.8})
+        path = export_json(temp_dir, "stage5_editorial_feedback")
+        assert path.read_text() == '{\n  "claude_score": 0.8\n}'
+
+
+class TestConvertRunDir:
+    """Test upgrading stageN_*.json files."""
+
+    def test_converts_stage_files(self, temp_dir: Path) -> None:
+        """Test conversion, skips and failures."""
+        run_dir = temp_dir / "run_AAPL_20251001"
+        run_dir.mkdir()
+        stages = {
+            "stage1_company_context": {"symbol": "AAPL", "profile": {"companyName": "Apple"}},
+            "stage3_verticals": [{"vertical_name": "Services"}],
+            "stage6_final_report": {"investment_view": "BUY", "conviction": "medium", "overall_confidence": 0.6},
+        }
+        for stage, data in stages.items():
+            legacy_path(run_dir, stage).write_text(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
+        review = run_dir / "stage2_discovery_review.json"
+        review.write_text("{}")
+        (run_dir / "stage4_gpt_synthesis.json").write_text("{not json")
+        (run_dir / "manifest.json").write_text("{}")
+
+        result = convert_run_dir(run_dir)
+
+        assert result.converted == sorted(stages)
+        assert result.failed == ["stage4_gpt_synthesis"]
+        for stage, data in stages.items():
+            assert load_checkpoint(run_dir, stage) == data
+            assert legacy_path(run_dir, stage).exists()
+        assert review.exists() and not checkpoint_path(run_dir, "stage2_discovery_review").exists()
+        assert (run_dir / "stage4_gpt_synthesis.json").exists()
+        assert result.checkpoint_bytes > 0
+
+        # Dashboard verdict reads the converted report
+        assert _read_verdict(run_dir) == {
+            "investment_view": "BUY",
+            "conviction": "medium",
+            "confidence": 0.6,
+        }
+
+        # Re-running converts nothing new; deleting JSON is opt-in
+        assert convert_run_dir(run_dir, delete_json=True).converted == []
+        for stage, data in stages.items():
+            assert not legacy_path(run_dir, stage).exists()
+            assert load_checkpoint(run_dir, stage) == data
+        assert review.exists()
+        assert (run_dir / "stage4_gpt_synthesis.json").exists()
+
+    def test_keeps_json_next_to_unreadable_checkpoint(self, temp_dir: Path) -> None:
+        """Test that --delete-json never removes the only readable copy."""
+        run_dir = temp_dir / "run_AAPL_20251001"
+        run_dir.mkdir()
+        json_path = legacy_path(run_dir, "stage1_company_context")
+        json_path.write_bytes(orjson.dumps({"symbol": "AAPL"}))
+        checkpoint_path(run_dir, "stage1_company_context").write_bytes(b"truncated")
+
+        result = convert_run_dir(run_dir, delete_json=True)
+
+        assert result.converted == []
+        assert json_path.exists()
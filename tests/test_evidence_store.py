@@ -4,11 +4,13 @@ Tests for the evidence store.
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 import pytest
 
-from er.evidence.store import EvidenceStore
+from er.evidence import store as store_module
+from er.evidence.store import EvidenceInput, EvidenceStore
 from er.types import SourceTier, ToSRisk
 
 
@@ -301,3 +303,267 @@ class TestEvidenceStoreStats:
         assert stats["by_tier"]["news"] == 1
         assert stats["by_tos_risk"]["none"] == 1
         assert stats["by_tos_risk"]["low"] == 1
+
+
+class TestEvidenceStoreFullTextSearch:
+    """Test FTS5-backed search."""
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_and_indexes_blob_text(
+        self, evidence_store: EvidenceStore
+    ) -> None:
+        """Test that blob text is searchable and title matches rank first."""
+        await evidence_store.store(
+            url="https://example.com/body",
+            content=b"<html><script>var gpu = 1;</script><p>Datacenter GPU demand</p></html>",
+            content_type="text/html",
+            snippet="Quarterly update",
+        )
+        await evidence_store.store(
+            url="https://example.com/title",
+            content=b"Other",
+            content_type="text/plain",
+            snippet="Quarterly update",
+            title="Datacenter growth",
+        )
+
+        results = await evidence_store.search("datacenter")
+        assert [e.source_url for e in results] == [
+            "https://example.com/title",
+            "https://example.com/body",
+        ]
+
+        # Script contents are not indexed
+        results = await evidence_store.search("var")
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_phrase_and_prefix_queries(self, evidence_store: EvidenceStore) -> None:
+        """Test quoted phrases and trailing-* prefix terms."""
+        await evidence_store.store(
+            url="https://example.com/a",
+            content=b"a",
+            content_type="text/plain",
+            snippet="gross margin expansion in semiconductors",
+        )
+        await evidence_store.store(
+            url="https://example.com/b",
+            content=b"b",
+            content_type="text/plain",
+            snippet="margin on gross revenue",
+        )
+
+        results = await evidence_store.search('"gross margin"')
+        assert [e.source_url for e in results] == ["https://example.com/a"]
+
+        results = await evidence_store.search("semicond*")
+        assert [e.source_url for e in results] == ["https://example.com/a"]
+
+        # FTS syntax in user input does not raise
+        assert len(await evidence_store.search('margin ("')) == 2
+
+    @pytest.mark.asyncio
+    async def test_tier_and_date_filters(self, evidence_store: EvidenceStore) -> None:
+        """Test filtering by source tier and publication date."""
+        from datetime import datetime
+
+        await evidence_store.store(
+            url="https://sec.gov/10k",
+            content=b"x",
+            content_type="text/plain",
+            snippet="revenue guidance",
+            source_tier=SourceTier.OFFICIAL,
+            published_at=datetime(2024, 1, 10),
+        )
+        await evidence_store.store(
+            url="https://news.example.com/old",
+            content=b"y",
+            content_type="text/plain",
+            snippet="revenue guidance",
+            source_tier=SourceTier.NEWS,
+            published_at=datetime(2023, 1, 10),
+        )
+
+        results = await evidence_store.search("revenue", tiers=[SourceTier.OFFICIAL])
+        assert [e.source_url for e in results] == ["https://sec.gov/10k"]
+
+        results = await evidence_store.search("revenue", since=datetime(2023, 6, 1))
+        assert [e.source_url for e in results] == ["https://sec.gov/10k"]
+
+        results = await evidence_store.search("revenue", until=datetime(2023, 6, 1))
+        assert [e.source_url for e in results] == ["https://news.example.com/old"]
+
+    @pytest.mark.asyncio
+    async def test_backfill_existing_database(self, temp_dir: Path) -> None:
+        """Test that a database created before FTS is indexed on open and backfill."""
+        store = EvidenceStore(temp_dir / "legacy")
+        await store.init()
+        await store.store(
+            url="https://example.com/legacy",
+            content=b"<p>Legacy blob mentions tariffs</p>",
+            content_type="text/html",
+            snippet="Legacy snippet",
+        )
+        # Simulate an evidence.db written before the search index existed
+        await store._db.execute("DROP TABLE evidence_fts")
+        for trigger in ("insert", "delete", "update"):
+            await store._db.execute(f"DROP TRIGGER evidence_fts_{trigger}")
+        await store._db.commit()
+        await store.close()
+
+        store = EvidenceStore(temp_dir / "legacy")
+        await store.init()
+        try:
+            assert len(await store.search("legacy")) == 1
+            assert await store.search("tariffs") == []
+
+            assert await store.backfill_search_index() == 1
+            assert len(await store.search("tariffs")) == 1
+            assert await store.backfill_search_index() == 0
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_text_extraction_runs_off_event_loop(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that store() and backfill extract blob text in worker threads."""
+        threads: list[int] = []
+        extract = store_module.extract_search_text
+
+        def recording_extract(content: bytes, content_type: str) -> str:
+            threads.append(threading.get_ident())
+            return extract(content, content_type)
+
+        monkeypatch.setattr(store_module, "extract_search_text", recording_extract)
+        store = EvidenceStore(temp_dir / "threads")
+        await store.init()
+        try:
+            await store.store(
+                url="https://example.com/page",
+                content=b"<p>Inventory build in channel</p>",
+                content_type="text/html",
+                snippet="Channel check",
+            )
+            await store.flush()
+            assert await store.search("inventory")
+            await store._db.execute("UPDATE evidence_fts SET body = ''")
+            await store._db.commit()
+
+            assert await store.backfill_search_index() == 1
+        finally:
+            await store.close()
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+
+class TestEvidenceStoreBatchedWrites:
+    """Test store_many and write-behind batching."""
+
+    @pytest.mark.asyncio
+    async def test_store_many_single_transaction(self, evidence_store: EvidenceStore) -> None:
+        """Test that store_many returns records in order and commits once."""
+        commits = 0
+        original_commit = evidence_store._db.commit
+
+        async def counting_commit() -> None:
+            nonlocal commits
+            commits += 1
+            await original_commit()
+
+        evidence_store._db.commit = counting_commit  # type: ignore[method-assign]
+
+        items = [
+            EvidenceInput(
+                url=f"https://example.com/{i}",
+                content=f"Body {i}".encode(),
+                content_type="text/plain",
+                snippet=f"Snippet {i}",
+            )
+            for i in range(5)
+        ]
+        stored = await evidence_store.store_many(items)
+
+        assert commits == 1
+        assert [e.source_url for e in stored] == [item.url for item in items]
+        assert await evidence_store.count() == 5
+        assert len(await evidence_store.search("body")) == 5
+
+    @pytest.mark.asyncio
+    async def test_write_behind_flushes_on_size_read_and_close(self, temp_dir: Path) -> None:
+        """Test that buffered rows are flushed by size, before reads, and on close."""
+        store = EvidenceStore(
+            temp_dir / "wb", write_behind=True, flush_size=3, flush_interval=60.0
+        )
+        await store.init()
+
+        first = await store.store(
+            url="https://example.com/1", content=b"1", content_type="text/plain", snippet="one"
+        )
+        assert len(store._pending) == 1
+        # Reads see buffered rows
+        assert await store.get(first.evidence_id) == first
+
+        for i in range(3):
+            await store.store(
+                url=f"https://example.com/b{i}", content=b"b", content_type="text/plain", snippet="b"
+            )
+        assert store._pending == []
+
+        await store.store(
+            url="https://example.com/last", content=b"z", content_type="text/plain", snippet="z"
+        )
+        await store.close()
+
+        reopened = EvidenceStore(temp_dir / "wb")
+        await reopened.init()
+        try:
+            assert await reopened.count() == 5
+            assert await reopened.find_by_url("https://example.com/last") is not None
+        finally:
+            await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_write_behind_flushes_after_interval(self, temp_dir: Path) -> None:
+        """Test that buffered rows are committed after the flush interval."""
+        import asyncio
+
+        store = EvidenceStore(temp_dir / "wb", write_behind=True, flush_interval=0.01)
+        await store.init()
+        try:
+            await store.store(
+                url="https://example.com/t", content=b"t", content_type="text/plain", snippet="t"
+            )
+            await asyncio.sleep(0.1)
+            assert store._pending == []
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_wal_mode(self, evidence_store: EvidenceStore) -> None:
+        """Test that the database runs in WAL mode."""
+        async with evidence_store._db.execute("PRAGMA journal_mode") as cursor:
+            row = await cursor.fetchone()
+        assert row[0] == "wal"
+
+
+class TestEvidenceStoreDerived:
+    """Test derived artifacts keyed by content hash."""
+
+    @pytest.mark.asyncio
+    async def test_derived_round_trip_by_version(self, temp_dir: Path) -> None:
+        """Test that derivations persist and are scoped to their version."""
+        store = EvidenceStore(temp_dir / "cache")
+        await store.init()
+        await store.put_derived("abc", "text", "1:lxml", {"title": "T", "text": "body"})
+        await store.close()
+
+        reopened = EvidenceStore(temp_dir / "cache")
+        await reopened.init()
+        try:
+            assert await reopened.get_derived("abc", "text", "1:lxml") == {"title": "T", "text": "body"}
+            assert await reopened.get_derived("abc", "text", "2:lxml") is None
+            assert await reopened.get_derived("abc", "chunks", "1:lxml") is None
+        finally:
+            await reopened.close()
@@ -0,0 +1,185 @@
+"""
+Tests for the content-addressed file cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from er.cache.file_cache import COMPRESSION_GZIP, COMPRESSION_NONE, FileCache
+from er.evidence.store import EvidenceStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _age(path: Path, seconds: float) -> None:
+    """Backdate a file's mtime."""
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+class TestFileCache:
+    """Test FileCache storage and reads."""
+
+    def test_put_dedupes_and_compresses(self, temp_dir: Path) -> None:
+        """Test that identical content is stored once, compressed."""
+        cache = FileCache(temp_dir / "blobs", compression=COMPRESSION_GZIP)
+        content = b"<html>" + b"repeated filing text " * 500 + b"</html>"
+
+        first = cache.put(content, "text/html")
+        second = cache.put(content, "text/html")
+
+        assert first.hash == hashlib.sha256(content).hexdigest()
+        assert second.path == first.path
+        assert first.compression == COMPRESSION_GZIP
+        assert first.stored_size < first.size
+        assert cache.read_bytes(first.hash) == content
+        assert cache.stats()["blobs"] == 1
+
+    def test_incompressible_types_stored_raw(self, temp_dir: Path) -> None:
+        """Test that PDFs are stored raw and can be memory-mapped."""
+        cache = FileCache(temp_dir / "blobs", compression=COMPRESSION_GZIP)
+        content = b"%PDF-1.7 " + b"x" * 4096
+
+        ref = cache.put(content, "application/pdf")
+
+        assert ref.compression == COMPRESSION_NONE
+        with cache.mmap(ref.hash) as mapped:
+            assert mapped[:8] == b"%PDF-1.7"
+
+    def test_streaming_reads(self, temp_dir: Path) -> None:
+        """Test streaming a compressed blob in chunks."""
+        cache = FileCache(temp_dir / "blobs", compression=COMPRESSION_GZIP)
+        content = b"0123456789" * 10_000
+        ref = cache.put(content, "text/plain")
+
+        assert b"".join(cache.iter_chunks(ref.hash, chunk_size=4096)) == content
+        with pytest.raises(ValueError):
+            with cache.mmap(ref.hash):
+                pass
+        assert list(cache.iter_chunks("0" * 64)) == []
+
+    def test_lru_eviction(self, temp_dir: Path) -> None:
+        """Test that least recently used blobs are evicted first."""
+        cache = FileCache(temp_dir / "blobs", max_size_bytes=2500, compression=COMPRESSION_NONE)
+        old = cache.put(os.urandom(1000), "application/octet-stream")
+        recent = cache.put(os.urandom(1000), "application/octet-stream")
+        _age(old.path, 200)
+        _age(recent.path, 100)
+
+        # Reading marks the older blob as recently used
+        assert cache.read_bytes(old.hash) is not None
+        newest = cache.put(os.urandom(1000), "application/octet-stream")
+
+        assert cache.contains(old.hash)
+        assert not cache.contains(recent.hash)
+        assert cache.contains(newest.hash)
+        assert cache.total_size() <= 2500
+
+    def test_ttl_expiry(self, temp_dir: Path) -> None:
+        """Test that expired blobs read as missing."""
+        cache = FileCache(temp_dir / "blobs")
+        ref = cache.put(b"short lived", ttl_seconds=1)
+        assert cache.contains(ref.hash)
+
+        ref.expires_at = "2000-01-01T00:00:00+00:00"
+        (ref.path.parent / f"{ref.hash}.json").write_bytes(orjson.dumps(ref.to_sidecar()))
+        assert cache.read_bytes(ref.hash) is None
+        assert not ref.path.exists()
+
+    def test_cleanup_orphans(self, temp_dir: Path) -> None:
+        """Test removal of temp files, dangling sidecars and unreferenced blobs."""
+        cache = FileCache(temp_dir / "blobs", compression=COMPRESSION_GZIP)
+        keep = cache.put(b"keep me " * 200, "text/plain")
+        drop = cache.put(b"drop me " * 200, "text/plain")
+        stale_tmp = keep.path.parent / ".partial.tmp"
+        stale_tmp.write_bytes(b"partial")
+        for path in keep.path.parent.iterdir():
+            _age(path, 7200)
+        for path in drop.path.parent.iterdir():
+            _age(path, 7200)
+
+        removed = cache.cleanup_orphans(referenced={keep.hash})
+
+        assert removed >= 3  # tmp file, dropped blob, dropped sidecar
+        assert not stale_tmp.exists()
+        assert cache.read_bytes(keep.hash) == b"keep me " * 200
+        assert not cache.contains(drop.hash)
+
+    def test_reads_legacy_raw_blobs(self, temp_dir: Path) -> None:
+        """Test that blobs written without a sidecar are still readable."""
+        content = b"legacy blob"
+        content_hash = hashlib.sha256(content).hexdigest()
+        legacy_path = temp_dir / "blobs" / content_hash[:2] / content_hash
+        legacy_path.parent.mkdir(parents=True)
+        legacy_path.write_bytes(content)
+
+        cache = FileCache(temp_dir / "blobs")
+        assert cache.read_bytes(content_hash) == content
+        assert cache.cleanup_orphans(min_age_seconds=0) == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_protocol(self, temp_dir: Path) -> None:
+        """Test the async CacheProtocol interface."""
+        cache = FileCache(temp_dir / "blobs")
+        content = b"protocol"
+        key = hashlib.sha256(content).hexdigest()
+
+        await cache.set(key, content)
+        assert await cache.exists(key)
+        assert await cache.get(key) == content
+        assert await cache.delete(key)
+        assert await cache.get(key) is None
+        with pytest.raises(ValueError):
+            await cache.set("wrong", content)
+
+
+class TestEvidenceStoreBlobs:
+    """Test EvidenceStore on top of FileCache."""
+
+    @pytest.mark.asyncio
+    async def test_store_round_trip_and_stream(self, temp_dir: Path) -> None:
+        """Test that evidence blobs are compressed, readable and streamable."""
+        store = EvidenceStore(temp_dir / "cache")
+        await store.init()
+        try:
+            content = b"<html><body>" + b"10-K risk factor text. " * 1000 + b"</body></html>"
+            evidence = await store.store(
+                url="https://sec.gov/filing",
+                content=content,
+                content_type="text/html",
+                snippet="10-K",
+            )
+
+            assert (store.cache_dir / evidence.blob_path).stat().st_size < len(content)
+            assert await store.get_blob(evidence.evidence_id) == content
+            stream = await store.open_blob(evidence.evidence_id)
+            assert stream is not None
+            with stream:
+                assert stream.read(12) == b"<html><body>"
+        finally:
+            await store.close()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_referenced_blobs(self, temp_dir: Path) -> None:
+        """Test that cleanup only removes blobs no evidence references."""
+        store = EvidenceStore(temp_dir / "cache")
+        await store.init()
+        try:
+            evidence = await store.store(
+                url="https://example.com", content=b"referenced", content_type="text/plain", snippet="x"
+            )
+            orphan = store.blob_cache.put(b"unreferenced", "text/plain")
+
+            assert await store.cleanup_blobs(min_age_seconds=0) == 2  # blob + sidecar
+            assert await store.get_blob(evidence.evidence_id) == b"referenced"
+            assert not store.blob_cache.contains(orphan.hash)
+        finally:
+            await store.close()
@@ -0,0 +1,163 @@
+"""
+Tests for FMP client concurrent fetching and rate limiting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from er.data.base import RateLimiter
+from er.data.fmp_client import FMPClient
+from er.exceptions import DataFetchError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class FakeFMPClient(FMPClient):
+    """FMPClient with a canned `_fetch` that records concurrency."""
+
+    def __init__(self, fail_endpoints: set[str] | None = None, **kwargs: Any) -> None:
+        super().__init__(evidence_store=None, api_key="test-key", **kwargs)  # type: ignore[arg-type]
+        self.fail_endpoints = fail_endpoints or set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        source_tier: Any = None,
+    ) -> tuple[Any, Any]:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later endpoints finish first to shake out ordering bugs
+            await asyncio.sleep(0.02 / self.calls)
+        finally:
+            self.in_flight -= 1
+
+        if endpoint in self.fail_endpoints:
+            raise DataFetchError("boom", context={"endpoint": endpoint})
+
+        key = f"{endpoint}:{sorted((params or {}).items())}"
+        evidence = SimpleNamespace(evidence_id=f"ev_{key}")
+        if endpoint == "profile":
+            return [{"symbol": "TEST", "companyName": "Test Co"}], evidence
+        if endpoint in ("price-target-summary", "price-target-consensus"):
+            return {"endpoint": endpoint}, evidence
+        return [{"endpoint": endpoint, "params": key}], evidence
+
+
+def _strip_timestamp(context: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in context.items() if k != "fetched_at"}
+
+
+class TestFullContextConcurrency:
+    """Test concurrent get_full_context matches the sequential result."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_matches_sequential(self) -> None:
+        """Test that the context dict and evidence ordering are identical."""
+        sequential = await FakeFMPClient().get_full_context(
+            "test", include_transcripts=True, concurrent=False
+        )
+        concurrent = await FakeFMPClient().get_full_context(
+            "test", include_transcripts=True, concurrent=True
+        )
+
+        assert _strip_timestamp(concurrent) == _strip_timestamp(sequential)
+        assert list(concurrent.keys()) == list(sequential.keys())
+        assert concurrent["evidence_ids"] == sequential["evidence_ids"]
+        assert concurrent["profile"]["companyName"] == "Test Co"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_respected(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that in-flight HTTP requests never exceed max_concurrency."""
+        monkeypatch.setattr("er.data.fmp_client.FMP_CACHE_DIR", temp_dir)
+        counter = {"in_flight": 0, "max": 0}
+
+        class FakeResponse:
+            def raise_for_status(self) -> None:
+                return None
+
+            def json(self) -> list[dict[str, Any]]:
+                return []
+
+        class FakeHTTPClient:
+            async def get(self, url: str, params: dict[str, Any]) -> FakeResponse:
+                counter["in_flight"] += 1
+                counter["max"] = max(counter["max"], counter["in_flight"])
+                await asyncio.sleep(0.01)
+                counter["in_flight"] -= 1
+                return FakeResponse()
+
+        class FakeEvidenceStore:
+            async def store(self, **kwargs: Any) -> SimpleNamespace:
+                return SimpleNamespace(evidence_id=f"ev_{kwargs['url']}")
+
+        client = FMPClient(
+            evidence_store=FakeEvidenceStore(),  # type: ignore[arg-type]
+            api_key="test-key",
+            max_concurrency=3,
+            requests_per_minute=10_000,
+        )
+        client._client = FakeHTTPClient()  # type: ignore[assignment]
+
+        context = await client.get_full_context("test", concurrent=True)
+
+        assert 1 < counter["max"] <= 3
+        assert len(context["evidence_ids"]) == 18
+
+    @pytest.mark.asyncio
+    async def test_failed_sections_use_defaults(self) -> None:
+        """Test that failed sections fall back without breaking ordering."""
+        fail = {"profile", "price-target-summary", "ratios-ttm"}
+        sequential = await FakeFMPClient(fail_endpoints=fail).get_full_context(
+            "test", concurrent=False
+        )
+        concurrent = await FakeFMPClient(fail_endpoints=fail).get_full_context(
+            "test", concurrent=True
+        )
+
+        assert concurrent["profile"] == {}
+        assert concurrent["price_target_summary"] == {}
+        assert concurrent["evidence_ids"] == sequential["evidence_ids"]
+        assert not any("ratios-ttm" in ev_id for ev_id in concurrent["evidence_ids"])
+
+
+class TestRateLimiter:
+    """Test the token bucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_immediate(self) -> None:
+        """Test that requests within the burst do not wait."""
+        limiter = RateLimiter(rate=100, period=1.0, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+    @pytest.mark.asyncio
+    async def test_throttles_after_burst(self) -> None:
+        """Test that requests beyond the burst wait for refill."""
+        limiter = RateLimiter(rate=20, period=1.0, burst=1)
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        # Two refills at 20/sec -> at least ~0.1s
+        assert time.monotonic() - start >= 0.09
+
+    def test_invalid_rate_rejected(self) -> None:
+        """Test that non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
@@ -0,0 +1,191 @@
+"""Tests for the inverted index engine and persisted indexes."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from er.indexing.filing_index import FilingIndex, FilingType, build_filing_excerpts
+from er.indexing.inverted_index import InvertedIndex
+from er.indexing.transcript_index import TranscriptIndex
+from er.types import CompanyContext
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _random_corpus(seed: int, num_docs: int = 200) -> list[dict[str, int]]:
+    """Build a corpus with a skewed vocabulary so some terms are common."""
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(60)]
+    weights = [1.0 / (i + 1) for i in range(len(vocabulary))]
+    docs = []
+    for _ in range(num_docs):
+        terms = rng.choices(vocabulary, weights=weights, k=rng.randint(5, 40))
+        counts: dict[str, int] = {}
+        for term in terms:
+            counts[term] = counts.get(term, 0) + 1
+        docs.append(counts)
+    return docs
+
+
+def _build(docs: list[dict[str, int]]) -> InvertedIndex:
+    index = InvertedIndex()
+    for tf in docs:
+        index.add_document(tf, sum(tf.values()))
+    return index
+
+
+def _exhaustive(index: InvertedIndex, query: list[str], top_k: int) -> list[tuple[int, float]]:
+    scored = [(doc_id, index.score(query, doc_id)) for doc_id in range(index.num_docs)]
+    scored = [item for item in scored if item[1] > 0]
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:top_k]
+
+
+class TestInvertedIndex:
+    """Tests for InvertedIndex."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_maxscore_matches_exhaustive_ranking(self, seed: int) -> None:
+        """Test that pruned top-k equals scoring every document."""
+        index = _build(_random_corpus(seed))
+        rng = random.Random(seed + 100)
+
+        for _ in range(20):
+            query = rng.choices([f"term{i}" for i in range(70)], k=rng.randint(1, 6))
+            top_k = rng.choice([1, 3, 10])
+            results = index.search(query, top_k)
+            expected = _exhaustive(index, query, top_k)
+
+            assert [doc_id for doc_id, _ in results] == [doc_id for doc_id, _ in expected]
+            for (_, score), (_, expected_score) in zip(results, expected, strict=True):
+                assert score == pytest.approx(expected_score)
+
+    def test_doc_filter(self) -> None:
+        """Test that filtered documents never appear in results."""
+        index = _build(_random_corpus(7))
+        results = index.search(["term0", "term5"], 10, doc_filter=lambda d: d % 2 == 0)
+
+        assert results
+        assert all(doc_id % 2 == 0 for doc_id, _ in results)
+
+    def test_incremental_statistics(self) -> None:
+        """Test that IDF and average length update as documents are added."""
+        index = InvertedIndex()
+        index.add_document({"revenue": 2}, 4)
+        idf_before = index.idf("revenue")
+        index.add_document({"margin": 1}, 2)
+
+        assert index.doc_frequency("revenue") == 1
+        assert index.avg_doc_length == pytest.approx(3.0)
+        assert index.idf("revenue") > idf_before
+        assert index.idf("missing") == 0.0
+
+    def test_round_trip(self) -> None:
+        """Test serialization preserves scores and term frequencies."""
+        docs = _random_corpus(11, num_docs=30)
+        index = _build(docs)
+        restored = InvertedIndex.from_dict(index.to_dict())
+
+        assert restored.all_term_frequencies() == docs
+        assert restored.search(["term1", "term2"], 5) == index.search(["term1", "term2"], 5)
+
+    def test_rejects_unknown_version(self) -> None:
+        """Test that incompatible payloads are rejected."""
+        data = InvertedIndex().to_dict()
+        data["version"] = -1
+        with pytest.raises(ValueError):
+            InvertedIndex.from_dict(data)
+
+
+class TestPersistedIndexes:
+    """Tests for on-disk TranscriptIndex and FilingIndex."""
+
+    @pytest.fixture
+    def company_context(self) -> CompanyContext:
+        """Create a company context with one transcript."""
+        return CompanyContext(
+            symbol="AAPL",
+            fetched_at=datetime(2024, 1, 15, 10, 0),
+            transcripts=[
+                {
+                    "quarter": 4,
+                    "year": 2024,
+                    "evidence_id": "ev_transcript",
+                    "content": "Services revenue grew strongly. Gross margin expanded on mix. " * 40,
+                }
+            ],
+        )
+
+    def test_transcript_index_reloads(self, company_context: CompanyContext, temp_dir: Path) -> None:
+        """Test that a persisted transcript index is reused with identical results."""
+        path = temp_dir / "transcripts.json"
+        first = TranscriptIndex(chunk_size=200, chunk_overlap=50, index_path=path)
+        first.build_from_company_context(company_context)
+        assert path.exists()
+        assert first.chunks
+
+        second = TranscriptIndex(chunk_size=200, chunk_overlap=50, index_path=path)
+        second.build_from_company_context(company_context)
+
+        assert [c.excerpt_id for c in second.chunks] == [c.excerpt_id for c in first.chunks]
+        assert [e.excerpt_id for e in second.retrieve_excerpts("gross margin")] == [
+            e.excerpt_id for e in first.retrieve_excerpts("gross margin")
+        ]
+
+    def test_filing_index_dedupes_and_reloads(self, temp_dir: Path) -> None:
+        """Test that re-adding a filing is a no-op and the index survives reopen."""
+        content = "Item 1A. Risk Factors\n\nSupply chain concentration is a key risk. " * 20
+        path = temp_dir / "filings.json"
+
+        index = FilingIndex(chunk_size=300, chunk_overlap=50, index_path=path)
+        chunks = index.add_filing(content, FilingType.FORM_10K, "2024-11-01", "FY2024")
+        again = index.add_filing(content, FilingType.FORM_10K, "2024-11-01", "FY2024")
+        assert [c.excerpt_id for c in again] == [c.excerpt_id for c in chunks]
+        assert len(index.chunks) == len(chunks)
+        index.save()
+
+        reopened = FilingIndex(chunk_size=300, chunk_overlap=50, index_path=path)
+        assert len(reopened.chunks) == len(chunks)
+        assert reopened.chunks[0].filing_type == FilingType.FORM_10K
+        results = reopened.retrieve_excerpts("supply chain", filing_type=FilingType.FORM_10K)
+        assert results
+        assert results[0].excerpt_id in {c.excerpt_id for c in chunks}
+
+    def test_reloaded_filing_cites_new_evidence(self, temp_dir: Path) -> None:
+        """Test that a filing reused from a saved index cites the current run's evidence."""
+        content = "Item 7. Management's Discussion and Analysis\n\nMargins improved. " * 20
+        path = temp_dir / "filings.json"
+
+        index = FilingIndex(chunk_size=300, chunk_overlap=50, index_path=path)
+        old = index.add_filing(content, "10-K", "2024-11-01", "FY2024", evidence_id="ev_old")
+        old_excerpt_ids = {c.excerpt_id for c in old}
+        index.save()
+
+        reopened = FilingIndex(chunk_size=300, chunk_overlap=50, index_path=path)
+        new = reopened.add_filing(content, "10-K", "2024-11-01", "FY2024", evidence_id="ev_new")
+
+        assert len(new) == len(old)
+        assert {c.source_evidence_id for c in new} == {"ev_new"}
+        assert not old_excerpt_ids & {c.excerpt_id for c in new}
+        results = reopened.retrieve_excerpts("margins improved")
+        assert results
+        assert {e.source_evidence_id for e in results} == {"ev_new"}
+
+        # Re-adding within the same run keeps the IDs already handed out
+        again = reopened.add_filing(content, "10-K", "2024-11-01", "FY2024", evidence_id="ev_new")
+        assert [c.excerpt_id for c in again] == [c.excerpt_id for c in new]
+
+    def test_build_filing_excerpts_persists(self, temp_dir: Path) -> None:
+        """Test that the convenience builder reuses a persisted index."""
+        path = temp_dir / "filings.json"
+        filings = [{"content": "Revenue increased due to services. " * 30, "type": "10-Q"}]
+
+        first = build_filing_excerpts(filings, index_path=path)
+        second = build_filing_excerpts(filings, index_path=path)
+
+        assert [e.excerpt_id for e in second] == [e.excerpt_id for e in first]
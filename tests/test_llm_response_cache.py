@@ -0,0 +1,242 @@
+"""
+Tests for the LLM response cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from er.llm.base import LLMCacheMissError, LLMRequest, LLMResponse, ToolCall
+from er.llm.client_pool import ProviderClientPool
+from er.llm.gemini_client import GeminiClient
+from er.llm.openai_client import OpenAIClient
+from er.llm.response_cache import (
+    CACHE_MODE_REPLAY,
+    CachingClient,
+    LLMResponseCache,
+)
+from er.llm.router import LLMRouter
+from er.retrieval.search_provider import GeminiWebSearchProvider, OpenAIWebSearchProvider
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from er.config import Settings
+
+
+class FakeProviderClient:
+    """Provider client that counts the calls reaching it."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def provider(self) -> str:
+        return "openai"
+
+    def supports_model(self, model: str) -> bool:
+        return True
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return LLMResponse(
+            content=f"answer {self.calls}",
+            model=request.model,
+            provider="openai",
+            input_tokens=100,
+            output_tokens=20,
+            tool_calls=[ToolCall(id="t1", name="lookup", arguments={"q": "x"})],
+        )
+
+    async def complete_with_reasoning(
+        self, request: LLMRequest, reasoning_effort: str = "medium"
+    ) -> LLMResponse:
+        return await self.complete(request)
+
+    async def close(self) -> None:
+        pass
+
+
+def _request(content: str = "Summarize the 10-K", temperature: float = 0.7) -> LLMRequest:
+    return LLMRequest(
+        messages=[{"role": "user", "content": content}],
+        model="gpt-5.2",
+        temperature=temperature,
+    )
+
+
+class TestLLMResponseCache:
+    """Test record/replay through CachingClient."""
+
+    @pytest.mark.asyncio
+    async def test_read_through_records_and_replays(self, temp_dir: Path) -> None:
+        """Test that a repeated call is served from the cache without billing tokens."""
+        provider = FakeProviderClient()
+        cache = LLMResponseCache(temp_dir)
+        client = CachingClient(provider, cache)
+        try:
+            first = await client.complete(_request())
+            second = await client.complete(_request())
+
+            assert provider.calls == 1
+            assert second.content == first.content
+            assert second.tool_calls == first.tool_calls
+            assert (second.input_tokens, second.output_tokens) == (0, 0)
+            assert second.metadata["cache_hit"] is True
+            assert second.metadata["cached_input_tokens"] == 100
+            assert client.supports_model("gpt-5.2")
+
+            # Anything that changes the output is part of the key
+            await client.complete(_request(temperature=0.0))
+            await client.complete(_request(content="Summarize the 10-Q"))
+            await client.complete_with_reasoning(_request(), reasoning_effort="high")
+            await client.complete_with_reasoning(_request(), reasoning_effort="high")
+            assert provider.calls == 4
+            assert cache.stats()["hits"] == 2
+        finally:
+            cache.close()
+
+    @pytest.mark.asyncio
+    async def test_replay_mode_and_persistence(self, temp_dir: Path) -> None:
+        """Test that replay serves recorded responses and fails on new requests."""
+        cache = LLMResponseCache(temp_dir)
+        await CachingClient(FakeProviderClient(), cache).complete(_request())
+        cache.close()
+
+        provider = FakeProviderClient()
+        replay = LLMResponseCache(temp_dir, mode=CACHE_MODE_REPLAY)
+        client = CachingClient(provider, replay)
+        try:
+            assert (await client.complete(_request())).content == "answer 1"
+            with pytest.raises(LLMCacheMissError):
+                await client.complete(_request(content="new prompt"))
+            assert provider.calls == 0
+        finally:
+            replay.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_request(self, temp_dir: Path) -> None:
+        """Test that identical in-flight calls are coalesced."""
+        provider = FakeProviderClient()
+        cache = LLMResponseCache(temp_dir)
+        client = CachingClient(provider, cache)
+        try:
+            responses = await asyncio.gather(*(client.complete(_request()) for _ in range(3)))
+            assert provider.calls == 1
+            assert {r.content for r in responses} == {"answer 1"}
+        finally:
+            cache.close()
+
+    @pytest.mark.asyncio
+    async def test_size_and_age_eviction(self, temp_dir: Path) -> None:
+        """Test LRU eviction above the size limit and expiry by age."""
+        provider = FakeProviderClient()
+        cache = LLMResponseCache(temp_dir, max_size_bytes=1)
+        client = CachingClient(provider, cache)
+        try:
+            await client.complete(_request("a"))
+            await client.complete(_request("b"))
+            # Only the newest entry survives a limit smaller than two entries
+            assert cache.stats()["entries"] == 1
+            await client.complete(_request("b"))
+            assert provider.calls == 2
+        finally:
+            cache.close()
+
+        aged = LLMResponseCache(temp_dir, max_age_seconds=60)
+        try:
+            aged._get_conn().execute("UPDATE responses SET created_at = ?", (time.time() - 3600,))
+            aged._get_conn().commit()
+            assert aged.prune() == 1
+            assert aged.stats()["entries"] == 0
+        finally:
+            aged.close()
+
+
+SEARCH_RESULTS_JSON = (
+    '{"results": [{"title": "Q3 results", "url": "https://example.com/q3",'
+    ' "snippet": "Revenue grew", "source": "example.com"}]}'
+)
+
+
+class TestCachedWebSearch:
+    """Test web search through pooled clients with the response cache on."""
+
+    @pytest.mark.asyncio
+    async def test_openai_web_search_with_cache(
+        self, mock_settings: Settings, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the cached OpenAI client passes the provider check and replays."""
+        calls: list[str] = []
+
+        async def fake_web_search(
+            _self: OpenAIClient, request: LLMRequest, reasoning_effort: str = "high"
+        ) -> LLMResponse:
+            calls.append(reasoning_effort)
+            return LLMResponse(
+                content=SEARCH_RESULTS_JSON,
+                model=request.model,
+                provider="openai",
+                input_tokens=50,
+                output_tokens=40,
+            )
+
+        monkeypatch.setattr(OpenAIClient, "complete_with_web_search", fake_web_search)
+        pool = ProviderClientPool(mock_settings, response_cache=LLMResponseCache(temp_dir))
+        router = LLMRouter(settings=mock_settings, client_pool=pool)
+        provider = OpenAIWebSearchProvider(router)
+        try:
+            assert isinstance(pool.openai(), CachingClient)
+            assert isinstance(pool.openai(), OpenAIClient)
+
+            first = await provider.search("ACME earnings")
+            second = await provider.search("ACME earnings")
+
+            assert [r.url for r in first] == ["https://example.com/q3"]
+            assert second == first
+            assert calls == ["low"]
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_gemini_web_search_with_cache(
+        self, mock_settings: Settings, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the cached Gemini client passes the provider check and replays."""
+        calls: list[bool] = []
+
+        async def fake_grounding(
+            _self: GeminiClient, request: LLMRequest, enable_google_search: bool = True
+        ) -> LLMResponse:
+            calls.append(enable_google_search)
+            return LLMResponse(
+                content=SEARCH_RESULTS_JSON,
+                model=request.model,
+                provider="google",
+                input_tokens=50,
+                output_tokens=40,
+            )
+
+        monkeypatch.setattr(GeminiClient, "complete_with_grounding", fake_grounding)
+        cache = LLMResponseCache(temp_dir)
+        client = CachingClient(GeminiClient(api_key="test-gemini-key"), cache)
+        router = LLMRouter(settings=mock_settings)
+        monkeypatch.setattr(
+            router, "get_client_and_model", lambda *_: (client, "gemini-2.5-flash")
+        )
+        provider = GeminiWebSearchProvider(router)
+        try:
+            first = await provider.search("ACME earnings")
+            second = await provider.search("ACME earnings")
+
+            assert [r.url for r in first] == ["https://example.com/q3"]
+            assert second == first
+            assert calls == [True]
+        finally:
+            await client.close()
+            cache.close()
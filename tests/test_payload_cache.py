@@ -0,0 +1,210 @@
+"""
+Tests for the dashboard's run file cache and ETag/gzip negotiation.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from er.checkpoints import write_checkpoint
+from er.payload_cache import (
+    GZIP_MIN_BYTES,
+    FilePayloadCache,
+    accepts_gzip,
+    etag_matches,
+    negotiate_json,
+    run_dir_etag,
+)
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def _touch(path: Path, mtime_ns: int) -> None:
+    """Set a file's mtime explicitly (filesystem timestamps can be coarse)."""
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestFilePayloadCache:
+    """Test mtime/size validation and eviction."""
+
+    def test_reuses_entry_until_file_changes(self, temp_dir: Path) -> None:
+        """Test that an unchanged file is served from cache and a rewrite is reloaded."""
+        path = temp_dir / "manifest.json"
+        path.write_text(json.dumps({"status": "running"}))
+        _touch(path, 1_000_000_000)
+        cache = FilePayloadCache()
+
+        first = cache.get(path)
+        assert first is not None
+        assert first.parsed() == {"status": "running"}
+        assert cache.get(path) is first
+
+        # Same size, new mtime
+        path.write_text(json.dumps({"status": "errored"}))
+        _touch(path, 2_000_000_000)
+        second = cache.get(path)
+        assert second is not first
+        assert second.parsed() == {"status": "errored"}
+        assert second.etag != first.etag
+
+        # Same mtime, new size
+        path.write_text(json.dumps({"status": "complete", "ok": True}))
+        _touch(path, 2_000_000_000)
+        third = cache.get(path)
+        assert third is not second
+        assert third.parsed() == {"status": "complete", "ok": True}
+
+    def test_missing_file_is_dropped(self, temp_dir: Path) -> None:
+        """Test that a deleted file returns None and leaves the cache."""
+        path = temp_dir / "stage1_company_context.json"
+        path.write_text("{}")
+        cache = FilePayloadCache()
+        assert cache.get(path) is not None
+
+        path.unlink()
+        assert cache.get(path) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, temp_dir: Path) -> None:
+        """Test eviction by entry count and by total bytes."""
+        paths = []
+        for name in ("a", "b", "c"):
+            path = temp_dir / f"{name}.json"
+            path.write_text(json.dumps({"name": name}))
+            paths.append(path)
+
+        cache = FilePayloadCache(max_entries=2)
+        first = cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])  # a is now most recent
+        cache.get(paths[2])  # evicts b
+        assert len(cache) == 2
+        assert cache.get(paths[0]) is first
+
+        size = paths[0].stat().st_size
+        cache = FilePayloadCache(max_bytes=2 * size)
+        for path in paths:
+            cache.get(path)
+        assert len(cache) == 2
+
+    def test_checkpoint_served_as_json(self, temp_dir: Path) -> None:
+        """Test that a checkpoint is decoded and re-serialized as JSON."""
+        payload = {"investment_view": "BUY", "conviction": "high", "confident": True}
+        path = write_checkpoint(temp_dir, "stage6_final_report", payload)
+
+        entry = FilePayloadCache().get(path)
+        assert entry is not None
+        assert entry.checkpoint
+        assert entry.parsed() == payload
+        assert json.loads(entry.json_bytes()) == payload
+        assert json.loads(gzip.decompress(entry.gzipped())) == payload
+
+
+class TestRunDirEtag:
+    """Test the whole-run ETag."""
+
+    def test_changes_when_any_file_changes(self, temp_dir: Path) -> None:
+        """Test that the ETag tracks file mtimes, sizes and additions."""
+        (temp_dir / "manifest.json").write_text("{}")
+        _touch(temp_dir / "manifest.json", 1_000_000_000)
+        etag = run_dir_etag(temp_dir)
+        assert run_dir_etag(temp_dir) == etag
+
+        _touch(temp_dir / "manifest.json", 2_000_000_000)
+        touched = run_dir_etag(temp_dir)
+        assert touched != etag
+
+        (temp_dir / "report.md").write_text("# Report")
+        assert run_dir_etag(temp_dir) != touched
+
+
+class TestNegotiation:
+    """Test If-None-Match and Accept-Encoding handling."""
+
+    ETAG = '"5f3a-2c"'
+
+    def test_etag_matches(self) -> None:
+        """Test strong, weak, listed and wildcard If-None-Match values."""
+        assert etag_matches(self.ETAG, self.ETAG)
+        assert etag_matches(f"W/{self.ETAG}", self.ETAG)
+        assert etag_matches(f'"other", {self.ETAG}', self.ETAG)
+        assert etag_matches("*", self.ETAG)
+        assert not etag_matches('"other"', self.ETAG)
+        assert not etag_matches(None, self.ETAG)
+        assert not etag_matches("", self.ETAG)
+
+    def test_matching_if_none_match_is_304(self) -> None:
+        """Test that a matching ETag returns 304 with no body."""
+        body = b'{"status": "complete"}'
+        status, content, headers = negotiate_json(self.ETAG, body, if_none_match=self.ETAG)
+        assert status == 304
+        assert content == b""
+        assert headers["ETag"] == self.ETAG
+        assert "Content-Encoding" not in headers
+
+        status, content, headers = negotiate_json(self.ETAG, body, if_none_match='"stale"')
+        assert status == 200
+        assert content == body
+        assert headers["ETag"] == self.ETAG
+        assert headers["Cache-Control"] == "no-cache"
+
+    def test_gzip_negotiation(self) -> None:
+        """Test that large bodies are gzipped only for clients that accept it."""
+        body = json.dumps({"rows": list(range(GZIP_MIN_BYTES))}).encode()
+
+        status, content, headers = negotiate_json(self.ETAG, body, accept_encoding="br, gzip;q=0.8")
+        assert status == 200
+        assert headers["Content-Encoding"] == "gzip"
+        assert headers["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(content) == body
+
+        for accept_encoding in (None, "identity", "br", "gzip;q=0"):
+            _, content, headers = negotiate_json(self.ETAG, body, accept_encoding=accept_encoding)
+            assert content == body
+            assert "Content-Encoding" not in headers
+
+        # Small bodies are not worth compressing
+        _, content, headers = negotiate_json(self.ETAG, b"{}", accept_encoding="gzip")
+        assert content == b"{}"
+        assert "Content-Encoding" not in headers
+
+    def test_precompressed_body_used_only_when_gzipping(self) -> None:
+        """Test that the gzipped callback is called only when gzip is negotiated."""
+        body = b"x" * GZIP_MIN_BYTES
+        calls: list[bool] = []
+
+        def precompressed() -> bytes:
+            calls.append(True)
+            return b"cached-gzip"
+
+        _, content, _ = negotiate_json(self.ETAG, body, gzipped=precompressed)
+        assert content == body
+        assert not calls
+
+        _, content, _ = negotiate_json(
+            self.ETAG, body, accept_encoding="gzip", gzipped=precompressed
+        )
+        assert content == b"cached-gzip"
+        assert calls == [True]
+
+    def test_accepts_gzip(self) -> None:
+        """Test Accept-Encoding parsing, including q-values and wildcards."""
+        assert accepts_gzip("gzip")
+        assert accepts_gzip("deflate, GZIP")
+        assert accepts_gzip("gzip; q=0.5")
+        assert accepts_gzip("*")
+        assert not accepts_gzip("gzip;q=0")
+        assert not accepts_gzip("gzip;q=0.0")
+        assert not accepts_gzip("br")
+        assert not accepts_gzip(None)
@@ -0,0 +1,186 @@
+"""
+Tests for budget-aware prompt context packing.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from er.types import CompanyContext, utc_now
+from er.utils.prompt_packing import (
+    OMITTED,
+    PromptSection,
+    SectionVariant,
+    pack_sections,
+    render_fragment,
+    render_sections,
+)
+
+
+def _variant(tokens: int, value: float) -> SectionVariant:
+    return SectionVariant(fragment=render_fragment("k", tokens), value=value, tokens=tokens)
+
+
+@pytest.fixture
+def large_context() -> CompanyContext:
+    """Context with long transcripts and every section populated."""
+    return CompanyContext(
+        symbol="GOOG",
+        fetched_at=utc_now(),
+        profile={"companyName": "Alphabet Inc.", "description": "Search and cloud"},
+        income_statement_annual=[{"date": f"202{i}", "revenue": i * 1e9} for i in range(5)],
+        income_statement_quarterly=[{"date": f"q{i}", "revenue": i} for i in range(8)],
+        balance_sheet_annual=[{"date": f"202{i}", "totalAssets": i} for i in range(3)],
+        cash_flow_annual=[{"date": f"202{i}", "freeCashFlow": i} for i in range(3)],
+        transcripts=[
+            {"quarter": q, "year": 2025, "text": f"Q{q} remarks. " * 2000} for q in range(1, 5)
+        ],
+        news=[{"title": f"Headline {i}", "publishedDate": "2025-10-01"} for i in range(15)],
+        analyst_grades=[{"gradingCompany": f"Bank {i}", "newGrade": "Buy"} for i in range(10)],
+        price_target_consensus={"targetMedian": 210, "targetConsensus": 205},
+        quant_metrics={"roic": 0.31, "red_flags": []},
+    )
+
+
+class TestPackSections:
+    """Test the multiple-choice knapsack."""
+
+    def test_upgrades_by_value_per_token(self) -> None:
+        """Test that cheap valuable upgrades win and required floors hold."""
+        sections = [
+            PromptSection("profile", [_variant(50, 10.0)], required=True),
+            PromptSection(
+                "transcripts",
+                [_variant(900, 3.0), _variant(200, 1.5), _variant(20, 0.5)],
+                required=True,
+            ),
+            PromptSection("news", [_variant(100, 2.0), _variant(30, 1.0)], required=True),
+            PromptSection("grades", [_variant(40, 1.0)]),
+        ]
+
+        assert pack_sections(sections, 10_000) == [0, 0, 0, 0]
+        assert pack_sections(sections, 250) == [0, 2, 0, 0]
+        assert pack_sections(sections, 100) == [0, 2, 1, OMITTED]
+        # Required sections are kept even over budget
+        assert pack_sections(sections, 10) == [0, 2, 1, OMITTED]
+
+    def test_render_matches_json_dumps(self) -> None:
+        """Test that joined fragments equal json.dumps(indent=2) of the dict."""
+        payload = {"a": {"b": [1, {"c": "x\ny"}]}, "d": [], "e": None}
+        text = render_sections([render_fragment(k, v) for k, v in payload.items()])
+        assert text == json.dumps(payload, indent=2)
+        assert render_sections([]) == json.dumps({}, indent=2)
+
+
+class TestCompanyContextViews:
+    """Test cached views and budgeted serialization."""
+
+    def test_views_match_previous_output(self, large_context: CompanyContext) -> None:
+        """Test that cached views are byte-identical to serializing the payload."""
+        payload = large_context.to_json_payload()
+        assert large_context.to_prompt_string() == json.dumps(payload, indent=2, default=str)
+        assert large_context.for_deep_research() == large_context.to_prompt_string()
+
+        discovery = json.loads(large_context.for_discovery())
+        first = discovery["earnings_transcripts"][0]["full_text"]
+        assert first.endswith("\n[...transcript continues...]")
+        assert len(first) == 2000 + len("\n[...transcript continues...]")
+        assert discovery["recent_news"] == payload["recent_news"]
+
+        judge = json.loads(large_context.for_judge())
+        assert judge["price_target_consensus"] == {"targetMedian": 210, "targetConsensus": 205}
+        assert judge["quant_metrics"] == payload["quant_metrics"]
+
+    def test_sections_render_once(
+        self, large_context: CompanyContext, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that repeated views and budgets reuse cached renderings."""
+        large_context.for_discovery()
+        large_context.to_prompt_string(max_tokens=5000)
+
+        calls = 0
+        real_dumps = json.dumps
+
+        def counting_dumps(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return real_dumps(*args, **kwargs)
+
+        monkeypatch.setattr(json, "dumps", counting_dumps)
+        large_context.to_prompt_string()
+        large_context.for_discovery()
+        large_context.for_deep_research()
+        large_context.to_prompt_string(max_tokens=3000)
+        assert calls == 0
+
+        # Reassigning a field invalidates the cache
+        monkeypatch.setattr(json, "dumps", real_dumps)
+        large_context.news = []
+        assert "recent_news" not in json.loads(large_context.to_prompt_string())
+
+    def test_budget_packing_priorities(self, large_context: CompanyContext) -> None:
+        """Test that transcripts shrink first and critical sections survive."""
+        full = large_context.to_prompt_string()
+
+        # Room for everything except full transcript text
+        roomy = json.loads(large_context.to_prompt_string(max_tokens=len(full) // 8))
+        assert len(roomy["income_statement_quarterly"]) == 8
+        assert len(roomy["recent_news"]) == 15
+        assert len(roomy["earnings_transcripts"][0]["full_text"]) < 2100
+
+        tight = large_context.to_prompt_string(max_tokens=1200)
+        packed = json.loads(tight)
+        assert len(tight) <= 1200 * 4
+        assert packed["profile"]["company_name"] == "Alphabet Inc."
+        assert packed["quant_metrics"] == {"roic": 0.31, "red_flags": []}
+        assert packed["earnings_transcripts"][0]["full_text"].startswith("[TRUNCATED")
+        assert len(packed["income_statement_annual"]) >= 2
+
+    def test_budget_cut_order(self, large_context: CompanyContext) -> None:
+        """Test that a tight budget cuts sections in the documented order.
+
+        Transcript text goes first, then older quarters, news beyond the top
+        5, analyst grades and older annual data; a budget one token short of
+        restoring the quarters keeps every higher-priority section whole.
+        """
+        sections = {section.key: section for section in large_context.prompt_sections()}
+
+        def extra(key: str) -> int:
+            variants = sections[key].variants
+            return variants[0].tokens - (0 if key == "recent_analyst_grades" else variants[-1].tokens)
+
+        floor = sum(
+            section.variants[-1].tokens
+            for key, section in sections.items()
+            if key != "recent_analyst_grades"
+        )
+        kept = [
+            "income_statement_annual",
+            "balance_sheet_annual",
+            "cash_flow_annual",
+            "recent_analyst_grades",
+            "recent_news",
+        ]
+        budget = floor + sum(extra(key) for key in kept) + extra("income_statement_quarterly") - 1
+
+        packed = json.loads(large_context.to_prompt_string(max_tokens=budget))
+
+        assert len(packed["income_statement_annual"]) == 5
+        assert len(packed["balance_sheet_annual"]) == 3
+        assert len(packed["cash_flow_annual"]) == 3
+        assert len(packed["recent_analyst_grades"]) == 10
+        assert len(packed["recent_news"]) == 15
+        assert len(packed["income_statement_quarterly"]) == 4
+        assert packed["earnings_transcripts"][0]["full_text"].startswith("[TRUNCATED")
+
+        # One token short of the grades: their budget goes to the news,
+        # which still outranks the quarters
+        budget = floor + sum(extra(key) for key in kept[:4]) - 1
+        packed = json.loads(large_context.to_prompt_string(max_tokens=budget))
+
+        assert "recent_analyst_grades" not in packed
+        assert len(packed["income_statement_annual"]) == 5
+        assert len(packed["recent_news"]) == 15
+        assert len(packed["income_statement_quarterly"]) == 4
@@ -0,0 +1,110 @@
+"""
+Tests for the run catalog.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import orjson
+import pytest
+
+from er.manifest import RunManifest
+from er.run_catalog import RunCatalog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _make_run(output_dir: Path, name: str, ticker: str, hours_ago: int, complete: bool = True) -> Path:
+    """Create a run directory with a saved manifest."""
+    run_dir = output_dir / name
+    manifest = RunManifest(run_dir, name, ticker)
+    manifest.started_at = manifest.started_at - timedelta(hours=hours_ago)
+    if complete:
+        run_dir.mkdir(parents=True, exist_ok=True)
+        (run_dir / "stage6_final_report.json").write_bytes(
+            orjson.dumps({"investment_view": "BUY", "conviction": "high", "overall_confidence": 0.7})
+        )
+        manifest.complete(success=True)
+    else:
+        manifest.save()
+    return run_dir
+
+
+class TestRunCatalog:
+    """Test RunCatalog indexing and queries."""
+
+    def test_manifest_save_updates_catalog(self, temp_dir: Path) -> None:
+        """Test that saving manifests keeps the catalog current."""
+        _make_run(temp_dir, "run_a", "AAPL", hours_ago=3)
+        _make_run(temp_dir, "run_b", "msft", hours_ago=1, complete=False)
+
+        with RunCatalog(temp_dir) as catalog:
+            runs = catalog.list_runs()
+
+        assert [r["run_dir"] for r in runs] == ["run_b", "run_a"]
+        assert runs[0]["ticker"] == "MSFT"
+        assert runs[0]["status"] == "running"
+        assert runs[0]["verdict"] == {}
+        assert runs[1]["verdict"] == {"investment_view": "BUY", "conviction": "high", "confidence": 0.7}
+        assert runs[1]["duration"] > 3 * 3600 - 60
+        assert runs[1]["manifest"]["run_id"] == "run_a"
+
+    def test_filters_pagination_and_sort(self, temp_dir: Path) -> None:
+        """Test ticker/status/date filters, offsets and sort order."""
+        for i in range(5):
+            _make_run(temp_dir, f"run_{i}", "AAPL" if i % 2 else "GOOGL", hours_ago=i, complete=i != 4)
+
+        with RunCatalog(temp_dir) as catalog:
+            assert catalog.count() == 5
+            assert [r["run_dir"] for r in catalog.list_runs(ticker="aapl")] == ["run_1", "run_3"]
+            assert [r["run_dir"] for r in catalog.list_runs(status="running")] == ["run_4"]
+            page = catalog.list_runs(limit=2, offset=2, descending=False)
+            assert [r["run_dir"] for r in page] == ["run_2", "run_1"]
+
+            newest = catalog.list_runs(limit=1)[0]
+            since = newest["started_at"]
+            assert [r["run_dir"] for r in catalog.list_runs(since=since)] == ["run_0"]
+            assert catalog.count(until=since) == 4
+            with pytest.raises(ValueError):
+                catalog.list_runs(sort="manifest_json; DROP TABLE runs")
+
+    def test_backfill_marker_survives_manifest_saves(self, temp_dir: Path) -> None:
+        """Test that a catalog created by a manifest save still needs a backfill."""
+        # A run from before the catalog existed: manifest.json only
+        old_dir = temp_dir / "run_old"
+        old_dir.mkdir()
+        old_manifest = RunManifest(old_dir, "run_old", "AAPL")
+        (old_dir / "manifest.json").write_bytes(orjson.dumps(old_manifest.to_dict()))
+        _make_run(temp_dir, "run_new", "MSFT", hours_ago=0, complete=False)
+
+        with RunCatalog(temp_dir) as catalog:
+            assert catalog.db_path.exists()
+            assert catalog.count() == 1
+            assert not catalog.is_backfilled()
+
+            assert catalog.rebuild() == 2
+            assert catalog.is_backfilled()
+
+        _make_run(temp_dir, "run_next", "GOOGL", hours_ago=0, complete=False)
+        with RunCatalog(temp_dir) as catalog:
+            assert catalog.is_backfilled()
+            assert catalog.count() == 3
+
+    def test_rebuild_indexes_existing_directories(self, temp_dir: Path) -> None:
+        """Test that rebuild picks up uncatalogued runs and drops deleted ones."""
+        run_dir = _make_run(temp_dir, "run_old", "NVDA", hours_ago=2)
+        (temp_dir / "runs.db").unlink()
+        for suffix in ("-wal", "-shm"):
+            (temp_dir / f"runs.db{suffix}").unlink(missing_ok=True)
+        (temp_dir / "not_a_run").mkdir()
+
+        with RunCatalog(temp_dir) as catalog:
+            assert catalog.rebuild() == 1
+            assert catalog.list_runs()[0]["verdict"]["investment_view"] == "BUY"
+
+            (run_dir / "manifest.json").unlink()
+            assert catalog.rebuild() == 0
+            assert catalog.count() == 0
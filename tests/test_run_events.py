@@ -0,0 +1,126 @@
+"""
+Tests for the run event broker behind the dashboard's SSE stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from er.run_events import AgentEvent, RunEventBroker
+
+
+def _event(event_type: str = "stage_update", stage: float = 1.0, **data: object) -> AgentEvent:
+    """Create an event of the given type."""
+    return AgentEvent(
+        timestamp="2025-10-01T00:00:00+00:00",
+        type=event_type,
+        event_type=event_type,
+        agent_name="Pipeline",
+        stage=stage,
+        data=dict(data),
+    )
+
+
+class TestRunEventBroker:
+    """Test fan-out, replay and backpressure."""
+
+    def test_fan_out_serializes_once(self) -> None:
+        """Test that every subscriber receives the same serialized frame."""
+        broker = RunEventBroker()
+        first = broker.subscribe()
+        second = broker.subscribe()
+
+        published = broker.publish(_event(message="hello"))
+
+        assert published.event_id == 1
+        assert published.frame.startswith("id: 1\ndata: ")
+        assert json.loads(published.frame.split("data: ", 1)[1])["data"] == {"message": "hello"}
+        for subscriber in (first, second):
+            assert subscriber.wakeup.is_set()
+            drained = subscriber.drain()
+            assert [p.frame for p in drained] == [published.frame]
+            assert drained[0] is published
+            assert not subscriber.wakeup.is_set()
+
+        broker.unsubscribe(second)
+        broker.publish(_event())
+        assert len(first.pending) == 1
+        assert not second.pending
+
+    def test_replay_after_last_event_id(self) -> None:
+        """Test that a reconnect replays only events after Last-Event-ID."""
+        broker = RunEventBroker(replay_size=4)
+        for stage in range(1, 7):
+            broker.publish(_event(stage=stage))
+
+        # The ring buffer keeps the last 4 events (ids 3-6)
+        assert [p.event_id for p in broker.subscribe().drain()] == [3, 4, 5, 6]
+        assert [p.event_id for p in broker.subscribe(last_event_id=4).drain()] == [5, 6]
+
+        caught_up = broker.subscribe(last_event_id=6)
+        assert not caught_up.pending
+        assert not caught_up.wakeup.is_set()
+
+        broker.publish(_event(stage=7))
+        assert [p.event_id for p in caught_up.drain()] == [7]
+
+    def test_full_subscriber_drops_progress_events(self) -> None:
+        """Test that a slow client loses progress events but never lifecycle ones."""
+        broker = RunEventBroker(subscriber_backlog=3)
+        slow = broker.subscribe()
+
+        broker.publish(_event("run_started", stage=0))
+        broker.publish(_event("stage_update", stage=1))
+        broker.publish(_event("stage_update", stage=2))
+        # Full: the oldest queued progress event makes room
+        broker.publish(_event("stage_update", stage=3))
+        assert [(p.event.type, p.event.stage) for p in slow.pending] == [
+            ("run_started", 0.0),
+            ("stage_update", 2.0),
+            ("stage_update", 3.0),
+        ]
+        assert slow.dropped == 1
+
+        broker.publish(_event("run_complete", stage=6))
+        assert [p.event.type for p in slow.pending] == ["run_started", "stage_update", "run_complete"]
+        assert slow.dropped == 2
+
+    def test_full_subscriber_of_lifecycle_events_drops_new_progress(self) -> None:
+        """Test that a new progress event is dropped when only lifecycle events are queued."""
+        broker = RunEventBroker(subscriber_backlog=2)
+        slow = broker.subscribe()
+        broker.publish(_event("run_started"))
+        broker.publish(_event("run_paused"))
+
+        broker.publish(_event("stage_update"))
+        assert [p.event.type for p in slow.pending] == ["run_started", "run_paused"]
+        assert slow.dropped == 1
+
+        # Lifecycle events are queued even past the backlog
+        broker.publish(_event("run_error"))
+        assert [p.event.type for p in slow.pending] == ["run_started", "run_paused", "run_error"]
+        assert broker.finished()
+
+        # A new client replays the whole buffer, past the backlog limit
+        assert len(broker.subscribe().drain()) == 4
+
+    @pytest.mark.asyncio
+    async def test_publish_wakes_waiting_subscriber(self) -> None:
+        """Test that a subscriber blocked on wakeup resumes on publish."""
+        broker = RunEventBroker()
+        subscriber = broker.subscribe()
+
+        waiter = asyncio.create_task(subscriber.wakeup.wait())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        broker.publish(_event("agent_event"))
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert [p.event.type for p in subscriber.drain()] == ["agent_event"]
+
+        broker.wake_all()
+        assert subscriber.wakeup.is_set()
+        assert not broker.finished()
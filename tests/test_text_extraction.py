@@ -0,0 +1,163 @@
+"""
+Tests for HTML text extraction.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from er.evidence.store import EvidenceStore
+from er.retrieval import extract
+from er.retrieval.extract import (
+    PARSER_HTML,
+    PARSER_LXML,
+    TextExtractor,
+    extract_text,
+    extraction_timeout,
+)
+from er.retrieval.fetch import WebFetcher
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PAGE = """
+<html>
+  <head><title> Q3 Results </title><style>body { color: red; }</style></head>
+  <body>
+    <nav>Home | About</nav>
+    <main>
+      <h1>Revenue grew 12%</h1>
+      <p>Cloud margins expanded.</p>
+      <script>track();</script>
+    </main>
+    <footer>Copyright</footer>
+  </body>
+</html>
+"""
+
+
+def _hang(html: str, _parser: str, _timeout: float) -> tuple[str, str]:
+    """Worker stand-in that never honours its deadline."""
+    time.sleep(60)
+    return "", html
+
+
+class TestExtractText:
+    """Test parser-level extraction."""
+
+    @pytest.mark.parametrize("parser", [PARSER_HTML, PARSER_LXML])
+    def test_extracts_main_content(self, parser: str) -> None:
+        """Test that every parser keeps the main content and drops noise."""
+        title, text = extract_text(PAGE, parser)
+
+        assert title == "Q3 Results"
+        assert text == "Revenue grew 12%\nCloud margins expanded."
+
+    def test_timeout_scales_with_size(self) -> None:
+        """Test that larger pages get proportionally longer timeouts."""
+        assert extraction_timeout(0) == 5.0
+        assert extraction_timeout(2 * 1024 * 1024) == 25.0
+
+
+class TestTextExtractor:
+    """Test off-loop extraction."""
+
+    @pytest.mark.asyncio
+    async def test_extracts_in_process_pool(self) -> None:
+        """Test that large pages are parsed by a worker process."""
+        extractor = TextExtractor(max_workers=1, inline_threshold=0)
+        try:
+            result = await extractor.extract(PAGE)
+            assert (result.title, result.text) == extract_text(PAGE)
+            assert not result.degraded
+        finally:
+            extractor.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_falls_back_to_tag_strip(self) -> None:
+        """Test that a timed-out extraction still returns the page text."""
+        extractor = TextExtractor(max_workers=1, inline_threshold=0, base_timeout=0, timeout_per_mb=0)
+        try:
+            result = await extractor.extract(PAGE)
+            assert result.degraded
+            assert result.title == ""
+            assert "Revenue grew 12%" in result.text
+            assert "track()" not in result.text
+        finally:
+            extractor.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_deadline_keeps_pool(self) -> None:
+        """Test that a page aborted by its worker deadline frees the worker."""
+        extractor = TextExtractor(max_workers=1, inline_threshold=0, base_timeout=0, timeout_per_mb=0)
+        try:
+            assert (await extractor.extract(PAGE)).degraded
+            pool = extractor._pool
+
+            extractor.base_timeout = 5.0
+            result = await extractor.extract(PAGE)
+
+            assert not result.degraded
+            assert extractor._pool is pool
+        finally:
+            extractor.close()
+
+    @pytest.mark.asyncio
+    async def test_overrunning_worker_replaces_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a worker stuck past its deadline is killed and replaced."""
+        extractor = TextExtractor(
+            max_workers=1, inline_threshold=0, base_timeout=0.1, timeout_per_mb=0, kill_grace=0.2
+        )
+        try:
+            monkeypatch.setattr(extract, "_extract_with_deadline", _hang)
+            await extractor._get_pool()
+            stuck_pool = extractor._pool
+            assert stuck_pool is not None
+            workers = list(stuck_pool._processes.values())
+
+            assert (await extractor.extract(PAGE)).degraded
+            assert extractor._pool is None
+            for worker in workers:
+                worker.join(timeout=5)
+                assert not worker.is_alive()
+
+            monkeypatch.undo()
+            extractor.base_timeout = 5.0
+            result = await extractor.extract(PAGE)
+            assert not result.degraded
+            assert extractor._pool is not stuck_pool
+        finally:
+            extractor.close()
+
+
+class TestWebFetcherTextCache:
+    """Test that cached pages reuse their saved extraction."""
+
+    @pytest.mark.asyncio
+    async def test_cached_fetch_reads_derived_text(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that only the first cache hit reads and parses the blob."""
+        store = EvidenceStore(temp_dir / "cache")
+        await store.init()
+        fetcher = WebFetcher(store)
+        try:
+            url = "https://example.com/q3"
+            await store.store(url=url, content=PAGE.encode(), content_type="text/html", snippet="Q3")
+
+            first = await fetcher.fetch(url)
+            assert first.text == "Revenue grew 12%\nCloud margins expanded."
+
+            async def no_blob_reads(evidence_id: str) -> bytes | None:
+                raise AssertionError("blob should not be read")
+
+            monkeypatch.setattr(store, "get_blob", no_blob_reads)
+            second = await fetcher.fetch(url)
+
+            assert (second.title, second.text) == (first.title, first.text)
+        finally:
+            await fetcher.close()
+            await store.close()
@@ -0,0 +1,114 @@
+"""
+Tests for token counting.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from er.llm import token_counter
+from er.llm.base import LLMRequest, LLMResponse
+from er.llm.token_counter import (
+    PARALLEL_MIN_CHARS,
+    TokenCounter,
+    compress_context,
+    model_encoding,
+    model_provider,
+)
+
+
+class FakeEncoding:
+    """Whitespace tokenizer that records what it encodes."""
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode_ordinary(self, text: str) -> list[str]:
+        self.encoded.append(text)
+        return text.split()
+
+
+@pytest.fixture
+def fake_encoding(monkeypatch: pytest.MonkeyPatch) -> FakeEncoding:
+    """Serve every tiktoken encoding from a FakeEncoding."""
+    encoding = FakeEncoding()
+    monkeypatch.setattr(token_counter, "_get_encoding", lambda name: encoding)
+    return encoding
+
+
+def _response(input_tokens: int) -> LLMResponse:
+    return LLMResponse(
+        content="ok",
+        model="claude-sonnet-4-5",
+        provider="anthropic",
+        input_tokens=input_tokens,
+        output_tokens=10,
+    )
+
+
+class TestTokenCounter:
+    """Test exact counting, memoization and calibration."""
+
+    def test_model_families(self) -> None:
+        """Test provider and encoding resolution by model name."""
+        assert model_provider("gpt-5.2-mini") == "openai"
+        assert model_provider("o4-mini-deep-research-2025-06-26") == "openai"
+        assert model_provider("claude-opus-4-20250514") == "anthropic"
+        assert model_provider("gemini-3-pro") == "google"
+        assert model_encoding("gpt-5.2") == "o200k_base"
+        assert model_encoding("gpt-4") == "cl100k_base"
+        assert model_encoding("claude-opus-4-20250514") is None
+
+    def test_count_many_memoizes_by_content(self, fake_encoding: FakeEncoding) -> None:
+        """Test that repeated and duplicate texts are encoded once."""
+        counter = TokenCounter()
+        try:
+            counts = counter.count_many(["a b c", "d e", "a b c", ""], "gpt-5.2")
+            assert counts == [3, 2, 3, 0]
+            assert fake_encoding.encoded == ["a b c", "d e"]
+
+            assert counter.count("d e", "gpt-5.2") == 2
+            assert len(fake_encoding.encoded) == 2
+
+            # Large batches go through the worker threads, order preserved
+            big = [f"w{i} " * (PARALLEL_MIN_CHARS // 8) for i in range(4)]
+            assert counter.count_many(big, "gpt-5.2") == [PARALLEL_MIN_CHARS // 8] * 4
+        finally:
+            counter.close()
+
+    def test_memo_is_bounded(self, fake_encoding: FakeEncoding) -> None:
+        """Test that the least recently used counts are dropped."""
+        counter = TokenCounter(memo_size=2)
+        counter.count_many(["a", "b", "c"], "gpt-5.2")
+        counter.count("a", "gpt-5.2")
+        assert fake_encoding.encoded == ["a", "b", "c", "a"]
+
+    def test_calibration_from_observed_usage(self) -> None:
+        """Test that billed input tokens move the provider's estimate."""
+        counter = TokenCounter()
+        request = LLMRequest(
+            messages=[{"role": "user", "content": "x" * 10000}],
+            model="claude-sonnet-4-5",
+        )
+        before = counter.count_request(request)
+
+        # This provider actually bills ~2 chars/token for this content
+        for _ in range(20):
+            counter.observe(request, _response(5004))
+        counter.observe(request, _response(0))  # cache hits are ignored
+
+        estimator = counter.estimator("anthropic")
+        assert estimator.samples == 20
+        assert estimator.chars_per_token == pytest.approx(2.0, rel=0.1)
+        assert counter.count_request(request) > before
+        assert counter.count("x" * 10000, "gemini-3-pro") == 2500  # other providers untouched
+
+    def test_compress_context_fits_target(self) -> None:
+        """Test that compression sizes the cut from the text's own ratio."""
+        context = "\n\n".join(f"Paragraph {i}: " + "revenue grew " * 50 for i in range(200))
+
+        compressed = compress_context(context, target_tokens=2000, model="claude-sonnet-4-5")
+
+        assert "[... context truncated to fit token limit ...]" in compressed
+        assert compressed.startswith("Paragraph 0")
+        assert TokenCounter().count(compressed, "claude-sonnet-4-5") <= 2000
@@ -0,0 +1,142 @@
+"""
+Tests for the transcript extraction agent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from er.agents import transcript_extractor
+from er.agents.base import AgentContext
+from er.agents.transcript_extractor import TranscriptExtractorAgent
+from er.budget import BudgetTracker
+from er.llm.base import LLMRequest, LLMResponse
+from er.types import RunState
+
+if TYPE_CHECKING:
+    from er.config import Settings
+
+
+class FakeOpenAIClient:
+    """Returns a JSON extract naming the quarter, optionally failing first."""
+
+    def __init__(self, failures: dict[str, int] | None = None) -> None:
+        self.failures = dict(failures or {})
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            prompt = request.messages[0]["content"]
+            quarter = prompt.split("## Transcript (", 1)[1].split(" ", 1)[0]
+            # Later quarters finish first to exercise ordering
+            await asyncio.sleep(0.02 if quarter.startswith("Q1") else 0.0)
+            if self.failures.get(quarter, 0) > 0:
+                self.failures[quarter] -= 1
+                raise RuntimeError("transient error")
+            content = json.dumps({"repeated_themes": [quarter]})
+        finally:
+            self.in_flight -= 1
+        return LLMResponse(
+            content=content,
+            model=request.model,
+            provider="openai",
+            input_tokens=100,
+            output_tokens=20,
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def transcripts() -> list[dict[str, Any]]:
+    """Four quarters of transcripts."""
+    return [
+        {"quarter": q, "year": 2024, "text": f"Q{q} call about margins and growth."}
+        for q in (1, 2, 3, 4)
+    ]
+
+
+def _make_agent(
+    settings: Settings, client: FakeOpenAIClient, max_concurrency: int = 2
+) -> TranscriptExtractorAgent:
+    context = AgentContext(
+        settings=settings,
+        llm_router=None,  # type: ignore[arg-type]
+        evidence_store=None,  # type: ignore[arg-type]
+        budget_tracker=BudgetTracker(budget_limit=10.0),
+    )
+    agent = TranscriptExtractorAgent(context, max_concurrency=max_concurrency)
+    agent._openai_client = client  # type: ignore[assignment]
+    return agent
+
+
+class TestTranscriptExtractor:
+    """Test concurrent, cached extraction."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_extraction_keeps_order(
+        self, mock_settings: Settings, transcripts: list[dict[str, Any]]
+    ) -> None:
+        """Test bounded concurrency and input-ordered results."""
+        client = FakeOpenAIClient()
+        agent = _make_agent(mock_settings, client, max_concurrency=2)
+
+        extracts = await agent.run(RunState.create("AAPL", 10.0), transcripts)
+
+        assert [e.quarter_num for e in extracts] == [1, 2, 3, 4]
+        assert [e.repeated_themes for e in extracts] == [["Q1"], ["Q2"], ["Q3"], ["Q4"]]
+        assert client.max_in_flight == 2
+        assert agent.budget_tracker.total_input_tokens == 400
+
+    @pytest.mark.asyncio
+    async def test_retries_then_falls_back(
+        self,
+        mock_settings: Settings,
+        transcripts: list[dict[str, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that transient failures are retried and persistent ones fall back."""
+        monkeypatch.setattr(transcript_extractor, "EXTRACTION_RETRY_BASE_DELAY", 0.0)
+        client = FakeOpenAIClient(failures={"Q2": 1, "Q3": 10})
+        agent = _make_agent(mock_settings, client)
+
+        extracts = await agent.run(RunState.create("AAPL", 10.0), transcripts)
+
+        assert extracts[1].repeated_themes == ["Q2"]
+        assert extracts[2].repeated_themes == []
+        assert extracts[2].raw_excerpt.startswith("Q3 call")
+        assert client.calls == 4 + 1 + transcript_extractor.EXTRACTION_MAX_ATTEMPTS - 1
+
+    @pytest.mark.asyncio
+    async def test_cache_skips_llm_calls(
+        self,
+        mock_settings: Settings,
+        transcripts: list[dict[str, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that unchanged transcripts are served from the extract cache."""
+        client = FakeOpenAIClient()
+        agent = _make_agent(mock_settings, client)
+        run_state = RunState.create("AAPL", 10.0)
+
+        first = await agent.run(run_state, transcripts)
+        second = await agent.run(run_state, transcripts)
+        assert client.calls == 4
+        assert second == first
+
+        # A new prompt version invalidates the cache
+        monkeypatch.setattr(transcript_extractor, "EXTRACTION_PROMPT_VERSION", "test")
+        await agent.run(run_state, transcripts[:1])
+        assert client.calls == 5
+        assert (Path(mock_settings.CACHE_DIR) / "transcript_extracts").is_dir()
@@ -5,14 +5,23 @@ from __future__ import annotations
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from er.valuation.dcf import DCFEngine, DCFInputs, DCFResult, WACCInputs
+from er.valuation.dcf import (
+    DCFEngine,
+    DCFInputs,
+    DCFResult,
+    MonteCarloSpec,
+    WACCInputs,
+    dcf_value_grid,
+)
 from er.valuation.reverse_dcf import (
     ReverseDCFEngine,
     ReverseDCFInputs,
     ReverseDCFResult,
     calculate_implied_growth_simple,
+    solve_implied_growth,
 )
 from er.valuation.excel_export import ValuationExporter, ValuationWorkbook
 
@@ -161,6 +170,66 @@ class TestDCFEngine:
         assert high_wacc[0][2] < low_wacc[0][2]
 
 
+class TestVectorizedDCF:
+    """Tests for the vectorized valuation kernel and Monte Carlo."""
+
+    @pytest.fixture
+    def dcf_inputs(self) -> DCFInputs:
+        """Create sample DCF inputs (margins shorter than the projection)."""
+        return DCFInputs(
+            revenue_projections=[110e9, 121e9, 133e9, 146e9, 161e9],
+            operating_margins=[0.30, 0.31, 0.32],
+            current_revenue=100e9,
+        )
+
+    def test_grid_matches_scalar_dcf(self, dcf_inputs: DCFInputs) -> None:
+        """Test that every grid cell equals calculate_dcf for that pair."""
+        engine = DCFEngine()
+        waccs = np.linspace(0.06, 0.14, 100)
+        growths = np.linspace(0.0, 0.04, 100)
+
+        grid = engine.sensitivity_grid(dcf_inputs, 50e9, 15e9, waccs, growths)
+
+        assert grid.shape == (100, 100)
+        for i, j in [(0, 0), (37, 81), (99, 99)]:
+            dcf_inputs.wacc, dcf_inputs.terminal_growth = waccs[i], growths[j]
+            scalar = engine.calculate_dcf(dcf_inputs, 50e9, 15e9)
+            assert grid[i, j] == pytest.approx(scalar.intrinsic_value_per_share, rel=1e-12)
+
+    def test_kernel_broadcasts_paths(self, dcf_inputs: DCFInputs) -> None:
+        """Test that stacked revenue paths value independently and WACC <= g is NaN."""
+        base = np.asarray(dcf_inputs.revenue_projections)
+        values = dcf_value_grid(
+            np.stack([base, base * 1.1]),
+            dcf_inputs.operating_margins,
+            wacc=[0.10, 0.10],
+            terminal_growth=[0.025, 0.025],
+            current_revenue=dcf_inputs.current_revenue,
+        )
+        assert values.shape == (2,)
+        assert values[1] > values[0]
+
+        undefined = dcf_value_grid(base, dcf_inputs.operating_margins, 0.03, [0.02, 0.03, 0.04])
+        assert np.isfinite(undefined[0])
+        assert np.isnan(undefined[1:]).all()
+
+    def test_monte_carlo_distribution(self, dcf_inputs: DCFInputs) -> None:
+        """Test that Monte Carlo is seeded, ordered and centered on the base case."""
+        engine = DCFEngine()
+        base = engine.calculate_dcf(dcf_inputs, 0, 1e9).intrinsic_value_per_share
+
+        result = engine.monte_carlo(dcf_inputs, 0, 1e9, MonteCarloSpec(seed=7))
+        again = engine.monte_carlo(dcf_inputs, 0, 1e9, MonteCarloSpec(seed=7))
+
+        assert result.n_valid == result.n_paths == 10_000
+        assert result.percentiles == again.percentiles
+        points = list(result.percentiles.values())
+        assert points == sorted(points)
+        assert result.percentiles[5] < base < result.percentiles[95]
+        assert 0.0 < result.probability_above(base) < 1.0
+        assert result.to_dict()["percentiles"]["50"] == round(result.percentiles[50], 2)
+
+
 class TestReverseDCFEngine:
     """Tests for reverse DCF engine."""
 
@@ -254,6 +323,98 @@ class TestReverseDCFEngine:
         assert result.implied_revenue_cagr is not None
 
 
+
+class TestImpliedGrowthSolver:
+    """Tests for the vectorized implied-growth solver."""
+
+    @pytest.fixture
+    def base_inputs(self) -> ReverseDCFInputs:
+        """Create base reverse DCF inputs."""
+        return ReverseDCFInputs(
+            current_price=100.0,
+            shares_outstanding=1e9,
+            net_debt=0,
+            current_revenue=20e9,
+            current_margin=0.20,
+        )
+
+    def test_solution_reprices_to_target(self, base_inputs: ReverseDCFInputs) -> None:
+        """Test that the implied CAGR values the company at the market EV."""
+        engine = DCFEngine()
+        result = ReverseDCFEngine().calculate_implied_growth(base_inputs)
+        cagr = result.implied_revenue_cagr
+
+        dcf = engine.calculate_dcf(
+            DCFInputs(
+                revenue_projections=[20e9 * (1 + cagr) ** (i + 1) for i in range(5)],
+                operating_margins=[0.20] * 5,
+                current_revenue=20e9,
+            )
+        )
+
+        assert result.converged
+        assert result.solver_iterations < 20
+        assert dcf.enterprise_value == pytest.approx(result.enterprise_value, rel=1e-6)
+
+    def test_heatmap_grid(self, base_inputs: ReverseDCFInputs) -> None:
+        """Test that a price x WACC grid is solved in one call with diagnostics."""
+        prices = np.linspace(60, 160, 100)
+        waccs = np.linspace(0.08, 0.12, 100)
+
+        solution = ReverseDCFEngine().implied_growth_grid(
+            base_inputs, current_price=prices, wacc=waccs
+        )
+
+        assert solution.shape == (100, 100)
+        assert solution.converged[solution.bracketed].all()
+        # Higher prices and higher discount rates both demand more growth
+        assert (np.diff(solution.implied_cagr, axis=0) >= 0).all()
+        assert (np.diff(solution.implied_cagr, axis=1) >= 0).all()
+        assert solution.to_dict()["count"] == 10_000
+
+        with pytest.raises(ValueError):
+            ReverseDCFEngine().implied_growth_grid(base_inputs, projection_years=[5, 10])
+
+    def test_batch_matches_single_and_flags_unreachable(
+        self, base_inputs: ReverseDCFInputs
+    ) -> None:
+        """Test a screen of mixed inputs, including an unreachable price."""
+        engine = ReverseDCFEngine()
+        screen = [
+            base_inputs,
+            ReverseDCFInputs(
+                current_price=40.0, shares_outstanding=2e9, net_debt=5e9,
+                current_revenue=30e9, current_margin=0.12, projection_years=10,
+            ),
+            ReverseDCFInputs(
+                current_price=10_000.0, shares_outstanding=1e9, net_debt=0,
+                current_revenue=1e9, current_margin=0.10,
+            ),
+        ]
+
+        solution = engine.implied_growth_batch(screen)
+
+        assert solution.bracketed.tolist() == [True, True, False]
+        assert solution.implied_cagr[2] == 0.50
+        for item, cagr in zip(screen[:2], solution.implied_cagr[:2], strict=True):
+            single = engine.calculate_implied_growth(item)
+            assert cagr == pytest.approx(single.implied_revenue_cagr, abs=1e-9)
+
+    def test_non_monotonic_ev_finds_lowest_root(self) -> None:
+        """Test that a thin-margin company still gets the low-growth root."""
+        solution = solve_implied_growth(
+            target_ev=35.6e9,
+            current_revenue=39.8e9,
+            current_margin=0.055,
+            wacc=0.0796,
+            terminal_growth=0.0253,
+            projection_years=10,
+        )
+
+        assert bool(solution.converged)
+        assert 0.0 < float(solution.implied_cagr) < 0.2
+
+
 class TestValuationExporter:
     """Tests for valuation exporter."""
 
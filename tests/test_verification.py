@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import re
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
-from er.verification.claim_graph import ClaimGraphBuilder, ExtractedFact
+from er.llm.base import LLMResponse
+
+from er.verification.claim_graph import ClaimGraphBuilder, ExtractedFact, LinkIndex, tokenize
 from er.verification.entailment import (
     EntailmentVerifier,
     EntailmentResult,
@@ -146,6 +152,52 @@ may offset some of the revenue gains.
         # Should update cited_claims count
         assert updated_graph.cited_claims >= 0
 
+    def test_link_index_matches_pairwise_overlap(self) -> None:
+        """Test that indexed linking equals comparing every claim/evidence pair."""
+        words = [
+            "revenue", "margin", "iphone", "services", "growth", "china", "demand",
+            "pricing", "supply", "cloud", "capex", "buyback", "dividend", "wearables",
+        ]
+        evidence_texts = {
+            f"ev_{i}": " ".join(words[(i * 3 + k) % len(words)] for k in range(i % 5 + 2))
+            for i in range(40)
+        }
+        claims = [
+            " ".join(words[(j + k) % len(words)] for k in range(6)) for j in range(15)
+        ]
+
+        index = LinkIndex(evidence_texts.items())
+        for claim in claims:
+            claim_terms = set(tokenize(claim))
+            expected = [
+                ev_id for ev_id, text in evidence_texts.items()
+                if len(claim_terms & set(tokenize(text))) >= 3
+            ]
+            assert index.match(claim, min_overlap=3) == expected
+
+    def test_link_evidence_tfidf_threshold(self) -> None:
+        """Test that TF-IDF weighting drops links made of common terms."""
+        claim = Claim(
+            claim_id="clm_1",
+            text="Apple revenue growth from wearables pricing power",
+            claim_type=ClaimType.FACT,
+            section="financial",
+        )
+        evidence_texts = {f"ev_common_{i}": "Apple revenue growth update" for i in range(20)}
+        evidence_texts["ev_specific"] = "Wearables pricing power lifted Apple revenue"
+
+        plain = ClaimGraphBuilder().link_evidence_to_claims(
+            ClaimGraph(ticker="AAPL", source="test", claims=[claim]), evidence_texts
+        )
+        assert len(plain.claims[0].cited_evidence_ids) == 21
+
+        claim.cited_evidence_ids = []
+        weighted = ClaimGraphBuilder(use_tfidf=True, min_tfidf_score=0.5).link_evidence_to_claims(
+            ClaimGraph(ticker="AAPL", source="test", claims=[claim]), evidence_texts
+        )
+        assert weighted.claims[0].cited_evidence_ids == ["ev_specific"]
+        assert weighted.cited_claims == 1
+
     def test_empty_text(self) -> None:
         """Test with empty text."""
         builder = ClaimGraphBuilder()
@@ -274,6 +326,120 @@ class TestEntailmentVerifier:
         assert report.overall_confidence <= 1.0
 
 
+class FakeEntailmentRouter:
+    """Router stub that answers batched and single-claim prompts."""
+
+    def __init__(self, drop_labels: set[str] | None = None, delay: float = 0.01) -> None:
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.drop_labels = drop_labels or set()
+        self.delay = delay
+
+    async def complete(self, role, messages, **kwargs) -> LLMResponse:
+        prompt = messages[0]["content"]
+        self.calls.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+        def verdict(text: str) -> dict:
+            status = "CONTRADICTED" if "decline" in text else "SUPPORTED"
+            return {"status": status, "confidence": 0.9, "supporting_evidence_indices": [0]}
+
+        labels = re.findall(r"CLAIM (C\d+):\n(.*)", prompt)
+        if labels:
+            payload = {
+                "results": [
+                    {"claim": label, **verdict(text)}
+                    for label, text in labels
+                    if label not in self.drop_labels
+                ]
+            }
+        else:
+            claim_text = prompt.split("CLAIM:", 1)[1].split("EVIDENCE:", 1)[0]
+            payload = verdict(claim_text)
+        return LLMResponse(
+            content=json.dumps(payload),
+            model="fake",
+            provider="fake",
+            input_tokens=10,
+            output_tokens=10,
+        )
+
+
+def _claim_graph(num_claims: int) -> ClaimGraph:
+    claims = [
+        Claim(
+            claim_id=f"claim_{i}",
+            text=f"Segment {i} revenue will {'decline' if i % 3 == 0 else 'grow'} next year.",
+            claim_type=ClaimType.FORECAST,
+            section="thesis",
+            cited_evidence_ids=[f"ev_{i}"],
+        )
+        for i in range(num_claims)
+    ]
+    return ClaimGraph(ticker="AAPL", source="synthesis", claims=claims)
+
+
+class TestEntailmentVerifierLLM:
+    """Tests for concurrent and batched LLM entailment."""
+
+    @pytest.mark.asyncio
+    async def test_batched_requests_parse_per_claim(self) -> None:
+        """Test that claims are packed into batches and mapped back in order."""
+        graph = _claim_graph(10)
+        evidence_map = {f"ev_{i}": f"Evidence about segment {i}." for i in range(10)}
+        router = FakeEntailmentRouter()
+        verifier = EntailmentVerifier(llm_router=router, batch_size=4, max_concurrency=2)
+
+        report = await verifier.verify_claim_graph(graph, evidence_map)
+
+        assert len(router.calls) == 3
+        assert router.max_in_flight <= 2
+        assert [r.claim_id for r in report.results] == [c.claim_id for c in graph.claims]
+        for claim, result in zip(graph.claims, report.results, strict=True):
+            expected = (
+                EntailmentStatus.CONTRADICTED
+                if "decline" in claim.text
+                else EntailmentStatus.SUPPORTED
+            )
+            assert result.status == expected
+            assert result.supporting_evidence == [evidence_map[claim.cited_evidence_ids[0]]]
+        assert report.claims_contradicted == 4
+        assert report.claims_verified == 6
+
+    @pytest.mark.asyncio
+    async def test_missing_batch_entries_fall_back(self) -> None:
+        """Test that claims omitted from a batched response are verified alone."""
+        graph = _claim_graph(3)
+        evidence_map = {f"ev_{i}": f"Evidence about segment {i}." for i in range(3)}
+        router = FakeEntailmentRouter(drop_labels={"C2"})
+        verifier = EntailmentVerifier(llm_router=router, batch_size=3)
+
+        report = await verifier.verify_claim_graph(graph, evidence_map)
+
+        assert len(router.calls) == 2
+        assert "CLAIM:" in router.calls[1]
+        assert report.results[1].status == EntailmentStatus.SUPPORTED
+        assert report.results[1].claim_id == "claim_1"
+
+    @pytest.mark.asyncio
+    async def test_unbatched_concurrency_is_bounded(self) -> None:
+        """Test one request per claim with at most max_concurrency in flight."""
+        graph = _claim_graph(8)
+        evidence_map = {f"ev_{i}": f"Evidence about segment {i}." for i in range(8)}
+        router = FakeEntailmentRouter()
+        verifier = EntailmentVerifier(llm_router=router, batch_size=1, max_concurrency=3)
+
+        report = await verifier.verify_claim_graph(graph, evidence_map)
+
+        assert len(router.calls) == 8
+        assert 1 < router.max_in_flight <= 3
+        assert report.claims_contradicted == 3
+
+
 class TestExtractedFact:
     """Tests for ExtractedFact dataclass."""
 
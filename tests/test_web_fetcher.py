@@ -0,0 +1,130 @@
+"""
+Tests for the web fetcher's HTTP engine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from er.evidence.store import EvidenceStore
+from er.retrieval.fetch import USER_AGENT, WebFetcher
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+PAGE = b"<html><head><title>Filing</title></head><body><main>Revenue grew 12%</main></body></html>"
+
+
+@pytest.fixture
+async def evidence_store(temp_dir: Path) -> EvidenceStore:
+    """Create an initialized evidence store for testing."""
+    store = EvidenceStore(temp_dir / "cache")
+    await store.init()
+    yield store
+    await store.close()
+
+
+def _fetcher(evidence_store: EvidenceStore, handler, **kwargs) -> WebFetcher:
+    """WebFetcher whose requests go to a mock transport."""
+    fetcher = WebFetcher(evidence_store, retry_base_delay=0, per_host_rate=1000, **kwargs)
+    fetcher._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), headers={"User-Agent": USER_AGENT}
+    )
+    return fetcher
+
+
+class TestWebFetcher:
+    """Test streaming, revalidation, retries and per-host limits."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_size_limit(self, evidence_store: EvidenceStore) -> None:
+        """Test that bodies without content-length are cut off at the limit."""
+
+        async def body():
+            for _ in range(10):
+                yield b"x" * 1000
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body(), headers={"content-type": "text/html"})
+
+        fetcher = _fetcher(evidence_store, handler, max_content_size=2500)
+        try:
+            result = await fetcher.fetch("https://example.com/huge")
+            assert not result.success
+            assert "too large" in result.error
+            assert await evidence_store.count() == 0
+        finally:
+            await fetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_conditional_revalidation(self, evidence_store: EvidenceStore) -> None:
+        """Test that stale cached pages are revalidated with their ETag."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304, headers={"etag": '"v1"'})
+            return httpx.Response(200, content=PAGE, headers={"etag": '"v1"'})
+
+        fetcher = _fetcher(evidence_store, handler, revalidate_after=0)
+        try:
+            first = await fetcher.fetch("https://example.com/10-k")
+            second = await fetcher.fetch("https://example.com/10-k")
+
+            assert second.success
+            assert second.evidence_id == first.evidence_id
+            assert second.text == first.text == "Revenue grew 12%"
+            assert len(requests) == 2
+            assert requests[1].headers["if-none-match"] == '"v1"'
+            assert await evidence_store.count() == 1
+        finally:
+            await fetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors_only(self, evidence_store: EvidenceStore) -> None:
+        """Test that 503s are retried and 404s are not."""
+        calls: dict[str, int] = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls[request.url.path] = calls.get(request.url.path, 0) + 1
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            if calls[request.url.path] == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, content=PAGE)
+
+        fetcher = _fetcher(evidence_store, handler)
+        try:
+            assert (await fetcher.fetch("https://example.com/flaky")).success
+            assert not (await fetcher.fetch("https://example.com/missing")).success
+            assert calls == {"/flaky": 2, "/missing": 1}
+        finally:
+            await fetcher.close()
+
+    @pytest.mark.asyncio
+    async def test_per_host_concurrency(self, evidence_store: EvidenceStore) -> None:
+        """Test that each host sees at most per_host_concurrency requests at once."""
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            return httpx.Response(200, content=PAGE + request.url.path.encode())
+
+        fetcher = _fetcher(evidence_store, handler, per_host_concurrency=2)
+        try:
+            urls = [f"https://{host}/{i}" for host in ("a.com", "b.com") for i in range(6)]
+            results = await fetcher.fetch_many(urls)
+            assert all(r.success for r in results)
+            assert peak == {"a.com": 2, "b.com": 2}
+        finally:
+            await fetcher.close()
@@ -0,0 +1,121 @@
+"""
+Tests for the workspace store.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import TYPE_CHECKING
+
+from er.workspace.store import ArtifactInput, WorkspaceStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestArtifactEvidenceIndex:
+    """Test evidence ID -> artifact lookups."""
+
+    def test_get_artifacts_by_evidence_ids(self, temp_dir: Path) -> None:
+        """Test resolving many evidence IDs in one call."""
+        store = WorkspaceStore(temp_dir / "workspace.db")
+        try:
+            card_id = store.put_artifact(
+                "evidence_card", "cards", {"title": "Card"}, evidence_ids=["ev_raw", "ev_sum"]
+            )
+            dossier_id = store.put_artifact(
+                "vertical_dossier", "analyst", {"title": "Dossier"}, evidence_ids=["ev_raw"]
+            )
+            store.put_artifact("thread_brief", "discovery", {"title": "Uncited"})
+
+            result = store.get_artifacts_by_evidence_ids(["ev_raw", "ev_sum", "ev_none", "ev_raw"])
+
+            assert set(result) == {"ev_raw", "ev_sum"}
+            assert {a["id"] for a in result["ev_raw"]} == {card_id, dossier_id}
+            assert result["ev_sum"][0]["content"] == {"title": "Card"}
+
+            cards = store.get_artifacts_by_evidence_ids(["ev_raw"], artifact_type="evidence_card")
+            assert [a["id"] for a in cards["ev_raw"]] == [card_id]
+            assert store.get_artifacts_by_evidence_ids([]) == {}
+        finally:
+            store.close()
+
+    def test_backfills_existing_workspace(self, temp_dir: Path) -> None:
+        """Test that workspaces created before the mapping table are indexed on open."""
+        db_path = temp_dir / "workspace.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE artifacts (
+                id TEXT PRIMARY KEY, type TEXT NOT NULL, created_at TEXT NOT NULL,
+                producer TEXT NOT NULL, json TEXT NOT NULL, summary TEXT, evidence_ids TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ("evidence_card_1", "evidence_card", "2025-01-01T00:00:00+00:00", "cards",
+             json.dumps({"title": "Legacy"}), None, json.dumps(["ev_legacy"])),
+        )
+        conn.commit()
+        conn.close()
+
+        store = WorkspaceStore(db_path)
+        try:
+            result = store.get_artifacts_by_evidence_ids(["ev_legacy"])
+            assert [a["id"] for a in result["ev_legacy"]] == ["evidence_card_1"]
+        finally:
+            store.close()
+
+
+class TestBulkArtifacts:
+    """Test bulk writes and projected reads."""
+
+    def test_put_artifacts_single_transaction(self, temp_dir: Path) -> None:
+        """Test that bulk writes return IDs in order and index evidence."""
+        store = WorkspaceStore(temp_dir / "workspace.db")
+        try:
+            ids = store.put_artifacts(
+                ArtifactInput("thread_brief", "discovery", {"thread_id": f"t{i}"}, evidence_ids=[f"ev_{i}"])
+                for i in range(3)
+            )
+
+            assert len(ids) == 3
+            assert [store.get_artifact(i)["content"]["thread_id"] for i in ids] == ["t0", "t1", "t2"]
+            assert store.count_artifacts("thread_brief") == 3
+            assert [a["id"] for a in store.get_artifacts_by_evidence_ids(["ev_1"])["ev_1"]] == [ids[1]]
+            assert store.put_artifacts([]) == []
+            journal_mode = store._get_conn().execute("PRAGMA journal_mode").fetchone()[0]
+            assert journal_mode == "wal"
+        finally:
+            store.close()
+
+    def test_iter_artifacts_projects_fields(self, temp_dir: Path) -> None:
+        """Test that projections return only the requested keys with JSON types intact."""
+        store = WorkspaceStore(temp_dir / "workspace.db")
+        try:
+            store.put_artifact(
+                "vertical_dossier",
+                "analyst",
+                {"title": "Cloud", "facts": [{"id": 1}], "meta": {"n": 2}, "body": "x" * 1000},
+            )
+            store.put_artifact("vertical_dossier", "analyst", {"title": "Ads"})
+            store.put_artifact("flags", "analyst", {"flag": True, "off": False, "n": 1, "x": 1.5})
+            store.put_artifact("thread_brief", "discovery", {"title": "Other"})
+
+            projected = list(
+                store.iter_artifacts("vertical_dossier", fields=["title", "facts", "meta"], batch_size=1)
+            )
+
+            assert [a["content"]["title"] for a in projected] == ["Ads", "Cloud"]
+            assert projected[1]["content"] == {"title": "Cloud", "facts": [{"id": 1}], "meta": {"n": 2}}
+            assert projected[0]["content"] == {"title": "Ads", "facts": None, "meta": None}
+            assert len(store.list_artifacts()) == 4
+            assert store.list_artifacts("thread_brief", fields=["title"])[0]["content"] == {"title": "Other"}
+
+            # Booleans stay booleans (json_extract alone returns them as 0/1)
+            flags = store.list_artifacts("flags", fields=["flag", "off", "n", "x"])[0]["content"]
+            assert flags == store.list_artifacts("flags")[0]["content"]
+            assert flags["flag"] is True and flags["off"] is False
+            assert type(flags["n"]) is int
+        finally:
+            store.close()